@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: Batch-Konvertierung von Infobriefen
+
+Erzeugt N Beispiel-Infobriefe in einem temporären Verzeichnis und misst
+die HTML-Konvertierung wie in process_batch:
+
+- ohne Cache: CSS und Logo pro Dokument neu lesen und kodieren (bisher)
+- mit Cache:  prozessweiter AssetCache (einmal pro Batch)
+
+und process_batch komplett: sequentiell, mit --jobs N und inkrementell
+(zweiter Lauf ohne Änderungen, dann mit einer geänderten Datei).
+
+Mit weasyprint zusätzlich PDF: je ein PDF pro Infobrief (eigener Kontext
+wie bisher / gemeinsamer PdfRenderer) gegen ein Archiv-PDF in einem Lauf.
+
+Verwendung:
+    python scripts/benchmark_batch.py [--count 200] [--rounds 7] [--jobs 4]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from format_infobrief import (ASSETS, InfobriefFormatter, PdfRenderer, process_batch,
+                              save_archive_pdf)
+
+SAMPLE = """# Infobrief {n}
+
+> **Datum:** {day:02d}.12.2025 12:27
+> **Von:** Schulleitung
+> **Teams-Link:** https://teams.microsoft.com/l/message/{n}
+
+---
+
+Liebes Kollegium BS05
+
+Need-to-know:
+
+- Save-the-date: Am 21.01.26 findet die **Lehrerkonferenz** statt
+- Zeugniskonferenzen laut *Terminplan*, Details im [Portal](https://bswi.hamburg)
+- Abgabe der Noten bis Freitag
+
+Nice-to-know:
+
+- Die Bibliothek hat neue Öffnungszeiten
+- Fortbildung „Digitale Tools“ im Februar
+
+## Termine
+
+Weitere Informationen folgen im nächsten Infobrief.
+
+Viele Grüße
+"""
+
+
+def write_samples(directory: Path, count: int) -> list:
+    """Schreibt count Beispiel-Infobriefe und gibt die Pfade zurück"""
+    paths = []
+    for n in range(count):
+        path = directory / f"infobrief-{n:04d}.md"
+        path.write_text(SAMPLE.format(n=n, day=n % 28 + 1), encoding='utf-8')
+        paths.append(path)
+    return paths
+
+
+def run_batch(md_files: list, cached: bool) -> tuple:
+    """
+    Konvertiert alle Dateien zu HTML.
+
+    Returns:
+        (Sekunden gesamt, davon HTML erzeugen)
+    """
+    ASSETS.clear()
+    generate = 0.0
+    started = time.perf_counter()
+    for md_file in md_files:
+        if not cached:
+            ASSETS.clear()      # bisheriges Verhalten: Assets pro Dokument laden
+        formatter = InfobriefFormatter(md_file)
+        t0 = time.perf_counter()
+        html_content = formatter.generate_html()
+        generate += time.perf_counter() - t0
+        md_file.with_suffix('.html').write_text(html_content, encoding='utf-8')
+    return time.perf_counter() - started, generate
+
+
+def benchmark(count: int = 200, rounds: int = 7):
+    variants = {'ohne Cache': False, 'mit Cache': True}
+    timings = {label: [] for label in variants}
+    with tempfile.TemporaryDirectory() as tmp:
+        md_files = write_samples(Path(tmp), count)
+        run_batch(md_files[:5], cached=True)        # Aufwärmen
+        # Varianten abwechselnd, damit Schwankungen des Dateisystems beide treffen
+        for i in range(rounds):
+            order = list(variants.items())
+            for label, cached in (order if i % 2 == 0 else order[::-1]):
+                timings[label].append(run_batch(md_files, cached))
+
+    print(f"Batch: {count} Infobriefe -> HTML (Minimum aus {rounds} Läufen)\n")
+    print("| Variante | Gesamt | HTML erzeugen | pro Dokument |")
+    print("|----------|--------|---------------|--------------|")
+    best = {}
+    for label, runs in timings.items():
+        total = min(run[0] for run in runs)
+        best[label] = generate = min(run[1] for run in runs)
+        print(f"| {label} | {total * 1000:.1f} ms | {generate * 1000:.1f} ms | "
+              f"{generate / count * 1e6:.0f} µs |")
+    print(f"\nHTML erzeugen: {best['ohne Cache'] / best['mit Cache']:.2f}x schneller "
+          f"(CSS/Logo: {count}x gelesen und kodiert -> 1x)")
+
+
+def _timed_batch(directory: Path, **kwargs) -> float:
+    """process_batch ohne Ausgabe, Rückgabe: Sekunden"""
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        process_batch(directory, **kwargs)
+    return time.perf_counter() - started
+
+
+def benchmark_process_batch(count: int = 200, jobs: int = 0, rounds: int = 3):
+    jobs = jobs or os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        md_files = write_samples(directory, count)
+        runs = {
+            'voll, 1 Prozess': lambda: _timed_batch(directory),
+            f'voll, --jobs {jobs}': lambda: _timed_batch(directory, jobs=jobs),
+            'inkrementell, nichts geändert': lambda: _timed_batch(directory, incremental=True),
+        }
+        timings = {label: min(run() for _ in range(rounds)) for label, run in runs.items()}
+        md_files[0].touch()
+        timings['inkrementell, 1 Datei geändert'] = _timed_batch(directory, incremental=True)
+
+    print(f"\nprocess_batch: {count} Infobriefe -> HTML ({os.cpu_count()} CPUs)\n")
+    print("| Variante | Zeit |")
+    print("|----------|------|")
+    for label, seconds in timings.items():
+        print(f"| {label} | {seconds * 1000:.1f} ms |")
+
+
+def benchmark_pdf(count: int = 20):
+    try:
+        renderer = PdfRenderer()
+    except ImportError:
+        print("\nPDF: übersprungen (weasyprint nicht installiert)")
+        return
+    from weasyprint import HTML
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        md_files = write_samples(directory, count)
+        formatters = [InfobriefFormatter(md_file) for md_file in md_files]
+        timings = {}
+
+        started = time.perf_counter()
+        for formatter in formatters:     # bisher: HTML mit eingebettetem CSS, neuer Kontext
+            HTML(string=formatter.generate_html()).write_pdf(formatter.input_file.with_suffix('.pdf'))
+        timings[f'{count} PDFs, je eigener Kontext'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for formatter in formatters:
+            renderer.write_pdf(formatter.generate_html(inline_css=False), formatter.input_file.with_suffix('.pdf'))
+        timings[f'{count} PDFs, gemeinsamer PdfRenderer'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        save_archive_pdf(md_files, directory / 'archiv.pdf')
+        timings['1 Archiv-PDF (--archive)'] = time.perf_counter() - started
+
+    print(f"\nPDF: {count} Infobriefe\n")
+    print("| Variante | Zeit |")
+    print("|----------|------|")
+    for label, seconds in timings.items():
+        print(f"| {label} | {seconds * 1000:.0f} ms |")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark der Infobrief-Batch-Konvertierung')
+    parser.add_argument('--count', type=int, default=200, help='Anzahl Infobriefe (default: 200)')
+    parser.add_argument('--rounds', type=int, default=7, help='Wiederholungen (default: 7)')
+    parser.add_argument('--jobs', '-j', type=int, default=0, help='Prozesse für --jobs (default: alle CPUs)')
+    parser.add_argument('--pdf-count', type=int, default=20, help='Infobriefe für den PDF-Vergleich (default: 20)')
+    args = parser.parse_args()
+    benchmark(args.count, args.rounds)
+    benchmark_process_batch(args.count, args.jobs)
+    benchmark_pdf(args.pdf_count)
+
+
+if __name__ == '__main__':
+    main()
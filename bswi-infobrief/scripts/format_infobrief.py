@@ -5,21 +5,257 @@ BS:WI Infobrief Formatter
 Konvertiert Markdown-Infobriefe in HTML/PDF mit Corporate Design
 """
 
+import os
 import sys
 import re
 import argparse
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 import html
 import io
 import base64
+import threading
 
 # Fix Windows console encoding
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
+TEMPLATES_DIR = Path(__file__).parent.parent / 'templates'
+CSS_PATH = TEMPLATES_DIR / 'style.css'
+LOGO_PATH = TEMPLATES_DIR / 'Logo_BSWI_Quer_RGB.png'
+
+
+class AssetCache:
+    """
+    Prozessweiter Cache für Template-Dateien (CSS, Logo als Data-URI).
+
+    Schlüssel ist der Pfad, gültig solange mtime und Größe gleich bleiben -
+    im Batch wird jede Datei einmal gelesen und kodiert statt pro Dokument,
+    Änderungen am Template werden trotzdem sofort übernommen.
+    """
+
+    def __init__(self):
+        self._entries: Dict[tuple, tuple] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, path: Path, kind: str, load):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        key = (str(path), kind)
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self.hits += 1
+                return entry[1]
+        value = load(path)
+        with self._lock:
+            self._entries[key] = (version, value)
+            self.misses += 1
+        return value
+
+    def text(self, path: Path) -> Optional[str]:
+        """Dateiinhalt als Text (None, wenn die Datei fehlt)"""
+        return self._get(Path(path), 'text', lambda p: p.read_text(encoding='utf-8'))
+
+    def data_uri(self, path: Path, mime: str = 'image/png') -> Optional[str]:
+        """Datei als Base64-Data-URI (None, wenn die Datei fehlt)"""
+        def load(p: Path) -> str:
+            return f'data:{mime};base64,{base64.b64encode(p.read_bytes()).decode("ascii")}'
+        return self._get(Path(path), f'data:{mime}', load)
+
+    def clear(self):
+        """Alle Einträge verwerfen"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+ASSETS = AssetCache()
+
+
+# Blockelemente am Zeilenanfang - eine Alternation statt mehrerer re.match pro Zeile
+_TITLE = re.compile(r'#\s+(.+)')
+_BLOCK = re.compile(
+    r'(?P<section>(?i:need-to-know|nice-to-know)):(?P<rest>.*)'
+    r'|[-*]\s(?P<item>.*)'
+    r'|(?P<level>#{2,6})\s+(?P<heading>.+)'
+)
+# Inline: Link, fett, kursiv (kursiv darf fette Abschnitte enthalten)
+_INLINE = re.compile(
+    r'\[(?P<label>.+?)\]\((?P<href>.+?)\)'
+    r'|\*\*(?P<strong>.+?)\*\*'
+    r'|\*(?P<em>(?:\*\*.+?\*\*|[^*])+)\*'
+)
+_META_FIELDS = (('**Datum:**', 'datum'), ('**Von:**', 'von'), ('**Teams-Link:**', 'teams_link'))
+_SECTIONS = {
+    'need-to-know': ('section-needtoknow', 'Need-to-know'),
+    'nice-to-know': ('section-nicetoknow', 'Nice-to-know'),
+}
+
+
+def render_inline(text: str, write) -> None:
+    """
+    Schreibt Inline-Markdown als HTML: **fett**, *kursiv*, [Text](URL).
+
+    Text außerhalb der Auszeichnungen wird escaped (roh eingegebenes < oder &
+    erscheint als Zeichen, nicht als Markup), URLs zusätzlich für Attribute.
+    """
+    pos = 0
+    for match in _INLINE.finditer(text):
+        write(html.escape(text[pos:match.start()], quote=False))
+        if match.group('label') is not None:
+            write(f'<a href="{html.escape(match.group("href"))}">')
+            render_inline(match.group('label'), write)
+            write('</a>')
+        elif match.group('strong') is not None:
+            write('<strong>')
+            render_inline(match.group('strong'), write)
+            write('</strong>')
+        else:
+            write('<em>')
+            render_inline(match.group('em'), write)
+            write('</em>')
+        pos = match.end()
+    write(html.escape(text[pos:], quote=False))
+
+
+@dataclass
+class ParsedInfobrief:
+    """Ergebnis von parse_infobrief"""
+    title: str
+    metadata: Dict[str, str]
+    body: str           # Markdown nach Metadaten und Trennlinie
+    body_html: str
+
+
+def parse_infobrief(content: str) -> ParsedInfobrief:
+    """
+    Zerlegt einen Infobrief in einem Durchlauf über die Zeilen.
+
+    Aufbau: `# Titel` in der ersten Zeile, direkt danach optional der
+    Metadaten-Blockquote (`> **Datum:** ...`) bis zur ersten Leerzeile, eine
+    optionale `---`-Trennlinie, dann der Body. Der Body wird dabei direkt
+    als HTML in einen Puffer geschrieben: Need-to-know/Nice-to-know-Sektionen,
+    Listen (Save-the-date hervorgehoben), Überschriften `##`-`######` und
+    Absätze mit Inline-Markdown.
+    """
+    title = ""
+    metadata: Dict[str, str] = {}
+    out = io.StringIO()
+    write = out.write
+
+    state = 'title'         # title -> meta -> separator -> body
+    in_meta = False
+    body_start = len(content)
+    offset = 0
+    section = None
+    in_list = False
+    pending_blank = 0
+
+    for line in content.split('\n'):
+        line_start = offset
+        offset += len(line) + 1
+        line = line.rstrip()
+
+        if state == 'title':
+            state = 'meta'
+            title_match = _TITLE.match(line)
+            if title_match:
+                title = title_match.group(1).strip()
+                continue
+
+        if state == 'meta':
+            if line.lstrip().startswith('>'):
+                in_meta = True
+                meta_line = line.lstrip('> ').strip()
+                for prefix, key in _META_FIELDS:
+                    if meta_line.startswith(prefix):
+                        metadata[key] = meta_line[len(prefix):].strip()
+                        break
+                continue
+            if not line:
+                if in_meta:
+                    state = 'separator'
+                continue
+            if in_meta:
+                continue        # andere Zeilen im Metadaten-Block
+            state = 'separator'
+
+        if state == 'separator':
+            if not line:
+                continue
+            state = 'body'
+            body_start = line_start
+            if line.strip() == '---':
+                body_start = offset
+                continue
+
+        # Body
+        if not line:
+            if in_list:
+                write('</ul>\n')
+                in_list = False
+            if out.tell():
+                pending_blank += 1      # Leerzeilen am Anfang und Ende entfallen
+            continue
+        if pending_blank:
+            write('\n' * pending_blank)
+            pending_blank = 0
+
+        block = _BLOCK.match(line)
+        if block and block.group('item') is not None:
+            if not in_list:
+                write('<ul>\n')
+                in_list = True
+            item_text = block.group('item')
+            if 'save-the-date' in item_text.lower():
+                write('<li class="save-the-date">')
+            else:
+                write('<li>')
+            render_inline(item_text, write)
+            write('</li>\n')
+            continue
+
+        if in_list:
+            write('</ul>\n')
+            in_list = False
+
+        if block and block.group('section') is not None:
+            if section:
+                write('</div>\n')
+            section = _SECTIONS[block.group('section').lower()]
+            write(f'<div class="{section[0]}">\n<h3>{section[1]}</h3>\n')
+            rest = block.group('rest').strip()
+            if rest:
+                write('<p>')
+                render_inline(rest, write)
+                write('</p>\n')
+        elif block:
+            level = len(block.group('level'))
+            write(f'<h{level}>{html.escape(block.group("heading"))}</h{level}>\n')
+        else:
+            write('<p>')
+            render_inline(line, write)
+            write('</p>\n')
+
+    # Schließe offene Sektionen
+    if in_list:
+        write('</ul>\n')
+    if section:
+        write('</div>\n')
+
+    return ParsedInfobrief(title=title, metadata=metadata, body=content[body_start:].strip(),
+                           body_html=out.getvalue()[:-1])
+
 
 class InfobriefFormatter:
     """Formatiert BS:WI Infobriefe im Corporate Design"""
@@ -37,141 +273,41 @@ class InfobriefFormatter:
         self._parse()
 
     def _parse(self):
-        """Extrahiere Titel, Metadaten und Body"""
-        lines = self.content.split('\n')
-
-        # Titel extrahieren (erste Zeile mit #)
-        title_match = re.match(r'^#\s+(.+)$', lines[0])
-        if title_match:
-            self.title = title_match.group(1).strip()
-
-        # Metadaten aus Blockquote extrahieren
-        metadata_section = []
-        in_metadata = False
-        content_start = 0
-
-        for i, line in enumerate(lines):
-            if line.strip().startswith('>'):
-                in_metadata = True
-                metadata_section.append(line.lstrip('> ').strip())
-            elif in_metadata and line.strip() == '':
-                content_start = i + 1
-                break
-
-        # Parse Metadaten
-        for meta_line in metadata_section:
-            if meta_line.startswith('**Datum:**'):
-                self.metadata['datum'] = meta_line.replace('**Datum:**', '').strip()
-            elif meta_line.startswith('**Von:**'):
-                self.metadata['von'] = meta_line.replace('**Von:**', '').strip()
-            elif meta_line.startswith('**Teams-Link:**'):
-                self.metadata['teams_link'] = meta_line.replace('**Teams-Link:**', '').strip()
-
-        # Body extrahieren (nach Metadaten und ----)
-        body_lines = lines[content_start:]
-        # Überspringe --- Trennlinie
-        if body_lines and body_lines[0].strip() == '---':
-            body_lines = body_lines[1:]
-
-        self.body = '\n'.join(body_lines).strip()
+        """Extrahiere Titel, Metadaten und Body (ein Durchlauf, siehe parse_infobrief)"""
+        parsed = parse_infobrief(self.content)
+        self.title = parsed.title
+        self.metadata = parsed.metadata
+        self.body = parsed.body
+        self.body_html = parsed.body_html
 
     def _process_body(self) -> str:
-        """Verarbeite Body und füge CSS-Klassen hinzu"""
-        lines = self.body.split('\n')
-        processed = []
-        in_need_to_know = False
-        in_nice_to_know = False
-        in_list = False
-
-        for line in lines:
-            # Erkenne Sektionen
-            if re.match(r'^Need-to-know:', line, re.IGNORECASE):
-                if in_need_to_know or in_nice_to_know:
-                    processed.append('</div>')
-                processed.append('<div class="section-needtoknow">')
-                processed.append('<h3>Need-to-know</h3>')
-                in_need_to_know = True
-                in_nice_to_know = False
-                continue
-
-            elif re.match(r'^Nice-to-know:', line, re.IGNORECASE):
-                if in_need_to_know or in_nice_to_know:
-                    processed.append('</div>')
-                processed.append('<div class="section-nicetoknow">')
-                processed.append('<h3>Nice-to-know</h3>')
-                in_nice_to_know = True
-                in_need_to_know = False
-                continue
-
-            # Erkenne Listen
-            if re.match(r'^[-*]\s', line):
-                if not in_list:
-                    processed.append('<ul>')
-                    in_list = True
-                # Extrahiere List-Item Text
-                item_text = re.sub(r'^[-*]\s', '', line)
-                # Highlight "Save-the-date"
-                if 'save-the-date' in item_text.lower():
-                    processed.append(f'<li class="save-the-date">{self._markdown_inline(item_text)}</li>')
-                else:
-                    processed.append(f'<li>{self._markdown_inline(item_text)}</li>')
-                continue
-            else:
-                if in_list:
-                    processed.append('</ul>')
-                    in_list = False
-
-            # Normale Zeilen
-            if line.strip():
-                # Überschriften
-                heading_match = re.match(r'^(#{2,6})\s+(.+)$', line)
-                if heading_match:
-                    level = len(heading_match.group(1))
-                    text = heading_match.group(2)
-                    processed.append(f'<h{level}>{html.escape(text)}</h{level}>')
-                else:
-                    # Paragraphen
-                    processed.append(f'<p>{self._markdown_inline(line)}</p>')
-            else:
-                if not in_list:
-                    processed.append('')
-
-        # Schließe offene Sektionen
-        if in_list:
-            processed.append('</ul>')
-        if in_need_to_know or in_nice_to_know:
-            processed.append('</div>')
-
-        return '\n'.join(processed)
+        """Body als HTML mit CSS-Klassen (beim Parsen erzeugt)"""
+        return self.body_html
 
     def _markdown_inline(self, text: str) -> str:
-        """Verarbeite Inline-Markdown (Bold, Italic, Links)"""
-        # Bold
-        text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
-        # Italic
-        text = re.sub(r'\*(.+?)\*', r'<em>\1</em>', text)
-        # Links
-        text = re.sub(r'\[(.+?)\]\((.+?)\)', r'<a href="\2">\1</a>', text)
-        # Escape remaining HTML
-        # text = html.escape(text)
-        return text
-
-    def generate_html(self, include_footer: bool = True) -> str:
-        """Generiere komplettes HTML-Dokument"""
-
-        # Lade CSS
-        css_path = Path(__file__).parent.parent / 'templates' / 'style.css'
-        css_content = ""
-        if css_path.exists():
-            css_content = css_path.read_text(encoding='utf-8')
-
-        # Logo als Base64 für PDF-Kompatibilität
-        logo_path = Path(__file__).parent.parent / 'templates' / 'Logo_BSWI_Quer_RGB.png'
-        logo_data_uri = None
-        if logo_path.exists():
-            with open(logo_path, 'rb') as logo_file:
-                logo_base64 = base64.b64encode(logo_file.read()).decode('utf-8')
-                logo_data_uri = f'data:image/png;base64,{logo_base64}'
+        """Verarbeite Inline-Markdown (Bold, Italic, Links) mit HTML-Escaping"""
+        out = io.StringIO()
+        render_inline(text, out.write)
+        return out.getvalue()
+
+    def generate_html(self, include_footer: bool = True, inline_css: bool = True) -> str:
+        """
+        Generiere komplettes HTML-Dokument.
+
+        Args:
+            inline_css: style.css als <style> einbetten (False für PDF - dort
+                kommt das Stylesheet geparst aus dem PdfRenderer)
+        """
+        out = io.StringIO()
+        _write_head(out, f'{html.escape(self.title)} - BS:WI Hamburg', inline_css)
+        out.write('<body>\n')
+        self.write_container(out, include_footer)
+        out.write('</body>\n</html>\n')
+        return out.getvalue()
+
+    def write_container(self, out, include_footer: bool = True):
+        """Schreibt den Inhalt (<div class="container">) in einen Puffer"""
+        logo_data_uri = ASSETS.data_uri(LOGO_PATH)
 
         # Datum formatieren
         datum = self.metadata.get('datum', '')
@@ -211,19 +347,7 @@ class InfobriefFormatter:
 </div>
 '''
 
-        # Komplettes HTML
-        html_doc = f'''<!DOCTYPE html>
-<html lang="de">
-<head>
-  <meta charset="UTF-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>{html.escape(self.title)} - BS:WI Hamburg</title>
-  <style>
-{css_content}
-  </style>
-</head>
-<body>
-  <div class="container">
+        out.write(f'''  <div class="container">
     <div class="header">
       <div class="header-logo">
         {logo_html}
@@ -242,11 +366,7 @@ class InfobriefFormatter:
 
     {footer_html}
   </div>
-</body>
-</html>
-'''
-
-        return html_doc
+''')
 
     def save_html(self, output_path: Optional[Path] = None) -> Path:
         """Speichere HTML-Datei"""
@@ -260,44 +380,224 @@ class InfobriefFormatter:
 
     def save_pdf(self, output_path: Optional[Path] = None) -> Path:
         """Speichere als PDF (benötigt weasyprint)"""
-        try:
-            from weasyprint import HTML
-        except ImportError:
-            print("FEHLER: weasyprint nicht installiert. Installiere mit: pip install weasyprint", file=sys.stderr)
-            sys.exit(1)
+        renderer = _require_pdf_renderer()
 
         if output_path is None:
             output_path = self.input_file.with_suffix('.pdf')
 
-        html_content = self.generate_html()
-        HTML(string=html_content).write_pdf(output_path)
+        return renderer.write_pdf(self.generate_html(inline_css=False), output_path)
+
 
+def _write_head(out, title: str, inline_css: bool):
+    """DOCTYPE und <head> (title bereits escaped)"""
+    out.write(f'''<!DOCTYPE html>
+<html lang="de">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>{title}</title>
+''')
+    if inline_css:
+        out.write(f'''  <style>
+{ASSETS.text(CSS_PATH) or ""}
+  </style>
+''')
+    out.write('</head>\n')
+
+
+def generate_archive_html(formatters: List[InfobriefFormatter], include_footer: bool = True,
+                          inline_css: bool = True) -> str:
+    """
+    Ein HTML-Dokument mit allen Infobriefen (je ein <section class="archiv-eintrag">,
+    im Druck jeweils ab einer neuen Seite).
+    """
+    out = io.StringIO()
+    _write_head(out, 'Infobrief-Archiv - BS:WI Hamburg', inline_css)
+    out.write('<body>\n')
+    for formatter in formatters:
+        out.write('<section class="archiv-eintrag">\n')
+        formatter.write_container(out, include_footer)
+        out.write('</section>\n')
+    out.write('</body>\n</html>\n')
+    return out.getvalue()
+
+
+class PdfRenderer:
+    """
+    Gemeinsamer weasyprint-Kontext: eine FontConfiguration und das einmal
+    geparste Stylesheet für alle PDFs des Prozesses, statt CSS und Fonts
+    pro Dokument neu zu laden.
+    """
+
+    def __init__(self):
+        from weasyprint import CSS, HTML
+        try:
+            from weasyprint.text.fonts import FontConfiguration
+        except ImportError:         # weasyprint < 53
+            from weasyprint.fonts import FontConfiguration
+        self._html_class = HTML
+        self._css_class = CSS
+        self.font_config = FontConfiguration()
+        self._css_source = None
+        self._stylesheet = None
+        self._lock = threading.Lock()
+
+    def stylesheet(self):
+        """style.css als weasyprint.CSS (neu geparst nur nach Änderungen)"""
+        css_content = ASSETS.text(CSS_PATH) or ""
+        with self._lock:
+            if self._stylesheet is None or css_content != self._css_source:
+                self._stylesheet = self._css_class(string=css_content, font_config=self.font_config)
+                self._css_source = css_content
+            return self._stylesheet
+
+    def write_pdf(self, html_content: str, output_path: Path) -> Path:
+        """Rendert HTML (ohne eingebettetes CSS) als PDF"""
+        document = self._html_class(string=html_content)
+        document.write_pdf(output_path, stylesheets=[self.stylesheet()], font_config=self.font_config)
         return output_path
 
 
-def process_batch(input_dir: Path, output_format: str = 'html'):
-    """Verarbeite alle Markdown-Dateien in einem Verzeichnis"""
-    md_files = list(input_dir.glob('*.md'))
+_PDF_RENDERER: Optional[PdfRenderer] = None
+
+
+def pdf_renderer() -> PdfRenderer:
+    """Prozessweiter PdfRenderer (ImportError ohne weasyprint)"""
+    global _PDF_RENDERER
+    if _PDF_RENDERER is None:
+        _PDF_RENDERER = PdfRenderer()
+    return _PDF_RENDERER
+
+
+def _require_pdf_renderer() -> PdfRenderer:
+    """pdf_renderer() oder Abbruch mit Installationshinweis"""
+    try:
+        return pdf_renderer()
+    except ImportError:
+        print("FEHLER: weasyprint nicht installiert. Installiere mit: pip install weasyprint", file=sys.stderr)
+        sys.exit(1)
+
+
+def save_archive_pdf(md_files: List[Path], output_path: Path, include_footer: bool = True) -> Path:
+    """
+    Alle Infobriefe in einem Archiv-PDF: ein Dokument, ein Render-Durchlauf
+    mit gemeinsamem Stylesheet - statt N PDFs und anschließendem Zusammenfügen.
+    Jeder Infobrief beginnt auf einer neuen Seite; die Titel (h1) erscheinen
+    als Lesezeichen.
+    """
+    renderer = _require_pdf_renderer()
+    formatters = [InfobriefFormatter(md_file) for md_file in md_files]
+    archive_html = generate_archive_html(formatters, include_footer, inline_css=False)
+    return renderer.write_pdf(archive_html, Path(output_path))
+
+
+@dataclass
+class BatchResult:
+    """Ergebnis von process_batch"""
+    converted: List[Path] = field(default_factory=list)
+    skipped: List[Path] = field(default_factory=list)
+    failed: List[Path] = field(default_factory=list)
+
+
+def _convert_file(md_file: Path, output_format: str) -> Tuple[Optional[Path], Optional[str]]:
+    """Konvertiert eine Datei (auch im Worker-Prozess): (Ausgabe, Fehlertext)"""
+    try:
+        formatter = InfobriefFormatter(md_file)
+        if output_format == 'pdf':
+            return formatter.save_pdf(), None
+        return formatter.save_html(), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _templates_mtime() -> float:
+    """Letzte Änderung an den Template-Dateien (CSS, Logo)"""
+    return max((p.stat().st_mtime for p in (CSS_PATH, LOGO_PATH) if p.exists()), default=0)
+
+
+def _is_up_to_date(md_file: Path, output_format: str, templates_mtime: float) -> bool:
+    """Ausgabe existiert und ist neuer als Markdown-Quelle und Templates"""
+    try:
+        output_mtime = md_file.with_suffix(f'.{output_format}').stat().st_mtime
+    except FileNotFoundError:
+        return False
+    return output_mtime >= max(md_file.stat().st_mtime, templates_mtime)
+
+
+def _archive_up_to_date(md_files: List[Path], archive: Path) -> bool:
+    """Archiv existiert und ist neuer als alle Quellen und Templates"""
+    try:
+        archive_mtime = archive.stat().st_mtime
+    except FileNotFoundError:
+        return False
+    sources = max(md_file.stat().st_mtime for md_file in md_files)
+    return archive_mtime >= max(sources, _templates_mtime())
+
+
+def process_batch(input_dir: Path, output_format: str = 'html', jobs: int = 1,
+                  incremental: bool = False) -> BatchResult:
+    """
+    Verarbeite alle Markdown-Dateien in einem Verzeichnis.
+
+    Args:
+        jobs: Anzahl Worker-Prozesse (1 = sequentiell, 0 = alle CPUs) -
+            lohnt sich vor allem für PDF, weasyprint ist CPU-lastig
+        incremental: Dateien überspringen, deren Ausgabe neuer ist als die
+            Markdown-Quelle und die Template-Dateien
+    """
+    md_files = sorted(input_dir.glob('*.md'))
+    result = BatchResult()
 
     if not md_files:
         print(f"Keine Markdown-Dateien in {input_dir} gefunden.", file=sys.stderr)
-        return
+        return result
 
-    print(f"Verarbeite {len(md_files)} Dateien...")
-
-    for md_file in md_files:
+    if output_format == 'pdf':
         try:
-            formatter = InfobriefFormatter(md_file)
-
-            if output_format == 'html':
-                output = formatter.save_html()
-                print(f"✓ {md_file.name} → {output.name}")
-            elif output_format == 'pdf':
-                output = formatter.save_pdf()
-                print(f"✓ {md_file.name} → {output.name}")
+            import weasyprint  # noqa: F401 - einmal prüfen statt pro Datei/Prozess
+        except ImportError:
+            print("FEHLER: weasyprint nicht installiert. Installiere mit: pip install weasyprint", file=sys.stderr)
+            sys.exit(1)
 
-        except Exception as e:
-            print(f"✗ {md_file.name}: {e}", file=sys.stderr)
+    if incremental:
+        templates_mtime = _templates_mtime()
+        todo = []
+        for md_file in md_files:
+            if _is_up_to_date(md_file, output_format, templates_mtime):
+                result.skipped.append(md_file)
+            else:
+                todo.append(md_file)
+    else:
+        todo = md_files
+
+    jobs = jobs or os.cpu_count() or 1
+    print(f"Verarbeite {len(todo)} Dateien"
+          + (f" ({len(result.skipped)} unverändert übersprungen)" if result.skipped else "")
+          + (f" mit {jobs} Prozessen" if jobs > 1 and len(todo) > 1 else "") + "...")
+
+    if jobs > 1 and len(todo) > 1:
+        workers = min(jobs, len(todo))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Mehrere Dateien pro Auftrag: bei HTML ist die Konvertierung
+            # kürzer als der Versand an den Worker-Prozess
+            outcomes = executor.map(_convert_file, todo, [output_format] * len(todo),
+                                    chunksize=max(1, len(todo) // (workers * 4)))
+            for md_file, (output, error) in zip(todo, outcomes):
+                _report(result, md_file, output, error)
+    else:
+        for md_file in todo:
+            _report(result, md_file, *_convert_file(md_file, output_format))
+
+    return result
+
+
+def _report(result: BatchResult, md_file: Path, output: Optional[Path], error: Optional[str]):
+    if error is None:
+        result.converted.append(md_file)
+        print(f"✓ {md_file.name} → {output.name}")
+    else:
+        result.failed.append(md_file)
+        print(f"✗ {md_file.name}: {error}", file=sys.stderr)
 
 
 def main():
@@ -309,6 +609,12 @@ def main():
     parser.add_argument('--batch', action='store_true', help='Verarbeite alle .md Dateien im Verzeichnis')
     parser.add_argument('--preview', action='store_true', help='Öffne Ausgabe im Browser')
     parser.add_argument('--no-footer', action='store_true', help='Ohne Footer')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Batch: parallele Prozesse (default: 1, 0 = alle CPUs)')
+    parser.add_argument('--incremental', '-i', action='store_true',
+                        help='Batch: nur Dateien neu erzeugen, deren Ausgabe älter ist als Quelle/Templates')
+    parser.add_argument('--archive', metavar='PDF',
+                        help='Alle .md Dateien des Verzeichnisses in ein Archiv-PDF (ein Render-Durchlauf)')
 
     args = parser.parse_args()
 
@@ -319,12 +625,30 @@ def main():
         sys.exit(1)
 
     try:
+        # Archiv-PDF
+        if args.archive:
+            if not input_path.is_dir():
+                print("FEHLER: --archive benötigt ein Verzeichnis.", file=sys.stderr)
+                sys.exit(1)
+            md_files = sorted(input_path.glob('*.md'))
+            if not md_files:
+                print(f"Keine .md Dateien in {input_path} gefunden.")
+                return
+            archive = Path(args.archive)
+            if args.incremental and _archive_up_to_date(md_files, archive):
+                print(f"⏭ Überspringe (aktuell): {archive}")
+                return
+            output = save_archive_pdf(md_files, archive, include_footer=not args.no_footer)
+            print(f"✓ Archiv-PDF erstellt: {output} ({len(md_files)} Infobriefe)")
+
         # Batch-Modus
-        if args.batch or input_path.is_dir():
+        elif args.batch or input_path.is_dir():
             if not input_path.is_dir():
                 print("FEHLER: --batch benötigt ein Verzeichnis.", file=sys.stderr)
                 sys.exit(1)
-            process_batch(input_path, args.output)
+            result = process_batch(input_path, args.output, jobs=args.jobs, incremental=args.incremental)
+            if result.failed:
+                sys.exit(1)
 
         # Einzeldatei
         else:
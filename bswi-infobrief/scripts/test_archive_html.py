@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test: generate_archive_html (ein Dokument für das Archiv-PDF)
+
+Testet ob:
+1. Das Archiv genau ein DOCTYPE, <head>, <body> und </html> hat
+2. Jeder Infobrief genau ein <section class="archiv-eintrag"> ergibt - in der
+   Reihenfolge der Formatter und mit demselben Inhalt wie generate_html()
+3. inline_css das Stylesheet einmal einbettet bzw. weglässt und style.css
+   den Seitenumbruch zwischen den Einträgen enthält
+4. include_footer den Footer in jedem bzw. keinem Eintrag erzeugt
+5. Titel und Metadaten in den Einträgen escaped werden
+"""
+
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+# Pfade einrichten
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+
+from format_infobrief import ASSETS, CSS_PATH, InfobriefFormatter, generate_archive_html
+
+failures = []
+
+
+def check(label: str, ok: bool):
+    print(f"  [{'OK' if ok else 'FEHLER'}] {label}")
+    if not ok:
+        failures.append(label)
+
+
+BRIEFE = [
+    ("2025-11-infobrief.md", "Infobrief November", "01.11.2025", "Text November"),
+    ("2025-12-infobrief.md", "Infobrief <Dezember> & Jahresende", "01.12.2025 <morgens>", "Text Dezember"),
+    ("2025-10-infobrief.md", "Infobrief Oktober", "01.10.2025", "Text Oktober"),
+]
+
+
+def sections(document: str) -> list:
+    return re.findall(r'<section class="archiv-eintrag">\n(.*?)</section>\n', document, re.S)
+
+
+def body_of(document: str) -> str:
+    """Inhalt zwischen <body> und </body> eines Einzeldokuments"""
+    return document.split('<body>\n', 1)[1].rsplit('</body>', 1)[0]
+
+
+print("=" * 60)
+print("Test: generate_archive_html (format_infobrief)")
+print("=" * 60)
+
+with tempfile.TemporaryDirectory() as tmp:
+    formatters = []
+    for name, title, datum, text in BRIEFE:
+        source = Path(tmp) / name
+        source.write_text(f"# {title}\n\n> **Datum:** {datum}\n\n---\n\n{text}\n", encoding='utf-8')
+        formatters.append(InfobriefFormatter(source))
+
+    archive = generate_archive_html(formatters)
+
+    print("\n1. Ein Dokument:")
+    for tag in ('<!DOCTYPE html>', '<head>', '</head>', '<body>', '</body>', '</html>'):
+        check(f"{tag} genau einmal", archive.count(tag) == 1)
+    check("Archiv-Titel", '<title>Infobrief-Archiv - BS:WI Hamburg</title>' in archive)
+    check("Einträge im <body>", archive.index('<body>') < archive.index('<section')
+          and archive.rindex('</section>') < archive.index('</body>'))
+
+    print("\n2. Einträge:")
+    entries = sections(archive)
+    check(f"{len(entries)} Einträge für {len(formatters)} Infobriefe",
+          len(entries) == len(formatters) == archive.count('<section') == archive.count('</section>'))
+    order = [text for entry in entries for _, _, _, text in BRIEFE if text in entry]
+    check("Reihenfolge der Formatter (nicht nach Dateiname)", order == [text for *_, text in BRIEFE])
+    check("je ein Container und eine h1 pro Eintrag",
+          all(entry.count('<div class="container">') == entry.count('<h1>') == 1 for entry in entries))
+    check("Inhalt wie generate_html()",
+          entries == [body_of(formatter.generate_html()) for formatter in formatters])
+    empty = generate_archive_html([])
+    check("leere Liste: Dokument ohne Einträge", '<section' not in empty and empty.endswith('</html>\n'))
+
+    print("\n3. Stylesheet:")
+    css = ASSETS.text(CSS_PATH) or ""
+    check("inline_css=True: einmal eingebettet", archive.count('<style>') == 1 and css in archive)
+    external = generate_archive_html(formatters, inline_css=False)
+    check("inline_css=False: kein <style>", '<style>' not in external)
+    check("inline_css=False: Einträge unverändert", sections(external) == entries)
+    check("Seitenumbruch zwischen Einträgen in style.css",
+          re.search(r'\.archiv-eintrag \+ \.archiv-eintrag \{\s*page-break-before: always;', css) is not None)
+
+    print("\n4. Footer:")
+    check("include_footer=True: Footer in jedem Eintrag",
+          all(entry.count('<div class="footer">') == 1 for entry in entries))
+    no_footer = sections(generate_archive_html(formatters, include_footer=False))
+    check("include_footer=False: kein Footer", len(no_footer) == len(formatters)
+          and not any('<div class="footer">' in entry for entry in no_footer))
+    check("include_footer=False: Inhalt wie generate_html()",
+          no_footer == [body_of(formatter.generate_html(include_footer=False)) for formatter in formatters])
+
+    print("\n5. Escaping:")
+    december = entries[1]
+    check("Titel escaped", '<h1>Infobrief &lt;Dezember&gt; &amp; Jahresende <span' in december)
+    check("Metadaten escaped", '01.12.2025 &lt;morgens&gt;' in december)
+    check("kein rohes Markup", '<Dezember>' not in archive and '<morgens>' not in archive)
+
+print("\n" + "=" * 60)
+if failures:
+    print("Test fehlgeschlagen:")
+    for failure in failures:
+        print(f"  - {failure}")
+    sys.exit(1)
+print("Test abgeschlossen!")
+print("=" * 60)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test: AssetCache (CSS und Logo im Batch)
+
+Testet ob:
+1. Eine unveränderte Datei nur einmal gelesen wird (Treffer danach)
+2. Eine Änderung an mtime oder Größe den Eintrag neu lädt - auch bei
+   gleicher Größe bzw. gleicher mtime
+3. Text und Data-URI derselben Datei getrennt gecacht werden und fehlende
+   Dateien None liefern, bis sie angelegt sind
+4. generate_html() ein geändertes Stylesheet im laufenden Prozess übernimmt
+"""
+
+import base64
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Pfade einrichten
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+
+import format_infobrief
+from format_infobrief import AssetCache, InfobriefFormatter
+
+failures = []
+
+
+def check(label: str, ok: bool):
+    print(f"  [{'OK' if ok else 'FEHLER'}] {label}")
+    if not ok:
+        failures.append(label)
+
+
+def rewrite(path: Path, data: bytes, mtime_ns: int):
+    """Datei neu schreiben und mtime explizit setzen (Dateisystem-Auflösung egal)"""
+    path.write_bytes(data)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+print("=" * 60)
+print("Test: AssetCache (format_infobrief)")
+print("=" * 60)
+
+with tempfile.TemporaryDirectory() as tmp:
+    css = Path(tmp) / 'style.css'
+    t0 = 1_700_000_000 * 10 ** 9
+    rewrite(css, b'body { color: red; }', t0)
+
+    print("\n1. Unveränderte Datei:")
+    cache = AssetCache()
+    first = cache.text(css)
+    second = cache.text(str(css))
+    check("Inhalt gelesen", first == 'body { color: red; }')
+    check(f"einmal gelesen ({cache.misses} Fehlzugriff, {cache.hits} Treffer)",
+          (cache.misses, cache.hits) == (1, 1) and second is first)
+
+    print("\n2. Invalidierung:")
+    rewrite(css, b'body { color: tan; }', t0 + 1_000_000)
+    check("gleiche Größe, neue mtime -> neu geladen", cache.text(css) == 'body { color: tan; }')
+    rewrite(css, b'body { color: green; }', t0 + 1_000_000)
+    check("gleiche mtime, neue Größe -> neu geladen", cache.text(css) == 'body { color: green; }')
+    check(f"{cache.misses} Fehlzugriffe", cache.misses == 3)
+    cache.text(css)
+    check("danach wieder Treffer", cache.misses == 3 and cache.hits == 2)
+    cache.clear()
+    check("clear() setzt zurück", (cache.misses, cache.hits) == (0, 0) and cache.text(css) is not None
+          and cache.misses == 1)
+
+    print("\n3. Data-URI und fehlende Dateien:")
+    logo = Path(tmp) / 'logo.png'
+    check("fehlende Datei -> None", cache.data_uri(logo) is None and cache.text(logo) is None)
+    rewrite(logo, b'\x89PNG-alt', t0)
+    uri = cache.data_uri(logo)
+    check("nach Anlegen geladen", uri == 'data:image/png;base64,' + base64.b64encode(b'\x89PNG-alt').decode())
+    rewrite(logo, b'\x89PNG-neu', t0 + 1_000_000)
+    check("Data-URI nach Änderung neu kodiert",
+          cache.data_uri(logo) == 'data:image/png;base64,' + base64.b64encode(b'\x89PNG-neu').decode())
+    check("Text und Data-URI getrennt", cache.text(css) != cache.data_uri(css)
+          and cache.data_uri(css).startswith('data:image/png;base64,'))
+    check("MIME-Typ Teil des Schlüssels",
+          cache.data_uri(logo, 'image/svg+xml').startswith('data:image/svg+xml;base64,'))
+
+    print("\n4. generate_html im laufenden Prozess:")
+    brief = Path(tmp) / 'infobrief.md'
+    brief.write_text("# Infobrief\n\n> **Datum:** 01.12.2025\n\n---\n\nText\n", encoding='utf-8')
+    original = format_infobrief.CSS_PATH
+    format_infobrief.CSS_PATH = css
+    try:
+        formatter = InfobriefFormatter(brief)
+        before = formatter.generate_html()
+        rewrite(css, b'.metadata { color: navy; }', t0 + 2_000_000)
+        after = formatter.generate_html()
+    finally:
+        format_infobrief.CSS_PATH = original
+    check("altes Stylesheet eingebettet", 'color: green' in before)
+    check("geändertes Stylesheet ohne Neustart übernommen",
+          'color: navy' in after and 'color: green' not in after)
+
+print("\n" + "=" * 60)
+if failures:
+    print("Test fehlgeschlagen:")
+    for failure in failures:
+        print(f"  - {failure}")
+    sys.exit(1)
+print("Test abgeschlossen!")
+print("=" * 60)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test: parse_infobrief (Tokenizer in einem Durchlauf)
+
+Testet ob:
+1. Roh eingegebenes <, > und & in Absätzen, Listen, Sektionen, Überschriften
+   und Auszeichnungen escaped wird, URLs zusätzlich für Attribute
+2. Titel, Metadaten-Blockquote und Body korrekt getrennt werden - mit und
+   ohne ---, ohne Metadaten, ohne Titel
+3. Sektionen, Listen und Überschriften richtig geöffnet und geschlossen werden
+4. generate_html() Titel und Metadaten ebenfalls escaped
+"""
+
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+# Pfade einrichten
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+
+from format_infobrief import InfobriefFormatter, parse_infobrief
+
+failures = []
+
+
+def check(label: str, ok: bool):
+    print(f"  [{'OK' if ok else 'FEHLER'}] {label}")
+    if not ok:
+        failures.append(label)
+
+
+DOC = """# Infobrief <12> & mehr
+
+> **Datum:** 01.12.2025 <morgens>
+> **Von:** Schulleitung & Team
+> Sonstiges im Blockquote
+> **Teams-Link:** https://teams.example/x?a=1&b="2"
+
+---
+
+Absatz mit <script>alert(1)</script> & **fett <b>** und *kursiv*.
+
+Need-to-know: Sofort <wichtig>
+
+- Save-the-date: 5 < 6 & [Link "x"](https://a.example/?q=1&r="2")
+- normal **A & B**
+
+## Termine <2026>
+
+Nice-to-know:
+
+- Ende
+"""
+
+print("=" * 60)
+print("Test: parse_infobrief (format_infobrief)")
+print("=" * 60)
+
+parsed = parse_infobrief(DOC)
+body_html = parsed.body_html
+
+print("\n1. Escaping:")
+check("kein rohes Markup aus dem Text", '<script>' not in body_html and '<b>' not in body_html
+      and '<wichtig>' not in body_html and '<2026>' not in body_html)
+check("Absatz", '<p>Absatz mit &lt;script&gt;alert(1)&lt;/script&gt; &amp; '
+                '<strong>fett &lt;b&gt;</strong> und <em>kursiv</em>.</p>' in body_html)
+check("Sektion mit Resttext", '<p>Sofort &lt;wichtig&gt;</p>' in body_html)
+check("Listenpunkt mit Link (href attributsicher)",
+      '<li class="save-the-date">Save-the-date: 5 &lt; 6 &amp; '
+      '<a href="https://a.example/?q=1&amp;r=&quot;2&quot;">Link "x"</a></li>' in body_html)
+check("fett in Liste", '<li>normal <strong>A &amp; B</strong></li>' in body_html)
+check("Überschrift", '<h2>Termine &lt;2026&gt;</h2>' in body_html)
+stray = re.findall(r'&(?!amp;|lt;|gt;|quot;|#x27;)', body_html)
+check(f"jedes & als Entity ({len(stray)} roh)", not stray)
+
+print("\n2. Titel, Metadaten und Body:")
+check(f"Titel roh ({parsed.title!r})", parsed.title == 'Infobrief <12> & mehr')
+check(f"Metadaten roh, andere Blockquote-Zeilen ignoriert ({parsed.metadata})", parsed.metadata == {
+    'datum': '01.12.2025 <morgens>', 'von': 'Schulleitung & Team',
+    'teams_link': 'https://teams.example/x?a=1&b="2"'})
+check("Body beginnt nach ---", parsed.body.startswith('Absatz mit <script>')
+      and parsed.body.endswith('- Ende'))
+check("Metadaten nicht im Body-HTML", 'morgens' not in body_html and 'Sonstiges' not in body_html)
+
+no_separator = parse_infobrief("# T\n> **Datum:** 1\n\nBody direkt\n")
+check("ohne ---: Body nach der Leerzeile",
+      (no_separator.metadata, no_separator.body, no_separator.body_html)
+      == ({'datum': '1'}, 'Body direkt', '<p>Body direkt</p>'))
+no_meta = parse_infobrief("# T\n\nKein Meta\n---\nx")
+check("ohne Metadaten: spätere --- bleibt Text",
+      no_meta.metadata == {} and no_meta.body == 'Kein Meta\n---\nx'
+      and no_meta.body_html == '<p>Kein Meta</p>\n<p>---</p>\n<p>x</p>')
+no_title = parse_infobrief("Ohne Titel\n\nText")
+check("ohne Titel: alles Body", no_title.title == '' and no_title.body == 'Ohne Titel\n\nText')
+
+print("\n3. Struktur:")
+check("Sektionen geschlossen und nicht verschachtelt",
+      body_html.count('<div class="section-') == body_html.count('</div>') == 2
+      and body_html.index('</div>') < body_html.index('<div class="section-nicetoknow">'))
+check("Listen geschlossen", body_html.count('<ul>') == body_html.count('</ul>') == 2)
+check("Save-the-date nur einmal hervorgehoben", body_html.count('save-the-date') == 1)
+check("keine Leerzeilen am Anfang und Ende", body_html == body_html.strip('\n'))
+
+print("\n4. generate_html:")
+with tempfile.TemporaryDirectory() as tmp:
+    source = Path(tmp) / 'infobrief.md'
+    source.write_text(DOC, encoding='utf-8')
+    document = InfobriefFormatter(source).generate_html(inline_css=False)
+check("Titel in <title> und <h1> escaped",
+      '<title>Infobrief &lt;12&gt; &amp; mehr - BS:WI Hamburg</title>' in document
+      and '<h1>Infobrief &lt;12&gt; &amp; mehr <span' in document)
+check("Metadaten escaped", '01.12.2025 &lt;morgens&gt;' in document and 'Schulleitung &amp; Team' in document)
+check("Teams-Link attributsicher", 'href="https://teams.example/x?a=1&amp;b=&quot;2&quot;"' in document)
+check("Body-HTML unverändert eingebettet", body_html in document)
+
+print("\n" + "=" * 60)
+if failures:
+    print("Test fehlgeschlagen:")
+    for failure in failures:
+        print(f"  - {failure}")
+    sys.exit(1)
+print("Test abgeschlossen!")
+print("=" * 60)
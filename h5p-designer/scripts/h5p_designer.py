@@ -3,10 +3,13 @@
 H5P Designer - Analyze, Debug and Optimize H5P Files
 
 Features:
-- Parse H5P files (extract content.json)
-- Analyze design issues (spacing, sizes, readability)
-- Apply fixes (resize, reposition, fix encoding)
-- Repackage to new .h5p file
+- Parse H5P files, package bytes or content dicts (extract content.json)
+- Analyze design issues (spacing, sizes, readability) - at any nesting depth
+  (InteractiveBook, Column, QuestionSet, ...) in a single content-tree pass
+- Apply fixes (resize, reposition, restore umlauts via the generator's
+  lexicon-based UmlautRestorer)
+- Repackage to new .h5p file, or return package bytes in memory
+- Batch mode: audit whole directory trees in a process pool (JSON lines + summary)
 
 Supported Content Types:
 - H5P.DragQuestion (Drag & Drop)
@@ -16,17 +19,32 @@ Supported Content Types:
 - H5P.DialogCards (Flashcards)
 """
 
+import io
 import json
+import bisect
+import heapq
 import zipfile
 import os
+import sys
+import glob
 import shutil
-from pathlib import Path
+import struct
+import tempfile
+import zlib
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any, Tuple
+from pathlib import Path
+from dataclasses import dataclass, field, asdict
+from typing import List, Dict, Optional, Any, Tuple, Union
 import re
 import copy
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "h5p-generator" / "scripts"))
+from umlaut_restorer import UmlautRestorer
+from drag_layout import EM_PX, LayoutConfig, layout_drag_question
+from json_backend import dumps as dumps_json
+
 
 # =============================================================================
 # Data Classes
@@ -75,38 +93,96 @@ class H5PAnalysis:
 # H5P Parser
 # =============================================================================
 
-class H5PParser:
-    """Parse and extract H5P file contents"""
+# Anything the designer can work on: a path, package bytes or a content dict
+H5PSource = Union[str, os.PathLike, bytes, bytearray, memoryview, Dict]
 
-    def __init__(self, h5p_path: str):
-        self.h5p_path = Path(h5p_path)
+
+class H5PParser:
+    """
+    Parse and extract H5P contents.
+
+    Sources:
+    - path to an .h5p file
+    - package bytes (e.g. straight from the generator or an upload)
+    - content dict: plain content.json params (pass h5p_json or at least
+      {'mainLibrary': ...}) or a sub-content node {'library': ..., 'params': ...}
+    """
+
+    def __init__(self, source: H5PSource, h5p_json: Dict = None):
+        self.h5p_path = None
+        self.data = None
         self.h5p_json = None
         self.content_json = None
         self.content_type = None
         self.title = None
         self._images = []
+        self._content_source = None
+
+        if isinstance(source, dict):
+            self._content_source = source
+            self.h5p_json = h5p_json
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            self.data = bytes(source)
+        else:
+            self.h5p_path = Path(source)
+
+    @property
+    def is_package(self) -> bool:
+        """True if the source is a zip package (file or bytes)"""
+        return self._content_source is None
+
+    @property
+    def name(self) -> str:
+        """Label for reports"""
+        if self.h5p_path is not None:
+            return str(self.h5p_path)
+        return '<bytes>' if self.data is not None else '<content>'
+
+    def open_package(self):
+        """Zip source for zipfile.ZipFile: the path or a BytesIO over the package bytes"""
+        if not self.is_package:
+            raise ValueError("Content dict source has no package")
+        return self.h5p_path if self.h5p_path is not None else io.BytesIO(self.data)
 
     def parse(self) -> Tuple[Dict, Dict]:
-        """Extract and parse H5P file contents"""
-        if not self.h5p_path.exists():
-            raise FileNotFoundError(f"H5P file not found: {self.h5p_path}")
+        """Extract and parse H5P contents (once - later calls return the cached result)"""
+        if self.content_json is not None:
+            return self.h5p_json, self.content_json
 
-        with zipfile.ZipFile(self.h5p_path, 'r') as zf:
-            # Read h5p.json
-            with zf.open('h5p.json') as f:
-                self.h5p_json = json.load(f)
-                self.title = self.h5p_json.get('title', 'Unknown')
-                self.content_type = self.h5p_json.get('mainLibrary', 'Unknown')
+        if not self.is_package:
+            self._parse_content_dict()
+        else:
+            if self.h5p_path is not None and not self.h5p_path.exists():
+                raise FileNotFoundError(f"H5P file not found: {self.h5p_path}")
+
+            with zipfile.ZipFile(self.open_package(), 'r') as zf:
+                # Read h5p.json
+                with zf.open('h5p.json') as f:
+                    self.h5p_json = json.load(f)
 
-            # Read content/content.json
-            with zf.open('content/content.json') as f:
-                self.content_json = json.load(f)
+                # Read content/content.json
+                with zf.open('content/content.json') as f:
+                    self.content_json = json.load(f)
 
-            # List images
-            self._images = [n for n in zf.namelist() if n.startswith('content/images/')]
+                # List images
+                self._images = [n for n in zf.namelist() if n.startswith('content/images/')]
 
+        self.title = self.h5p_json.get('title', 'Unknown')
+        self.content_type = self.h5p_json.get('mainLibrary', 'Unknown')
         return self.h5p_json, self.content_json
 
+    def _parse_content_dict(self):
+        """Content dict source: copy it (fixes must not leak into the caller's dict)"""
+        source = self._content_source
+        h5p_json = dict(self.h5p_json or {})
+        if is_content_node(source):
+            # Sub-content node: {'library': 'H5P.DragQuestion 1.14', 'params': {...}}
+            h5p_json.setdefault('mainLibrary', source['library'].split(' ')[0])
+            h5p_json.setdefault('title', source.get('metadata', {}).get('title', 'Unknown'))
+            source = source['params']
+        self.h5p_json = h5p_json
+        self.content_json = copy.deepcopy(source)
+
     def get_content_type(self) -> str:
         """Get the main content type (e.g., 'DragQuestion', 'MultiChoice')"""
         if self.content_type:
@@ -115,6 +191,112 @@ class H5PParser:
         return 'Unknown'
 
 
+# =============================================================================
+# Geometry (spacing / overlap detection)
+# =============================================================================
+
+@dataclass
+class Rect:
+    """Axis-aligned rectangle in percent of the canvas width (both axes)"""
+    x: float
+    y: float
+    width: float
+    height: float
+
+    @property
+    def right(self) -> float:
+        return self.x + self.width
+
+    @property
+    def bottom(self) -> float:
+        return self.y + self.height
+
+
+@dataclass
+class RectConflict:
+    """Two rectangles that overlap or are closer than the minimum gap"""
+    first: int
+    second: int
+    kind: str      # 'overlap', 'horizontal', 'vertical'
+    amount: float  # overlap depth or gap in %
+
+
+def _classify_pair(a: Rect, b: Rect, min_gap: float,
+                   row_tolerance: float = 0.0) -> Optional[Tuple[str, float]]:
+    """
+    Overlap / too-close test for one pair (negative gap = intervals intersect).
+
+    Horizontal neighbours count if their vertical ranges intersect or their
+    top edges differ by less than row_tolerance (same row).
+    """
+    x_gap = max(a.x, b.x) - min(a.right, b.right)
+    y_gap = max(a.y, b.y) - min(a.bottom, b.bottom)
+
+    if x_gap < 0 and y_gap < 0:
+        return 'overlap', min(-x_gap, -y_gap)
+    if 0 < x_gap < min_gap and (y_gap < 0 or abs(a.y - b.y) < row_tolerance):
+        return 'horizontal', x_gap
+    if x_gap < 0 and 0 < y_gap < min_gap:
+        return 'vertical', y_gap
+    return None
+
+
+def find_rect_conflicts(rects: List[Rect], min_gap: float,
+                        row_tolerance: float = 0.0) -> List[RectConflict]:
+    """
+    Find all overlapping or too-close rectangle pairs with a sweep line.
+
+    Rectangles are swept left to right. The active set holds rectangles whose
+    right edge (plus min_gap) reaches the sweep position, kept sorted by top
+    edge so each new rectangle only tests the slice whose vertical range can
+    touch it. Runs in O(n log n + k) for typical layouts instead of O(n^2).
+
+    Args:
+        min_gap: Pairs closer than this (in %) are reported
+        row_tolerance: Also report horizontal neighbours whose top edges differ
+            by less than this, even without vertical overlap (float('inf') =
+            horizontal gap in any row)
+
+    Returns:
+        Conflicts sorted by (first, second) index
+    """
+    if len(rects) < 2:
+        return []
+
+    max_height = max(r.height for r in rects)
+    order = sorted(range(len(rects)), key=lambda i: rects[i].x)
+
+    expiry: List[Tuple[float, int]] = []   # heap of (right edge, index)
+    active: List[Tuple[float, int]] = []   # sorted (top edge, index)
+    conflicts = []
+
+    for idx in order:
+        rect = rects[idx]
+
+        # Drop rectangles that end (plus gap) left of the sweep line
+        while expiry and rect.x - expiry[0][0] >= min_gap:
+            right, old = heapq.heappop(expiry)
+            del active[bisect.bisect_left(active, (rects[old].y, old))]
+
+        # Candidates: tops within reach of the vertical gap or the row tolerance
+        # (+ float slack, the exact test happens in _classify_pair)
+        reach_up = max(max_height + min_gap, row_tolerance)
+        reach_down = max(rect.height + min_gap, row_tolerance)
+        lo = bisect.bisect_left(active, (rect.y - reach_up - 1e-9, -1))
+        hi = bisect.bisect_right(active, (rect.y + reach_down + 1e-9, len(rects)))
+        for _, other in active[lo:hi]:
+            result = _classify_pair(rects[other], rect, min_gap, row_tolerance)
+            if result:
+                first, second = min(idx, other), max(idx, other)
+                conflicts.append(RectConflict(first, second, result[0], round(result[1], 2)))
+
+        heapq.heappush(expiry, (rect.right, idx))
+        bisect.insort(active, (rect.y, idx))
+
+    conflicts.sort(key=lambda c: (c.first, c.second))
+    return conflicts
+
+
 # =============================================================================
 # Design Analyzers
 # =============================================================================
@@ -129,12 +311,17 @@ class BaseAnalyzer:
 class DragQuestionAnalyzer(BaseAnalyzer):
     """Analyzer for H5P.DragQuestion (Drag & Drop)"""
 
-    # Recommended minimums
-    MIN_DRAGGABLE_WIDTH = 12  # %
-    MIN_DRAGGABLE_HEIGHT = 8  # %
-    MIN_DROPZONE_WIDTH = 15   # %
-    MIN_DROPZONE_HEIGHT = 20  # %
-    MIN_SPACING = 3           # % between elements
+    # Recommended minimums, shared with the layout engine (drag_layout.py) so
+    # generated and optimized layouts pass. Sizes in em as stored by
+    # H5P.DragQuestion; spacing in % of the canvas width, on both axes.
+    MIN_DRAGGABLE_WIDTH = LayoutConfig.min_item_width / EM_PX    # em
+    MIN_DRAGGABLE_HEIGHT = LayoutConfig.min_item_height / EM_PX  # em
+    MIN_DROPZONE_WIDTH = LayoutConfig.min_zone_width / EM_PX     # em
+    MIN_DROPZONE_HEIGHT = LayoutConfig.min_zone_height / EM_PX   # em
+    MIN_SPACING = LayoutConfig.min_gap_percent                   # % between elements
+    MIN_DROPZONE_SPACING = LayoutConfig.min_zone_gap_percent     # % between dropzones
+    SAME_ROW_TOLERANCE = 5    # % top-edge difference at which elements share a row
+    DROPZONE_LABEL_HEIGHT = 1.5  # em reserved for the label in the capacity estimate
     MIN_CANVAS_WIDTH = 600
     MIN_CANVAS_HEIGHT = 400
 
@@ -182,7 +369,7 @@ class DragQuestionAnalyzer(BaseAnalyzer):
                 issues.append(DesignIssue(
                     severity='error',
                     category='size',
-                    message=f'Draggable {i+1} width ({elem_width}%) is too small - text may be cut off',
+                    message=f'Draggable {i+1} width ({elem_width}em) is too small - text may be cut off',
                     location=f'question.task.elements[{i}].width',
                     current_value=elem_width,
                     suggested_value=self.MIN_DRAGGABLE_WIDTH,
@@ -193,7 +380,7 @@ class DragQuestionAnalyzer(BaseAnalyzer):
                 issues.append(DesignIssue(
                     severity='error',
                     category='size',
-                    message=f'Draggable {i+1} height ({elem_height}%) is too small - hard to grab',
+                    message=f'Draggable {i+1} height ({elem_height}em) is too small - hard to grab',
                     location=f'question.task.elements[{i}].height',
                     current_value=elem_height,
                     suggested_value=self.MIN_DRAGGABLE_HEIGHT,
@@ -227,7 +414,7 @@ class DragQuestionAnalyzer(BaseAnalyzer):
                 issues.append(DesignIssue(
                     severity='error',
                     category='size',
-                    message=f'Dropzone {i+1} width ({dz_width}%) is too small for dropping items',
+                    message=f'Dropzone {i+1} width ({dz_width}em) is too small for dropping items',
                     location=f'question.task.dropZones[{i}].width',
                     current_value=dz_width,
                     suggested_value=self.MIN_DROPZONE_WIDTH,
@@ -238,7 +425,7 @@ class DragQuestionAnalyzer(BaseAnalyzer):
                 issues.append(DesignIssue(
                     severity='error',
                     category='size',
-                    message=f'Dropzone {i+1} height ({dz_height}%) is too small',
+                    message=f'Dropzone {i+1} height ({dz_height}em) is too small',
                     location=f'question.task.dropZones[{i}].height',
                     current_value=dz_height,
                     suggested_value=self.MIN_DROPZONE_HEIGHT,
@@ -246,12 +433,16 @@ class DragQuestionAnalyzer(BaseAnalyzer):
                 ))
 
             # Check dropzone capacity
-            correct_elements = dz.get('correctElements', [])
+            correct_elements = [int(ref) for ref in dz.get('correctElements', [])
+                                if str(ref).isdigit() and int(ref) < len(elements)]
             expected_items = len(correct_elements)
             if expected_items > 0:
-                # Estimate if dropzone can fit all items
-                estimated_capacity = (dz_height / 10) * (dz_width / 15)
-                if expected_items > estimated_capacity:
+                # Estimate if dropzone can fit all items (autoAlign stacks them
+                # below the label): total item area vs. zone area, in em²
+                needed = sum(elements[ref].get('width', 0) * elements[ref].get('height', 0)
+                             for ref in correct_elements)
+                available = dz_width * max(0, dz_height - self.DROPZONE_LABEL_HEIGHT)
+                if needed > available:
                     issues.append(DesignIssue(
                         severity='warning',
                         category='layout',
@@ -261,118 +452,80 @@ class DragQuestionAnalyzer(BaseAnalyzer):
                         auto_fixable=False
                     ))
 
-        # Check spacing between elements
-        issues.extend(self._check_element_spacing(elements))
-        issues.extend(self._check_dropzone_spacing(dropzones))
+        # Check spacing between elements (on a common percent scale)
+        issues.extend(self._check_element_spacing(self._percent_boxes(elements, width, height)))
+        issues.extend(self._check_dropzone_spacing(self._percent_boxes(dropzones, width, height)))
 
         return issues
 
-    def _check_encoding(self, text: str) -> str:
-        """Check for common encoding issues"""
-        issues = []
-
-        # German umlaut substitutions
-        umlaut_patterns = [
-            ('ae', 'ä'), ('oe', 'ö'), ('ue', 'ü'),
-            ('Ae', 'Ä'), ('Oe', 'Ö'), ('Ue', 'Ü'),
-            ('ss', 'ß')
-        ]
-
-        # Check for likely umlaut substitutions
-        words_with_ae = re.findall(r'\b\w*ae\w*\b', text, re.IGNORECASE)
-        words_with_oe = re.findall(r'\b\w*oe\w*\b', text, re.IGNORECASE)
-        words_with_ue = re.findall(r'\b\w*ue\w*\b', text, re.IGNORECASE)
-
-        # Common German words that should have umlauts
-        known_umlaut_words = {
-            'schaetzt': 'schätzt', 'waehlt': 'wählt', 'faehrt': 'fährt',
-            'laeuft': 'läuft', 'haelt': 'hält', 'traegt': 'trägt',
-            'kundenwuensche': 'Kundenwünsche', 'wuensche': 'Wünsche',
-            'prueft': 'prüft', 'fuehrt': 'führt', 'hoert': 'hört'
-        }
-
-        text_lower = text.lower()
-        for wrong, correct in known_umlaut_words.items():
-            if wrong in text_lower:
-                issues.append(f'"{wrong}" should be "{correct}"')
+    @staticmethod
+    def _percent_boxes(items: List[Dict], width: float, height: float) -> List[Dict]:
+        """
+        Boxes in percent of the canvas width: x is stored in % of the width,
+        y in % of the height, width/height in em (16px at canvas scale).
+        """
+        width = width or LayoutConfig.canvas_width
+        height = height or LayoutConfig.canvas_height
+        em = EM_PX * 100.0 / width
+        return [{
+            'x': item.get('x', 0),
+            'y': item.get('y', 0) * height / width,
+            'width': item.get('width', 0) * em,
+            'height': item.get('height', 0) * em,
+        } for item in items]
 
-        return ', '.join(issues) if issues else ''
+    def _check_encoding(self, text: str) -> str:
+        """Check for ASCII umlaut substitutions (lexicon-verified, compounds included)"""
+        return ', '.join(
+            f'"{wrong}" should be "{correct}"'
+            for wrong, correct in UmlautRestorer.default().find(text)
+        )
 
     def _fix_encoding(self, text: str) -> str:
-        """Fix common encoding issues"""
-        replacements = {
-            'Schaetzt': 'Schätzt', 'schaetzt': 'schätzt',
-            'Waehlt': 'Wählt', 'waehlt': 'wählt',
-            'Faehrt': 'Fährt', 'faehrt': 'fährt',
-            'Laeuft': 'Läuft', 'laeuft': 'läuft',
-            'Haelt': 'Hält', 'haelt': 'hält',
-            'Traegt': 'Trägt', 'traegt': 'trägt',
-            'Kundenwuensche': 'Kundenwünsche', 'kundenwuensche': 'Kundenwünsche',
-            'Wuensche': 'Wünsche', 'wuensche': 'Wünsche',
-            'Prueft': 'Prüft', 'prueft': 'prüft',
-            'Fuehrt': 'Führt', 'fuehrt': 'führt',
-            'Hoert': 'Hört', 'hoert': 'hört',
-            'Aufwaende': 'Aufwände', 'aufwaende': 'Aufwände',
-        }
-
-        result = text
-        for wrong, correct in replacements.items():
-            result = result.replace(wrong, correct)
-        return result
+        """Restore umlauts in known words, leave everything else untouched"""
+        return UmlautRestorer.default().restore(text)
 
     def _check_element_spacing(self, elements: List[Dict]) -> List[DesignIssue]:
-        """Check if elements have enough spacing between them"""
-        issues = []
-
-        for i, elem1 in enumerate(elements):
-            for j, elem2 in enumerate(elements):
-                if i >= j:
-                    continue
-
-                # Check horizontal overlap/proximity
-                x1, w1 = elem1.get('x', 0), elem1.get('width', 0)
-                x2, w2 = elem2.get('x', 0), elem2.get('width', 0)
-                y1, h1 = elem1.get('y', 0), elem1.get('height', 0)
-                y2, h2 = elem2.get('y', 0), elem2.get('height', 0)
-
-                # If on same row (similar y)
-                if abs(y1 - y2) < 5:
-                    gap = x2 - (x1 + w1) if x2 > x1 else x1 - (x2 + w2)
-                    if 0 < gap < self.MIN_SPACING:
-                        issues.append(DesignIssue(
-                            severity='warning',
-                            category='spacing',
-                            message=f'Elements {i+1} and {j+1} are too close ({gap:.1f}%)',
-                            location=f'question.task.elements',
-                            current_value=gap,
-                            suggested_value=self.MIN_SPACING,
-                            auto_fixable=False
-                        ))
-
-        return issues
+        """Check if elements overlap or have too little spacing between them"""
+        return self._spacing_issues(elements, self.MIN_SPACING, 'Elements', 'question.task.elements',
+                                    close_severity='warning', close_word='too close',
+                                    row_tolerance=self.SAME_ROW_TOLERANCE)
 
     def _check_dropzone_spacing(self, dropzones: List[Dict]) -> List[DesignIssue]:
-        """Check spacing between dropzones"""
+        """Check if dropzones overlap or have too little spacing between them"""
+        # Dropzones are checked column-wise in any row (horizontal gap alone)
+        return self._spacing_issues(dropzones, self.MIN_DROPZONE_SPACING, 'Dropzones', 'question.task.dropZones',
+                                    close_severity='warning', close_word='very close',
+                                    row_tolerance=float('inf'))
+
+    def _spacing_issues(self, items: List[Dict], min_gap: float, label: str, location: str,
+                        close_severity: str, close_word: str,
+                        row_tolerance: float = 0.0) -> List[DesignIssue]:
+        """Turn the conflicts of a rectangle set into DesignIssues"""
+        rects = [Rect(i.get('x', 0), i.get('y', 0), i.get('width', 0), i.get('height', 0)) for i in items]
         issues = []
 
-        for i, dz1 in enumerate(dropzones):
-            for j, dz2 in enumerate(dropzones):
-                if i >= j:
-                    continue
-
-                x1, w1 = dz1.get('x', 0), dz1.get('width', 0)
-                x2, w2 = dz2.get('x', 0), dz2.get('width', 0)
-
-                gap = x2 - (x1 + w1) if x2 > x1 else x1 - (x2 + w2)
-                if 0 < gap < 5:
-                    issues.append(DesignIssue(
-                        severity='warning',
-                        category='spacing',
-                        message=f'Dropzones {i+1} and {j+1} are very close ({gap:.1f}%)',
-                        location='question.task.dropZones',
-                        current_value=gap,
-                        auto_fixable=False
-                    ))
+        for conflict in find_rect_conflicts(rects, min_gap, row_tolerance):
+            i, j = conflict.first + 1, conflict.second + 1
+            if conflict.kind == 'overlap':
+                issues.append(DesignIssue(
+                    severity='error',
+                    category='layout',
+                    message=f'{label} {i} and {j} overlap ({conflict.amount:.1f}%)',
+                    location=location,
+                    current_value=conflict.amount,
+                    auto_fixable=False
+                ))
+            else:
+                issues.append(DesignIssue(
+                    severity=close_severity,
+                    category='spacing',
+                    message=f'{label} {i} and {j} are {close_word} ({conflict.amount:.1f}%)',
+                    location=location,
+                    current_value=conflict.amount,
+                    suggested_value=min_gap,
+                    auto_fixable=False
+                ))
 
         return issues
 
@@ -383,9 +536,17 @@ class MultiChoiceAnalyzer(BaseAnalyzer):
     def analyze(self, content: Dict, h5p_meta: Dict) -> List[DesignIssue]:
         issues = []
 
-        questions = content.get('questions', [])
-        for i, q in enumerate(questions):
-            params = q.get('params', {})
+        # Legacy wrapper {'questions': [{'params': ...}]} or plain MultiChoice params.
+        # Wrapper entries with a 'library' are content nodes of their own and
+        # reach the rules through ContentWalker, so they are skipped here.
+        if 'questions' in content:
+            questions = [(i, q.get('params', {}), f'questions[{i}].params.')
+                         for i, q in enumerate(content['questions'])
+                         if not is_content_node(q)]
+        else:
+            questions = [(0, content, '')]
+
+        for i, params, prefix in questions:
             answers = params.get('answers', [])
 
             # Check answer count
@@ -394,7 +555,7 @@ class MultiChoiceAnalyzer(BaseAnalyzer):
                     severity='error',
                     category='content',
                     message=f'Question {i+1} has fewer than 2 answers',
-                    location=f'questions[{i}].params.answers',
+                    location=f'{prefix}answers',
                     auto_fixable=False
                 ))
 
@@ -403,7 +564,7 @@ class MultiChoiceAnalyzer(BaseAnalyzer):
                     severity='warning',
                     category='usability',
                     message=f'Question {i+1} has many answers ({len(answers)}) - consider reducing',
-                    location=f'questions[{i}].params.answers',
+                    location=f'{prefix}answers',
                     auto_fixable=False
                 ))
 
@@ -414,13 +575,348 @@ class MultiChoiceAnalyzer(BaseAnalyzer):
                     severity='error',
                     category='content',
                     message=f'Question {i+1} has no correct answer marked',
-                    location=f'questions[{i}].params.answers',
+                    location=f'{prefix}answers',
                     auto_fixable=False
                 ))
 
         return issues
 
 
+# =============================================================================
+# Zip Rewriting
+# =============================================================================
+
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+# Zip records as specified in PKWARE's APPNOTE.TXT (4.3.7, 4.3.12, 4.3.16)
+_LOCAL_HEADER = struct.Struct('<4s2B4HL2L2H')
+_CENTRAL_HEADER = struct.Struct('<4s4B4HL2L5H2L')
+_END_RECORD = struct.Struct('<4s4H2LH')
+_LOCAL_SIGNATURE = b'PK\x03\x04'
+_CENTRAL_SIGNATURE = b'PK\x01\x02'
+_END_SIGNATURE = b'PK\x05\x06'
+
+_FLAG_ENCRYPTED = 0x01
+_FLAG_DATA_DESCRIPTOR = 0x08
+_FLAG_UTF8 = 0x800
+_ZIP64_EXTRA_ID = 0x0001
+_ZIP32_LIMIT = 0xFFFFFFFF
+_ZIP32_MAX_ENTRIES = 0xFFFF
+
+
+@dataclass
+class _RawEntry:
+    """A member as written by _RawZipWriter (what goes into the central directory)"""
+    name: bytes
+    flag_bits: int
+    compress_type: int
+    dos_time: int
+    dos_date: int
+    crc: int
+    compress_size: int
+    file_size: int
+    extra: bytes
+    comment: bytes
+    create_version: int
+    create_system: int
+    extract_version: int
+    internal_attr: int
+    external_attr: int
+    header_offset: int = 0
+
+
+def _encode_name(name: str, flag_bits: int) -> Tuple[bytes, int]:
+    """Filename bytes and flags: ASCII as is, anything else as UTF-8 with bit 11 set"""
+    try:
+        return name.encode('ascii'), flag_bits & ~_FLAG_UTF8
+    except UnicodeEncodeError:
+        return name.encode('utf-8'), flag_bits | _FLAG_UTF8
+
+
+def _strip_zip64_extra(extra: bytes) -> bytes:
+    """Extra field without the Zip64 record (sizes go into the 32-bit fields)"""
+    kept, pos = [], 0
+    while pos + 4 <= len(extra):
+        header_id, size = struct.unpack_from('<2H', extra, pos)
+        if header_id != _ZIP64_EXTRA_ID:
+            kept.append(extra[pos:pos + 4 + size])
+        pos += 4 + size
+    return b''.join(kept)
+
+
+def _dos_date_time(date_time) -> Tuple[int, int]:
+    """(time, date) in MS-DOS format as stored in zip headers"""
+    year, month, day, hour, minute, second = date_time
+    return (hour << 11 | minute << 5 | second // 2,
+            (max(year, 1980) - 1980) << 9 | month << 5 | day)
+
+
+class _RawZipWriter:
+    """
+    Minimal zip writer for rewrite_zip: copies members' compressed bytes
+    unchanged and deflates new data with zlib. No Zip64, no encryption -
+    rewrite_zip only uses it when neither is needed.
+    """
+
+    def __init__(self, fp):
+        self.fp = fp
+        self.start = fp.tell()
+        self.entries: List[_RawEntry] = []
+
+    def _begin(self, entry: _RawEntry):
+        entry.header_offset = self.fp.tell() - self.start
+        self.fp.write(_LOCAL_HEADER.pack(
+            _LOCAL_SIGNATURE, entry.extract_version, 0, entry.flag_bits, entry.compress_type,
+            entry.dos_time, entry.dos_date, entry.crc, entry.compress_size, entry.file_size,
+            len(entry.name), len(entry.extra)))
+        self.fp.write(entry.name)
+        self.fp.write(entry.extra)
+        self.entries.append(entry)
+
+    def copy_raw(self, src_fp, info: zipfile.ZipInfo):
+        """Copy info's compressed bytes from the source file without decompressing"""
+        src_fp.seek(info.header_offset)
+        header = src_fp.read(_LOCAL_HEADER.size)
+        if len(header) != _LOCAL_HEADER.size or header[:4] != _LOCAL_SIGNATURE:
+            raise zipfile.BadZipFile(f"Bad local header: {info.filename}")
+        fields = _LOCAL_HEADER.unpack(header)
+        src_fp.seek(info.header_offset + _LOCAL_HEADER.size + fields[10] + fields[11])
+
+        name, flag_bits = _encode_name(info.filename, info.flag_bits)
+        dos_time, dos_date = _dos_date_time(info.date_time)
+        extra = _strip_zip64_extra(info.extra)
+        # CRC and sizes come from the central directory and go into the local
+        # header, so a source data descriptor is not carried over
+        self._begin(_RawEntry(
+            name, flag_bits & ~_FLAG_DATA_DESCRIPTOR, info.compress_type, dos_time, dos_date,
+            info.CRC, info.compress_size, info.file_size, extra, info.comment,
+            info.create_version, info.create_system, info.extract_version,
+            info.internal_attr, info.external_attr))
+
+        remaining = info.compress_size
+        while remaining > 0:
+            chunk = src_fp.read(min(_COPY_CHUNK_SIZE, remaining))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated member: {info.filename}")
+            self.fp.write(chunk)
+            remaining -= len(chunk)
+
+    def write_deflated(self, name: str, data: bytes, date_time, external_attr: int):
+        """Add a member with data deflated at zlib's default level"""
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+        compressed = compressor.compress(data) + compressor.flush()
+        encoded, flag_bits = _encode_name(name, 0)
+        dos_time, dos_date = _dos_date_time(date_time)
+        self._begin(_RawEntry(
+            encoded, flag_bits, zipfile.ZIP_DEFLATED, dos_time, dos_date, zlib.crc32(data),
+            len(compressed), len(data), b'', b'', 20, 3, 20, 0, external_attr))
+        self.fp.write(compressed)
+
+    def close(self, comment: bytes = b''):
+        """Write the central directory and the end record"""
+        directory_offset = self.fp.tell() - self.start
+        for entry in self.entries:
+            self.fp.write(_CENTRAL_HEADER.pack(
+                _CENTRAL_SIGNATURE, entry.create_version, entry.create_system,
+                entry.extract_version, 0, entry.flag_bits, entry.compress_type,
+                entry.dos_time, entry.dos_date, entry.crc, entry.compress_size, entry.file_size,
+                len(entry.name), len(entry.extra), len(entry.comment), 0,
+                entry.internal_attr, entry.external_attr, entry.header_offset))
+            self.fp.write(entry.name)
+            self.fp.write(entry.extra)
+            self.fp.write(entry.comment)
+        directory_size = self.fp.tell() - self.start - directory_offset
+        self.fp.write(_END_RECORD.pack(
+            _END_SIGNATURE, 0, 0, len(self.entries), len(self.entries),
+            directory_size, directory_offset, len(comment)))
+        self.fp.write(comment)
+
+
+def _raw_copy_possible(infos: List[zipfile.ZipInfo], replacements: Dict[str, bytes]) -> bool:
+    """
+    True if the raw writer can produce the archive: no encrypted members and
+    everything (entries, sizes, offsets) within the 32-bit zip limits.
+    """
+    if len(infos) + len(replacements) >= _ZIP32_MAX_ENTRIES:
+        return False
+    # Upper bound for the output size: headers, copied data, deflated replacements
+    total = sum(len(data) + len(data) // 1000 + 1024 for data in replacements.values())
+    for info in infos:
+        if info.flag_bits & _FLAG_ENCRYPTED:
+            return False
+        name_size = len(info.filename.encode('utf-8')) + len(info.extra)
+        total += (_LOCAL_HEADER.size + _CENTRAL_HEADER.size + 2 * name_size + len(info.comment)
+                  + info.compress_size)
+    return total < _ZIP32_LIMIT
+
+
+def _copy_member(src: zipfile.ZipFile, dst: zipfile.ZipFile, info: zipfile.ZipInfo):
+    """
+    Copy one member by re-encoding it (fallback of rewrite_zip), streamed in chunks.
+
+    Keeps the original compression type, name, timestamp and attributes.
+    """
+    out = zipfile.ZipInfo(info.filename, info.date_time)
+    out.compress_type = info.compress_type
+    out.comment = info.comment
+    out.create_system = info.create_system
+    out.internal_attr = info.internal_attr
+    out.external_attr = info.external_attr
+    out.file_size = info.file_size
+
+    with src.open(info) as reader, dst.open(out, 'w', force_zip64=info.file_size >= zipfile.ZIP64_LIMIT) as writer:
+        shutil.copyfileobj(reader, writer, _COPY_CHUNK_SIZE)
+
+
+def _rewrite_reencoded(src: zipfile.ZipFile, dst_path, pending: Dict[str, bytes]):
+    """rewrite_zip through the ZipFile API (every member decompressed and compressed again)"""
+    with zipfile.ZipFile(dst_path, 'w', zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            if info.filename in pending:
+                replaced = zipfile.ZipInfo(info.filename, info.date_time)
+                replaced.compress_type = zipfile.ZIP_DEFLATED
+                replaced.external_attr = info.external_attr
+                dst.writestr(replaced, pending.pop(info.filename))
+            else:
+                _copy_member(src, dst, info)
+
+        for name, data in pending.items():
+            dst.writestr(name, data)
+
+
+@contextmanager
+def _binary_file(target, mode: str):
+    """Open a path, or use an already open binary file object as is"""
+    if hasattr(target, 'read' if mode == 'rb' else 'write'):
+        yield target
+    else:
+        with open(target, mode) as fp:
+            yield fp
+
+
+def rewrite_zip(src_path, dst_path, replacements: Dict[str, bytes]):
+    """
+    Copy a zip archive, replacing the given members (paths or binary file objects).
+
+    Unchanged members keep their compressed bytes, order and metadata - they
+    are copied without decompressing, so media-heavy packages cost one
+    sequential copy. Replaced members are deflated fresh in place of the
+    original entry, new names are appended. Archives the raw writer cannot
+    produce (encrypted members, Zip64) are re-encoded through ZipFile instead.
+    """
+    pending = dict(replacements)
+    with zipfile.ZipFile(src_path, 'r') as src:
+        infos = src.infolist()
+        if not _raw_copy_possible(infos, pending):
+            _rewrite_reencoded(src, dst_path, pending)
+            return
+
+        with _binary_file(src_path, 'rb') as src_fp, _binary_file(dst_path, 'wb') as dst_fp:
+            writer = _RawZipWriter(dst_fp)
+            for info in infos:
+                if info.filename in pending:
+                    writer.write_deflated(info.filename, pending.pop(info.filename),
+                                          info.date_time, info.external_attr)
+                else:
+                    writer.copy_raw(src_fp, info)
+
+            now = datetime.now().timetuple()[:6]
+            for name, data in pending.items():
+                writer.write_deflated(name, data, now, 0o600 << 16)
+            writer.close(src.comment)
+
+
+# =============================================================================
+# Content Tree Walker
+# =============================================================================
+
+@dataclass
+class ContentNode:
+    """A (sub-)content instance inside content.json: a library/params pair"""
+    library: str        # e.g. 'H5P.DragQuestion 1.14'
+    params: Dict
+    path: str           # location of params, e.g. 'chapters[3].params.content[0].content.params'
+    depth: int
+
+    @property
+    def machine_name(self) -> str:
+        return self.library.split(' ')[0]
+
+
+def is_content_node(value) -> bool:
+    """True for a dict with a string 'library' and dict 'params' (a nested H5P content)"""
+    return (isinstance(value, dict) and isinstance(value.get('library'), str)
+            and isinstance(value.get('params'), dict))
+
+
+def join_location(base: str, location: str) -> str:
+    """Prefix a rule-relative location with the node path ('' = node root)"""
+    if not base:
+        return location
+    if not location:
+        return base
+    return f"{base}{location}" if location.startswith('[') else f"{base}.{location}"
+
+
+class ContentWalker:
+    """
+    Walks content.json once and dispatches rules per library machine name.
+
+    Every dict with a string 'library' and a dict 'params' is a content node,
+    at any depth (InteractiveBook chapters, Column content, CoursePresentation
+    slides, QuestionSet questions, ...). Rules are BaseAnalyzer instances;
+    their issue locations are relative to the node's params and get prefixed
+    with the node path, so _apply_fix works on nested content unchanged.
+    """
+
+    def __init__(self, rules: Dict[str, List[BaseAnalyzer]] = None):
+        self.rules: Dict[str, List[BaseAnalyzer]] = {}
+        for machine_name, rule_list in (rules or {}).items():
+            for rule in rule_list:
+                self.register(machine_name, rule)
+
+    def register(self, machine_name: str, rule: BaseAnalyzer):
+        """Register a rule for a library machine name, e.g. 'H5P.DragQuestion'"""
+        self.rules.setdefault(machine_name, []).append(rule)
+
+    def walk(self, content: Dict, root_library: str):
+        """Yield all content nodes (root first, then depth-first in document order)"""
+        yield ContentNode(root_library, content, '', 0)
+
+        # Stack of (value, path, depth of the enclosing node); reversed pushes keep order
+        stack = [(content, '', 0, True)]
+        while stack:
+            value, path, depth, is_root = stack.pop()
+            if isinstance(value, dict):
+                if not is_root and is_content_node(value):
+                    depth += 1
+                    yield ContentNode(value['library'], value['params'], join_location(path, 'params'), depth)
+                items = value.items()
+                children = [(child, join_location(path, key), depth, False)
+                            for key, child in items if isinstance(child, (dict, list))]
+            else:
+                children = [(child, f"{path}[{i}]", depth, False)
+                            for i, child in enumerate(value) if isinstance(child, (dict, list))]
+            stack.extend(reversed(children))
+
+    def run(self, content: Dict, h5p_meta: Dict) -> Tuple[List[DesignIssue], Dict[str, int]]:
+        """
+        Analyze the whole tree in one traversal.
+
+        Returns:
+            (issues with absolute locations, node count per machine name)
+        """
+        issues = []
+        node_counts: Dict[str, int] = {}
+        for node in self.walk(content, h5p_meta.get('mainLibrary', '')):
+            node_counts[node.machine_name] = node_counts.get(node.machine_name, 0) + 1
+            for rule in self.rules.get(node.machine_name, []):
+                for issue in rule.analyze(node.params, h5p_meta):
+                    issue.location = join_location(node.path, issue.location)
+                    issues.append(issue)
+        return issues, node_counts
+
+
 # =============================================================================
 # H5P Designer (Main Class)
 # =============================================================================
@@ -433,21 +929,34 @@ class H5PDesigner:
         'MultiChoice': MultiChoiceAnalyzer(),
     }
 
-    def __init__(self, h5p_path: str):
-        self.parser = H5PParser(h5p_path)
+    # Rules per library machine name, applied at any nesting depth
+    WALKER = ContentWalker({f'H5P.{name}': [analyzer] for name, analyzer in ANALYZERS.items()})
+
+    def __init__(self, source: H5PSource, h5p_json: Dict = None):
+        """
+        Args:
+            source: .h5p path, package bytes or content dict (see H5PParser)
+            h5p_json: h5p.json for content dict sources (mainLibrary, title)
+        """
+        self.parser = H5PParser(source, h5p_json)
         self.h5p_json = None
         self.content_json = None
         self.original_content = None
 
-    def analyze(self) -> H5PAnalysis:
-        """Analyze the H5P file for design issues"""
-        self.h5p_json, self.content_json = self.parser.parse()
-        self.original_content = copy.deepcopy(self.content_json)
+    def load(self) -> Dict:
+        """Parse the source once; later calls keep the (possibly modified) content"""
+        if self.content_json is None:
+            self.h5p_json, self.content_json = self.parser.parse()
+            self.original_content = copy.deepcopy(self.content_json)
+        return self.content_json
 
+    def analyze(self) -> H5PAnalysis:
+        """Analyze the current content for design issues (parses the source on first use)"""
+        self.load()
         content_type = self.parser.get_content_type()
 
         analysis = H5PAnalysis(
-            file_path=str(self.parser.h5p_path),
+            file_path=self.parser.name,
             content_type=content_type,
             title=self.parser.title,
             metadata={
@@ -456,11 +965,11 @@ class H5PDesigner:
             }
         )
 
-        # Get appropriate analyzer
-        analyzer = self.ANALYZERS.get(content_type)
-        if analyzer:
-            analysis.issues = analyzer.analyze(self.content_json, self.h5p_json)
-        else:
+        # Single traversal: rules for every (nested) content node
+        analysis.issues, node_counts = self.WALKER.run(self.content_json, self.h5p_json)
+        analysis.metadata['content_nodes'] = node_counts
+
+        if not any(name in self.WALKER.rules for name in node_counts):
             analysis.issues.append(DesignIssue(
                 severity='info',
                 category='support',
@@ -517,6 +1026,7 @@ class H5PDesigner:
 
     def optimize_layout(self, content_type: str = None) -> Dict:
         """Automatically optimize the layout for better usability"""
+        self.load()
         if content_type is None:
             content_type = self.parser.get_content_type()
 
@@ -544,124 +1054,132 @@ class H5PDesigner:
             size['height'] = 500
             changes.append('Expanded canvas height to 500px')
 
-        # Resize draggables for better readability
-        num_elements = len(elements)
-        if num_elements > 0:
-            # Calculate optimal layout
-            cols = min(4, num_elements)
-            rows = (num_elements + cols - 1) // cols
-
-            elem_width = min(20, 80 // cols)
-            elem_height = min(12, 35 // rows)
-            h_gap = (100 - cols * elem_width) / (cols + 1)
-            v_gap = 3
-
-            for i, elem in enumerate(elements):
-                row = i // cols
-                col = i % cols
-
-                old_w, old_h = elem.get('width'), elem.get('height')
-                elem['width'] = elem_width
-                elem['height'] = elem_height
-                elem['x'] = round(h_gap + col * (elem_width + h_gap), 1)
-                elem['y'] = round(5 + row * (elem_height + v_gap), 1)
-
-                if old_w != elem_width or old_h != elem_height:
-                    changes.append(f'Resized draggable {i+1}: {old_w}x{old_h} -> {elem_width}x{elem_height}')
-
-                # Fix encoding in text
-                if 'type' in elem and 'params' in elem['type']:
-                    text = elem['type']['params'].get('text', '')
-                    fixed_text = self._fix_german_encoding(text)
-                    if fixed_text != text:
-                        elem['type']['params']['text'] = fixed_text
-                        changes.append(f'Fixed encoding in draggable {i+1}')
-
-        # Resize and reposition dropzones
-        num_zones = len(dropzones)
-        if num_zones > 0:
-            zone_width = min(25, 80 // num_zones)
-            zone_height = 30
-            zone_y = 65  # Below draggables
-            h_gap = (100 - num_zones * zone_width) / (num_zones + 1)
-
-            for i, dz in enumerate(dropzones):
-                old_w, old_h = dz.get('width'), dz.get('height')
-                dz['width'] = zone_width
-                dz['height'] = zone_height
-                dz['x'] = round(h_gap + i * (zone_width + h_gap), 1)
-                dz['y'] = zone_y
-
-                if old_w != zone_width or old_h != zone_height:
-                    changes.append(f'Resized dropzone {i+1}: {old_w}x{old_h} -> {zone_width}x{zone_height}')
+        layout = self._pack_drag_question(elements, dropzones, size['width'], size['height'])
+        if layout.canvas_width != size['width']:
+            size['width'] = layout.canvas_width
+            changes.append(f'Expanded canvas width to {layout.canvas_width}px')
+        if layout.canvas_height != size['height']:
+            size['height'] = layout.canvas_height
+            changes.append(f'Expanded canvas height to {layout.canvas_height}px')
+
+        for i, elem in enumerate(elements):
+            old_w, old_h = elem.get('width'), elem.get('height')
+            elem.update(layout.geometry(layout.draggables[i]))
+
+            if old_w != elem['width'] or old_h != elem['height']:
+                changes.append(f'Resized draggable {i+1}: {old_w}x{old_h} -> {elem["width"]}x{elem["height"]}')
+
+            # Fix encoding in text
+            if 'type' in elem and 'params' in elem['type']:
+                text = elem['type']['params'].get('text', '')
+                fixed_text = self._fix_german_encoding(text)
+                if fixed_text != text:
+                    elem['type']['params']['text'] = fixed_text
+                    changes.append(f'Fixed encoding in draggable {i+1}')
+
+        for i, dz in enumerate(dropzones):
+            old_w, old_h = dz.get('width'), dz.get('height')
+            dz.update(layout.geometry(layout.dropzones[i]))
+
+            if old_w != dz['width'] or old_h != dz['height']:
+                changes.append(f'Resized dropzone {i+1}: {old_w}x{old_h} -> {dz["width"]}x{dz["height"]}')
 
         return {
             'optimized': True,
             'changes': changes
         }
 
+    def _pack_drag_question(self, elements: List[Dict], dropzones: List[Dict], width: int, height: int):
+        """
+        Pack draggables (shelf) and dropzones (skyline) with the generator's
+        shared layout engine; its minimums are the analyzer's limits.
+        """
+        texts = [e.get('type', {}).get('params', {}).get('text', '') for e in elements]
+        labels = [dz.get('label', '') for dz in dropzones]
+        assignments = self._dropzone_assignments(elements, dropzones)
+        return layout_drag_question(texts, labels, assignments, LayoutConfig(
+            canvas_width=width,
+            canvas_height=height,
+            max_canvas_width=max(width, LayoutConfig.max_canvas_width),
+            max_canvas_height=max(height, LayoutConfig.max_canvas_height)
+        ))
+
+    @staticmethod
+    def _dropzone_assignments(elements: List[Dict], dropzones: List[Dict]) -> List[Optional[int]]:
+        """Correct dropzone index per draggable (from correctElements, else dropZones)"""
+        assignments: List[Optional[int]] = [None] * len(elements)
+        for zone, dz in enumerate(dropzones):
+            for ref in dz.get('correctElements', []):
+                if str(ref).isdigit() and int(ref) < len(elements) and assignments[int(ref)] is None:
+                    assignments[int(ref)] = zone
+        for i, elem in enumerate(elements):
+            if assignments[i] is None and elem.get('dropZones'):
+                ref = str(elem['dropZones'][0])
+                assignments[i] = int(ref) if ref.isdigit() else None
+        return assignments
+
     def _fix_german_encoding(self, text: str) -> str:
         """Fix German umlaut encoding issues"""
-        replacements = {
-            'Schaetzt': 'Schätzt', 'schaetzt': 'schätzt',
-            'Waehlt': 'Wählt', 'waehlt': 'wählt',
-            'Faehrt': 'Fährt', 'faehrt': 'fährt',
-            'Laeuft': 'Läuft', 'laeuft': 'läuft',
-            'Haelt': 'Hält', 'haelt': 'hält',
-            'Traegt': 'Trägt', 'traegt': 'trägt',
-            'Kundenwuensche': 'Kundenwünsche',
-            'Wuensche': 'Wünsche', 'wuensche': 'Wünsche',
-            'Prueft': 'Prüft', 'prueft': 'prüft',
-            'Fuehrt': 'Führt', 'fuehrt': 'führt',
-            'Hoert': 'Hört', 'hoert': 'hört',
-            'Aufwaende': 'Aufwände', 'aufwaende': 'Aufwände',
-            'Losung': 'Lösung', 'losung': 'Lösung',
-        }
-
-        result = text
-        for wrong, correct in replacements.items():
-            result = result.replace(wrong, correct)
-        return result
+        return UmlautRestorer.default().restore(text)
+
+    def to_bytes(self) -> bytes:
+        """
+        The current state as .h5p package bytes, without touching the filesystem.
+
+        Package sources go through rewrite_zip (unchanged members keep their
+        compressed bytes, only content/content.json is replaced); content dict
+        sources become a minimal package with h5p.json and content/content.json.
+        """
+        buffer = io.BytesIO()
+        self._write_package(buffer)
+        return buffer.getvalue()
+
+    def _write_package(self, dst):
+        """Write the package to a path or binary file object"""
+        self.load()
+        # Compact like the generator's packages; get_content_json() stays readable
+        content_bytes = dumps_json(self.content_json).encode('utf-8')
+        if self.parser.is_package:
+            rewrite_zip(self.parser.open_package(), dst, {'content/content.json': content_bytes})
+            return
+
+        with zipfile.ZipFile(dst, 'w', zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr('h5p.json', dumps_json(self.h5p_json))
+            zf.writestr('content/content.json', content_bytes)
 
     def save(self, output_path: str = None, suffix: str = '-optimized') -> str:
-        """Save the modified H5P file"""
+        """
+        Save the modified H5P file.
+
+        Streams the source package into the destination zip-to-zip: every
+        member except content/content.json is copied as compressed bytes
+        (see rewrite_zip), so media-heavy packages cost one sequential copy.
+        The output is written to a temp file next to the target and renamed,
+        which also makes saving over the source file safe.
+        """
         if output_path is None:
+            if self.parser.h5p_path is None:
+                raise ValueError("output_path is required for in-memory sources (or use to_bytes())")
             base = self.parser.h5p_path.stem
             output_path = self.parser.h5p_path.parent / f"{base}{suffix}.h5p"
 
         output_path = Path(output_path)
 
-        # Create temp directory
-        temp_dir = Path('/tmp') / f"h5p_save_{datetime.now().strftime('%H%M%S')}"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        (temp_dir / 'content').mkdir(exist_ok=True)
-
+        fd, temp_name = tempfile.mkstemp(prefix='.h5p_save_', suffix='.h5p', dir=output_path.parent)
+        os.close(fd)
         try:
-            # Extract original file (to get images etc.)
-            with zipfile.ZipFile(self.parser.h5p_path, 'r') as zf:
-                zf.extractall(temp_dir)
-
-            # Overwrite content.json with modified version
-            with open(temp_dir / 'content' / 'content.json', 'w', encoding='utf-8') as f:
-                json.dump(self.content_json, f, ensure_ascii=False, indent=2)
+            self._write_package(temp_name)
+            os.replace(temp_name, output_path)
+        except BaseException:
+            if os.path.exists(temp_name):
+                os.remove(temp_name)
+            raise
 
-            # Create new H5P file
-            with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-                for root, dirs, files in os.walk(temp_dir):
-                    for file in files:
-                        file_path = Path(root) / file
-                        arcname = file_path.relative_to(temp_dir)
-                        zf.write(file_path, arcname)
-
-            return str(output_path)
-
-        finally:
-            # Cleanup
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        return str(output_path)
 
     def get_content_json(self) -> str:
         """Get the current content.json as formatted string"""
-        return json.dumps(self.content_json, ensure_ascii=False, indent=2)
+        return dumps_json(self.content_json, pretty=True)
 
     def set_content_value(self, location: str, value: Any):
         """Set a specific value in content.json"""
@@ -672,9 +1190,9 @@ class H5PDesigner:
 # Convenience Functions
 # =============================================================================
 
-def analyze_h5p(h5p_path: str) -> H5PAnalysis:
-    """Analyze an H5P file and return issues"""
-    designer = H5PDesigner(h5p_path)
+def analyze_h5p(source: H5PSource, h5p_json: Dict = None) -> H5PAnalysis:
+    """Analyze an H5P file, package bytes or content dict and return issues"""
+    designer = H5PDesigner(source, h5p_json)
     return designer.analyze()
 
 
@@ -699,6 +1217,204 @@ def optimize_h5p(h5p_path: str, output_path: str = None) -> Tuple[str, Dict]:
     }
 
 
+def optimize_h5p_data(source: H5PSource, h5p_json: Dict = None) -> Tuple[bytes, Dict]:
+    """
+    In-memory variant of optimize_h5p: analyze -> apply_fixes -> optimize_layout
+    on package bytes or a content dict, returning the optimized package bytes.
+    The optimized content dict is in the report under 'content'.
+    """
+    designer = H5PDesigner(source, h5p_json)
+    analysis = designer.analyze()
+    fix_result = designer.apply_fixes([i for i in analysis.issues if i.auto_fixable])
+    layout_result = designer.optimize_layout()
+
+    return designer.to_bytes(), {
+        'analysis': analysis.summary(),
+        'fixes': fix_result,
+        'layout': layout_result,
+        'content': designer.content_json
+    }
+
+
+# =============================================================================
+# Batch Mode
+# =============================================================================
+
+@dataclass
+class BatchSummary:
+    """Aggregate result of a batch run over many H5P files"""
+    files: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    fixed: int = 0
+    by_content_type: Dict[str, int] = field(default_factory=dict)
+    issues_by_category: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    issues_by_content_type: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    errors: List[Dict] = field(default_factory=list)
+
+    def add(self, record: Dict):
+        """Fold one per-file record (as produced by process_h5p_file) into the summary"""
+        self.files += 1
+        if record['status'] != 'ok':
+            self.failed += 1
+            self.errors.append({'file': record['file'], 'error': record.get('error')})
+            return
+
+        self.succeeded += 1
+        if record.get('saved_path'):
+            self.fixed += 1
+
+        content_type = record['content_type']
+        self.by_content_type[content_type] = self.by_content_type.get(content_type, 0) + 1
+        per_type = self.issues_by_content_type.setdefault(content_type, {})
+
+        for issue in record['issues']:
+            per_category = self.issues_by_category.setdefault(issue['category'], {})
+            per_category[issue['severity']] = per_category.get(issue['severity'], 0) + 1
+            per_type[issue['category']] = per_type.get(issue['category'], 0) + 1
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    def summary(self) -> str:
+        lines = [
+            f"Batch: {self.files} files, {self.succeeded} analyzed, {self.failed} failed"
+            + (f", {self.fixed} fixed" if self.fixed else "")
+        ]
+        if self.by_content_type:
+            lines.append("By content type:")
+            for content_type, count in sorted(self.by_content_type.items(), key=lambda kv: -kv[1]):
+                categories = self.issues_by_content_type.get(content_type, {})
+                detail = ', '.join(f"{c}: {n}" for c, n in sorted(categories.items()))
+                lines.append(f"  {content_type}: {count} files" + (f" ({detail})" if detail else ""))
+        if self.issues_by_category:
+            lines.append("Issues by category:")
+            for category, severities in sorted(self.issues_by_category.items()):
+                detail = ', '.join(f"{s}: {n}" for s, n in sorted(severities.items()))
+                lines.append(f"  {category}: {sum(severities.values())} ({detail})")
+        return '\n'.join(lines)
+
+
+def collect_h5p_files(target: str, exclude_suffix: str = None) -> List[Path]:
+    """
+    Resolve a file, directory (recursive) or glob pattern to a sorted list of .h5p files.
+
+    Args:
+        exclude_suffix: Skip directory/glob matches whose name ends in this suffix
+            (earlier --fix output such as quiz-optimized.h5p); an explicitly
+            named file is always returned
+
+    Raises:
+        FileNotFoundError: target is neither an existing path nor a glob pattern
+            (a mistyped filename is reported, not treated as a pattern without matches)
+    """
+    path = Path(target)
+    if path.is_file():
+        return [path]
+    if path.is_dir():
+        files = path.rglob('*.h5p')
+    elif glob.has_magic(target):
+        files = (Path(p) for p in glob.glob(target, recursive=True) if p.endswith('.h5p'))
+    else:
+        raise FileNotFoundError(f"No such file or directory: {target}")
+    return sorted(f for f in files if not (exclude_suffix and f.stem.endswith(exclude_suffix)))
+
+
+def process_h5p_file(h5p_path: str, fix: bool = False, output_dir: str = None,
+                     base_dir: str = None, suffix: str = '-optimized') -> Dict:
+    """
+    Analyze (and optionally fix + save) a single file and return a JSON-serializable record.
+
+    Runs in batch worker processes, so it never raises - failures are reported
+    as {'status': 'error', ...}.
+    """
+    record = {'file': str(h5p_path), 'status': 'ok'}
+    try:
+        designer = H5PDesigner(h5p_path)
+        analysis = designer.analyze()
+        record.update({
+            'content_type': analysis.content_type,
+            'title': analysis.title,
+            'errors': analysis.error_count,
+            'warnings': analysis.warning_count,
+            'auto_fixable': analysis.auto_fixable_count,
+            'issues': [asdict(issue) for issue in analysis.issues],
+        })
+
+        if fix:
+            fix_result = designer.apply_fixes([i for i in analysis.issues if i.auto_fixable])
+            layout_result = designer.optimize_layout()
+
+            output_path = None
+            if output_dir:
+                relative = Path(h5p_path).relative_to(base_dir) if base_dir else Path(Path(h5p_path).name)
+                output_path = Path(output_dir) / relative
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+
+            record['fixes_applied'] = fix_result['fixes_applied']
+            record['layout_changes'] = len(layout_result.get('changes', []))
+            record['saved_path'] = designer.save(output_path, suffix=suffix)
+    except Exception as e:
+        record['status'] = 'error'
+        record['error'] = f"{type(e).__name__}: {e}"
+    return record
+
+
+def _process_h5p_file_task(task: Tuple) -> Dict:
+    """Picklable adapter for ProcessPoolExecutor.submit"""
+    return process_h5p_file(*task)
+
+
+def batch_process(target: str, fix: bool = False, output_dir: str = None,
+                  jobs: int = None, jsonl_out=None, suffix: str = '-optimized') -> BatchSummary:
+    """
+    Analyze (and optionally fix) every .h5p file below a directory or matching a glob.
+
+    Args:
+        target: Directory (searched recursively), glob pattern or single file
+        fix: Apply auto-fixes, optimize layout and save each file
+        output_dir: Write fixed files here, mirroring the input tree
+            (default: next to the original with `suffix`)
+        jobs: Worker processes (default: CPU count, 1 = run inline)
+        jsonl_out: Text stream receiving one JSON record per file as it completes
+            (completion order - a slow file does not hold back the others)
+        suffix: Filename suffix for fixed files without output_dir; files already
+            carrying it are skipped, so a rerun does not process its own output
+
+    Returns:
+        BatchSummary aggregated by content type and issue category
+        (errors sorted by file)
+
+    Raises:
+        FileNotFoundError: target does not exist and is not a glob pattern
+    """
+    files = collect_h5p_files(target, exclude_suffix=suffix)
+    base_dir = str(Path(target)) if Path(target).is_dir() else None
+    tasks = [(str(f), fix, output_dir, base_dir, suffix) for f in files]
+
+    summary = BatchSummary()
+
+    def emit(record: Dict):
+        summary.add(record)
+        if jsonl_out is not None:
+            jsonl_out.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+            jsonl_out.flush()
+
+    if jobs == 1 or len(tasks) <= 1:
+        for task in tasks:
+            emit(_process_h5p_file_task(task))
+        return summary
+
+    workers = min(jobs or os.cpu_count() or 1, len(tasks))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_process_h5p_file_task, task) for task in tasks]
+        for future in as_completed(futures):
+            emit(future.result())
+
+    summary.errors.sort(key=lambda error: error['file'])
+    return summary
+
+
 def print_analysis(analysis: H5PAnalysis):
     """Pretty print an analysis"""
     print(f"\n{'='*60}")
@@ -730,23 +1446,44 @@ def print_analysis(analysis: H5PAnalysis):
 # =============================================================================
 
 if __name__ == "__main__":
-    import sys
-
     if len(sys.argv) < 2:
-        print("Usage: python h5p_designer.py <h5p_file> [--fix] [--output <path>]")
+        print("Usage: python h5p_designer.py <h5p_file|directory|glob> [--fix] [--output <path>]")
+        print("                              [--jobs <n>] [--jsonl <path>]")
         print("\nOptions:")
         print("  --fix      Apply auto-fixes and optimize layout")
-        print("  --output   Specify output path for fixed file")
+        print("  --output   Specify output path for fixed file (batch: output directory)")
+        print("  --jobs     Batch mode: number of worker processes (default: CPU count)")
+        print("  --jsonl    Batch mode: write per-file JSON lines here (default: stdout)")
         sys.exit(1)
 
+    def _option(name: str) -> Optional[str]:
+        if name in sys.argv:
+            idx = sys.argv.index(name)
+            if idx + 1 < len(sys.argv):
+                return sys.argv[idx + 1]
+        return None
+
     h5p_path = sys.argv[1]
     do_fix = '--fix' in sys.argv
-    output_path = None
+    output_path = _option('--output')
 
-    if '--output' in sys.argv:
-        idx = sys.argv.index('--output')
-        if idx + 1 < len(sys.argv):
-            output_path = sys.argv[idx + 1]
+    if not Path(h5p_path).exists() and not glob.has_magic(h5p_path):
+        print(f"Error: {h5p_path} not found", file=sys.stderr)
+        sys.exit(1)
+
+    # Batch mode: directory or glob pattern
+    if Path(h5p_path).is_dir() or not Path(h5p_path).exists():
+        jobs = _option('--jobs')
+        jsonl_path = _option('--jsonl')
+        jsonl_out = open(jsonl_path, 'w', encoding='utf-8') if jsonl_path else sys.stdout
+        try:
+            summary = batch_process(h5p_path, fix=do_fix, output_dir=output_path,
+                                    jobs=int(jobs) if jobs else None, jsonl_out=jsonl_out)
+        finally:
+            if jsonl_path:
+                jsonl_out.close()
+        print(summary.summary(), file=sys.stderr)
+        sys.exit(1 if summary.failed or summary.files == 0 else 0)
 
     # Analyze
     analysis = analyze_h5p(h5p_path)
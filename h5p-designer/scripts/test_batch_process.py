@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Test: Batch-Modus des H5P Designers
+
+Testet ob:
+1. JSON-Lines in Abschlussreihenfolge kommen (eine langsame Datei haelt
+   die uebrigen nicht auf)
+2. Die Zusammenfassung vollstaendig ist und Fehler nach Datei sortiert sind
+3. Ein Tippfehler im Dateinamen als "nicht gefunden" gemeldet wird,
+   ein Glob ohne Treffer dagegen als leerer Lauf
+4. Ein erneuter --fix-Lauf ohne Ausgabeverzeichnis seine eigenen
+   *-optimized.h5p nicht noch einmal verarbeitet
+"""
+
+import io
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Pfade einrichten
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+sys.path.insert(0, str(script_dir.parent.parent / "h5p-generator" / "scripts"))
+
+from h5p_generator import DragDropGenerator, TrueFalseGenerator
+from h5p_designer import batch_process, collect_h5p_files
+
+failures = []
+
+
+def check(label: str, ok: bool):
+    print(f"  [{'OK' if ok else 'FEHLER'}] {label}")
+    if not ok:
+        failures.append(label)
+
+
+def build(directory: Path):
+    """Eine langsame Datei (alphabetisch zuerst), sechs schnelle, eine kaputte"""
+    DragDropGenerator(output_dir=str(directory)).create(
+        "Gross", "Ordne zu", [f"Zone {i}" for i in range(4)],
+        [{'text': f"Begriff {i}", 'dropzone': i % 4} for i in range(1000)], output_name="a-gross")
+    for i in range(6):
+        TrueFalseGenerator(output_dir=str(directory / "klein")).create(
+            f"Quiz {i}", [{'text': f"Aussage {i}", 'correct': True}], output_name=f"quiz-{i}")
+    (directory / "klein" / "kaputt.h5p").write_bytes(b"kein zip")
+    (directory / "klein" / "b-kaputt.h5p").write_bytes(b"auch kein zip")
+
+
+print("=" * 60)
+print("Test: H5P Designer Batch-Modus")
+print("=" * 60)
+
+with tempfile.TemporaryDirectory() as tmp:
+    directory = Path(tmp)
+    build(directory)
+
+    print("\n1. Abschlussreihenfolge (--jobs 2):")
+    stream = io.StringIO()
+    summary = batch_process(str(directory), jobs=2, jsonl_out=stream)
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    order = [Path(r['file']).name for r in records]
+    check(f"langsame Datei zuletzt ({order[0]} ... {order[-1]})", order[-1] == "a-gross.h5p")
+    check("ein Datensatz pro Datei", sorted(order) == sorted(p.name for p in collect_h5p_files(str(directory))))
+
+    print("\n2. Zusammenfassung:")
+    check(f"{summary.files} Dateien, {summary.succeeded} ok, {summary.failed} fehlerhaft",
+          (summary.files, summary.succeeded, summary.failed) == (9, 7, 2))
+    check("Fehler nach Datei sortiert",
+          [Path(e['file']).name for e in summary.errors] == ["b-kaputt.h5p", "kaputt.h5p"])
+    inline = batch_process(str(directory), jobs=1)
+    check("gleiches Ergebnis ohne Prozess-Pool", inline.to_dict() == summary.to_dict())
+
+    print("\n3. Pfade und Globs:")
+    typo = str(directory / "klein" / "quiz-O.h5p")
+    try:
+        collect_h5p_files(typo)
+        check("Tippfehler -> FileNotFoundError", False)
+    except FileNotFoundError:
+        check("Tippfehler -> FileNotFoundError", True)
+    check("Glob ohne Treffer -> leere Liste", collect_h5p_files(str(directory / "*.zip.h5p")) == [])
+    check("Glob mit Treffern", len(collect_h5p_files(str(directory / "**" / "quiz-*.h5p"))) == 6)
+
+    cli = subprocess.run([sys.executable, str(script_dir / "h5p_designer.py"), typo],
+                         capture_output=True, text=True)
+    check(f"CLI: Tippfehler -> Exit 1, '{cli.stderr.strip()}'",
+          cli.returncode == 1 and "not found" in cli.stderr and not cli.stdout)
+
+print("\n4. Wiederholter --fix-Lauf ohne Ausgabeverzeichnis:")
+with tempfile.TemporaryDirectory() as tmp:
+    directory = Path(tmp)
+    for i in range(3):
+        TrueFalseGenerator(output_dir=str(directory)).create(
+            f"Quiz {i}", [{'text': f"Aussage {i}", 'correct': True}], output_name=f"quiz-{i}")
+    first = batch_process(str(directory), fix=True, jobs=1)
+    second = batch_process(str(directory), fix=True, jobs=1)
+    names = sorted(p.name for p in directory.glob('*.h5p'))
+    check(f"beide Laeufe nur die Quellen ({first.files}, {second.files} Dateien)",
+          first.files == second.files == 3)
+    check(f"keine doppelt optimierten Dateien ({len(names)} Dateien)",
+          names == sorted([f"quiz-{i}.h5p" for i in range(3)] + [f"quiz-{i}-optimized.h5p" for i in range(3)]))
+    check("Glob ueberspringt *-optimized.h5p",
+          len(collect_h5p_files(str(directory / "*.h5p"), exclude_suffix='-optimized')) == 3)
+    check("explizit genannte Datei wird verarbeitet",
+          collect_h5p_files(str(directory / "quiz-0-optimized.h5p"), exclude_suffix='-optimized')
+          == [directory / "quiz-0-optimized.h5p"])
+
+print("\n" + "=" * 60)
+if failures:
+    print("Test fehlgeschlagen:")
+    for failure in failures:
+        print(f"  - {failure}")
+    sys.exit(1)
+print("Test abgeschlossen!")
+print("=" * 60)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test: Content-Baum-Analyse (ContentWalker)
+
+Testet ob:
+1. MultiChoice-Fehler genau einmal gemeldet werden - als Legacy-Wrapper,
+   als Wrapper mit library/params-Knoten und als einfache Params
+2. Verschachtelte Inhalte (QuestionSet, InteractiveBook) mit absoluten
+   Pfaden gemeldet und pro Bibliothek gezaehlt werden
+3. Fremde Bibliotheken im Wrapper nicht als MultiChoice geprueft werden
+"""
+
+import sys
+from pathlib import Path
+
+# Pfade einrichten
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+
+from h5p_designer import H5PDesigner
+
+failures = []
+
+
+def check(label: str, ok: bool):
+    print(f"  [{'OK' if ok else 'FEHLER'}] {label}")
+    if not ok:
+        failures.append(label)
+
+
+# Ein Fehler pro Frage: zwei Antworten, keine richtig markiert
+NO_CORRECT = {'question': 'Was ist ein Sprint?', 'answers': [{'text': 'A'}, {'text': 'B'}]}
+
+
+def node(library, params):
+    return {'library': library, 'params': params, 'subContentId': 'x'}
+
+
+def issues(content, main_library):
+    designer = H5PDesigner(content, {'mainLibrary': main_library, 'title': 'Test'})
+    analysis = designer.analyze()
+    return [(i.message, i.location) for i in analysis.issues], analysis.metadata['content_nodes']
+
+
+print("=" * 60)
+print("Test: ContentWalker (verschachtelte Analyse)")
+print("=" * 60)
+
+print("\n1. MultiChoice genau einmal:")
+found, _ = issues(dict(NO_CORRECT), 'H5P.MultiChoice')
+check(f"einfache Params: {found}", found == [('Question 1 has no correct answer marked', 'answers')])
+
+found, _ = issues({'questions': [{'params': NO_CORRECT}, {'params': NO_CORRECT}]}, 'H5P.MultiChoice')
+check(f"Legacy-Wrapper: {len(found)} Meldungen", found == [
+    ('Question 1 has no correct answer marked', 'questions[0].params.answers'),
+    ('Question 2 has no correct answer marked', 'questions[1].params.answers')])
+
+found, counts = issues({'questions': [node('H5P.MultiChoice 1.16', NO_CORRECT)]}, 'H5P.MultiChoice')
+check(f"Wrapper mit library/params: {len(found)} Meldung(en)",
+      found == [('Question 1 has no correct answer marked', 'questions[0].params.answers')])
+check(f"beide Knoten gezaehlt ({counts})", counts == {'H5P.MultiChoice': 2})
+
+found, _ = issues({'questions': [{'params': NO_CORRECT}, node('H5P.MultiChoice 1.16', NO_CORRECT)]},
+                  'H5P.MultiChoice')
+check(f"gemischter Wrapper: {len(found)} Meldungen",
+      sorted(location for _, location in found) == ['questions[0].params.answers', 'questions[1].params.answers'])
+
+print("\n2. Verschachtelte Inhalte:")
+question_set = {'questions': [node('H5P.MultiChoice 1.16', NO_CORRECT), node('H5P.TrueFalse 1.8', {})]}
+found, counts = issues(question_set, 'H5P.QuestionSet')
+check(f"QuestionSet: {found}", found == [('Question 1 has no correct answer marked', 'questions[0].params.answers')])
+book = {'chapters': [node('H5P.Column 1.16', {'content': [{'content': node('H5P.QuestionSet 1.20', question_set)}]})
+                     for _ in range(3)]}
+found, counts = issues(book, 'H5P.InteractiveBook')
+check(f"InteractiveBook: {len(found)} Meldungen (eine pro Kapitel)", len(found) == 3)
+check("absoluter Pfad", found[2][1] ==
+      'chapters[2].params.content[0].content.params.questions[0].params.answers')
+check(f"Knoten pro Bibliothek ({counts})", counts == {
+    'H5P.InteractiveBook': 1, 'H5P.Column': 3, 'H5P.QuestionSet': 3, 'H5P.MultiChoice': 3, 'H5P.TrueFalse': 3})
+
+print("\n3. Fremde Bibliotheken im Wrapper:")
+found, _ = issues({'questions': [node('H5P.TrueFalse 1.8', {'question': 'Richtig?'})]}, 'H5P.MultiChoice')
+check(f"TrueFalse-Knoten nicht als MultiChoice geprueft ({found})", found == [])
+
+print("\n" + "=" * 60)
+if failures:
+    print("Test fehlgeschlagen:")
+    for failure in failures:
+        print(f"  - {failure}")
+    sys.exit(1)
+print("Test abgeschlossen!")
+print("=" * 60)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Test: DragQuestion-Layout (Generator und Designer)
+
+Testet ob:
+1. Vom DragDropGenerator erzeugte Pakete die Pruefungen des Designers ohne
+   Groessen-, Abstands- und Layout-Meldungen bestehen (klein bis 120 Draggables)
+2. Generator und Designer dieselben Einheiten schreiben (Breite/Hoehe in em)
+3. Der Canvas bei vielen Draggables erst breiter statt immer hoeher wird
+4. Eine vom Designer optimierte Datei anschliessend ebenfalls sauber ist
+"""
+
+import json
+import random
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+# Pfade einrichten
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+sys.path.insert(0, str(script_dir.parent.parent / "h5p-generator" / "scripts"))
+
+from drag_layout import LayoutConfig
+from h5p_generator import DragDropGenerator
+from h5p_designer import H5PDesigner
+
+failures = []
+
+
+def check(label: str, ok: bool):
+    print(f"  [{'OK' if ok else 'FEHLER'}] {label}")
+    if not ok:
+        failures.append(label)
+
+
+WORDS = ['Bilanz', 'Eigenkapital', 'Verbindlichkeiten', 'Umsatzerlöse', 'Abschreibung',
+         'Rückstellungen', 'Forderungen', 'Kasse', 'Vorräte', 'Gewinn', 'Aufwand', 'Ertrag']
+
+
+def build(directory: Path, name: str, draggables: int, zones: int, seed: int) -> Path:
+    rng = random.Random(seed)
+    items = [{'text': ' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 4))),
+              'dropzone': rng.randrange(zones)} for _ in range(draggables)]
+    labels = [f"Kategorie {i + 1}: {rng.choice(WORDS)}" for i in range(zones)]
+    result = DragDropGenerator(output_dir=str(directory)).create(name, "Ordne zu", labels, items,
+                                                                 output_name=name)
+    return Path(result.path)
+
+
+def layout_issues(analysis):
+    """Alles ausser Encoding (Texte sind hier absichtlich beliebig)"""
+    return [i.message for i in analysis.issues if i.category in ('size', 'spacing', 'layout')]
+
+
+def content(path: Path) -> dict:
+    with zipfile.ZipFile(path) as zf:
+        return json.loads(zf.read('content/content.json'))
+
+
+print("=" * 60)
+print("Test: DragQuestion-Layout (Generator -> Designer)")
+print("=" * 60)
+
+config = LayoutConfig()
+with tempfile.TemporaryDirectory() as tmp:
+    directory = Path(tmp)
+    cases = {'klein': (5, 2), 'mittel': (20, 4), 'gross': (40, 8), 'riesig': (120, 8)}
+    packages = {name: build(directory, name, *size, seed=36) for name, size in cases.items()}
+
+    print("\n1. Generator-Ausgabe besteht die Designer-Pruefungen:")
+    for name, path in packages.items():
+        issues = layout_issues(H5PDesigner(str(path)).analyze())
+        check(f"{name} ({cases[name][0]} Draggables): {issues[:2] or 'keine Meldungen'}", issues == [])
+
+    print("\n2. Einheiten:")
+    task = content(packages['klein'])['question']['task']
+    heights = sorted({e['height'] for e in task['elements']})
+    check(f"Draggable-Hoehen in em ({heights}; mindestens 2em = 32px, je Zeile ~1em mehr)",
+          all(config.min_item_height / 16 <= h < 5 for h in heights))
+    check("Dropzone-Breite in em, nicht in %",
+          all(dz['width'] * 16 <= config.canvas_width for dz in task['dropZones']))
+
+    print("\n3. Canvas-Groesse:")
+    sizes = {name: content(path)['question']['settings']['size'] for name, path in packages.items()}
+    for name, size in sizes.items():
+        print(f"  {name}: {size['width']}x{size['height']}px")
+    check("kleine Aufgabe bleibt 620px breit", sizes['klein']['width'] == config.canvas_width)
+    check("bis 40 Draggables hoechstens max_canvas_height hoch (sonst breiter)",
+          all(sizes[n]['height'] <= config.max_canvas_height or sizes[n]['width'] > config.canvas_width
+              for n in ('klein', 'mittel', 'gross')))
+    check("nie breiter als max_canvas_width",
+          all(size['width'] <= config.max_canvas_width for size in sizes.values()))
+    check(f"120 Draggables: breiter statt nur hoeher ({sizes['riesig']['height']}px < 4793px)",
+          sizes['riesig']['width'] == config.max_canvas_width and sizes['riesig']['height'] < 4793)
+
+    print("\n4. Designer-Optimierung:")
+    broken = content(packages['mittel'])
+    for i, elem in enumerate(broken['question']['task']['elements']):
+        elem.update({'x': 2 + (i % 5) * 9, 'y': 2 + (i // 5) * 3, 'width': 3, 'height': 1})
+    designer = H5PDesigner(broken, {'mainLibrary': 'H5P.DragQuestion', 'title': 'Kaputt'})
+    before = layout_issues(designer.analyze())
+    result = designer.optimize_layout()
+    after = layout_issues(H5PDesigner(designer.content_json, {'mainLibrary': 'H5P.DragQuestion'}).analyze())
+    check(f"vorher {len(before)} Meldungen, nachher {after[:2] or 'keine'}",
+          len(before) > 0 and result['optimized'] and after == [])
+
+print("\n" + "=" * 60)
+if failures:
+    print("Test fehlgeschlagen:")
+    for failure in failures:
+        print(f"  - {failure}")
+    sys.exit(1)
+print("Test abgeschlossen!")
+print("=" * 60)
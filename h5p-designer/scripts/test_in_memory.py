@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Test: Designer-Pipeline im Speicher (Bytes und Content-Dicts)
+
+Testet ob:
+1. optimize_h5p_data() auf Paket-Bytes ein gueltiges Paket liefert, dessen
+   content.json dem Report entspricht und dem dateibasierten optimize_h5p()
+2. Alle uebrigen Member der Bytes-Quelle unveraendert uebernommen werden
+3. to_bytes() ohne Aenderungen denselben Inhalt zurueckliefert (Round-Trip)
+4. Content-Dicts (Params und Sub-Content-Knoten) ein Minimalpaket ergeben,
+   ohne das Dict des Aufrufers zu veraendern
+"""
+
+import copy
+import io
+import json
+import os
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+# Pfade einrichten
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+sys.path.insert(0, str(script_dir.parent.parent / "h5p-generator" / "scripts"))
+
+from h5p_generator import DragDropGenerator
+from h5p_designer import H5PDesigner, optimize_h5p, optimize_h5p_data, rewrite_zip
+
+failures = []
+
+
+def check(label: str, ok: bool):
+    print(f"  [{'OK' if ok else 'FEHLER'}] {label}")
+    if not ok:
+        failures.append(label)
+
+
+def members(data: bytes) -> dict:
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        return {info.filename: zf.read(info) for info in zf.infolist()}
+
+
+def content_of(data: bytes) -> dict:
+    return json.loads(members(data)['content/content.json'])
+
+
+print("=" * 60)
+print("Test: Designer im Speicher (to_bytes / optimize_h5p_data)")
+print("=" * 60)
+
+with tempfile.TemporaryDirectory() as tmp:
+    result = DragDropGenerator(output_dir=tmp).create(
+        "Bilanz", "Ordne zu", ["Aktiva", "Passiva"],
+        [{'text': "Kasse", 'dropzone': 0}, {'text': "Rueckstellungen", 'dropzone': 1},
+         {'text': "Vorraete", 'dropzone': 0}], output_name="bilanz")
+    package = Path(result.path).read_bytes()
+    # Ein kaputtes Layout, damit die Pipeline etwas zu tun hat
+    broken = content_of(package)
+    for elem in broken['question']['task']['elements']:
+        elem.update({'x': 1, 'y': 1, 'width': 2, 'height': 1})
+    designer = H5PDesigner(package)
+    designer.load()
+    designer.content_json.update(broken)
+    # Plus ein Bild, das unveraendert durch die Pipeline muss
+    buffer = io.BytesIO()
+    rewrite_zip(io.BytesIO(designer.to_bytes()), buffer, {'content/images/bild.png': os.urandom(50_000)})
+    package = buffer.getvalue()
+
+    print("\n1. optimize_h5p_data auf Bytes:")
+    data, report = optimize_h5p_data(package)
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        check("gueltiges Paket (testzip)", zf.testzip() is None)
+    optimized = content_of(data)
+    check("content.json entspricht report['content']", optimized == report['content'])
+    check(f"Fixes und Layout angewendet ({len(report['layout']['changes'])} Layout-Aenderungen)",
+          report['layout']['optimized'] and optimized != broken)
+    check("Umlaute repariert", "Rückstellungen" in json.dumps(optimized, ensure_ascii=False))
+
+    on_disk = Path(tmp) / "kaputt.h5p"
+    on_disk.write_bytes(package)
+    saved, _ = optimize_h5p(str(on_disk), str(Path(tmp) / "kaputt-optimiert.h5p"))
+    check("gleiches Ergebnis wie optimize_h5p() mit Dateien",
+          content_of(Path(saved).read_bytes()) == optimized)
+
+    print("\n2. Uebrige Member:")
+    before, after = members(package), members(data)
+    check("gleiche Member-Liste", list(before) == list(after))
+    unchanged = [name for name in before if name != 'content/content.json' and before[name] == after[name]]
+    check(f"{len(unchanged)} von {len(before) - 1} Membern identisch", len(unchanged) == len(before) - 1)
+
+    print("\n3. Round-Trip ohne Aenderungen:")
+    again = H5PDesigner(data).to_bytes()
+    check("content.json gleich", content_of(again) == optimized)
+    check("Analyse gleich", H5PDesigner(again).analyze().summary() == H5PDesigner(data).analyze().summary())
+
+print("\n4. Content-Dicts:")
+params = copy.deepcopy(broken)
+snapshot = copy.deepcopy(params)
+data, report = optimize_h5p_data(params, {'mainLibrary': 'H5P.DragQuestion', 'title': 'Bilanz'})
+package = members(data)
+check("Minimalpaket: h5p.json + content.json", sorted(package) == ['content/content.json', 'h5p.json'])
+check("h5p.json uebernommen", json.loads(package['h5p.json'])['mainLibrary'] == 'H5P.DragQuestion')
+check("Dict des Aufrufers unveraendert", params == snapshot)
+check("gleiches Ergebnis wie aus Bytes", content_of(data) == optimized)
+
+node = {'library': 'H5P.DragQuestion 1.14', 'params': copy.deepcopy(broken), 'metadata': {'title': 'Knoten'}}
+data, _ = optimize_h5p_data(node)
+meta = json.loads(members(data)['h5p.json'])
+check(f"Sub-Content-Knoten: {meta}", meta == {'mainLibrary': 'H5P.DragQuestion', 'title': 'Knoten'}
+      and content_of(data) == optimized)
+
+try:
+    H5PDesigner(params, {'mainLibrary': 'H5P.DragQuestion'}).save()
+    check("save() ohne Pfad bei Dict-Quelle -> ValueError", False)
+except ValueError:
+    check("save() ohne Pfad bei Dict-Quelle -> ValueError", True)
+
+print("\n" + "=" * 60)
+if failures:
+    print("Test fehlgeschlagen:")
+    for failure in failures:
+        print(f"  - {failure}")
+    sys.exit(1)
+print("Test abgeschlossen!")
+print("=" * 60)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Test: Abstands- und Ueberlappungspruefung (Sweep-Line)
+
+Testet ob:
+1. find_rect_conflicts() auf Zufallslayouts exakt die Paare eines
+   Brute-Force-Vergleichs findet (ohne, mit Zeilen-Toleranz, beliebige Zeile)
+2. Alle Warnungen der bisherigen Paar-Schleifen weiterhin gemeldet werden
+   (Elemente: gleiche Zeile = Oberkante < 5% auseinander; Dropzones: jede Zeile)
+3. Ueberlappungen und vertikale Nachbarn erkannt werden
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Pfade einrichten
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+
+from h5p_designer import DragQuestionAnalyzer, Rect, _classify_pair, find_rect_conflicts
+
+failures = []
+
+
+def check(label: str, ok: bool):
+    print(f"  [{'OK' if ok else 'FEHLER'}] {label}")
+    if not ok:
+        failures.append(label)
+
+
+def brute_force(rects, min_gap, row_tolerance):
+    """Alle Paare einzeln pruefen"""
+    found = []
+    for i in range(len(rects)):
+        for j in range(i + 1, len(rects)):
+            result = _classify_pair(rects[i], rects[j], min_gap, row_tolerance)
+            if result:
+                found.append((i, j, result[0], round(result[1], 2)))
+    return found
+
+
+def baseline_warnings(items, min_gap, same_row):
+    """Die frueheren Paar-Schleifen (_check_element_spacing / _check_dropzone_spacing)"""
+    pairs = set()
+    for i, a in enumerate(items):
+        for j, b in enumerate(items):
+            if i >= j or (same_row and abs(a['y'] - b['y']) >= 5):
+                continue
+            gap = b['x'] - (a['x'] + a['width']) if b['x'] > a['x'] else a['x'] - (b['x'] + b['width'])
+            if 0 < gap < min_gap:
+                pairs.add((i, j))
+    return pairs
+
+
+def random_items(rng, count, grid):
+    """Zufallslayout; grid rastet auf ganze Prozent, damit Gleichstaende vorkommen"""
+    items = []
+    for _ in range(count):
+        value = (lambda lo, hi: float(rng.randint(lo, hi))) if grid else rng.uniform
+        items.append({'x': value(0, 90), 'y': value(0, 90), 'width': value(1, 20), 'height': value(1, 15)})
+    return items
+
+
+print("=" * 60)
+print("Test: find_rect_conflicts (Sweep-Line)")
+print("=" * 60)
+
+print("\n1. Gegen Brute-Force (600 Zufallslayouts):")
+rng = random.Random(33)
+mismatches = {0.0: 0, 5.0: 0, float('inf'): 0}
+for layout in range(600):
+    items = random_items(rng, rng.randint(2, 40), grid=layout % 2 == 0)
+    rects = [Rect(i['x'], i['y'], i['width'], i['height']) for i in items]
+    for tolerance in mismatches:
+        fast = [(c.first, c.second, c.kind, c.amount) for c in find_rect_conflicts(rects, 3, tolerance)]
+        if fast != brute_force(rects, 3, tolerance):
+            mismatches[tolerance] += 1
+for tolerance, count in mismatches.items():
+    check(f"row_tolerance={tolerance}: {count} Abweichungen", count == 0)
+
+print("\n2. Bisherige Warnungen bleiben erhalten:")
+analyzer = DragQuestionAnalyzer()
+missing = {'Elemente': 0, 'Dropzones': 0}
+for _ in range(300):
+    items = random_items(rng, rng.randint(2, 25), grid=True)
+    for label, method, min_gap, same_row in (
+            ('Elemente', analyzer._check_element_spacing, analyzer.MIN_SPACING, True),
+            ('Dropzones', analyzer._check_dropzone_spacing, analyzer.MIN_DROPZONE_SPACING, False)):
+        reported = set()
+        for issue in method(items):
+            if issue.category == 'spacing':
+                numbers = [int(w) - 1 for w in issue.message.split() if w.isdigit()]
+                reported.add((numbers[0], numbers[1]))
+        missing[label] += len(baseline_warnings(items, min_gap, same_row) - reported)
+for label, count in missing.items():
+    check(f"{label}: {count} fruehere Warnungen fehlen", count == 0)
+
+stacked = [{'x': 0, 'y': 0, 'width': 30, 'height': 20}, {'x': 32, 'y': 60, 'width': 30, 'height': 20}]
+check("Dropzones in verschiedenen Zeilen, 2% Spaltenabstand -> Warnung",
+      [i.message for i in analyzer._check_dropzone_spacing(stacked)] == ['Dropzones 1 and 2 are very close (2.0%)'])
+check("Elemente in verschiedenen Zeilen -> keine Warnung", analyzer._check_element_spacing(stacked) == [])
+same_row = [{'x': 0, 'y': 10, 'width': 20, 'height': 3}, {'x': 21, 'y': 14, 'width': 20, 'height': 3}]
+check("Elemente gleiche Zeile ohne vertikale Ueberdeckung -> Warnung",
+      [i.message for i in analyzer._check_element_spacing(same_row)] == ['Elements 1 and 2 are too close (1.0%)'])
+
+print("\n3. Ueberlappung und vertikale Nachbarn:")
+rects = [Rect(0, 0, 20, 10), Rect(10, 5, 20, 10), Rect(0, 12, 20, 10), Rect(60, 60, 10, 10)]
+conflicts = [(c.first, c.second, c.kind, c.amount) for c in find_rect_conflicts(rects, 3)]
+check(f"{conflicts}", conflicts == [(0, 1, 'overlap', 5.0), (0, 2, 'vertical', 2.0), (1, 2, 'overlap', 3.0)])
+check("weniger als zwei Rechtecke", find_rect_conflicts(rects[:1], 3) == [])
+
+print("\n" + "=" * 60)
+if failures:
+    print("Test fehlgeschlagen:")
+    for failure in failures:
+        print(f"  - {failure}")
+    sys.exit(1)
+print("Test abgeschlossen!")
+print("=" * 60)
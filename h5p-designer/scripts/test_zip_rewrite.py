@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Test: Zip-zu-Zip-Speichern des H5P Designers
+
+Testet ob:
+1. Das gespeicherte Paket gueltig ist (testzip) und nur content.json ersetzt
+2. Alle uebrigen Member identisch sind (Inhalt, Reihenfolge, Kompression,
+   Zeitstempel, Attribute)
+3. Speichern ueber die Quelldatei und neue Member funktionieren
+4. Unveraenderte Member roh kopiert werden (komprimierte Bytes identisch,
+   nicht neu komprimiert) - auch aus Quellen mit Data Descriptor, Zip64-
+   Extra-Feld und UTF-8-Namen
+5. Der Rueckfall ueber ZipFile (Neukodierung) dieselben Member liefert
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+# Pfade einrichten
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+
+import h5p_designer
+from h5p_designer import H5PDesigner, rewrite_zip
+
+failures = []
+
+
+def check(label: str, ok: bool):
+    print(f"  [{'OK' if ok else 'FEHLER'}] {label}")
+    if not ok:
+        failures.append(label)
+
+
+def build(path: Path):
+    """Paket mit gemischter Kompression, Verzeichnis-Eintrag und Attributen"""
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('h5p.json', json.dumps({'title': 'Quiz', 'mainLibrary': 'H5P.TrueFalse',
+                                            'preloadedDependencies': []}))
+        zf.writestr('content/', b'')
+        zf.writestr('content/content.json', json.dumps({'question': 'Groesse?'}))
+        image = zipfile.ZipInfo('content/images/bild.png', (2024, 5, 17, 12, 30, 0))
+        image.external_attr = 0o100644 << 16
+        zf.writestr(image, os.urandom(300_000), compress_type=zipfile.ZIP_STORED)
+        zf.writestr('content/text.txt', 'Lernfeld ' * 20_000)
+        zf.writestr('H5P.TrueFalse-1.8/library.json', json.dumps({'machineName': 'H5P.TrueFalse'}))
+
+
+class Unseekable(io.RawIOBase):
+    """Schreib-Stream ohne seek() - ZipFile schreibt dann Data Descriptors"""
+
+    def __init__(self):
+        self.buffer = io.BytesIO()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        return self.buffer.write(data)
+
+
+def compressed(path) -> dict:
+    """Komprimierte Bytes und Flags pro Member (ohne zu dekomprimieren)"""
+    result = {}
+    with zipfile.ZipFile(path) as zf, open(path, 'rb') as fp:
+        for info in zf.infolist():
+            fp.seek(info.header_offset + 26)
+            name_length, extra_length = int.from_bytes(fp.read(2), 'little'), int.from_bytes(fp.read(2), 'little')
+            fp.seek(info.header_offset + 30 + name_length + extra_length)
+            result[info.filename] = (fp.read(info.compress_size), info.CRC, info.flag_bits)
+    return result
+
+
+def members(path):
+    with zipfile.ZipFile(path) as zf:
+        return {
+            info.filename: (zf.read(info), info.compress_type, info.date_time, info.external_attr)
+            for info in zf.infolist()
+        }, [info.filename for info in zf.infolist()]
+
+
+print("=" * 60)
+print("Test: Zip-zu-Zip-Speichern (H5P Designer)")
+print("=" * 60)
+
+with tempfile.TemporaryDirectory() as tmp:
+    source = Path(tmp) / 'quiz.h5p'
+    build(source)
+    before, order_before = members(source)
+
+    print("\n1. Speichern:")
+    designer = H5PDesigner(str(source))
+    designer.load()
+    designer.set_content_value('question', 'Größe?')
+    saved = Path(designer.save())
+    with zipfile.ZipFile(saved) as zf:
+        check("testzip() ohne Fehler", zf.testzip() is None)
+    after, order_after = members(saved)
+    check("content.json ersetzt",
+          json.loads(after['content/content.json'][0]) == {'question': 'Größe?'})
+
+    print("\n2. Unveraenderte Member:")
+    check("gleiche Reihenfolge", order_after == order_before)
+    for name, original in before.items():
+        if name != 'content/content.json':
+            check(f"{name}: identisch", after[name] == original)
+
+    print("\n3. In-place und neue Member:")
+    H5PDesigner(str(source)).save(str(source))
+    with zipfile.ZipFile(source) as zf:
+        check("Speichern ueber die Quelle", zf.testzip() is None and members(source)[1] == order_before)
+    target = Path(tmp) / 'erweitert.h5p'
+    rewrite_zip(str(source), str(target), {'content/neu.txt': b'neu', 'h5p.json': b'{}'})
+    extended, order = members(target)
+    check("neuer Member angehaengt, ersetzter an alter Stelle",
+          order == order_before + ['content/neu.txt'] and extended['h5p.json'][0] == b'{}')
+
+    print("\n4. Rohkopie:")
+    # Niedrige Kompressionsstufe: eine Neukodierung (Stufe 6) haette andere Bytes
+    with zipfile.ZipFile(source, 'a') as zf:
+        zf.writestr('content/stufe1.txt', 'Kontenrahmen ' * 50_000,
+                    compress_type=zipfile.ZIP_DEFLATED, compresslevel=1)
+    saved = Path(H5PDesigner(str(source)).save(str(Path(tmp) / 'roh.h5p')))
+    raw_before, raw_after = compressed(source), compressed(saved)
+    check("komprimierte Bytes und CRC identisch (nicht neu komprimiert)",
+          all(raw_after[name][:2] == raw_before[name][:2] for name in raw_before if name != 'content/content.json'))
+
+    stream = Unseekable()
+    with zipfile.ZipFile(stream, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('content/content.json', '{}')
+        zf.writestr('content/Übersicht.txt', 'Größe ' * 5_000)
+        with zf.open('content/video.bin', 'w', force_zip64=True) as member:
+            member.write(os.urandom(100_000))
+    streamed = Path(tmp) / 'gestreamt.h5p'
+    streamed.write_bytes(stream.buffer.getvalue())
+    streamed_before = compressed(streamed)
+    check("Quelle nutzt Data Descriptors", all(flags & 0x08 for _, _, flags in streamed_before.values()))
+    target = Path(tmp) / 'gestreamt-neu.h5p'
+    rewrite_zip(str(streamed), str(target), {'content/content.json': b'{"neu":1}'})
+    with zipfile.ZipFile(target) as zf:
+        check("testzip() ohne Fehler", zf.testzip() is None)
+        check("UTF-8-Name erhalten", 'content/Übersicht.txt' in zf.namelist()
+              and zf.read('content/Übersicht.txt') == ('Größe ' * 5_000).encode('utf-8'))
+    streamed_after = compressed(target)
+    check("Data Descriptor und Zip64-Extra entfernt, Daten identisch",
+          all(streamed_after[name][:2] == streamed_before[name][:2] and not streamed_after[name][2] & 0x08
+              for name in ('content/Übersicht.txt', 'content/video.bin')))
+    in_memory = io.BytesIO()
+    rewrite_zip(io.BytesIO(streamed.read_bytes()), in_memory, {'content/content.json': b'{"neu":1}'})
+    check("Bytes-Quelle und -Ziel ergeben dieselbe Datei", in_memory.getvalue() == target.read_bytes())
+
+    print("\n5. Rueckfall ueber ZipFile:")
+    raw_copy_possible = h5p_designer._raw_copy_possible
+    h5p_designer._raw_copy_possible = lambda infos, replacements: False
+    try:
+        fallback = Path(tmp) / 'neu-kodiert.h5p'
+        rewrite_zip(str(source), str(fallback), {'content/content.json': b'{}'})
+    finally:
+        h5p_designer._raw_copy_possible = raw_copy_possible
+    rewritten = Path(tmp) / 'roh-kopiert.h5p'
+    rewrite_zip(str(source), str(rewritten), {'content/content.json': b'{}'})
+    with zipfile.ZipFile(fallback) as zf:
+        check("testzip() ohne Fehler", zf.testzip() is None)
+    check("gleiche Member wie die Rohkopie", members(fallback) == members(rewritten))
+
+print("\n" + "=" * 60)
+if failures:
+    print("Test fehlgeschlagen:")
+    for failure in failures:
+        print(f"  - {failure}")
+    sys.exit(1)
+print("Test abgeschlossen!")
+print("=" * 60)
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Content Skeleton - Vorab gebaute, statische Teile von content.json
+
+Pro (Content-Type, Style) sind grosse Teile von content.json identisch:
+l10n-Bloecke, behaviour-Dicts, QuestionSet-Texte, End-Screen, Feedback.
+Statt sie bei jedem create() neu aufzubauen, baut der Generator sie einmal,
+wendet Overlay und Umlaut-Wiederherstellung an und friert sie ein
+(FrozenDict/FrozenList). Die eingefrorenen Teile werden geteilt: Schreiben
+darauf wirft TypeError, statt den Cache zu veraendern, und beim Kodieren
+ueberspringen Overlay und Umlaut-Wiederherstellung sie - sie sind bereits
+vorbereitet. Kodiert wird das ganze content.json in einem Aufruf des
+JSON-Backends (json_backend.py); vorab serialisierte Teile per Platzhalter
+einzusetzen war langsamer als der Encoder selbst.
+
+Verwendung im Generator:
+    def _static_parts(self):                  # einmal pro Style
+        return {
+            'tail': Members({"overallFeedback": ..., "behaviour": {...}}),
+            'l10n': {"trueText": "Wahr", "falseText": "Falsch"},
+        }
+
+    skeleton = self._skeleton("H5P.Blanks")
+    content = {
+        "questions": f"<p>{task}</p>",
+        **skeleton.members('tail'),           # Folge statischer Keys
+    }
+    question["l10n"] = skeleton['l10n']       # statischer Wert (eingefroren)
+    question["l10n"] = dict(skeleton['l10n']) # veraenderbare Kopie
+
+Microbenchmark:
+    python content_skeleton.py --repeat 200 --rounds 5
+    python content_skeleton.py --pretty
+    python content_skeleton.py --umlauts
+"""
+
+import argparse
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+
+class Members(dict):
+    """Markiert eine Folge statischer Keys, die per ** eingesetzt wird"""
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} ist ein geteilter Skeleton-Teil "
+                    "(schreibgeschuetzt) - fuer Aenderungen dict()/list() kopieren")
+
+
+class FrozenDict(dict):
+    """Schreibgeschuetztes dict fuer geteilte Skeleton-Teile (Kopien sind normale dicts)"""
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+class FrozenList(list):
+    """Schreibgeschuetzte list fuer geteilte Skeleton-Teile (Kopien sind normale lists)"""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+# Knoten, die beim Kodieren schon vorbereitet sind (Overlay, Umlaute)
+FROZEN_TYPES = (FrozenDict, FrozenList)
+
+
+def freeze(value: Any) -> Any:
+    """Tiefe, schreibgeschuetzte Kopie aus FrozenDict/FrozenList"""
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+class Skeleton:
+    """Statische Teile eines Content-Types fuer einen Style"""
+
+    def __init__(self, parts: Dict[str, Any]):
+        self.parts = parts
+
+    def __getitem__(self, name: str) -> Any:
+        """Statischer Wert (im Cache eingefroren und geteilt)"""
+        return self.parts[name]
+
+    def members(self, name: str) -> Dict[str, Any]:
+        """Statische Key-Folge zum Einsetzen per ** (Reihenfolge bleibt erhalten)"""
+        return self.parts[name]
+
+
+def compile_skeleton(parts: Dict[str, Any], prepare: Callable[[Dict], Dict] = None) -> Skeleton:
+    """
+    Bereitet die Rohteile eines Builders einmal vor und friert sie ein.
+
+    Args:
+        parts: Name -> Wert; Members-Werte sind Key-Folgen, alle anderen
+            Werte stehen im Content unter einem Key gleichen Namens
+        prepare: Vorverarbeitung wie beim Schreiben (Overlay, Umlaute).
+            Erhaelt jeden Teil als Top-Level-Dict und gibt ihn neu zurueck.
+    """
+    compiled = {}
+    for name, value in parts.items():
+        if isinstance(value, Members):
+            compiled[name] = freeze(prepare(dict(value)) if prepare else value)
+        else:
+            compiled[name] = freeze(prepare({name: value})[name] if prepare else value)
+    return Skeleton(compiled)
+
+
+class SkeletonCache:
+    """
+    LRU-Cache (Typ, Style) -> Skeleton.
+
+    enabled=False baut bei jedem Aufruf neu und friert nicht ein - das alte
+    Verhalten, fuer Vergleiche und Benchmarks.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.enabled = True
+        self._entries: 'OrderedDict[Hashable, Skeleton]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, build: Callable[[], Dict[str, Any]],
+            prepare: Callable[[Dict], Dict] = None) -> Skeleton:
+        if not self.enabled:
+            return Skeleton({
+                name: dict(value) if isinstance(value, Members) else value
+                for name, value in build().items()
+            })
+
+        with self._lock:
+            skeleton = self._entries.get(key)
+            if skeleton is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return skeleton
+
+        skeleton = compile_skeleton(build(), prepare)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = skeleton
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return skeleton
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Gemeinsamer Cache aller Generatoren
+SKELETONS = SkeletonCache()
+
+
+# =============================================================================
+# Microbenchmark
+# =============================================================================
+
+class _Captured(Exception):
+    """Bricht create() nach dem Kodieren von content.json ab"""
+
+
+def benchmark(repeat: int = 200, rounds: int = 5, pretty: bool = False,
+              umlauts: bool = False) -> Dict[str, Dict[str, float]]:
+    """
+    Misst pro Content-Type Aufbau + Kodierung von content.json mit und ohne
+    Skeleton-Cache (ohne Dateisystem und ZIP), kompakt oder eingerueckt,
+    optional mit Umlaut-Wiederherstellung (restore_umlauts).
+
+    Returns:
+        Typ -> {'uncached_us', 'cached_us', 'speedup', 'identical'}
+    """
+    import random
+    import tempfile
+    import h5p_generator as gen
+
+    # Als Skript gestartet ist dieses Modul __main__ - der Generator nutzt
+    # den Cache aus dem importierten Modul
+    cache = gen.SKELETONS
+    style = gen.H5PStyle(pretty_json=pretty, restore_umlauts=umlauts)
+
+    samples = {
+        'TrueFalse': (gen.TrueFalseGenerator, ('Quiz', [{'text': f'Aussage {i}', 'correct': i % 2 == 0} for i in range(10)])),
+        'MultiChoice': (gen.MultiChoiceGenerator, ('Quiz', [{'question': f'Frage {i}?', 'answers': [
+            {'text': 'Ja', 'correct': True}, {'text': 'Nein'}, {'text': 'Vielleicht'}]} for i in range(10)])),
+        'Blanks': (gen.FillInBlanksGenerator, ('Lücken', 'Der *Product Owner* priorisiert das *Backlog*.')),
+        'DragQuestion': (gen.DragDropGenerator, ('Zuordnung', 'Ordne zu', ['A', 'B', 'C'], [
+            {'text': f'Element {i}', 'dropzone': i % 3} for i in range(9)])),
+        'SingleChoiceSet': (gen.SingleChoiceSetGenerator, ('SC', [{'question': f'Frage {i}?', 'answers': ['a', 'b', 'c']} for i in range(10)])),
+        'Dialogcards': (gen.DialogCardsGenerator, ('Karten', [{'front': f'Vorne {i}', 'back': f'Hinten {i}'} for i in range(10)])),
+        'MarkTheWords': (gen.MarkTheWordsGenerator, ('Markieren', 'Der *PO* priorisiert das *Backlog*.')),
+        'Summary': (gen.SummaryGenerator, ('Summary', [{'statements': ['Richtig', 'Falsch 1', 'Falsch 2']} for _ in range(5)])),
+        'Accordion': (gen.AccordionGenerator, ('Akkordeon', [{'title': f'Teil {i}', 'content': 'Text'} for i in range(5)])),
+        'DragText': (gen.DragTextGenerator, ('Ziehen', 'Der *PO* priorisiert das *Backlog*.')),
+        'Timeline': (gen.TimelineGenerator, ('Zeitleiste', [{'start_date': str(2000 + i), 'headline': f'Ereignis {i}'} for i in range(5)])),
+        'MemoryGame': (gen.MemoryGameGenerator, ('Memory', [{'description': f'Karte {i}'} for i in range(6)])),
+        'Essay': (gen.EssayGenerator, ('Essay', 'Beschreibe Scrum.', [{'keyword': 'Sprint'}, {'keyword': 'Backlog'}])),
+        'SortParagraphs': (gen.SortParagraphsGenerator, ('Sortieren', ['Eins', 'Zwei', 'Drei', 'Vier'])),
+        'BranchingScenario': (gen.BranchingScenarioGenerator, ('Szenario', [
+            {'type': 'text', 'title': 'Start', 'content': 'Los', 'next': 1},
+            {'type': 'question', 'question': 'Weiter?', 'alternatives': [{'text': 'Ja', 'next': -1}, {'text': 'Nein', 'next': -1}]}])),
+        'InteractiveVideo': (gen.InteractiveVideoGenerator, ('Video', 'https://www.youtube.com/watch?v=abc', [])),
+    }
+
+    def encode(cls, args) -> str:
+        """Ein create() bis einschliesslich Kodierung von content.json"""
+        encoded = []
+        generator = cls(output_dir=tempfile.gettempdir(), style=style, rng=random.Random(0))
+        generator._create_temp_dir = lambda name: None
+
+        def write_content(temp_dir, content, library):
+            encoded.append(generator._encode_json(generator._prepare_content(content, library)))
+            raise _Captured()
+        generator._write_content = write_content
+        generator.create(*args)     # faengt _Captured als Fehler-Result ab
+        return encoded[0]
+
+    results = {}
+    for name, (cls, args) in samples.items():
+        timings = {'uncached': float('inf'), 'cached': float('inf')}
+        outputs = {}
+        for _ in range(rounds):         # abwechselnd messen, Minimum zaehlt
+            for mode in timings:
+                cache.clear()
+                cache.enabled = mode == 'cached'
+                outputs[mode] = encode(cls, args)       # Aufwaermen / Cache fuellen
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    encode(cls, args)
+                timings[mode] = min(timings[mode], (time.perf_counter() - start) / repeat * 1e6)
+        cache.enabled = True
+        results[name] = {
+            'uncached_us': round(timings['uncached'], 1),
+            'cached_us': round(timings['cached'], 1),
+            'speedup': round(timings['uncached'] / timings['cached'], 2),
+            'identical': outputs['uncached'] == outputs['cached'],
+        }
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Content Skeleton - Microbenchmark pro Content-Type')
+    parser.add_argument('--repeat', type=int, default=200, help='Wiederholungen pro Messung (default: 200)')
+    parser.add_argument('--rounds', type=int, default=5, help='Messungen pro Modus, Minimum zaehlt (default: 5)')
+    parser.add_argument('--pretty', action='store_true', help='Eingerueckte Ausgabe messen (pretty_json)')
+    parser.add_argument('--umlauts', action='store_true', help='Mit Umlaut-Wiederherstellung messen (restore_umlauts)')
+    args = parser.parse_args()
+
+    print(f"{'Typ':<20} {'ohne Cache':>12} {'mit Cache':>12} {'Faktor':>8}  identisch")
+    print("-" * 66)
+    for name, r in benchmark(args.repeat, args.rounds, args.pretty, args.umlauts).items():
+        print(f"{name:<20} {r['uncached_us']:>10.1f}us {r['cached_us']:>10.1f}us "
+              f"{r['speedup']:>7.2f}x  {'ja' if r['identical'] else 'NEIN'}")
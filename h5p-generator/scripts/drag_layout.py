@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""
+Drag Layout - Automatisches Layout fuer H5P.DragQuestion
+
+Gemeinsame Layout-Engine fuer DragDropGenerator (Erzeugung) und
+H5PDesigner (Optimierung bestehender Dateien):
+
+1. Textbreiten werden ueber eine Glyphen-Breitentabelle (Arial/Helvetica,
+   1/1000 em) geschaetzt und pro (Text, Schrift) gecacht
+2. Draggables werden per Shelf-Packing (First-Fit Decreasing Height) in
+   Reihen oben auf dem Canvas gepackt; lange Texte werden umgebrochen
+3. Dropzones werden per Skyline-Packing (Bottom-Left) darunter platziert,
+   Groesse nach Label und Anzahl zugeordneter Draggables (autoAlign)
+4. Reicht die Canvas-Hoehe nicht, waechst der Canvas nach unten - bis
+   max_canvas_height, danach wird er breiter (mehr Spalten) bis
+   max_canvas_width
+5. Prozentuale Mindestabstaende beziehen sich auf die Canvas-Breite (H5P
+   skaliert den Canvas nach der Breite), in beiden Richtungen
+
+Alle Berechnungen laufen in Pixeln; DragLayout.geometry() rechnet in das
+H5P-Format um (x/y in % des Canvas, Breite/Hoehe in em). Die Mindestwerte
+in LayoutConfig sind zugleich die Grenzwerte, gegen die der H5P Designer
+prueft (DragQuestionAnalyzer).
+
+Standalone:
+    python drag_layout.py --benchmark
+    python drag_layout.py --benchmark --draggables 200 --zones 12
+"""
+
+import argparse
+import html
+import math
+import re
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
+
+
+# H5P.DragQuestion skaliert em relativ zu 16px Grundschrift
+EM_PX = 16.0
+
+# Zeichenbreiten Arial/Helvetica in 1/1000 em (AFM-Metriken, gerundet)
+GLYPH_WIDTHS: Dict[str, int] = {
+    ' ': 278, '!': 278, '"': 355, '#': 556, '$': 556, '%': 889, '&': 667, "'": 191,
+    '(': 333, ')': 333, '*': 389, '+': 584, ',': 278, '-': 333, '.': 278, '/': 278,
+    '0': 556, '1': 556, '2': 556, '3': 556, '4': 556, '5': 556, '6': 556, '7': 556,
+    '8': 556, '9': 556, ':': 278, ';': 278, '<': 584, '=': 584, '>': 584, '?': 556,
+    '@': 1015, 'A': 667, 'B': 667, 'C': 722, 'D': 722, 'E': 667, 'F': 611, 'G': 778,
+    'H': 722, 'I': 278, 'J': 500, 'K': 667, 'L': 556, 'M': 833, 'N': 722, 'O': 778,
+    'P': 667, 'Q': 778, 'R': 722, 'S': 667, 'T': 611, 'U': 722, 'V': 667, 'W': 944,
+    'X': 667, 'Y': 667, 'Z': 611, '[': 278, '\\': 278, ']': 278, '^': 469, '_': 556,
+    '`': 333, 'a': 556, 'b': 556, 'c': 500, 'd': 556, 'e': 556, 'f': 278, 'g': 556,
+    'h': 556, 'i': 222, 'j': 222, 'k': 500, 'l': 222, 'm': 833, 'n': 556, 'o': 556,
+    'p': 556, 'q': 556, 'r': 333, 's': 500, 't': 278, 'u': 556, 'v': 500, 'w': 722,
+    'x': 500, 'y': 500, 'z': 500, '{': 334, '|': 260, '}': 334, '~': 584,
+    'Ä': 667, 'Ö': 778, 'Ü': 722, 'ä': 556, 'ö': 556, 'ü': 556, 'ß': 611,
+    '€': 556, '§': 556, '°': 400, '–': 556, '—': 1000, '„': 333, '“': 333, '…': 1000,
+}
+DEFAULT_GLYPH_WIDTH = 556
+BOLD_FACTOR = 1.07          # Arial Bold ist im Mittel ~7% breiter
+
+# Obergrenze fuer Neu-Packen beim Verbreitern des Canvas
+MAX_PASSES = 8
+
+_TAG_PATTERN = re.compile(r'<[^>]*>')
+
+
+def plain_text(text: str) -> str:
+    """Entfernt HTML-Tags und Entities ("<p>Gr&ouml;&szlig;e</p>" -> "Größe")"""
+    return ' '.join(html.unescape(_TAG_PATTERN.sub(' ', text or '')).split())
+
+
+@lru_cache(maxsize=8192)
+def text_width(text: str, font_size: float = 12.0, bold: bool = False) -> float:
+    """Geschaetzte Breite eines einzeiligen Textes in Pixeln (gecacht)"""
+    units = sum(GLYPH_WIDTHS.get(char, DEFAULT_GLYPH_WIDTH) for char in text)
+    return units * font_size / 1000.0 * (BOLD_FACTOR if bold else 1.0)
+
+
+@lru_cache(maxsize=8192)
+def wrapped_lines(text: str, max_width: float, font_size: float = 12.0, bold: bool = False) -> int:
+    """Anzahl Zeilen bei Wortumbruch auf max_width Pixel"""
+    if not text:
+        return 1
+    space = text_width(' ', font_size, bold)
+    lines, current = 1, 0.0
+    for word in text.split(' '):
+        width = text_width(word, font_size, bold)
+        if current and current + space + width > max_width:
+            lines += 1
+            current = 0.0
+        if width > max_width:
+            # Ueberlanges Wort bricht hart um
+            extra = math.ceil(width / max_width) - 1
+            lines += extra
+            width -= extra * max_width
+        current = width if not current else current + space + width
+    return lines
+
+
+@dataclass
+class LayoutConfig:
+    """Parameter der Layout-Engine (Masse in Pixeln, Abstaende optional in %)"""
+    canvas_width: int = 620
+    canvas_height: int = 450
+    max_canvas_height: int = 900         # darueber wird der Canvas breiter statt hoeher
+    max_canvas_width: int = 1240
+    font_size: float = 12.0              # Draggable-Text
+    label_font_size: float = 14.0        # Dropzone-Label
+    bold: bool = True
+    line_height: float = 1.35            # Faktor auf die Schriftgroesse
+    margin: float = 8.0                  # Rand zum Canvas
+    padding: float = 8.0                 # Innenabstand der Boxen
+    gap: float = 8.0                     # Abstand zwischen Draggables
+    zone_gap: float = 16.0               # Abstand zwischen Dropzones
+    min_gap_percent: float = 3.0         # Mindestabstand Draggables in % der Canvas-Breite
+    min_zone_gap_percent: float = 5.0    # Mindestabstand Dropzones in % der Canvas-Breite
+    min_item_width: float = 96.0
+    max_item_width: float = 200.0
+    min_item_height: float = 32.0
+    min_zone_width: float = 120.0
+    min_zone_height: float = 120.0
+
+
+@dataclass
+class Box:
+    """Ein platziertes Rechteck in Canvas-Pixeln"""
+    x: float
+    y: float
+    width: float
+    height: float
+
+    @property
+    def right(self) -> float:
+        return self.x + self.width
+
+    @property
+    def bottom(self) -> float:
+        return self.y + self.height
+
+
+@dataclass
+class DragLayout:
+    """Ergebnis: Boxen in Eingabe-Reihenfolge plus endgueltige Canvas-Groesse"""
+    canvas_width: int
+    canvas_height: int
+    draggables: List[Box] = field(default_factory=list)
+    dropzones: List[Box] = field(default_factory=list)
+
+    def geometry(self, box: Box, digits: int = 2) -> Dict[str, float]:
+        """H5P-Geometrie einer Box: x/y in % des Canvas, Breite/Hoehe in em"""
+        return {
+            'x': round(box.x * 100.0 / self.canvas_width, digits),
+            'y': round(box.y * 100.0 / self.canvas_height, digits),
+            'width': round(box.width / EM_PX, digits),
+            'height': round(box.height / EM_PX, digits),
+        }
+
+
+# =============================================================================
+# Packing
+# =============================================================================
+
+def _shelf_pack(sizes: List[tuple], left: float, top: float, width: float, gap: float) -> List[Box]:
+    """
+    Shelf-Packing (First-Fit Decreasing Height): hoechste Boxen zuerst, jede
+    Box kommt in die erste Reihe mit genug Restbreite. Reihen werden
+    horizontal zentriert. Rueckgabe in Eingabe-Reihenfolge.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i][1])   # stabil
+    shelves = []        # [y, hoehe, benutzte breite, [indizes]]
+    y = top
+    for i in order:
+        w, h = sizes[i]
+        for shelf in shelves:
+            if shelf[2] + gap + w <= width and h <= shelf[1]:
+                shelf[2] += gap + w
+                shelf[3].append(i)
+                break
+        else:
+            if shelves:
+                y = shelves[-1][0] + shelves[-1][1] + gap
+            shelves.append([y, h, w, [i]])
+
+    boxes: List[Optional[Box]] = [None] * len(sizes)
+    for shelf_y, _, used, members in shelves:
+        x = left + (width - used) / 2.0
+        for i in sorted(members):
+            w, h = sizes[i]
+            boxes[i] = Box(x, shelf_y, w, h)
+            x += w + gap
+    return boxes
+
+
+def _skyline_pack(sizes: List[tuple], left: float, top: float, width: float, gap: float) -> List[Box]:
+    """
+    Skyline-Packing (Bottom-Left): die Skyline ist eine Liste von Segmenten
+    [x, y, breite]; jede Box wird dort platziert, wo ihre Oberkante am
+    hoechsten liegt (dann am weitesten links). Reihenfolge bleibt erhalten,
+    damit Dropzones in Lesereihenfolge erscheinen.
+    """
+    # Boxen werden um gap vergroessert gepackt, die Region entsprechend auch
+    skyline = [[left, top, width + gap]]
+    right_edge = left + width + gap
+    boxes = []
+
+    for w, h in sizes:
+        w_gap, h_gap = w + gap, h + gap
+        best = None
+        for start, segment in enumerate(skyline):
+            x = segment[0]
+            if x + w_gap > right_edge + 1e-9:
+                break
+            y, covered, end = segment[1], 0.0, start
+            while covered < w_gap - 1e-9:
+                y = max(y, skyline[end][1])
+                covered += skyline[end][2]
+                end += 1
+            if best is None or (y, x) < (best[0], best[1]):
+                best = (y, x)
+        if best is None:
+            # Breiter als die Region: links anhaengen, ueber allem
+            best = (max(s[1] for s in skyline), left)
+
+        y, x = best
+        boxes.append(Box(x, y, w, h))
+
+        # Skyline aktualisieren: Segmente unter [x, x + w_gap) ersetzen
+        new_right = x + w_gap
+        updated = []
+        for sx, sy, sw in skyline:
+            s_right = sx + sw
+            if s_right <= x + 1e-9 or sx >= new_right - 1e-9:
+                updated.append([sx, sy, sw])
+                continue
+            if sx < x:
+                updated.append([sx, sy, x - sx])
+            if s_right > new_right:
+                updated.append([new_right, sy, s_right - new_right])
+        updated.append([x, y + h_gap, w_gap])
+        updated.sort(key=lambda s: s[0])
+
+        # Benachbarte Segmente gleicher Hoehe zusammenfassen
+        skyline = [updated[0]]
+        for segment in updated[1:]:
+            if abs(segment[1] - skyline[-1][1]) < 1e-9:
+                skyline[-1][2] += segment[2]
+            else:
+                skyline.append(segment)
+
+    return boxes
+
+
+# =============================================================================
+# Layout
+# =============================================================================
+
+def _gap(base: float, percent: float, canvas_width: int) -> float:
+    """
+    Abstand in Pixeln; prozentuale Mindestabstaende beziehen sich auf die
+    Canvas-Breite (+1px Reserve fuer gerundete Prozentwerte)
+    """
+    if not percent:
+        return base
+    return max(base, math.ceil(percent * canvas_width / 100.0) + 1)
+
+
+def _item_size(text: str, config: LayoutConfig) -> tuple:
+    """Breite/Hoehe eines Draggables aus der geschaetzten Textbreite"""
+    inner_max = config.max_item_width - 2 * config.padding
+    width = text_width(text, config.font_size, config.bold)
+    lines = wrapped_lines(text, inner_max, config.font_size, config.bold) if width > inner_max else 1
+    item_width = max(config.min_item_width, min(config.max_item_width, width + 2 * config.padding))
+    item_height = max(config.min_item_height,
+                      lines * config.font_size * config.line_height + 2 * config.padding)
+    return math.ceil(item_width), math.ceil(item_height)
+
+
+def _zone_sizes(labels: List[str], item_sizes: List[tuple], assignments: List[List[int]],
+                config: LayoutConfig, usable_width: float, gap: float) -> List[tuple]:
+    """
+    Dropzone-Groessen: eine gemeinsame Spaltenbreite (breit genug fuer jedes
+    Label und jedes Draggable), so dass die Zonen eine Reihe fuellen; Hoehe
+    fuer Label plus alle zugeordneten Draggables (autoAlign stapelt sie
+    zeilenweise in der Zone).
+    """
+    count = len(labels)
+    label_widths = [text_width(label, config.label_font_size, True) + 2 * config.padding for label in labels]
+    widest_item = max((item_sizes[i][0] for zone in assignments for i in zone), default=0)
+    min_width = min(usable_width, max([config.min_zone_width, widest_item + 2 * config.padding] + label_widths))
+
+    # Einheitliche Spaltenbreite: Skyline fuellt dann Spalte fuer Spalte
+    per_row = max(1, min(count, int((usable_width + gap) // (min_width + gap))))
+    width = math.floor((usable_width - (per_row - 1) * gap) / per_row)
+    label_height = config.label_font_size * config.line_height + config.padding
+
+    sizes = []
+    for zone in range(count):
+        # autoAlign: Draggables fliessen zeilenweise durch die Zone
+        inner = width - 2 * config.padding
+        row_height, row_width, content = 0.0, 0.0, 0.0
+        for i in assignments[zone]:
+            w, h = item_sizes[i]
+            if row_width and row_width + config.gap + w > inner:
+                content += row_height + config.gap
+                row_height, row_width = 0.0, 0.0
+            row_width += (config.gap if row_width else 0.0) + w
+            row_height = max(row_height, h)
+        content += row_height
+
+        height = max(config.min_zone_height, label_height + content + 2 * config.padding)
+        sizes.append((width, math.ceil(height)))
+    return sizes
+
+
+def _pack(item_sizes: List[tuple], labels: List[str], per_zone: List[List[int]],
+          config: LayoutConfig, canvas_width: int) -> DragLayout:
+    """Ein Packing-Durchlauf fuer eine Canvas-Breite"""
+    usable_width = canvas_width - 2 * config.margin
+    gap = _gap(config.gap, config.min_gap_percent, canvas_width)
+    zone_gap = _gap(config.zone_gap, config.min_zone_gap_percent, canvas_width)
+
+    item_boxes = _shelf_pack(item_sizes, config.margin, config.margin, usable_width, gap)
+    zones_top = max((b.bottom for b in item_boxes), default=config.margin) + zone_gap
+    zone_sizes = _zone_sizes(labels, item_sizes, per_zone, config, usable_width, zone_gap)
+    zone_boxes = _skyline_pack(zone_sizes, config.margin, zones_top, usable_width, zone_gap)
+
+    bottom = max((b.bottom for b in item_boxes + zone_boxes), default=0.0)
+    return DragLayout(
+        canvas_width=canvas_width,
+        canvas_height=max(config.canvas_height, math.ceil(bottom + config.margin)),
+        draggables=item_boxes,
+        dropzones=zone_boxes
+    )
+
+
+def layout_drag_question(
+    draggables: Sequence[str],
+    dropzones: Sequence[str],
+    assignments: Sequence[Optional[int]] = (),
+    config: LayoutConfig = None
+) -> DragLayout:
+    """
+    Berechnet ein ueberlappungsfreies Layout fuer eine DragQuestion.
+
+    Waechst der Canvas ueber max_canvas_height, wird er stattdessen breiter
+    (die Packer fuellen dann mehr Spalten); erst bei max_canvas_width waechst
+    er weiter nach unten.
+
+    Args:
+        draggables: Texte der Draggables (HTML erlaubt)
+        dropzones: Labels der Dropzones (HTML erlaubt)
+        assignments: Pro Draggable der Index der richtigen Dropzone (oder None)
+        config: Layout-Parameter
+
+    Returns:
+        DragLayout mit Boxen in Eingabe-Reihenfolge
+    """
+    config = config or LayoutConfig()
+    texts = [plain_text(t) for t in draggables]
+    labels = [plain_text(t) for t in dropzones]
+
+    per_zone: List[List[int]] = [[] for _ in labels]
+    for i, zone in enumerate(assignments):
+        if zone is not None and 0 <= zone < len(labels):
+            per_zone[zone].append(i)
+
+    item_sizes = [_item_size(t, config) for t in texts]
+    width = config.canvas_width
+    max_width = max(config.max_canvas_width, width)
+    max_height = max(config.max_canvas_height, config.canvas_height)
+
+    layout = _pack(item_sizes, labels, per_zone, config, width)
+    for _ in range(MAX_PASSES):
+        if layout.canvas_height <= max_height or width >= max_width:
+            break
+        # Zu hoch: breiter packen (die Flaeche bleibt etwa gleich)
+        width = min(max_width, math.ceil(width * layout.canvas_height / max_height))
+        layout = _pack(item_sizes, labels, per_zone, config, width)
+    return layout
+
+
+# =============================================================================
+# Benchmark
+# =============================================================================
+
+def _overlaps(boxes: List[Box]) -> int:
+    """Anzahl ueberlappender Paare (Kontrolle fuer den Benchmark)"""
+    count = 0
+    for i, a in enumerate(boxes):
+        for b in boxes[i + 1:]:
+            if a.x < b.right - 1e-6 and b.x < a.right - 1e-6 and a.y < b.bottom - 1e-6 and b.y < a.bottom - 1e-6:
+                count += 1
+    return count
+
+
+def benchmark(num_draggables: int = 120, num_zones: int = 8, repeat: int = 20):
+    """Misst Layout-Zeiten fuer grosse DragQuestions (kalter und warmer Cache)"""
+    import random
+    rng = random.Random(7)
+    words = ['Bilanz', 'Eigenkapital', 'Verbindlichkeiten', 'Umsatzerlöse', 'Abschreibung',
+             'Rückstellungen', 'Forderungen', 'Kasse', 'Vorräte', 'Gewinn', 'Aufwand', 'Ertrag']
+    draggables = [' '.join(rng.choice(words) for _ in range(rng.randint(1, 4))) for _ in range(num_draggables)]
+    zones = [f'Kategorie {i + 1}: {rng.choice(words)}' for i in range(num_zones)]
+    assignments = [rng.randrange(num_zones) for _ in range(num_draggables)]
+
+    text_width.cache_clear()
+    wrapped_lines.cache_clear()
+    start = time.perf_counter()
+    layout = layout_drag_question(draggables, zones, assignments)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        layout_drag_question(draggables, zones, assignments)
+    warm = (time.perf_counter() - start) / repeat
+
+    overlaps = _overlaps(layout.draggables + layout.dropzones)
+    info = text_width.cache_info()
+    print(f"Drag Layout Benchmark: {num_draggables} Draggables, {num_zones} Dropzones")
+    print(f"  Canvas:       {layout.canvas_width}x{layout.canvas_height}px")
+    print(f"  Kalt:         {cold * 1000:.2f} ms")
+    print(f"  Warm (x{repeat}):  {warm * 1000:.2f} ms")
+    print(f"  Glyph-Cache:  {info.hits} Treffer, {info.misses} Fehlschlaege")
+    print(f"  Ueberlappungen: {overlaps}")
+    return layout
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Drag Layout - Shelf/Skyline-Layout fuer DragQuestions')
+    parser.add_argument('--benchmark', action='store_true', help='Benchmark ausfuehren')
+    parser.add_argument('--draggables', type=int, default=120, help='Anzahl Draggables (default: 120)')
+    parser.add_argument('--zones', type=int, default=8, help='Anzahl Dropzones (default: 8)')
+    parser.add_argument('--repeat', type=int, default=20, help='Wiederholungen warm (default: 20)')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.draggables, args.zones, args.repeat)
+    else:
+        demo = layout_drag_question(
+            ['Kasse', 'Bank', 'Eigenkapital', 'Darlehen', 'Waren'],
+            ['Aktiva', 'Passiva'],
+            [0, 0, 1, 1, 0]
+        )
+        print(f"Canvas {demo.canvas_width}x{demo.canvas_height}")
+        for box in demo.draggables + demo.dropzones:
+            print(f"  {demo.geometry(box)}")
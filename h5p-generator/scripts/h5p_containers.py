@@ -19,7 +19,7 @@ import json
 import zipfile
 import os
 import shutil
-import uuid
+import random
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass
@@ -28,11 +28,6 @@ from typing import List, Dict, Optional, Any
 from h5p_generator import H5PGenerator, H5PResult, H5PStyle, THEMES
 
 
-def _uuid() -> str:
-    """Erzeugt eine UUID v4 als subContentId"""
-    return str(uuid.uuid4())
-
-
 # =============================================================================
 # Column Generator
 # =============================================================================
@@ -92,7 +87,7 @@ class ColumnGenerator(H5PGenerator):
                     "content": {
                         "library": elem.get('library', 'H5P.AdvancedText 1.1'),
                         "params": elem.get('params', {}),
-                        "subContentId": elem.get('subContentId', _uuid()),
+                        "subContentId": elem.get('subContentId') or self._generate_uuid(),
                         "metadata": elem.get('metadata', {
                             "contentType": "Text",
                             "license": "U",
@@ -129,7 +124,7 @@ class ColumnGenerator(H5PGenerator):
                                 "minorVersion": int(parts[1])
                             })
 
-            self._write_json(temp_dir / "content" / "content.json", content)
+            self._write_content(temp_dir, content, "H5P.Column")
             self._write_json(temp_dir / "h5p.json", self._create_h5p_meta(
                 title, "H5P.Column", dependencies
             ))
@@ -216,7 +211,7 @@ class QuestionSetGenerator(H5PGenerator):
                 question = {
                     "library": q.get('library', 'H5P.MultiChoice 1.16'),
                     "params": q.get('params', {}),
-                    "subContentId": q.get('subContentId', _uuid()),
+                    "subContentId": q.get('subContentId') or self._generate_uuid(),
                     "metadata": q.get('metadata', {
                         "contentType": "Multiple Choice",
                         "license": "U",
@@ -294,7 +289,7 @@ class QuestionSetGenerator(H5PGenerator):
                                 "minorVersion": int(parts[1])
                             })
 
-            self._write_json(temp_dir / "content" / "content.json", content)
+            self._write_content(temp_dir, content, "H5P.QuestionSet")
             self._write_json(temp_dir / "h5p.json", self._create_h5p_meta(
                 title, "H5P.QuestionSet", dependencies
             ))
@@ -521,7 +516,7 @@ class CoursePresentationGenerator(H5PGenerator):
                                 "minorVersion": int(parts[1])
                             })
 
-            self._write_json(temp_dir / "content" / "content.json", content)
+            self._write_content(temp_dir, content, "H5P.CoursePresentation")
             self._write_json(temp_dir / "h5p.json", self._create_h5p_meta(
                 title, "H5P.CoursePresentation", dependencies
             ))
@@ -624,7 +619,7 @@ class CoursePresentationGenerator(H5PGenerator):
                             "action": {
                                 "library": lib,
                                 "params": interactive.get('params', {}),
-                                "subContentId": _uuid(),
+                                "subContentId": self._generate_uuid(),
                                 "metadata": interactive.get('metadata', {
                                     "contentType": lib_name.replace('H5P.', ''),
                                     "license": "U",
@@ -674,7 +669,7 @@ class CoursePresentationGenerator(H5PGenerator):
             "action": {
                 "library": lib,
                 "params": elem.get('params', {}),
-                "subContentId": elem.get('subContentId', _uuid()),
+                "subContentId": elem.get('subContentId') or self._generate_uuid(),
                 "metadata": elem.get('metadata', {
                     "contentType": "Text",
                     "license": "U",
@@ -697,7 +692,7 @@ class CoursePresentationGenerator(H5PGenerator):
             "action": {
                 "library": "H5P.AdvancedText 1.1",
                 "params": {"text": html},
-                "subContentId": _uuid(),
+                "subContentId": self._generate_uuid(),
                 "metadata": {"contentType": "Text", "license": "U", "title": "Text"}
             },
             "backgroundOpacity": 0,
@@ -797,7 +792,7 @@ class InteractiveBookGenerator(H5PGenerator):
                         "content": {
                             "library": lib,
                             "params": elem.get('params', {}),
-                            "subContentId": elem.get('subContentId', _uuid()),
+                            "subContentId": elem.get('subContentId') or self._generate_uuid(),
                             "metadata": elem.get('metadata', {
                                 "contentType": lib_name.replace('H5P.', ''),
                                 "license": "U",
@@ -817,7 +812,7 @@ class InteractiveBookGenerator(H5PGenerator):
                     "params": {
                         "content": column_content
                     },
-                    "subContentId": _uuid(),
+                    "subContentId": self._generate_uuid(),
                     "metadata": {
                         "contentType": "Column",
                         "license": "U",
@@ -883,7 +878,7 @@ class InteractiveBookGenerator(H5PGenerator):
                                 "minorVersion": int(version_parts[1])
                             })
 
-            self._write_json(temp_dir / "content" / "content.json", content)
+            self._write_content(temp_dir, content, "H5P.InteractiveBook")
             self._write_json(temp_dir / "h5p.json", self._create_h5p_meta(
                 title, "H5P.InteractiveBook", dependencies
             ))
@@ -915,10 +910,11 @@ def create_column(
     title: str,
     elements: List[Dict],
     output_name: str = None,
-    style: H5PStyle = None
+    style: H5PStyle = None,
+    rng: random.Random = None
 ) -> H5PResult:
     """Erstellt eine Column"""
-    gen = ColumnGenerator(style=style)
+    gen = ColumnGenerator(style=style, rng=rng)
     return gen.create(title, elements, output_name)
 
 
@@ -927,10 +923,11 @@ def create_question_set(
     questions: List[Dict],
     output_name: str = None,
     pass_percentage: int = 60,
-    style: H5PStyle = None
+    style: H5PStyle = None,
+    rng: random.Random = None
 ) -> H5PResult:
     """Erstellt ein QuestionSet"""
-    gen = QuestionSetGenerator(style=style)
+    gen = QuestionSetGenerator(style=style, rng=rng)
     return gen.create(title, questions, output_name, pass_percentage)
 
 
@@ -938,10 +935,11 @@ def create_course_presentation(
     title: str,
     slides: List[Dict],
     output_name: str = None,
-    style: H5PStyle = None
+    style: H5PStyle = None,
+    rng: random.Random = None
 ) -> H5PResult:
     """Erstellt eine Course Presentation"""
-    gen = CoursePresentationGenerator(style=style)
+    gen = CoursePresentationGenerator(style=style, rng=rng)
     return gen.create(title, slides, output_name)
 
 
@@ -951,10 +949,11 @@ def create_interactive_book(
     output_name: str = None,
     cover_description: str = None,
     style: H5PStyle = None,
-    base_color: str = "#003366"
+    base_color: str = "#003366",
+    rng: random.Random = None
 ) -> H5PResult:
     """Erstellt ein Interactive Book"""
-    gen = InteractiveBookGenerator(style=style)
+    gen = InteractiveBookGenerator(style=style, rng=rng)
     return gen.create(title, chapters, output_name, cover_description, base_color=base_color)
 
 
@@ -21,10 +21,11 @@ Unterstützte Content-Types (16):
 - InteractiveVideo   - Videos mit eingebetteten Aufgaben (v3.1)
 """
 
-import json
 import zipfile
 import os
 import uuid
+import random
+import hashlib
 from pathlib import Path
 from datetime import datetime
 import shutil
@@ -32,6 +33,13 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Union
 import re
 
+from lexicon_index import BKTree
+from umlaut_restorer import UmlautRestorer
+from drag_layout import LayoutConfig, layout_drag_question
+from style_overlay import StyleOverlay
+from content_skeleton import FROZEN_TYPES, SKELETONS, Members, Skeleton
+from json_backend import dumps as dumps_json
+
 
 # =============================================================================
 # Result & Error Handling
@@ -62,6 +70,45 @@ class H5PGenerationError(Exception):
     pass
 
 
+# =============================================================================
+# Reproduzierbarkeit (Seeds)
+# =============================================================================
+
+# Feste Zeitstempel im ZIP, damit gleiche Seeds byte-identische Pakete ergeben
+ZIP_FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def derive_seed(seed: Union[int, str], *keys) -> int:
+    """
+    Leitet einen unabhaengigen Seed aus einem Basis-Seed ab.
+
+    Fuer parallele Worker oder einzelne Elemente: derive_seed(42, 'quiz', 3)
+    ist stabil ueber Prozesse hinweg (kein hash()-Salting) und unabhaengig
+    von der Reihenfolge, in der andere Seeds abgeleitet werden.
+    """
+    material = "\x1f".join(str(part) for part in (seed, *keys))
+    return int.from_bytes(hashlib.sha256(material.encode('utf-8')).digest()[:8], 'big')
+
+
+def make_rng(seed: Union[int, str, random.Random, None]) -> Optional[random.Random]:
+    """
+    Erstellt eine random.Random Instanz aus einem Seed.
+
+    Eine vorhandene Instanz wird unveraendert zurueckgegeben,
+    None bleibt None (nicht-deterministischer Modus).
+    """
+    if seed is None or isinstance(seed, random.Random):
+        return seed
+    return random.Random(derive_seed(seed))
+
+
+def generate_uuid(rng: random.Random = None) -> str:
+    """UUID v4 - zufaellig oder reproduzierbar aus einer random.Random Instanz"""
+    if rng is None:
+        return str(uuid.uuid4())
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
 # =============================================================================
 # Styling & Design Options
 # =============================================================================
@@ -92,6 +139,19 @@ class H5PStyle:
     # Pass-Threshold
     pass_percentage: int = 60
 
+    # Text-Vorverarbeitung: "prueft" -> "prüft" (nur Lexikon-Woerter)
+    restore_umlauts: bool = False
+
+    # Branding beim Bauen (StyleOverlay.compile / from_brand), None = ohne
+    overlay: Optional[StyleOverlay] = None
+
+    # JSON eingerueckt schreiben (Debugging); Standard ist kompakt
+    pretty_json: bool = False
+
+    def cache_key(self) -> tuple:
+        """Hashbarer Schluessel ueber alle Felder (fuer Caches pro Style)"""
+        return tuple(vars(self).values())      # __dict__ folgt der Feld-Reihenfolge
+
 
 # Vordefinierte Themes
 THEMES = {
@@ -123,9 +183,18 @@ THEMES = {
 class H5PGenerator:
     """Basisklasse für H5P-Generierung mit Fehlerbehandlung"""
 
-    def __init__(self, output_dir: str = "/home/claude/h5p-output", style: H5PStyle = None):
+    def __init__(self, output_dir: str = "/home/claude/h5p-output", style: H5PStyle = None,
+                 rng: random.Random = None):
+        """
+        Args:
+            output_dir: Ausgabeverzeichnis
+            style: H5PStyle
+            rng: Optionale random.Random Instanz. Mit rng sind subContentIds
+                und ZIP-Inhalt reproduzierbar (gleicher Seed = gleiches Paket).
+        """
         self.output_dir = Path(output_dir)
         self.style = style or H5PStyle()
+        self.rng = rng
         self._ensure_output_dir()
 
     def _ensure_output_dir(self):
@@ -167,14 +236,52 @@ class H5PGenerator:
         (temp_dir / "content").mkdir(exist_ok=True)
         return temp_dir
 
+    def _write_content(self, temp_dir: Path, content: dict, library: str):
+        """Schreibt content.json - mit Branding-Overlay, falls im Style gesetzt"""
+        self._write_json(temp_dir / "content" / "content.json", self._prepare_content(content, library))
+
+    def _prepare_content(self, content: dict, library: str) -> dict:
+        """Wendet das Branding-Overlay des Styles an (falls gesetzt)"""
+        if self.style.overlay is not None:
+            content = self.style.overlay.apply(content, library)
+        return content
+
+    def _encode_json(self, data: dict) -> str:
+        """Kodiert JSON inkl. Umlaut-Vorverarbeitung (Skeleton-Teile sind schon vorbereitet)"""
+        if self.style.restore_umlauts:
+            data = UmlautRestorer.default().restore_tree(data, keep=FROZEN_TYPES)
+        return dumps_json(data, pretty=self.style.pretty_json)
+
     def _write_json(self, path: Path, data: dict):
         """Schreibt JSON-Datei mit Fehlerbehandlung"""
         try:
+            text = self._encode_json(data)
             with open(path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+                f.write(text)
         except Exception as e:
             raise H5PGenerationError(f"Fehler beim Schreiben von {path}: {e}")
 
+    def _skeleton(self, library: str) -> Skeleton:
+        """
+        Statische Teile von content.json fuer (Typ, Style) aus dem Skeleton-Cache.
+
+        Die Teile liefert _static_parts(); sie werden einmal gebaut, mit
+        Overlay und Umlaut-Vorverarbeitung versehen und eingefroren geteilt
+        (Aenderungen nur an Kopien: dict(...)/list(...)).
+        """
+        def prepare(part: dict) -> dict:
+            part = self._prepare_content(part, library)
+            if self.style.restore_umlauts:
+                part = UmlautRestorer.default().restore_tree(part)
+            return part
+
+        key = (library, type(self).__name__, self.style.cache_key())
+        return SKELETONS.get(key, self._static_parts, prepare)
+
+    def _static_parts(self) -> Dict:
+        """Statische Teile von content.json (in Subklassen ueberschreiben)"""
+        return {}
+
     def _package_h5p(self, temp_dir: Path, output_name: str) -> Path:
         """Packt die H5P-Dateien in ein ZIP-Archiv"""
         output_path = self.output_dir / f"{output_name}.h5p"
@@ -182,10 +289,18 @@ class H5PGenerator:
         try:
             with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zf:
                 for root, dirs, files in os.walk(temp_dir):
-                    for file in files:
+                    dirs.sort()
+                    for file in sorted(files):
                         file_path = Path(root) / file
                         arcname = file_path.relative_to(temp_dir)
-                        zf.write(file_path, arcname)
+                        if self.rng is None:
+                            zf.write(file_path, arcname)
+                        else:
+                            # Reproduzierbar: feste Zeitstempel und Rechte
+                            info = zipfile.ZipInfo(arcname.as_posix(), ZIP_FIXED_DATE_TIME)
+                            info.compress_type = zipfile.ZIP_DEFLATED
+                            info.external_attr = 0o644 << 16
+                            zf.writestr(info, file_path.read_bytes())
         except Exception as e:
             raise H5PGenerationError(f"Fehler beim Erstellen der H5P-Datei: {e}")
 
@@ -210,8 +325,8 @@ class H5PGenerator:
         }
 
     def _generate_uuid(self) -> str:
-        """Erzeugt eine UUID v4 als subContentId"""
-        return str(uuid.uuid4())
+        """Erzeugt eine UUID v4 als subContentId (aus self.rng falls gesetzt)"""
+        return generate_uuid(self.rng)
 
     def _get_question_set_texts(self) -> dict:
         """Standard-Texte für QuestionSet"""
@@ -230,6 +345,28 @@ class H5PGenerator:
             "navigationLabel": "Fragen"
         }
 
+    def _question_set_parts(self) -> Dict:
+        """Statische QuestionSet-Teile vor ('head') und nach ('tail') den Fragen"""
+        return {
+            'head': Members({
+                "progressType": "dots",
+                "passPercentage": self.style.pass_percentage
+            }),
+            'tail': Members({
+                "texts": self._get_question_set_texts(),
+                "endGame": self._get_end_game_config(),
+                "override": {"showSolutionButton": "on", "retryButton": "on"}
+            })
+        }
+
+    def _overall_feedback(self) -> List[Dict]:
+        """overallFeedback aus den Feedback-Texten des Styles"""
+        return [
+            {"from": 0, "to": 50, "feedback": self.style.feedback_wrong},
+            {"from": 51, "to": 80, "feedback": self.style.feedback_partial},
+            {"from": 81, "to": 100, "feedback": self.style.feedback_correct}
+        ]
+
     def _get_end_game_config(self) -> dict:
         """Standard End-Screen Konfiguration"""
         return {
@@ -255,6 +392,19 @@ class H5PGenerator:
 class TrueFalseGenerator(H5PGenerator):
     """Generator für True/False Fragen"""
 
+    def _static_parts(self) -> Dict:
+        return {
+            **self._question_set_parts(),
+            'l10n': {"trueText": "Wahr", "falseText": "Falsch"},
+            'behaviour': {
+                "enableRetry": True,
+                "enableSolutionsButton": True,
+                "confirmCheckDialog": False,
+                "confirmRetryDialog": False,
+                "autoCheck": False
+            }
+        }
+
     def create(self, title: str, questions: List[Dict], output_name: str = None) -> H5PResult:
         """
         Erstellt eine True/False H5P-Datei
@@ -290,6 +440,8 @@ class TrueFalseGenerator(H5PGenerator):
 
             temp_dir = self._create_temp_dir(output_name)
 
+            skeleton = self._skeleton("H5P.QuestionSet")
+
             # H5P-Fragen erstellen
             h5p_questions = []
             for idx, q in enumerate(questions):
@@ -297,14 +449,8 @@ class TrueFalseGenerator(H5PGenerator):
                     "params": {
                         "question": f"<p>{q['text']}</p>",
                         "correct": "true" if q['correct'] else "false",
-                        "l10n": {"trueText": "Wahr", "falseText": "Falsch"},
-                        "behaviour": {
-                            "enableRetry": True,
-                            "enableSolutionsButton": True,
-                            "confirmCheckDialog": False,
-                            "confirmRetryDialog": False,
-                            "autoCheck": False
-                        },
+                        "l10n": skeleton['l10n'],
+                        "behaviour": skeleton['behaviour'],
                         "feedbackOnCorrect": q.get('feedback_correct', self.style.feedback_correct),
                         "feedbackOnWrong": q.get('feedback_wrong', self.style.feedback_wrong)
                     },
@@ -319,16 +465,13 @@ class TrueFalseGenerator(H5PGenerator):
                     "title": title,
                     "introduction": "<p>Entscheide bei jeder Aussage: Wahr oder Falsch?</p>"
                 },
-                "progressType": "dots",
-                "passPercentage": self.style.pass_percentage,
+                **skeleton.members('head'),
                 "questions": h5p_questions,
-                "texts": self._get_question_set_texts(),
-                "endGame": self._get_end_game_config(),
-                "override": {"showSolutionButton": "on", "retryButton": "on"}
+                **skeleton.members('tail')
             }
 
             # Dateien schreiben
-            self._write_json(temp_dir / "content" / "content.json", content)
+            self._write_content(temp_dir, content, "H5P.QuestionSet")
             self._write_json(temp_dir / "h5p.json", self._create_h5p_meta(
                 title, "H5P.QuestionSet",
                 [
@@ -363,6 +506,32 @@ class TrueFalseGenerator(H5PGenerator):
 class MultiChoiceGenerator(H5PGenerator):
     """Generator für Multiple Choice Fragen"""
 
+    def _static_parts(self) -> Dict:
+        return {
+            **self._question_set_parts(),
+            'behaviour': {
+                "enableRetry": True,
+                "enableSolutionsButton": True,
+                "enableCheckButton": True,
+                "type": "auto",
+                "singlePoint": False,
+                "randomAnswers": True,
+                "showSolutionsRequiresInput": True,
+                "confirmCheckDialog": False,
+                "confirmRetryDialog": False,
+                "autoCheck": False,
+                "passPercentage": 100
+            },
+            'UI': {
+                "checkAnswerButton": "Prüfen",
+                "submitAnswerButton": "Absenden",
+                "showSolutionButton": "Lösung zeigen",
+                "tryAgainButton": "Nochmal",
+                "correctText": self.style.feedback_correct,
+                "incorrectText": self.style.feedback_wrong
+            }
+        }
+
     def create(self, title: str, questions: List[Dict], output_name: str = None) -> H5PResult:
         """
         Erstellt eine Multiple Choice H5P-Datei
@@ -400,6 +569,8 @@ class MultiChoiceGenerator(H5PGenerator):
 
             temp_dir = self._create_temp_dir(output_name)
 
+            skeleton = self._skeleton("H5P.QuestionSet")
+
             h5p_questions = []
             for idx, q in enumerate(questions):
                 answers = []
@@ -414,27 +585,8 @@ class MultiChoiceGenerator(H5PGenerator):
                     "params": {
                         "question": f"<p>{q['question']}</p>",
                         "answers": answers,
-                        "behaviour": {
-                            "enableRetry": True,
-                            "enableSolutionsButton": True,
-                            "enableCheckButton": True,
-                            "type": "auto",
-                            "singlePoint": False,
-                            "randomAnswers": True,
-                            "showSolutionsRequiresInput": True,
-                            "confirmCheckDialog": False,
-                            "confirmRetryDialog": False,
-                            "autoCheck": False,
-                            "passPercentage": 100
-                        },
-                        "UI": {
-                            "checkAnswerButton": "Prüfen",
-                            "submitAnswerButton": "Absenden",
-                            "showSolutionButton": "Lösung zeigen",
-                            "tryAgainButton": "Nochmal",
-                            "correctText": self.style.feedback_correct,
-                            "incorrectText": self.style.feedback_wrong
-                        }
+                        "behaviour": skeleton['behaviour'],
+                        "UI": skeleton['UI']
                     },
                     "library": "H5P.MultiChoice 1.16",
                     "subContentId": f"mc-{idx}"
@@ -446,15 +598,12 @@ class MultiChoiceGenerator(H5PGenerator):
                     "title": title,
                     "introduction": "<p>Wähle die richtige(n) Antwort(en).</p>"
                 },
-                "progressType": "dots",
-                "passPercentage": self.style.pass_percentage,
+                **skeleton.members('head'),
                 "questions": h5p_questions,
-                "texts": self._get_question_set_texts(),
-                "endGame": self._get_end_game_config(),
-                "override": {"showSolutionButton": "on", "retryButton": "on"}
+                **skeleton.members('tail')
             }
 
-            self._write_json(temp_dir / "content" / "content.json", content)
+            self._write_content(temp_dir, content, "H5P.QuestionSet")
             self._write_json(temp_dir / "h5p.json", self._create_h5p_meta(
                 title, "H5P.QuestionSet",
                 [
@@ -481,8 +630,40 @@ class MultiChoiceGenerator(H5PGenerator):
 class FillInBlanksGenerator(H5PGenerator):
     """Generator für Lückentexte"""
 
+    BLANK_PATTERN = re.compile(r'\*([^*]+)\*')
+
+    def _static_parts(self) -> Dict:
+        return {
+            'tail': Members({
+                "overallFeedback": self._overall_feedback(),
+                "showSolutions": "Lösung anzeigen",
+                "tryAgain": "Nochmal",
+                "checkAnswer": "Prüfen",
+                "submitAnswer": "Absenden",
+                "notFilledOut": "Bitte fülle alle Lücken aus",
+                "answerIsCorrect": "':ans' ist richtig",
+                "answerIsWrong": "':ans' ist falsch",
+                "answeredCorrectly": "Richtig beantwortet",
+                "answeredIncorrectly": "Falsch beantwortet",
+                "solutionLabel": "Richtige Antwort:",
+                "inputLabel": "Lücke @num von @total",
+                "behaviour": {
+                    "enableRetry": True,
+                    "enableSolutionsButton": True,
+                    "enableCheckButton": True,
+                    "caseSensitive": False,
+                    "showSolutionsRequiresInput": True,
+                    "autoCheck": False,
+                    "separateLines": False,
+                    "acceptSpellingErrors": True
+                }
+            })
+        }
+
     def create(self, title: str, text_with_blanks: str, output_name: str = None,
-               task_description: str = None) -> H5PResult:
+               task_description: str = None,
+               spelling_lexicon: Union[List[str], BKTree] = None,
+               max_spelling_distance: int = 1) -> H5PResult:
         """
         Erstellt eine Fill in the Blanks H5P-Datei
 
@@ -493,6 +674,10 @@ class FillInBlanksGenerator(H5PGenerator):
                 Mehrere Antworten: "*Berlin/berlin*"
             output_name: Dateiname
             task_description: Aufgabenstellung (z.B. "Fülle die Lücken aus.")
+            spelling_lexicon: Optional, Lexikon akzeptierter Schreibweisen
+                (z.B. ["E-Mail", "Email"]). Nahe Schreibweisen werden als
+                alternative Antworten in die Lücken übernommen.
+            max_spelling_distance: Maximale Edit-Distanz für Alternativen
 
         Returns:
             H5PResult
@@ -509,6 +694,11 @@ class FillInBlanksGenerator(H5PGenerator):
             if blanks_count < 1:
                 raise H5PValidationError("Text muss mindestens eine Lücke enthalten")
 
+            if spelling_lexicon:
+                text_with_blanks = self.add_alternative_spellings(
+                    text_with_blanks, spelling_lexicon, max_spelling_distance
+                )
+
             if not output_name:
                 output_name = f"blanks_{self._sanitize_filename(title)}"
             else:
@@ -520,38 +710,14 @@ class FillInBlanksGenerator(H5PGenerator):
             if not task_description:
                 task_description = "Fülle die Lücken mit den richtigen Begriffen aus."
 
+            skeleton = self._skeleton("H5P.Blanks")
             content = {
                 "questions": f"<p>{task_description}</p>",
                 "text": text_with_blanks,
-                "overallFeedback": [
-                    {"from": 0, "to": 50, "feedback": self.style.feedback_wrong},
-                    {"from": 51, "to": 80, "feedback": self.style.feedback_partial},
-                    {"from": 81, "to": 100, "feedback": self.style.feedback_correct}
-                ],
-                "showSolutions": "Lösung anzeigen",
-                "tryAgain": "Nochmal",
-                "checkAnswer": "Prüfen",
-                "submitAnswer": "Absenden",
-                "notFilledOut": "Bitte fülle alle Lücken aus",
-                "answerIsCorrect": "':ans' ist richtig",
-                "answerIsWrong": "':ans' ist falsch",
-                "answeredCorrectly": "Richtig beantwortet",
-                "answeredIncorrectly": "Falsch beantwortet",
-                "solutionLabel": "Richtige Antwort:",
-                "inputLabel": "Lücke @num von @total",
-                "behaviour": {
-                    "enableRetry": True,
-                    "enableSolutionsButton": True,
-                    "enableCheckButton": True,
-                    "caseSensitive": False,
-                    "showSolutionsRequiresInput": True,
-                    "autoCheck": False,
-                    "separateLines": False,
-                    "acceptSpellingErrors": True
-                }
+                **skeleton.members('tail')
             }
 
-            self._write_json(temp_dir / "content" / "content.json", content)
+            self._write_content(temp_dir, content, "H5P.Blanks")
             self._write_json(temp_dir / "h5p.json", self._create_h5p_meta(
                 title, "H5P.Blanks",
                 [{"machineName": "H5P.Blanks", "majorVersion": 1, "minorVersion": 14}]
@@ -567,6 +733,55 @@ class FillInBlanksGenerator(H5PGenerator):
         except Exception as e:
             return H5PResult(success=False, error=f"Unerwarteter Fehler: {e}", content_type="FillInBlanks", title=title)
 
+    def suggest_alternative_spellings(self, text_with_blanks: str,
+                                      spelling_lexicon: Union[List[str], BKTree],
+                                      max_distance: int = 1) -> Dict[str, List[str]]:
+        """
+        Schlägt pro Lücke akzeptierte alternative Schreibweisen vor.
+
+        Args:
+            text_with_blanks: Text mit *Lücken*
+            spelling_lexicon: Liste akzeptierter Schreibweisen oder fertiger BKTree
+            max_distance: Maximale Edit-Distanz
+
+        Returns:
+            Dict: Antwort -> Liste alternativer Schreibweisen
+        """
+        tree = spelling_lexicon if isinstance(spelling_lexicon, BKTree) else BKTree(spelling_lexicon)
+        suggestions = {}
+
+        for match in self.BLANK_PATTERN.finditer(text_with_blanks):
+            answers_part = match.group(1).split(':', 1)[0]
+            answers = [a.strip() for a in answers_part.split('/') if a.strip()]
+            known = {a.lower() for a in answers}
+
+            for answer in answers:
+                for hit in tree.search(answer, max_distance):
+                    if hit.term.lower() not in known:
+                        known.add(hit.term.lower())
+                        suggestions.setdefault(answer, []).append(hit.term)
+
+        return suggestions
+
+    def add_alternative_spellings(self, text_with_blanks: str,
+                                  spelling_lexicon: Union[List[str], BKTree],
+                                  max_distance: int = 1) -> str:
+        """Ergänzt die Lücken um die vorgeschlagenen Schreibweisen ("*E-Mail/Email*")"""
+        suggestions = self.suggest_alternative_spellings(text_with_blanks, spelling_lexicon, max_distance)
+        if not suggestions:
+            return text_with_blanks
+
+        def extend_blank(match: re.Match) -> str:
+            answers_part, sep, tip = match.group(1).partition(':')
+            answers = [a.strip() for a in answers_part.split('/') if a.strip()]
+            for answer in list(answers):
+                for alternative in suggestions.get(answer, []):
+                    if alternative not in answers:
+                        answers.append(alternative)
+            return f"*{'/'.join(answers)}{sep}{tip}*"
+
+        return self.BLANK_PATTERN.sub(extend_blank, text_with_blanks)
+
 
 # =============================================================================
 # Drag and Drop Generator
@@ -575,6 +790,39 @@ class FillInBlanksGenerator(H5PGenerator):
 class DragDropGenerator(H5PGenerator):
     """Generator für Drag and Drop Zuordnungsaufgaben"""
 
+    def _static_parts(self) -> Dict:
+        return {
+            'head': Members({
+                "scoreShow": "Punkte anzeigen",
+                "tryAgain": "Nochmal",
+                "scoreExplanation": "Richtige Zuordnungen geben Punkte."
+            }),
+            'tail': Members({
+                "overallFeedback": self._overall_feedback(),
+                "behaviour": {
+                    "enableRetry": True,
+                    "enableCheckButton": True,
+                    "showSolutionsRequiresInput": True,
+                    "singlePoint": False,
+                    "applyPenalties": False,
+                    "enableScoreExplanation": True,
+                    "dropZoneHighlighting": "always",
+                    "autoAlignSpacing": 2,
+                    "enableFullScreen": True,
+                    "showScorePoints": True,
+                    "showTitle": True
+                },
+                "grabbablePrefix": "Ziehbares Element {num}.",
+                "dropzonePrefix": "Dropzone {num}.",
+                "tipLabel": "Tipps anzeigen",
+                "correctAnswer": "Richtige Antwort",
+                "wrongAnswer": "Falsche Antwort",
+                "scoreBarLabel": "Du hast :num von :total Punkten",
+                "showSolution": "Lösung anzeigen",
+                "submit": "Absenden"
+            })
+        }
+
     def create(self, title: str, task_description: str, dropzones: List[str],
                draggables: List[Dict], output_name: str = None,
                background_image: str = None) -> H5PResult:
@@ -655,46 +903,28 @@ class DragDropGenerator(H5PGenerator):
                     print(f"[WARN] Background image download failed: {e}")
 
             # =================================================================
-            # Canvas
+            # Layout: Shelf-Packing fuer Draggables, Skyline fuer Dropzones
+            # (drag_layout.py, gemeinsam mit dem H5P Designer). Groessen in em
+            # wie in der v13-Referenz; bei vielen Elementen wird der Canvas
+            # erst hoeher, dann breiter (Mindestwerte = Designer-Grenzwerte).
             # =================================================================
-            canvas_width = 620
-            canvas_height = 450  # Match v13 reference
+            config = LayoutConfig(canvas_width=620, canvas_height=450)
+            layout = layout_drag_question(
+                [d['text'] for d in draggables],
+                dropzones,
+                [d['dropzone'] for d in draggables],
+                config
+            )
+            canvas_width = layout.canvas_width
+            canvas_height = layout.canvas_height
+            if canvas_height > config.max_canvas_height:
+                print(f"[WARN] {len(draggables)} Draggables brauchen einen Canvas von "
+                      f"{canvas_width}x{canvas_height}px - Aufgabe besser aufteilen")
 
-            # =================================================================
-            # DRAGGABLES: Based on working v13 reference
-            # Width 6-8 depending on text length, height 2
-            # =================================================================
             h5p_draggables = []
-
-            items_per_row = 5
-            h_gap = 1.5
-            v_gap = 0.8
-            start_x = 2
-            start_y = 2
-
             for i, drag in enumerate(draggables):
-                row = i // items_per_row
-                col = i % items_per_row
-
-                # Calculate width based on text length (6-8 range)
-                text_len = len(drag['text'])
-                if text_len <= 12:
-                    item_width = 6
-                elif text_len <= 18:
-                    item_width = 7
-                else:
-                    item_width = 8
-
-                item_height = 2
-
-                x_pos = start_x + col * (8 + h_gap)  # Use max width for spacing
-                y_pos = start_y + row * (item_height + v_gap)
-
                 h5p_draggables.append({
-                    "x": round(x_pos, 2),
-                    "y": round(y_pos, 2),
-                    "width": item_width,
-                    "height": item_height,
+                    **layout.geometry(layout.draggables[i]),
                     "dropZones": [str(drag['dropzone'])],
                     "type": {
                         "library": "H5P.AdvancedText 1.1",
@@ -708,43 +938,14 @@ class DragDropGenerator(H5PGenerator):
                     "multiple": False
                 })
 
-            # =================================================================
-            # DROPZONES: Based on working v13 reference
-            # Fixed positions: x=3,37,71 for 3 zones, width=10, height=73
-            # =================================================================
-            num_zones = len(dropzones)
-
-            zone_height = 73   # Tall dropzones (v13 reference)
-            zone_y = 22        # Start below draggables (v13 reference)
-            zone_width = 10    # Wide enough for content (v13 reference)
-
-            # Fixed X-positions based on number of zones (v13 pattern)
-            # These create non-overlapping zones on a 620px canvas
-            if num_zones == 2:
-                zone_positions = [10, 55]
-            elif num_zones == 3:
-                zone_positions = [3, 37, 71]  # v13 reference values
-            elif num_zones == 4:
-                zone_positions = [2, 26, 50, 74]
-            elif num_zones == 5:
-                zone_positions = [2, 20, 38, 56, 74]
-            else:
-                # Distribute evenly for other counts
-                spacing = 90 // max(1, num_zones)
-                zone_positions = [3 + i * spacing for i in range(num_zones)]
-
             zone_colors = ["#e3f2fd", "#fce4ec", "#e8f5e9", "#fff8e1", "#f3e5f5", "#e0f7fa"]
 
             h5p_dropzones = []
             for i, dz in enumerate(dropzones):
                 bg_color = zone_colors[i % len(zone_colors)]
-                x_pos = zone_positions[i]
 
                 h5p_dropzones.append({
-                    "x": x_pos,
-                    "y": zone_y,
-                    "width": zone_width,
-                    "height": zone_height,
+                    **layout.geometry(layout.dropzones[i]),
                     "correctElements": [],
                     "showLabel": True,
                     "backgroundOpacity": 70,
@@ -765,10 +966,9 @@ class DragDropGenerator(H5PGenerator):
             if bg_settings:
                 question_settings["background"] = bg_settings
 
+            skeleton = self._skeleton("H5P.DragQuestion")
             content = {
-                "scoreShow": "Punkte anzeigen",
-                "tryAgain": "Nochmal",
-                "scoreExplanation": "Richtige Zuordnungen geben Punkte.",
+                **skeleton.members('head'),
                 "question": {
                     "settings": question_settings,
                     "task": {
@@ -776,35 +976,10 @@ class DragDropGenerator(H5PGenerator):
                         "dropZones": h5p_dropzones
                     }
                 },
-                "overallFeedback": [
-                    {"from": 0, "to": 50, "feedback": self.style.feedback_wrong},
-                    {"from": 51, "to": 80, "feedback": self.style.feedback_partial},
-                    {"from": 81, "to": 100, "feedback": self.style.feedback_correct}
-                ],
-                "behaviour": {
-                    "enableRetry": True,
-                    "enableCheckButton": True,
-                    "showSolutionsRequiresInput": True,
-                    "singlePoint": False,
-                    "applyPenalties": False,
-                    "enableScoreExplanation": True,
-                    "dropZoneHighlighting": "always",
-                    "autoAlignSpacing": 2,
-                    "enableFullScreen": True,
-                    "showScorePoints": True,
-                    "showTitle": True
-                },
-                "grabbablePrefix": "Ziehbares Element {num}.",
-                "dropzonePrefix": "Dropzone {num}.",
-                "tipLabel": "Tipps anzeigen",
-                "correctAnswer": "Richtige Antwort",
-                "wrongAnswer": "Falsche Antwort",
-                "scoreBarLabel": "Du hast :num von :total Punkten",
-                "showSolution": "Lösung anzeigen",
-                "submit": "Absenden"
+                **skeleton.members('tail')
             }
 
-            self._write_json(temp_dir / "content" / "content.json", content)
+            self._write_content(temp_dir, content, "H5P.DragQuestion")
             self._write_json(temp_dir / "h5p.json", self._create_h5p_meta(
                 title, "H5P.DragQuestion",
                 [
@@ -831,6 +1006,35 @@ class DragDropGenerator(H5PGenerator):
 class SingleChoiceSetGenerator(H5PGenerator):
     """Generator für schnelle Single Choice Fragen (ohne QuestionSet-Wrapper)"""
 
+    def _static_parts(self) -> Dict:
+        return {
+            'tail': Members({
+                "overallFeedback": self._overall_feedback(),
+                "behaviour": {
+                    "autoContinue": True,
+                    "timeoutCorrect": 2000,
+                    "timeoutWrong": 3000,
+                    "soundEffectsEnabled": False,
+                    "enableRetry": True,
+                    "enableSolutionsButton": True,
+                    "passPercentage": self.style.pass_percentage
+                },
+                "l10n": {
+                    "nextButtonLabel": "Weiter",
+                    "showSolutionButtonLabel": "Lösung zeigen",
+                    "retryButtonLabel": "Nochmal",
+                    "solutionViewTitle": "Lösung",
+                    "correctText": "Richtig!",
+                    "incorrectText": "Falsch!",
+                    "muteButtonLabel": "Ton aus",
+                    "closeButtonLabel": "Schließen",
+                    "slideOfTotal": "Frage :num von :total",
+                    "scoreBarLabel": "Du hast :num von :total Punkten",
+                    "resultSlideTitle": "Ergebnis"
+                }
+            })
+        }
+
     def create(self, title: str, questions: List[Dict], output_name: str = None) -> H5PResult:
         """
         Erstellt ein Single Choice Set - schnelle Frage/Antwort ohne Intro
@@ -869,38 +1073,13 @@ class SingleChoiceSetGenerator(H5PGenerator):
                     "answers": [f"<p>{a}</p>" for a in q['answers']]
                 })
 
+            skeleton = self._skeleton("H5P.SingleChoiceSet")
             content = {
                 "choices": h5p_questions,
-                "overallFeedback": [
-                    {"from": 0, "to": 50, "feedback": self.style.feedback_wrong},
-                    {"from": 51, "to": 80, "feedback": self.style.feedback_partial},
-                    {"from": 81, "to": 100, "feedback": self.style.feedback_correct}
-                ],
-                "behaviour": {
-                    "autoContinue": True,
-                    "timeoutCorrect": 2000,
-                    "timeoutWrong": 3000,
-                    "soundEffectsEnabled": False,
-                    "enableRetry": True,
-                    "enableSolutionsButton": True,
-                    "passPercentage": self.style.pass_percentage
-                },
-                "l10n": {
-                    "nextButtonLabel": "Weiter",
-                    "showSolutionButtonLabel": "Lösung zeigen",
-                    "retryButtonLabel": "Nochmal",
-                    "solutionViewTitle": "Lösung",
-                    "correctText": "Richtig!",
-                    "incorrectText": "Falsch!",
-                    "muteButtonLabel": "Ton aus",
-                    "closeButtonLabel": "Schließen",
-                    "slideOfTotal": "Frage :num von :total",
-                    "scoreBarLabel": "Du hast :num von :total Punkten",
-                    "resultSlideTitle": "Ergebnis"
-                }
+                **skeleton.members('tail')
             }
 
-            self._write_json(temp_dir / "content" / "content.json", content)
+            self._write_content(temp_dir, content, "H5P.SingleChoiceSet")
             self._write_json(temp_dir / "h5p.json", self._create_h5p_meta(
                 title, "H5P.SingleChoiceSet",
                 [{"machineName": "H5P.SingleChoiceSet", "majorVersion": 1, "minorVersion": 11}]
@@ -924,6 +1103,42 @@ class SingleChoiceSetGenerator(H5PGenerator):
 class DialogCardsGenerator(H5PGenerator):
     """Generator für Lernkarten (Flashcards)"""
 
+    def _static_parts(self) -> Dict:
+        return {
+            'head': Members({
+                "mode": "normal",
+                "description": "<p>Klicke auf die Karte um sie umzudrehen.</p>"
+            }),
+            'tail': Members({
+                "behaviour": {
+                    "enableRetry": True,
+                    "disableBackwardsNavigation": False,
+                    "scaleTextNotCard": False,
+                    "randomCards": False,
+                    "maxProficiency": 5,
+                    "quickProgression": False
+                },
+                "answer": "Umdrehen",
+                "next": "Weiter",
+                "prev": "Zurück",
+                "retry": "Nochmal",
+                "correctAnswer": "Ich wusste es!",
+                "incorrectAnswer": "Ich wusste es nicht",
+                "round": "Runde @round",
+                "cardsLeft": "Noch @number Karten",
+                "nextRound": "Nächste Runde",
+                "showSummary": "Zusammenfassung",
+                "summary": "Zusammenfassung",
+                "summaryCardsRight": "Karten richtig:",
+                "summaryCardsWrong": "Karten falsch:",
+                "summaryCardsNotShown": "Karten nicht gezeigt:",
+                "summaryOverallScore": "Gesamtpunktzahl:",
+                "summaryCardsCompleted": "Abgeschlossene Karten:",
+                "summaryCompletedRounds": "Abgeschlossene Runden:",
+                "progressText": "@card von @total"
+            })
+        }
+
     def create(self, title: str, cards: List[Dict], output_name: str = None) -> H5PResult:
         """
         Erstellt Dialog Cards (Lernkarten)
@@ -966,40 +1181,15 @@ class DialogCardsGenerator(H5PGenerator):
                     card["tips"] = [{"text": c['tip']}]
                 h5p_cards.append(card)
 
+            skeleton = self._skeleton("H5P.Dialogcards")
             content = {
                 "title": f"<p>{title}</p>",
-                "mode": "normal",
-                "description": "<p>Klicke auf die Karte um sie umzudrehen.</p>",
+                **skeleton.members('head'),
                 "dialogs": h5p_cards,
-                "behaviour": {
-                    "enableRetry": True,
-                    "disableBackwardsNavigation": False,
-                    "scaleTextNotCard": False,
-                    "randomCards": False,
-                    "maxProficiency": 5,
-                    "quickProgression": False
-                },
-                "answer": "Umdrehen",
-                "next": "Weiter",
-                "prev": "Zurück",
-                "retry": "Nochmal",
-                "correctAnswer": "Ich wusste es!",
-                "incorrectAnswer": "Ich wusste es nicht",
-                "round": "Runde @round",
-                "cardsLeft": "Noch @number Karten",
-                "nextRound": "Nächste Runde",
-                "showSummary": "Zusammenfassung",
-                "summary": "Zusammenfassung",
-                "summaryCardsRight": "Karten richtig:",
-                "summaryCardsWrong": "Karten falsch:",
-                "summaryCardsNotShown": "Karten nicht gezeigt:",
-                "summaryOverallScore": "Gesamtpunktzahl:",
-                "summaryCardsCompleted": "Abgeschlossene Karten:",
-                "summaryCompletedRounds": "Abgeschlossene Runden:",
-                "progressText": "@card von @total"
+                **skeleton.members('tail')
             }
 
-            self._write_json(temp_dir / "content" / "content.json", content)
+            self._write_content(temp_dir, content, "H5P.Dialogcards")
             self._write_json(temp_dir / "h5p.json", self._create_h5p_meta(
                 title, "H5P.Dialogcards",
                 [{"machineName": "H5P.Dialogcards", "majorVersion": 1, "minorVersion": 9}]
@@ -1023,6 +1213,26 @@ class DialogCardsGenerator(H5PGenerator):
 class MarkTheWordsGenerator(H5PGenerator):
     """Generator für 'Markiere die Wörter' Aufgaben"""
 
+    def _static_parts(self) -> Dict:
+        return {
+            'tail': Members({
+                "overallFeedback": self._overall_feedback(),
+                "behaviour": {
+                    "enableRetry": True,
+                    "enableSolutionsButton": True,
+                    "enableCheckButton": True,
+                    "showScorePoints": True
+                },
+                "checkAnswerButton": "Prüfen",
+                "tryAgainButton": "Nochmal",
+                "showSolutionButton": "Lösung zeigen",
+                "correctAnswer": "Richtige Antwort!",
+                "incorrectAnswer": "Falsche Antwort!",
+                "missedAnswer": "Verpasst!",
+                "displaySolutionDescription": "Die Lösung wird mit einem Stern markiert."
+            })
+        }
+
     def create(self, title: str, text_with_marks: str, output_name: str = None,
                task_description: str = "Markiere alle korrekten Wörter.") -> H5PResult:
         """
@@ -1052,30 +1262,14 @@ class MarkTheWordsGenerator(H5PGenerator):
 
             temp_dir = self._create_temp_dir(output_name)
 
+            skeleton = self._skeleton("H5P.MarkTheWords")
             content = {
                 "taskDescription": f"<p>{task_description}</p>",
                 "textField": text_with_marks,
-                "overallFeedback": [
-                    {"from": 0, "to": 50, "feedback": self.style.feedback_wrong},
-                    {"from": 51, "to": 80, "feedback": self.style.feedback_partial},
-                    {"from": 81, "to": 100, "feedback": self.style.feedback_correct}
-                ],
-                "behaviour": {
-                    "enableRetry": True,
-                    "enableSolutionsButton": True,
-                    "enableCheckButton": True,
-                    "showScorePoints": True
-                },
-                "checkAnswerButton": "Prüfen",
-                "tryAgainButton": "Nochmal",
-                "showSolutionButton": "Lösung zeigen",
-                "correctAnswer": "Richtige Antwort!",
-                "incorrectAnswer": "Falsche Antwort!",
-                "missedAnswer": "Verpasst!",
-                "displaySolutionDescription": "Die Lösung wird mit einem Stern markiert."
+                **skeleton.members('tail')
             }
 
-            self._write_json(temp_dir / "content" / "content.json", content)
+            self._write_content(temp_dir, content, "H5P.MarkTheWords")
             self._write_json(temp_dir / "h5p.json", self._create_h5p_meta(
                 title, "H5P.MarkTheWords",
                 [{"machineName": "H5P.MarkTheWords", "majorVersion": 1, "minorVersion": 11}]
@@ -1099,6 +1293,23 @@ class MarkTheWordsGenerator(H5PGenerator):
 class SummaryGenerator(H5PGenerator):
     """Generator für Zusammenfassungen mit Auswahl"""
 
+    def _static_parts(self) -> Dict:
+        return {
+            'tail': Members({
+                "overallFeedback": self._overall_feedback(),
+                "solvedLabel": "Gelöst:",
+                "scoreLabel": "Falsche Versuche:",
+                "resultLabel": "Dein Ergebnis",
+                "labelCorrect": "Richtig!",
+                "labelIncorrect": "Falsch! Versuche es nochmal.",
+                "alternativeIncorrectLabel": "Falsch",
+                "labelCorrectAnswers": "Richtige Antworten.",
+                "tipButtonLabel": "Tipp zeigen",
+                "scoreBarLabel": "Du hast @score von @total",
+                "progressText": "Fortschritt @current von @total"
+            })
+        }
+
     def create(self, title: str, summary_items: List[Dict], output_name: str = None,
                intro_text: str = "Wähle die korrekte Aussage.") -> H5PResult:
         """
@@ -1137,27 +1348,14 @@ class SummaryGenerator(H5PGenerator):
                     "tip": item.get('tip', '')
                 })
 
+            skeleton = self._skeleton("H5P.Summary")
             content = {
                 "intro": f"<p>{intro_text}</p>",
                 "summaries": h5p_summaries,
-                "overallFeedback": [
-                    {"from": 0, "to": 50, "feedback": self.style.feedback_wrong},
-                    {"from": 51, "to": 80, "feedback": self.style.feedback_partial},
-                    {"from": 81, "to": 100, "feedback": self.style.feedback_correct}
-                ],
-                "solvedLabel": "Gelöst:",
-                "scoreLabel": "Falsche Versuche:",
-                "resultLabel": "Dein Ergebnis",
-                "labelCorrect": "Richtig!",
-                "labelIncorrect": "Falsch! Versuche es nochmal.",
-                "alternativeIncorrectLabel": "Falsch",
-                "labelCorrectAnswers": "Richtige Antworten.",
-                "tipButtonLabel": "Tipp zeigen",
-                "scoreBarLabel": "Du hast @score von @total",
-                "progressText": "Fortschritt @current von @total"
+                **skeleton.members('tail')
             }
 
-            self._write_json(temp_dir / "content" / "content.json", content)
+            self._write_content(temp_dir, content, "H5P.Summary")
             self._write_json(temp_dir / "h5p.json", self._create_h5p_meta(
                 title, "H5P.Summary",
                 [{"machineName": "H5P.Summary", "majorVersion": 1, "minorVersion": 10}]
@@ -1181,6 +1379,13 @@ class SummaryGenerator(H5PGenerator):
 class AccordionGenerator(H5PGenerator):
     """Generator für aufklappbare Inhaltsabschnitte"""
 
+    def _static_parts(self) -> Dict:
+        return {
+            'tail': Members({
+                "hTag": "h2"
+            })
+        }
+
     def create(self, title: str, panels: List[Dict], output_name: str = None) -> H5PResult:
         """
         Erstellt ein Accordion (aufklappbare Abschnitte)
@@ -1219,7 +1424,7 @@ class AccordionGenerator(H5PGenerator):
                     "content": {
                         "params": {"text": f"<p>{p['content']}</p>"},
                         "library": "H5P.AdvancedText 1.1",
-                        "subContentId": f"acc-{idx}-{hash(p['title']) % 10000}",
+                        "subContentId": self._generate_uuid(),
                         "metadata": {
                             "contentType": "Text",
                             "license": "U",
@@ -1228,12 +1433,13 @@ class AccordionGenerator(H5PGenerator):
                     }
                 })
 
+            skeleton = self._skeleton("H5P.Accordion")
             content = {
                 "panels": h5p_panels,
-                "hTag": "h2"
+                **skeleton.members('tail')
             }
 
-            self._write_json(temp_dir / "content" / "content.json", content)
+            self._write_content(temp_dir, content, "H5P.Accordion")
             self._write_json(temp_dir / "h5p.json", self._create_h5p_meta(
                 title, "H5P.Accordion",
                 [
@@ -1261,6 +1467,34 @@ class AccordionGenerator(H5PGenerator):
 class DragTextGenerator(H5PGenerator):
     """Generator für 'Drag the Words' - Wörter in Lücken ziehen"""
 
+    def _static_parts(self) -> Dict:
+        return {
+            'tail': Members({
+                "overallFeedback": self._overall_feedback(),
+                "checkAnswer": "Prüfen",
+                "tryAgain": "Nochmal",
+                "showSolution": "Lösung anzeigen",
+                "dropZoneIndex": "Lücke @index.",
+                "empty": "Lücke @index ist leer.",
+                "contains": "Lücke @index enthält @draggable.",
+                "ariaDraggableIndex": "@index von @count ziehbare Elemente.",
+                "tipLabel": "Tipp anzeigen",
+                "correctText": "Richtig!",
+                "incorrectText": "Falsch!",
+                "resetDropTitle": "Zurücksetzen",
+                "resetDropDescription": "Bist du sicher?",
+                "grabbed": "Gezogen.",
+                "cancelledDragging": "Ziehen abgebrochen.",
+                "correctAnswer": "Richtige Antwort:",
+                "behaviour": {
+                    "enableRetry": True,
+                    "enableSolutionsButton": True,
+                    "enableCheckButton": True,
+                    "instantFeedback": False
+                }
+            })
+        }
+
     def create(self, title: str, text_with_blanks: str, output_name: str = None,
                task_description: str = "Ziehe die Wörter an die richtige Stelle.") -> H5PResult:
         """
@@ -1294,38 +1528,14 @@ class DragTextGenerator(H5PGenerator):
 
             temp_dir = self._create_temp_dir(output_name)
 
+            skeleton = self._skeleton("H5P.DragText")
             content = {
                 "taskDescription": f"<p>{task_description}</p>",
                 "textField": text_with_blanks,
-                "overallFeedback": [
-                    {"from": 0, "to": 50, "feedback": self.style.feedback_wrong},
-                    {"from": 51, "to": 80, "feedback": self.style.feedback_partial},
-                    {"from": 81, "to": 100, "feedback": self.style.feedback_correct}
-                ],
-                "checkAnswer": "Prüfen",
-                "tryAgain": "Nochmal",
-                "showSolution": "Lösung anzeigen",
-                "dropZoneIndex": "Lücke @index.",
-                "empty": "Lücke @index ist leer.",
-                "contains": "Lücke @index enthält @draggable.",
-                "ariaDraggableIndex": "@index von @count ziehbare Elemente.",
-                "tipLabel": "Tipp anzeigen",
-                "correctText": "Richtig!",
-                "incorrectText": "Falsch!",
-                "resetDropTitle": "Zurücksetzen",
-                "resetDropDescription": "Bist du sicher?",
-                "grabbed": "Gezogen.",
-                "cancelledDragging": "Ziehen abgebrochen.",
-                "correctAnswer": "Richtige Antwort:",
-                "behaviour": {
-                    "enableRetry": True,
-                    "enableSolutionsButton": True,
-                    "enableCheckButton": True,
-                    "instantFeedback": False
-                }
+                **skeleton.members('tail')
             }
 
-            self._write_json(temp_dir / "content" / "content.json", content)
+            self._write_content(temp_dir, content, "H5P.DragText")
             self._write_json(temp_dir / "h5p.json", self._create_h5p_meta(
                 title, "H5P.DragText",
                 [{"machineName": "H5P.DragText", "majorVersion": 1, "minorVersion": 10}]
@@ -1349,6 +1559,20 @@ class DragTextGenerator(H5PGenerator):
 class TimelineGenerator(H5PGenerator):
     """Generator für Zeitleisten/Timelines"""
 
+    def _static_parts(self) -> Dict:
+        return {
+            'tail': Members({
+                "era": [],
+                "asset": {
+                    "media": "",
+                    "credit": ""
+                },
+                "defaultZoomLevel": 0,
+                "height": 600,
+                "language": "de"
+            })
+        }
+
     def create(self, title: str, events: List[Dict], output_name: str = None,
                description: str = "") -> H5PResult:
         """
@@ -1410,23 +1634,17 @@ class TimelineGenerator(H5PGenerator):
                 timeline_events.append(event)
 
             # Build content structure matching official h5p.org format exactly
+            skeleton = self._skeleton("H5P.Timeline")
             content = {
                 "timeline": {
                     "headline": title,
                     "text": f"<p>{description}</p>" if description else "<p></p>",
                     "date": timeline_events,
-                    "era": [],
-                    "asset": {
-                        "media": "",
-                        "credit": ""
-                    },
-                    "defaultZoomLevel": 0,
-                    "height": 600,
-                    "language": "de"
+                    **skeleton.members('tail')
                 }
             }
 
-            self._write_json(temp_dir / "content" / "content.json", content)
+            self._write_content(temp_dir, content, "H5P.Timeline")
 
             # Timeline needs special h5p.json with div embedType and TimelineJS dependency
             h5p_meta = {
@@ -1460,6 +1678,30 @@ class TimelineGenerator(H5PGenerator):
 class MemoryGameGenerator(H5PGenerator):
     """Generator für Memory-Spiele"""
 
+    def _static_parts(self) -> Dict:
+        return {
+            'behaviour': {
+                "useGrid": True,
+                "allowRetry": True
+            },
+            'l10n_head': Members({
+                "cardTurns": "Züge",
+                "timeSpent": "Zeit",
+                "feedback": "Gut gemacht!",
+                "tryAgain": "Nochmal",
+                "closeLabel": "Schließen"
+            }),
+            'l10n_tail': Members({
+                "done": "Alle Paare gefunden!",
+                "cardPrefix": "Karte %num:",
+                "cardUnturned": "Nicht umgedreht.",
+                "cardMatched": "Paar gefunden."
+            }),
+            'lookNFeel': {
+                "themeColor": self.style.primary_color
+            }
+        }
+
     def create(self, title: str, cards: List[Dict], output_name: str = None) -> H5PResult:
         """
         Erstellt ein Memory-Spiel
@@ -1508,30 +1750,19 @@ class MemoryGameGenerator(H5PGenerator):
                     }
                 memory_cards.append(card)
 
+            skeleton = self._skeleton("H5P.MemoryGame")
             content = {
                 "cards": memory_cards,
-                "behaviour": {
-                    "useGrid": True,
-                    "allowRetry": True
-                },
+                "behaviour": skeleton['behaviour'],
                 "l10n": {
-                    "cardTurns": "Züge",
-                    "timeSpent": "Zeit",
-                    "feedback": "Gut gemacht!",
-                    "tryAgain": "Nochmal",
-                    "closeLabel": "Schließen",
+                    **skeleton.members('l10n_head'),
                     "label": f"Memory: {title}",
-                    "done": "Alle Paare gefunden!",
-                    "cardPrefix": "Karte %num:",
-                    "cardUnturned": "Nicht umgedreht.",
-                    "cardMatched": "Paar gefunden."
+                    **skeleton.members('l10n_tail')
                 },
-                "lookNFeel": {
-                    "themeColor": self.style.primary_color
-                }
+                "lookNFeel": skeleton['lookNFeel']
             }
 
-            self._write_json(temp_dir / "content" / "content.json", content)
+            self._write_content(temp_dir, content, "H5P.MemoryGame")
             self._write_json(temp_dir / "h5p.json", self._create_h5p_meta(
                 title, "H5P.MemoryGame",
                 [{"machineName": "H5P.MemoryGame", "majorVersion": 1, "minorVersion": 3}]
@@ -1555,6 +1786,29 @@ class MemoryGameGenerator(H5PGenerator):
 class EssayGenerator(H5PGenerator):
     """Generator für Essay-Aufgaben mit Keyword-basierter Bewertung"""
 
+    def _static_parts(self) -> Dict:
+        return {
+            'media': {"type": {"params": {}}, "disableImageZooming": False},
+            'overallFeedback': [
+                {"from": 0, "to": 50, "feedback": "Versuche, mehr Schl&uuml;sselbegriffe zu verwenden."},
+                {"from": 51, "to": 80, "feedback": "Gute Arbeit! Du hast die meisten Begriffe verwendet."},
+                {"from": 81, "to": 100, "feedback": "Ausgezeichnet! Du hast alle wichtigen Begriffe genannt."}
+            ],
+            'tail': Members({
+                "checkAnswer": "Antwort pr&uuml;fen",
+                "submitAnswer": "Absenden",
+                "tryAgain": "Nochmal versuchen",
+                "showSolution": "L&ouml;sung anzeigen",
+                "feedbackHeader": "Feedback",
+                "solutionTitle": "Musterl&ouml;sung",
+                "remainingChars": "Verbleibende Zeichen: @chars",
+                "notEnoughChars": "Du musst mindestens @chars Zeichen eingeben!",
+                "savingMessage": "Wird gespeichert...",
+                "savedMessage": "Gespeichert!",
+                "ariaYourResult": "Du hast @score von @total Punkten erreicht."
+            })
+        }
+
     def create(self, title: str, task_description: str, keywords: List[Dict],
                output_name: str = None, sample_solution: str = "",
                min_length: int = 0, input_field_size: int = 10,
@@ -1612,19 +1866,16 @@ class EssayGenerator(H5PGenerator):
                 }
                 h5p_keywords.append(keyword_entry)
 
+            skeleton = self._skeleton("H5P.Essay")
             content = {
-                "media": {"type": {"params": {}}, "disableImageZooming": False},
+                "media": skeleton['media'],
                 "taskDescription": f"<p>{task_description}</p>",
                 "solution": {
                     "introduction": "<p>Musterl&ouml;sung:</p>",
                     "sample": f"<p>{sample_solution}</p>" if sample_solution else ""
                 },
                 "keywords": h5p_keywords,
-                "overallFeedback": [
-                    {"from": 0, "to": 50, "feedback": "Versuche, mehr Schl&uuml;sselbegriffe zu verwenden."},
-                    {"from": 51, "to": 80, "feedback": "Gute Arbeit! Du hast die meisten Begriffe verwendet."},
-                    {"from": 81, "to": 100, "feedback": "Ausgezeichnet! Du hast alle wichtigen Begriffe genannt."}
-                ],
+                "overallFeedback": skeleton['overallFeedback'],
                 "behaviour": {
                     "minimumLength": min_length,
                     "inputFieldSize": input_field_size,
@@ -1633,20 +1884,10 @@ class EssayGenerator(H5PGenerator):
                     "ignoreScoring": False,
                     "pointsHost": 1
                 },
-                "checkAnswer": "Antwort pr&uuml;fen",
-                "submitAnswer": "Absenden",
-                "tryAgain": "Nochmal versuchen",
-                "showSolution": "L&ouml;sung anzeigen",
-                "feedbackHeader": "Feedback",
-                "solutionTitle": "Musterl&ouml;sung",
-                "remainingChars": "Verbleibende Zeichen: @chars",
-                "notEnoughChars": "Du musst mindestens @chars Zeichen eingeben!",
-                "savingMessage": "Wird gespeichert...",
-                "savedMessage": "Gespeichert!",
-                "ariaYourResult": "Du hast @score von @total Punkten erreicht."
+                **skeleton.members('tail')
             }
 
-            self._write_json(temp_dir / "content" / "content.json", content)
+            self._write_content(temp_dir, content, "H5P.Essay")
             self._write_json(temp_dir / "h5p.json", self._create_h5p_meta(
                 title, "H5P.Essay",
                 [
@@ -1674,6 +1915,36 @@ class EssayGenerator(H5PGenerator):
 class SortParagraphsGenerator(H5PGenerator):
     """Generator für Absätze sortieren - H5P.SortParagraphs"""
 
+    def _static_parts(self) -> Dict:
+        return {
+            'tail': Members({
+                "behaviour": {
+                    "enableRetry": True,
+                    "enableSolutionsButton": True,
+                    "scoringMode": "positions",
+                    "applyPenalties": True,
+                    "duplicatesInterchangeable": True
+                },
+                "l10n": {
+                    "checkAnswer": "Antwort pr&uuml;fen",
+                    "submitAnswer": "Absenden",
+                    "tryAgain": "Nochmal versuchen",
+                    "showSolution": "L&ouml;sung anzeigen",
+                    "up": "Nach oben",
+                    "down": "Nach unten",
+                    "disabled": "Deaktiviert",
+                    "correctAnswer": "Richtige Antwort",
+                    "wrongAnswer": "Falsche Antwort",
+                    "header": "Absatz sortieren",
+                    "resetDialog": "M&ouml;chtest du wirklich zur&uuml;cksetzen?",
+                    "resetDialogDescription": "Alle Antworten werden gel&ouml;scht.",
+                    "resetConfirm": "Zur&uuml;cksetzen",
+                    "resetDeny": "Abbrechen",
+                    "yourResult": "Du hast @score von @total Punkten erreicht."
+                }
+            })
+        }
+
     def create(self, title: str, paragraphs: List[str], output_name: str = None,
                task_description: str = "Bringe die Abs&auml;tze in die richtige Reihenfolge.") -> H5PResult:
         """
@@ -1700,36 +1971,14 @@ class SortParagraphsGenerator(H5PGenerator):
 
             temp_dir = self._create_temp_dir(output_name)
 
+            skeleton = self._skeleton("H5P.SortParagraphs")
             content = {
                 "taskDescription": f"<p>{task_description}</p>",
                 "paragraphs": [{"text": f"<p>{p}</p>"} for p in paragraphs],
-                "behaviour": {
-                    "enableRetry": True,
-                    "enableSolutionsButton": True,
-                    "scoringMode": "positions",
-                    "applyPenalties": True,
-                    "duplicatesInterchangeable": True
-                },
-                "l10n": {
-                    "checkAnswer": "Antwort pr&uuml;fen",
-                    "submitAnswer": "Absenden",
-                    "tryAgain": "Nochmal versuchen",
-                    "showSolution": "L&ouml;sung anzeigen",
-                    "up": "Nach oben",
-                    "down": "Nach unten",
-                    "disabled": "Deaktiviert",
-                    "correctAnswer": "Richtige Antwort",
-                    "wrongAnswer": "Falsche Antwort",
-                    "header": "Absatz sortieren",
-                    "resetDialog": "M&ouml;chtest du wirklich zur&uuml;cksetzen?",
-                    "resetDialogDescription": "Alle Antworten werden gel&ouml;scht.",
-                    "resetConfirm": "Zur&uuml;cksetzen",
-                    "resetDeny": "Abbrechen",
-                    "yourResult": "Du hast @score von @total Punkten erreicht."
-                }
+                **skeleton.members('tail')
             }
 
-            self._write_json(temp_dir / "content" / "content.json", content)
+            self._write_content(temp_dir, content, "H5P.SortParagraphs")
             self._write_json(temp_dir / "h5p.json", self._create_h5p_meta(
                 title, "H5P.SortParagraphs",
                 [
@@ -1757,6 +2006,19 @@ class SortParagraphsGenerator(H5PGenerator):
 class BranchingScenarioGenerator(H5PGenerator):
     """Generator für verzweigte Lernszenarien - H5P.BranchingScenario"""
 
+    def _static_parts(self) -> Dict:
+        return {
+            'l10n': {
+                "startScreenButtonText": "Starten",
+                "endScreenButtonText": "Neustart",
+                "backButtonText": "Zur&uuml;ck",
+                "proceedButtonText": "Weiter",
+                "disableProceedButtonText": "Bitte beantworte die Frage.",
+                "scoreText": "Dein Ergebnis:",
+                "fullscreenAria": "Vollbild"
+            }
+        }
+
     def create(self, title: str, nodes: List[Dict], output_name: str = None,
                start_title: str = None, scoring_option: str = "no-score") -> H5PResult:
         """
@@ -1893,19 +2155,11 @@ class BranchingScenarioGenerator(H5PGenerator):
                     "scoringOptionGroup": {
                         "scoringOption": scoring_map.get(scoring_option, "no-score")
                     },
-                    "l10n": {
-                        "startScreenButtonText": "Starten",
-                        "endScreenButtonText": "Neustart",
-                        "backButtonText": "Zur&uuml;ck",
-                        "proceedButtonText": "Weiter",
-                        "disableProceedButtonText": "Bitte beantworte die Frage.",
-                        "scoreText": "Dein Ergebnis:",
-                        "fullscreenAria": "Vollbild"
-                    }
+                    "l10n": self._skeleton("H5P.BranchingScenario")['l10n']
                 }
             }
 
-            self._write_json(temp_dir / "content" / "content.json", content)
+            self._write_content(temp_dir, content, "H5P.BranchingScenario")
             self._write_json(temp_dir / "h5p.json", self._create_h5p_meta(
                 title, "H5P.BranchingScenario",
                 [
@@ -1933,6 +2187,50 @@ class BranchingScenarioGenerator(H5PGenerator):
 class InteractiveVideoGenerator(H5PGenerator):
     """Generator für interaktive Videos - H5P.InteractiveVideo"""
 
+    def _static_parts(self) -> Dict:
+        return {
+            'tail': Members({
+                "override": {
+                    "autoplay": False,
+                    "loop": False,
+                    "showBookmarksmenuOnLoad": False,
+                    "showRewind10": False,
+                    "preventSkipping": False,
+                    "deactivateSound": False
+                },
+                "l10n": {
+                    "interaction": "Interaktion",
+                    "play": "Abspielen",
+                    "pause": "Pause",
+                    "mute": "Stumm",
+                    "unmute": "Ton an",
+                    "quality": "Qualit&auml;t",
+                    "captions": "Untertitel",
+                    "close": "Schlie&szlig;en",
+                    "fullscreen": "Vollbild",
+                    "exitFullscreen": "Vollbild beenden",
+                    "summary": "Zusammenfassung",
+                    "bookmarks": "Lesezeichen",
+                    "defaultAdaptivitySeekLabel": "Weiter bei @timecode",
+                    "continueWithVideo": "Video fortsetzen",
+                    "more": "Mehr",
+                    "playbackRate": "Geschwindigkeit",
+                    "rewind10": "10 Sekunden zur&uuml;ck",
+                    "navDisabled": "Navigation deaktiviert",
+                    "requiresCompletionWarning": "Beantworte alle Fragen, um fortzufahren.",
+                    "back": "Zur&uuml;ck",
+                    "hours": "Stunden",
+                    "minutes": "Minuten",
+                    "seconds": "Sekunden",
+                    "currentTime": "Aktuelle Zeit:",
+                    "totalTime": "Gesamtzeit:",
+                    "singleInteractionAnnouncement": "Interaktion erschien",
+                    "multipleInteractionsAnnouncement": "Mehrere Interaktionen erschienen",
+                    "videoPausedAnnouncement": "Video pausiert"
+                }
+            })
+        }
+
     SUPPORTED_INTERACTIONS = {
         'multi_choice': 'H5P.MultiChoice 1.16',
         'true_false': 'H5P.TrueFalse 1.8',
@@ -2037,6 +2335,7 @@ class InteractiveVideoGenerator(H5PGenerator):
                     }
                     h5p_interactions.append(h5p_interaction)
 
+            skeleton = self._skeleton("H5P.InteractiveVideo")
             content = {
                 "interactiveVideo": {
                     "video": {
@@ -2065,44 +2364,7 @@ class InteractiveVideoGenerator(H5PGenerator):
                         "displayAt": 3
                     }
                 },
-                "override": {
-                    "autoplay": False,
-                    "loop": False,
-                    "showBookmarksmenuOnLoad": False,
-                    "showRewind10": False,
-                    "preventSkipping": False,
-                    "deactivateSound": False
-                },
-                "l10n": {
-                    "interaction": "Interaktion",
-                    "play": "Abspielen",
-                    "pause": "Pause",
-                    "mute": "Stumm",
-                    "unmute": "Ton an",
-                    "quality": "Qualit&auml;t",
-                    "captions": "Untertitel",
-                    "close": "Schlie&szlig;en",
-                    "fullscreen": "Vollbild",
-                    "exitFullscreen": "Vollbild beenden",
-                    "summary": "Zusammenfassung",
-                    "bookmarks": "Lesezeichen",
-                    "defaultAdaptivitySeekLabel": "Weiter bei @timecode",
-                    "continueWithVideo": "Video fortsetzen",
-                    "more": "Mehr",
-                    "playbackRate": "Geschwindigkeit",
-                    "rewind10": "10 Sekunden zur&uuml;ck",
-                    "navDisabled": "Navigation deaktiviert",
-                    "requiresCompletionWarning": "Beantworte alle Fragen, um fortzufahren.",
-                    "back": "Zur&uuml;ck",
-                    "hours": "Stunden",
-                    "minutes": "Minuten",
-                    "seconds": "Sekunden",
-                    "currentTime": "Aktuelle Zeit:",
-                    "totalTime": "Gesamtzeit:",
-                    "singleInteractionAnnouncement": "Interaktion erschien",
-                    "multipleInteractionsAnnouncement": "Mehrere Interaktionen erschienen",
-                    "videoPausedAnnouncement": "Video pausiert"
-                }
+                **skeleton.members('tail')
             }
 
             # Build dependencies list
@@ -2125,7 +2387,7 @@ class InteractiveVideoGenerator(H5PGenerator):
                     "minorVersion": int(version[1])
                 })
 
-            self._write_json(temp_dir / "content" / "content.json", content)
+            self._write_content(temp_dir, content, "H5P.InteractiveVideo")
             self._write_json(temp_dir / "h5p.json", self._create_h5p_meta(
                 title, "H5P.InteractiveVideo", dependencies
             ))
@@ -2146,22 +2408,26 @@ class InteractiveVideoGenerator(H5PGenerator):
 # =============================================================================
 
 def create_true_false(title: str, questions: List[Dict], output_name: str = None,
-                      style: H5PStyle = None) -> H5PResult:
+                      style: H5PStyle = None,
+                      rng: random.Random = None) -> H5PResult:
     """Erstellt ein True/False Quiz"""
-    gen = TrueFalseGenerator(style=style)
+    gen = TrueFalseGenerator(style=style, rng=rng)
     return gen.create(title, questions, output_name)
 
 
 def create_multi_choice(title: str, questions: List[Dict], output_name: str = None,
-                        style: H5PStyle = None) -> H5PResult:
+                        style: H5PStyle = None,
+                        rng: random.Random = None) -> H5PResult:
     """Erstellt ein Multiple Choice Quiz"""
-    gen = MultiChoiceGenerator(style=style)
+    gen = MultiChoiceGenerator(style=style, rng=rng)
     return gen.create(title, questions, output_name)
 
 
 def create_fill_blanks(title: str, text: str, output_name: str = None,
                        style: H5PStyle = None,
-                       task_description: str = None) -> H5PResult:
+                       task_description: str = None,
+                       spelling_lexicon: Union[List[str], BKTree] = None,
+                       rng: random.Random = None) -> H5PResult:
     """Erstellt einen Lückentext
 
     Args:
@@ -2170,108 +2436,122 @@ def create_fill_blanks(title: str, text: str, output_name: str = None,
         output_name: Dateiname
         style: H5PStyle
         task_description: Aufgabenstellung (Default: "Fülle die Lücken...")
+        spelling_lexicon: Optional, akzeptierte Schreibweisen als Alternativen
     """
-    gen = FillInBlanksGenerator(style=style)
-    return gen.create(title, text, output_name, task_description)
+    gen = FillInBlanksGenerator(style=style, rng=rng)
+    return gen.create(title, text, output_name, task_description, spelling_lexicon=spelling_lexicon)
 
 
 def create_drag_drop(title: str, task: str, dropzones: List[str],
                      draggables: List[Dict], output_name: str = None,
                      style: H5PStyle = None,
-                     background_image: str = None) -> H5PResult:
+                     background_image: str = None,
+                     rng: random.Random = None) -> H5PResult:
     """Erstellt eine Drag & Drop Aufgabe
 
     Args:
         background_image: Optional URL zu einem Hintergrundbild (SVG/PNG/JPG)
     """
-    gen = DragDropGenerator(style=style)
+    gen = DragDropGenerator(style=style, rng=rng)
     return gen.create(title, task, dropzones, draggables, output_name, background_image)
 
 
 def create_single_choice(title: str, questions: List[Dict], output_name: str = None,
-                         style: H5PStyle = None) -> H5PResult:
+                         style: H5PStyle = None,
+                         rng: random.Random = None) -> H5PResult:
     """Erstellt ein Single Choice Set"""
-    gen = SingleChoiceSetGenerator(style=style)
+    gen = SingleChoiceSetGenerator(style=style, rng=rng)
     return gen.create(title, questions, output_name)
 
 
 def create_flashcards(title: str, cards: List[Dict], output_name: str = None,
-                      style: H5PStyle = None) -> H5PResult:
+                      style: H5PStyle = None,
+                      rng: random.Random = None) -> H5PResult:
     """Erstellt Lernkarten (Dialog Cards)"""
-    gen = DialogCardsGenerator(style=style)
+    gen = DialogCardsGenerator(style=style, rng=rng)
     return gen.create(title, cards, output_name)
 
 
 def create_mark_words(title: str, text: str, output_name: str = None,
                       task: str = "Markiere alle korrekten Wörter.",
-                      style: H5PStyle = None) -> H5PResult:
+                      style: H5PStyle = None,
+                      rng: random.Random = None) -> H5PResult:
     """Erstellt eine 'Markiere die Wörter' Aufgabe"""
-    gen = MarkTheWordsGenerator(style=style)
+    gen = MarkTheWordsGenerator(style=style, rng=rng)
     return gen.create(title, text, output_name, task)
 
 
 def create_summary(title: str, items: List[Dict], output_name: str = None,
                    intro: str = "Wähle die korrekte Aussage.",
-                   style: H5PStyle = None) -> H5PResult:
+                   style: H5PStyle = None,
+                   rng: random.Random = None) -> H5PResult:
     """Erstellt eine Summary"""
-    gen = SummaryGenerator(style=style)
+    gen = SummaryGenerator(style=style, rng=rng)
     return gen.create(title, items, output_name, intro)
 
 
 def create_accordion(title: str, panels: List[Dict], output_name: str = None,
-                     style: H5PStyle = None) -> H5PResult:
+                     style: H5PStyle = None,
+                     rng: random.Random = None) -> H5PResult:
     """Erstellt ein Accordion"""
-    gen = AccordionGenerator(style=style)
+    gen = AccordionGenerator(style=style, rng=rng)
     return gen.create(title, panels, output_name)
 
 
 def create_drag_text(title: str, text: str, output_name: str = None,
                      task: str = "Ziehe die Wörter an die richtige Stelle.",
-                     style: H5PStyle = None) -> H5PResult:
+                     style: H5PStyle = None,
+                     rng: random.Random = None) -> H5PResult:
     """Erstellt eine 'Drag the Words' Aufgabe - Wörter in Lücken ziehen"""
-    gen = DragTextGenerator(style=style)
+    gen = DragTextGenerator(style=style, rng=rng)
     return gen.create(title, text, output_name, task)
 
 
 def create_timeline(title: str, events: List[Dict], output_name: str = None,
-                    description: str = "", style: H5PStyle = None) -> H5PResult:
+                    description: str = "", style: H5PStyle = None,
+                    rng: random.Random = None) -> H5PResult:
     """Erstellt eine Timeline/Zeitleiste"""
-    gen = TimelineGenerator(style=style)
+    gen = TimelineGenerator(style=style, rng=rng)
     return gen.create(title, events, output_name, description)
 
 
 def create_memory_game(title: str, cards: List[Dict], output_name: str = None,
-                       style: H5PStyle = None) -> H5PResult:
+                       style: H5PStyle = None,
+                       rng: random.Random = None) -> H5PResult:
     """Erstellt ein Memory-Spiel (benötigt Bilder)"""
-    gen = MemoryGameGenerator(style=style)
+    gen = MemoryGameGenerator(style=style, rng=rng)
     return gen.create(title, cards, output_name)
 
 
 def create_essay(title: str, task_description: str, keywords: List[Dict],
-                 output_name: str = None, style: H5PStyle = None, **kwargs) -> H5PResult:
+                 output_name: str = None, style: H5PStyle = None, rng: random.Random = None,
+                 **kwargs) -> H5PResult:
     """Erstellt eine Essay-Aufgabe mit Keyword-Bewertung"""
-    gen = EssayGenerator(style=style)
+    gen = EssayGenerator(style=style, rng=rng)
     return gen.create(title, task_description, keywords, output_name, **kwargs)
 
 
 def create_sort_paragraphs(title: str, paragraphs: List[str], output_name: str = None,
-                           style: H5PStyle = None, **kwargs) -> H5PResult:
+                           style: H5PStyle = None, rng: random.Random = None,
+                           **kwargs) -> H5PResult:
     """Erstellt eine Absatz-Sortier-Aufgabe"""
-    gen = SortParagraphsGenerator(style=style)
+    gen = SortParagraphsGenerator(style=style, rng=rng)
     return gen.create(title, paragraphs, output_name, **kwargs)
 
 
 def create_branching_scenario(title: str, nodes: List[Dict], output_name: str = None,
-                              style: H5PStyle = None, **kwargs) -> H5PResult:
+                              style: H5PStyle = None, rng: random.Random = None,
+                              **kwargs) -> H5PResult:
     """Erstellt ein verzweigtes Lernszenario"""
-    gen = BranchingScenarioGenerator(style=style)
+    gen = BranchingScenarioGenerator(style=style, rng=rng)
     return gen.create(title, nodes, output_name, **kwargs)
 
 
 def create_interactive_video(title: str, video_url: str, interactions: List[Dict] = None,
-                             output_name: str = None, style: H5PStyle = None, **kwargs) -> H5PResult:
+                             output_name: str = None, style: H5PStyle = None, rng: random.Random = None,
+                             **kwargs) -> H5PResult:
     """Erstellt ein interaktives Video mit eingebetteten Aufgaben"""
-    gen = InteractiveVideoGenerator(style=style)
+    gen = InteractiveVideoGenerator(style=style, rng=rng)
     return gen.create(title, video_url, interactions, output_name, **kwargs)
 
 
@@ -2279,7 +2559,8 @@ def create_interactive_video(title: str, video_url: str, interactions: List[Dict
 # Batch Generation
 # =============================================================================
 
-def batch_create(content_list: List[Dict], style: H5PStyle = None) -> List[H5PResult]:
+def batch_create(content_list: List[Dict], style: H5PStyle = None,
+                 seed: Union[int, str] = None) -> List[H5PResult]:
     """
     Erstellt mehrere H5P-Inhalte auf einmal
 
@@ -2290,6 +2571,9 @@ def batch_create(content_list: List[Dict], style: H5PStyle = None) -> List[H5PRe
             - title: Titel
             - ... weitere typ-spezifische Felder
         style: Optionales Styling
+        seed: Optionaler Seed. Jedes Element erhaelt einen eigenen, aus
+            (seed, Index) abgeleiteten Zufallsgenerator - reproduzierbar und
+            unabhaengig von der Reihenfolge der Verarbeitung.
 
     Returns:
         Liste von H5PResult
@@ -2311,7 +2595,8 @@ def batch_create(content_list: List[Dict], style: H5PStyle = None) -> List[H5PRe
         'sort_paragraphs': ('paragraphs', create_sort_paragraphs),
     }
 
-    for item in content_list:
+    for index, item in enumerate(content_list):
+        rng = random.Random(derive_seed(seed, index)) if seed is not None else None
         content_type = item.get('type', '').lower()
         title = item.get('title', 'Untitled')
         output_name = item.get('output_name')
@@ -2323,7 +2608,8 @@ def batch_create(content_list: List[Dict], style: H5PStyle = None) -> List[H5PRe
                 item.get('dropzones', []),
                 item.get('draggables', []),
                 output_name,
-                style
+                style,
+                rng=rng
             )
         elif content_type == 'essay':
             result = create_essay(
@@ -2331,14 +2617,16 @@ def batch_create(content_list: List[Dict], style: H5PStyle = None) -> List[H5PRe
                 item.get('task_description', ''),
                 item.get('keywords', []),
                 output_name,
-                style=style
+                style=style,
+                rng=rng
             )
         elif content_type == 'branching_scenario':
             result = create_branching_scenario(
                 title,
                 item.get('nodes', []),
                 output_name,
-                style=style
+                style=style,
+                rng=rng
             )
         elif content_type == 'interactive_video':
             result = create_interactive_video(
@@ -2346,12 +2634,13 @@ def batch_create(content_list: List[Dict], style: H5PStyle = None) -> List[H5PRe
                 item.get('video_url', ''),
                 item.get('interactions', []),
                 output_name,
-                style=style
+                style=style,
+                rng=rng
             )
         elif content_type in type_mapping:
             data_key, func = type_mapping[content_type]
             data = item.get(data_key)
-            result = func(title, data, output_name, style=style)
+            result = func(title, data, output_name, style=style, rng=rng)
         else:
             result = H5PResult(
                 success=False,
@@ -44,8 +44,9 @@ Usage:
 """
 
 import json
+import random
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Optional, Union, List, Dict, Any
 
 # Imports aus dem System
@@ -57,8 +58,9 @@ from h5p_generator import (
     create_drag_text, create_timeline, create_memory_game,
     create_essay, create_sort_paragraphs,
     create_branching_scenario, create_interactive_video,
-    batch_create
+    batch_create, derive_seed
 )
+from style_overlay import StyleOverlay
 
 from orchestrator import (
     H5POrchestrator, OrchestratorResult,
@@ -72,7 +74,8 @@ from sub_agents import (
     ScenarioAgent, MediaAgent,
     # Text-zu-Quiz Agents (NEU v2.3)
     TextParserAgent, ParsedQuestion, ParseResult, QuestionType,
-    DistractorGenerator, DistractorResult
+    DistractorGenerator, DistractorResult,
+    QuestionDeduplicator, DedupResult
 )
 
 from h5p_containers import (
@@ -128,6 +131,9 @@ class SystemResult:
                 lines.append(f"  Operatoren: {or_result.analysis.operators}")
                 lines.append(f"  Komplexitaet: {or_result.analysis.complexity.value}")
 
+            if or_result.branded_elements:
+                lines.append(f"\nDesign beim Bauen angewendet: {or_result.branded_elements} Elemente")
+
             if or_result.design_results:
                 lines.append(f"\nDesign angewendet:")
                 for dr in or_result.design_results:
@@ -193,7 +199,8 @@ class H5PSystem:
         self,
         output_dir: Union[str, Path] = None,
         brand: Union[str, BrandConfig] = None,
-        style: H5PStyle = None
+        style: H5PStyle = None,
+        seed: Union[int, str] = None
     ):
         """
         Initialisiert das H5P System.
@@ -202,6 +209,8 @@ class H5PSystem:
             output_dir: Ausgabeverzeichnis fuer H5P-Dateien
             brand: Brand-Preset Name ('bswi', 'minimal', etc.) oder BrandConfig
             style: Legacy H5PStyle (wird von brand ueberschrieben wenn angegeben)
+            seed: Optionaler Seed fuer reproduzierbare Generierung
+                (subContentIds, Antwort-Reihenfolge, ZIP-Inhalt)
         """
         # Output-Verzeichnis
         if output_dir:
@@ -221,10 +230,20 @@ class H5PSystem:
         # Style (fuer Legacy-Kompatibilitaet)
         self.style = style or THEMES.get('education')
 
+        # Branding einmal kompilieren - wird beim Bauen angewendet
+        self.style_overlay = (
+            StyleOverlay.from_brand(self.brand_config, self.style) if self.brand_config else None
+        )
+
+        # Reproduzierbarkeit
+        self.seed = seed
+
         # Orchestrator initialisieren
         self._orchestrator = H5POrchestrator(
             output_dir=self.output_dir,
-            brand_config=self.brand_config
+            brand_config=self.brand_config,
+            seed=seed,
+            style=self.style
         )
 
         # Sub-Agents direkt verfuegbar machen
@@ -324,7 +343,7 @@ class H5PSystem:
                 'operatoren': or_result.analysis.operators if or_result.analysis else [],
                 'elemente_geplant': len(or_result.plan.elements) if or_result.plan else 0,
                 'elemente_erstellt': len(h5p_files) - (1 if combined_file else 0),
-                'design_angewendet': len([dr for dr in or_result.design_results if dr.success]),
+                'design_angewendet': or_result.branded_elements + len([dr for dr in or_result.design_results if dr.success]),
                 'kombiniert': or_result.combined_result.container_type if or_result.combined_result and or_result.combined_result.success else None,
                 'kombinierte_datei': str(combined_file) if combined_file else None
             }
@@ -372,7 +391,9 @@ class H5PSystem:
         output_format: str = 'auto',
         generate_distractors: bool = True,
         domain: str = None,
-        apply_design: bool = True
+        apply_design: bool = True,
+        dedupe: bool = False,
+        dedupe_threshold: float = 0.8
     ) -> SystemResult:
         """
         Generiert H5P-Quiz aus Freitext-Fragen.
@@ -390,6 +411,8 @@ class H5PSystem:
             generate_distractors: Bei offenen Fragen Distraktoren generieren
             domain: Fachbereich fuer Distraktoren ('accounting', 'scrum', 'it', 'business')
             apply_design: Branding anwenden (default: True)
+            dedupe: Nahezu identische Fragen entfernen (MinHash/LSH)
+            dedupe_threshold: Jaccard-Schwelle fuer Duplikate (default: 0.8)
 
         Returns:
             SystemResult mit generierter H5P-Datei
@@ -436,6 +459,17 @@ class H5PSystem:
 
             warnings.extend(parse_result.warnings)
 
+            # 1b. Near-Duplicates entfernen
+            duplicates_removed = 0
+            if dedupe:
+                dedup_result = QuestionDeduplicator(threshold=dedupe_threshold).deduplicate(parse_result.questions)
+                parse_result.questions = dedup_result.unique
+                duplicates_removed = dedup_result.removed_count
+                for group in dedup_result.groups:
+                    warnings.append(
+                        f"{len(group.duplicates)} Duplikat(e) entfernt von: {group.texts[0][:30]}..."
+                    )
+
             # 2. Output-Format bestimmen
             if output_format == 'auto':
                 if parse_result.detected_type == QuestionType.MULTI_CHOICE:
@@ -453,7 +487,9 @@ class H5PSystem:
 
             # 3. Distraktoren generieren falls noetig
             if generate_distractors and output_format == 'multi_choice':
-                distractor_gen = DistractorGenerator()
+                distractor_gen = DistractorGenerator(
+                    rng=random.Random(derive_seed(self.seed, 'distractors', title)) if self.seed is not None else None
+                )
                 for q in parse_result.questions:
                     if q.question_type == QuestionType.OPEN or not q.answers:
                         # Distraktoren fuer offene Fragen generieren
@@ -469,9 +505,7 @@ class H5PSystem:
                                     domain=domain,
                                     count=3
                                 )
-                                q.answers = [{"text": correct_concept, "correct": True}]
-                                for d in dist_result.distractors:
-                                    q.answers.append({"text": d, "correct": False})
+                                q.answers = distractor_gen.build_answers(correct_concept, dist_result.distractors)
                                 q.question_type = QuestionType.MULTI_CHOICE
                                 warnings.extend(dist_result.warnings)
 
@@ -547,7 +581,8 @@ class H5PSystem:
                 'questions_parsed': parse_result.question_count,
                 'output_format': output_format,
                 'distractors_generated': generate_distractors,
-                'domain': domain
+                'domain': domain,
+                'duplicates_removed': duplicates_removed
             }
 
             return SystemResult(
@@ -687,27 +722,15 @@ class H5PSystem:
         h5p_files = []
 
         try:
-            # batch_create nutzen
-            results = batch_create(elements, style=self.style)
+            # batch_create nutzen - Branding direkt beim Bauen
+            style = self.style
+            if apply_design and self.style_overlay:
+                style = replace(self.style, overlay=self.style_overlay)
+            results = batch_create(elements, style=style, seed=self.seed)
 
             for result in results:
                 if result.success and result.path:
-                    h5p_path = Path(result.path)
-                    h5p_files.append(h5p_path)
-
-                    # Design anwenden wenn gewuenscht
-                    if apply_design and self.design_agent:
-                        # Fake AgentResult fuer Design Agent
-                        from sub_agents.base_agent import AgentStatus
-                        fake_agent_result = AgentResult(
-                            status=AgentStatus.SUCCESS,
-                            h5p_result=result,
-                            original_type=result.content_type,
-                            final_type=result.content_type
-                        )
-                        design_result = self.design_agent.apply_branding(fake_agent_result)
-                        if not design_result.success:
-                            warnings.append(f"Design {result.content_type}: {design_result.error}")
+                    h5p_files.append(Path(result.path))
                 else:
                     errors.append(f"{result.content_type}: {result.error}")
 
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+JSON Backend - Austauschbarer Encoder fuer content.json und h5p.json
+
+Pakete werden standardmaessig kompakt geschrieben (ohne Einrueckung,
+Trennzeichen ',' und ':'). Eingerueckte Ausgabe gibt es fuer Debugging
+ueber H5PStyle(pretty_json=True).
+
+Backends:
+- orjson: deutlich schneller, wird genutzt wenn installiert
+- stdlib: json aus der Standardbibliothek (immer verfuegbar)
+
+Auswahl: automatisch (orjson vor stdlib), per Umgebungsvariable
+H5P_JSON_BACKEND=stdlib oder per set_backend('stdlib').
+
+Benchmark (Kodierzeit und Paketgroesse):
+    python json_backend.py --repeat 50 --rounds 5
+"""
+
+import argparse
+import json
+import os
+import time
+import zlib
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Trennzeichen (Element, Key/Wert) pro Ausgabeformat
+COMPACT_SEPARATORS = (',', ':')
+PRETTY_SEPARATORS = (',', ': ')
+PRETTY_INDENT = 2
+
+
+def separators_for(indent: Optional[int]) -> Tuple[str, str]:
+    """Trennzeichen passend zur Einrueckung (None = kompakt)"""
+    return PRETTY_SEPARATORS if indent is not None else COMPACT_SEPARATORS
+
+
+class StdlibBackend:
+    """json.dumps - C-Encoder im Kompaktmodus, Python-Encoder mit Einrueckung"""
+
+    name = 'stdlib'
+
+    def dumps(self, data: Any, indent: Optional[int] = None,
+              default: Callable[[Any], Any] = None) -> str:
+        return json.dumps(data, ensure_ascii=False, indent=indent,
+                          separators=separators_for(indent), default=default)
+
+
+class OrjsonBackend:
+    """orjson.dumps - gleiche Ausgabe wie stdlib (ensure_ascii=False)"""
+
+    name = 'orjson'
+
+    def __init__(self):
+        self._fallback = StdlibBackend()
+
+    def dumps(self, data: Any, indent: Optional[int] = None,
+              default: Callable[[Any], Any] = None) -> str:
+        if indent not in (None, PRETTY_INDENT):
+            # orjson kennt nur 2 Leerzeichen Einrueckung
+            return self._fallback.dumps(data, indent, default)
+        option = orjson.OPT_INDENT_2 if indent is not None else 0
+        try:
+            return orjson.dumps(data, default=default, option=option).decode('utf-8')
+        except TypeError:
+            # z.B. Ganzzahlen > 64 Bit, Nicht-String-Keys - stdlib kann das
+            return self._fallback.dumps(data, indent, default)
+
+
+BACKENDS: Dict[str, Callable[[], Any]] = {'stdlib': StdlibBackend}
+if orjson is not None:
+    BACKENDS['orjson'] = OrjsonBackend
+
+# Reihenfolge der automatischen Auswahl
+PREFERRED = ('orjson', 'stdlib')
+
+_backend = None
+
+
+def available_backends() -> Tuple[str, ...]:
+    """Namen der installierten Backends (bevorzugte zuerst)"""
+    return tuple(name for name in PREFERRED if name in BACKENDS)
+
+
+def set_backend(name: Optional[str] = None):
+    """
+    Waehlt das Backend fuer alle Generatoren.
+
+    Args:
+        name: 'orjson', 'stdlib' oder None (automatisch: Umgebungsvariable
+            H5P_JSON_BACKEND, sonst das schnellste installierte Backend)
+
+    Raises:
+        ValueError: Backend unbekannt oder nicht installiert
+    """
+    global _backend
+    name = name or os.environ.get('H5P_JSON_BACKEND') or available_backends()[0]
+    if name not in BACKENDS:
+        raise ValueError(
+            f"JSON-Backend '{name}' nicht verfuegbar (installiert: {', '.join(available_backends())})"
+        )
+    _backend = BACKENDS[name]()
+
+
+def get_backend():
+    """Aktives Backend (beim ersten Aufruf automatisch gewaehlt)"""
+    if _backend is None:
+        set_backend()
+    return _backend
+
+
+def dumps(data: Any, pretty: bool = False) -> str:
+    """Kodiert JSON mit dem aktiven Backend (kompakt, oder eingerueckt)"""
+    return get_backend().dumps(data, PRETTY_INDENT if pretty else None)
+
+
+# =============================================================================
+# Benchmark
+# =============================================================================
+
+def _sample_contents() -> Dict[str, Tuple[dict, dict]]:
+    """
+    content.json/h5p.json aller Batch-Typen plus eines InteractiveBook, das
+    alle Elemente als Kapitel enthaelt (gebaut mit festem Seed).
+    """
+    import zipfile
+    from pathlib import Path
+    from h5p_generator import batch_create, make_rng
+    from h5p_containers import create_interactive_book
+
+    elements = [
+        {'type': 'true_false', 'title': 'TF', 'questions': [
+            {'text': f'Aussage {i} ueber Scrum.', 'correct': i % 2 == 0} for i in range(10)]},
+        {'type': 'multi_choice', 'title': 'MC', 'questions': [{'question': f'Frage {i}?', 'answers': [
+            {'text': 'Ja', 'correct': True}, {'text': 'Nein'}, {'text': 'Vielleicht'}]} for i in range(10)]},
+        {'type': 'fill_blanks', 'title': 'FB', 'text': 'Der *Product Owner* priorisiert das *Backlog*.'},
+        {'type': 'single_choice', 'title': 'SC', 'questions': [
+            {'question': f'Frage {i}?', 'answers': ['a', 'b', 'c']} for i in range(10)]},
+        {'type': 'flashcards', 'title': 'FC', 'cards': [
+            {'front': f'Begriff {i}', 'back': f'Erklaerung {i}'} for i in range(10)]},
+        {'type': 'mark_words', 'title': 'MW', 'text': 'Der *PO* priorisiert das *Backlog*.'},
+        {'type': 'summary', 'title': 'SU', 'items': [{'statements': ['Richtig', 'Falsch 1', 'Falsch 2']}] * 5},
+        {'type': 'accordion', 'title': 'AC', 'panels': [{'title': f'Teil {i}', 'content': 'Text'} for i in range(5)]},
+        {'type': 'drag_text', 'title': 'DT', 'text': 'Der *PO* priorisiert das *Backlog*.'},
+        {'type': 'timeline', 'title': 'TL', 'events': [
+            {'start_date': str(2000 + i), 'headline': f'Ereignis {i}', 'text': 'Text'} for i in range(5)]},
+        {'type': 'memory_game', 'title': 'MG', 'cards': [{'description': f'Karte {i}'} for i in range(6)]},
+        {'type': 'sort_paragraphs', 'title': 'SP', 'paragraphs': ['Eins', 'Zwei', 'Drei', 'Vier']},
+        {'type': 'drag_drop', 'title': 'DD', 'task': 'Ordne zu', 'dropzones': ['A', 'B', 'C'],
+         'draggables': [{'text': f'Element {i}', 'dropzone': i % 3} for i in range(9)]},
+        {'type': 'essay', 'title': 'ES', 'task_description': 'Beschreibe Scrum.',
+         'keywords': [{'keyword': 'Sprint'}, {'keyword': 'Backlog'}]},
+    ]
+
+    def read(path) -> Tuple[dict, dict]:
+        with zipfile.ZipFile(path, 'r') as zf:
+            return json.loads(zf.read('content/content.json')), json.loads(zf.read('h5p.json'))
+
+    samples = {}
+    for result in batch_create(elements, seed=40):
+        if result.success:
+            samples[result.content_type] = read(result.path)
+            Path(result.path).unlink()
+
+    chapters = [{
+        'title': content_type,
+        'elements': [{'library': meta['mainLibrary'] + ' 1.0', 'params': content}],
+    } for content_type, (content, meta) in samples.items()]
+    book = create_interactive_book('Buch', chapters, rng=make_rng(40))
+    if book.success:
+        samples['InteractiveBook'] = read(book.path)
+        Path(book.path).unlink()
+    return samples
+
+
+def _deflate(data: bytes) -> bytes:
+    """Rohes Deflate wie in ZIP_DEFLATED (ohne zlib-Header)"""
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush()
+
+
+def benchmark(repeat: int = 50, rounds: int = 5) -> Dict[str, Dict[str, Any]]:
+    """
+    Misst pro Beispielpaket Kodierzeit (pro Backend, kompakt und eingerueckt)
+    sowie die Groesse von content.json + h5p.json roh und deflate-komprimiert
+    (wie im ZIP).
+
+    Returns:
+        Paket -> {'<backend>_<modus>_us': Zeit, 'pretty_bytes', 'compact_bytes',
+                  'pretty_zip', 'compact_zip', 'identical'}
+    """
+    backends = {name: BACKENDS[name]() for name in available_backends()}
+    modes = {'pretty': PRETTY_INDENT, 'compact': None}
+
+    results = {}
+    for name, (content, meta) in _sample_contents().items():
+        timings = {f'{b}_{m}': float('inf') for b in backends for m in modes}
+        for _ in range(rounds):         # abwechselnd messen, Minimum zaehlt
+            for backend_name, backend in backends.items():
+                for mode, indent in modes.items():
+                    backend.dumps(content, indent)
+                    start = time.perf_counter()
+                    for _ in range(repeat):
+                        backend.dumps(content, indent)
+                        backend.dumps(meta, indent)
+                    key = f'{backend_name}_{mode}'
+                    timings[key] = min(timings[key], (time.perf_counter() - start) / repeat * 1e6)
+
+        row = {key: round(value, 1) for key, value in timings.items()}
+        for mode, indent in modes.items():
+            data = [backends['stdlib'].dumps(d, indent).encode('utf-8') for d in (content, meta)]
+            row[f'{mode}_bytes'] = sum(len(d) for d in data)
+            row[f'{mode}_zip'] = sum(len(_deflate(d)) for d in data)
+        # Alle Backends liefern dasselbe JSON (Text kann sich bei Floats unterscheiden)
+        row['identical'] = all(
+            json.loads(backend.dumps(content, indent)) == content
+            for backend in backends.values() for indent in modes.values()
+        )
+        results[name] = row
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='JSON Backend - Kodierzeit und Paketgroesse')
+    parser.add_argument('--repeat', type=int, default=50, help='Wiederholungen pro Messung (default: 50)')
+    parser.add_argument('--rounds', type=int, default=5, help='Messungen pro Modus, Minimum zaehlt (default: 5)')
+    args = parser.parse_args()
+
+    names = available_backends()
+    print(f"Backends: {', '.join(names)} (aktiv: {get_backend().name})\n")
+    timing_cols = [f'{b}_{m}' for b in names for m in ('pretty', 'compact')]
+    print(f"{'Paket':<18}" + ''.join(f"{c:>17}" for c in timing_cols)
+          + f"{'JSON pretty':>13}{'kompakt':>9}{'ZIP pretty':>12}{'kompakt':>9}  gleich")
+    print("-" * (18 + 17 * len(timing_cols) + 52))
+    totals = {'pretty_bytes': 0, 'compact_bytes': 0, 'pretty_zip': 0, 'compact_zip': 0}
+    for name, r in benchmark(args.repeat, args.rounds).items():
+        for key in totals:
+            totals[key] += r[key]
+        print(f"{name:<18}" + ''.join(f"{r[c]:>15.1f}us" for c in timing_cols)
+              + f"{r['pretty_bytes']:>13}{r['compact_bytes']:>9}{r['pretty_zip']:>12}{r['compact_zip']:>9}"
+              + f"  {'ja' if r['identical'] else 'NEIN'}")
+    print(f"\nGesamt JSON: {totals['pretty_bytes']} -> {totals['compact_bytes']} Bytes "
+          f"({100 - 100 * totals['compact_bytes'] / totals['pretty_bytes']:.0f}% kleiner), "
+          f"komprimiert: {totals['pretty_zip']} -> {totals['compact_zip']} Bytes "
+          f"({100 - 100 * totals['compact_zip'] / totals['pretty_zip']:.0f}% kleiner)")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Lexicon Index - Edit-Distanz-Index fuer Fachbegriffe und Vokabeln
+
+BK-Tree ueber ein Lexikon: findet die k naechsten Begriffe innerhalb einer
+Levenshtein-Schranke, ohne das ganze Lexikon linear zu durchsuchen.
+
+Verwendet von:
+- DistractorGenerator: Near-Miss-Distraktoren fuer Rechtschreib-Aufgaben
+- FillInBlanksGenerator: Akzeptierte alternative Schreibweisen pro Luecke
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+
+def levenshtein(a: str, b: str) -> int:
+    """Levenshtein-Distanz (Einfuegen, Loeschen, Ersetzen)"""
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return len(a)
+
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,               # Loeschen
+                current[j - 1] + 1,            # Einfuegen
+                previous[j - 1] + (ca != cb)   # Ersetzen
+            ))
+        previous = current
+    return previous[-1]
+
+
+@dataclass
+class LexiconMatch:
+    """Ein Treffer im Lexikon"""
+    term: str
+    distance: int
+
+
+class BKTree:
+    """
+    Burkhard-Keller-Baum fuer Edit-Distanz-Suche.
+
+    Jeder Knoten speichert seine Kinder nach Distanz zum Knoten. Bei einer
+    Suche mit Radius r werden wegen der Dreiecksungleichung nur Kinder mit
+    Kanten-Distanz in [d - r, d + r] besucht.
+
+    Vergleiche erfolgen case-insensitive, zurueckgegeben wird die
+    Original-Schreibweise aus dem Lexikon.
+
+    Beispiel:
+        tree = BKTree(['Buchfuehrung', 'Buchhaltung', 'Bilanz'])
+        tree.search('Buchfuerung', max_distance=2)
+        # -> [LexiconMatch(term='Buchfuehrung', distance=1)]
+    """
+
+    def __init__(self, terms: Iterable[str] = None):
+        # Knoten: (key, original_term, children{distance: node})
+        self._root: Optional[Tuple[str, str, dict]] = None
+        self._size = 0
+        for term in terms or []:
+            self.add(term)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, term: str) -> bool:
+        """Fuegt einen Begriff hinzu. Gibt False zurueck, wenn er schon existiert."""
+        term = term.strip()
+        key = term.lower()
+        if not key:
+            return False
+
+        if self._root is None:
+            self._root = (key, term, {})
+            self._size = 1
+            return True
+
+        node = self._root
+        while True:
+            distance = levenshtein(key, node[0])
+            if distance == 0:
+                return False
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = (key, term, {})
+                self._size += 1
+                return True
+            node = child
+
+    def search(self, query: str, max_distance: int = 2) -> List[LexiconMatch]:
+        """
+        Alle Begriffe innerhalb der Distanz-Schranke.
+
+        Returns:
+            Treffer sortiert nach Distanz, dann alphabetisch
+        """
+        if self._root is None:
+            return []
+
+        key = query.strip().lower()
+        matches = []
+        stack = [self._root]
+        while stack:
+            node_key, term, children = stack.pop()
+            distance = levenshtein(key, node_key)
+            if distance <= max_distance:
+                matches.append(LexiconMatch(term, distance))
+            low, high = distance - max_distance, distance + max_distance
+            stack.extend(child for d, child in children.items() if low <= d <= high)
+
+        matches.sort(key=lambda m: (m.distance, m.term.lower()))
+        return matches
+
+    def nearest(
+        self,
+        query: str,
+        k: int = 3,
+        max_distance: int = 2,
+        include_exact: bool = False
+    ) -> List[LexiconMatch]:
+        """
+        Die k naechsten Begriffe innerhalb der Distanz-Schranke.
+
+        Args:
+            query: Suchbegriff
+            k: Anzahl Treffer
+            max_distance: Maximale Levenshtein-Distanz
+            include_exact: Den Suchbegriff selbst (Distanz 0) mitliefern
+        """
+        matches = self.search(query, max_distance)
+        if not include_exact:
+            matches = [m for m in matches if m.distance > 0]
+        return matches[:k]
+
+
+# =============================================================================
+# Test
+# =============================================================================
+
+if __name__ == "__main__":
+    lexicon = [
+        'Buchfuehrung', 'Buchhaltung', 'Bilanz', 'Bilanzen', 'Inventar',
+        'Inventur', 'Debitor', 'Kreditor', 'Kredit', 'Debit', 'E-Mail', 'Email'
+    ]
+    tree = BKTree(lexicon)
+
+    print("Lexicon Index - Test")
+    print("=" * 50)
+    for query in ['Inventur', 'Buchfuerung', 'Debitor', 'EMail']:
+        print(f"{query}: {tree.nearest(query, k=3, max_distance=2)}")
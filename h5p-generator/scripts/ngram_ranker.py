@@ -0,0 +1,243 @@
+"""
+N-Gram Ranker - Aehnlichkeits-Ranking fuer Distraktor-Kandidaten
+
+Bewertet Begriffe aus einem Fach-Vokabular nach ihrer Aehnlichkeit zur
+korrekten Antwort:
+1. Zeichen-Trigramme pro Begriff (" debitor " -> " de", "deb", ...)
+2. TF-IDF Gewichtung, L2-normalisiert
+3. Kosinus-Aehnlichkeit ueber eine vorberechnete Sparse-Matrix (CSC)
+4. Laengen- und Register-Faktor (Gross-/Kleinschreibung, Wortanzahl)
+
+Die Matrix wird einmal pro Vokabular aufgebaut. Eine Anfrage beruehrt nur
+die Spalten der Trigramme der Antwort, daher bleibt das Ranking auch bei
+100k Begriffen im Millisekunden-Bereich. Teilmengen (z.B. die Konzepte einer
+Domain) werden per Zeilen-Maske beim Ranking gefiltert, nicht neu indexiert.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@dataclass
+class RankedCandidate:
+    """Ein bewerteter Distraktor-Kandidat"""
+    term: str
+    score: float
+    similarity: float
+
+
+class NgramRanker:
+    """
+    Rankt Vokabular-Begriffe nach Zeichen-N-Gramm-Aehnlichkeit.
+
+    Mit NumPy werden die Scores vektorisiert per np.bincount ueber die
+    Postings der Anfrage-Trigramme berechnet. Ohne NumPy faellt das Ranking
+    auf eine reine Python-Akkumulation mit identischen Ergebnissen zurueck.
+
+    Beispiel:
+        ranker = NgramRanker(['Kreditor', 'Debitor', 'Inventar', 'Bilanz'])
+        ranker.rank('Debitor', k=2)
+        # -> [RankedCandidate(term='Kreditor', ...), ...]
+    """
+
+    def __init__(self, vocabulary: Iterable[str], n: int = 3):
+        self.n = n
+
+        # Begriffe deduplizieren (case-insensitive, erste Schreibweise gewinnt)
+        self.terms: list[str] = []
+        self._index: dict[str, int] = {}
+        for term in vocabulary:
+            key = term.strip().lower()
+            if key and key not in self._index:
+                self._index[key] = len(self.terms)
+                self.terms.append(term.strip())
+
+        self._build_matrix()
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def mask(self, terms: Iterable[str]):
+        """
+        Zeilen-Maske fuer eine Teilmenge des Vokabulars (fuer rank(allowed=...)).
+
+        Unbekannte Begriffe werden ignoriert.
+        """
+        rows = [self._index[key] for key in (t.strip().lower() for t in terms) if key in self._index]
+        if np is not None:
+            allowed = np.zeros(len(self.terms), dtype=bool)
+            allowed[rows] = True
+            return allowed
+        allowed = [False] * len(self.terms)
+        for row in rows:
+            allowed[row] = True
+        return allowed
+
+    def _ngrams(self, text: str) -> dict[str, int]:
+        """Zaehlt die Zeichen-N-Gramme eines Begriffs"""
+        padded = f" {text.lower()} "
+        counts: dict[str, int] = {}
+        for i in range(len(padded) - self.n + 1):
+            gram = padded[i:i + self.n]
+            counts[gram] = counts.get(gram, 0) + 1
+        return counts
+
+    def _build_matrix(self):
+        """Baut die TF-IDF Matrix spaltenweise (CSC) auf"""
+        doc_grams = [self._ngrams(t) for t in self.terms]
+
+        # Dokumentfrequenz und Spalten-Index pro Trigramm
+        df: dict[str, int] = {}
+        for grams in doc_grams:
+            for gram in grams:
+                df[gram] = df.get(gram, 0) + 1
+
+        n_docs = len(self.terms)
+        self._columns = {gram: col for col, gram in enumerate(df)}
+        self._idf = [math.log((1 + n_docs) / (1 + df[g])) + 1.0 for g in df]
+
+        # Zeilenweise normalisierte Gewichte einsammeln
+        postings: list[list[tuple[int, float]]] = [[] for _ in df]
+        for row, grams in enumerate(doc_grams):
+            weights = {g: tf * self._idf[self._columns[g]] for g, tf in grams.items()}
+            norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            for g, w in weights.items():
+                postings[self._columns[g]].append((row, w / norm))
+
+        self._postings = postings
+        self._lengths = [len(t) for t in self.terms]
+        self._registers = [self._register(t) for t in self.terms]
+
+        if np is not None:
+            col_ptr = [0]
+            rows, values = [], []
+            for col_postings in postings:
+                for row, value in col_postings:
+                    rows.append(row)
+                    values.append(value)
+                col_ptr.append(len(rows))
+            self._col_ptr = np.asarray(col_ptr, dtype=np.int64)
+            self._rows = np.asarray(rows, dtype=np.int64)
+            self._values = np.asarray(values, dtype=np.float64)
+            self._np_lengths = np.asarray(self._lengths, dtype=np.float64)
+            self._np_registers = np.asarray(self._registers, dtype=np.int64)
+
+    @staticmethod
+    def _register(term: str) -> int:
+        """Kodiert das Register: Grossschreibung und Wortanzahl"""
+        capitalized = 1 if term[:1].isupper() else 0
+        words = min(len(term.split()), 3)
+        return capitalized * 4 + words
+
+    def _query_vector(self, answer: str) -> dict[int, float]:
+        """TF-IDF Vektor der Antwort (nur bekannte Trigramme)"""
+        weights = {}
+        for gram, tf in self._ngrams(answer).items():
+            col = self._columns.get(gram)
+            if col is not None:
+                weights[col] = tf * self._idf[col]
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        return {col: w / norm for col, w in weights.items()}
+
+    def similarities(self, answer: str) -> list[float]:
+        """Kosinus-Aehnlichkeit der Antwort zu allen Begriffen"""
+        query = self._query_vector(answer)
+        if np is not None:
+            return self._np_similarities(query).tolist()
+
+        scores = [0.0] * len(self.terms)
+        for col, q_weight in query.items():
+            for row, value in self._postings[col]:
+                scores[row] += q_weight * value
+        return scores
+
+    def _np_similarities(self, query: dict[int, float]):
+        """Vektorisierte Kosinus-Aehnlichkeit ueber die Query-Spalten"""
+        if not query:
+            return np.zeros(len(self.terms))
+        cols = np.fromiter(query.keys(), dtype=np.int64, count=len(query))
+        q_weights = np.fromiter(query.values(), dtype=np.float64, count=len(query))
+        starts, ends = self._col_ptr[cols], self._col_ptr[cols + 1]
+        sizes = ends - starts
+        # Alle Postings der Query-Spalten als ein zusammenhaengender Index
+        offsets = np.repeat(starts - np.cumsum(sizes) + sizes, sizes) + np.arange(sizes.sum())
+        weights = self._values[offsets] * np.repeat(q_weights, sizes)
+        return np.bincount(self._rows[offsets], weights=weights, minlength=len(self.terms))
+
+    def rank(
+        self,
+        answer: str,
+        k: int = 5,
+        exclude: Optional[Iterable[str]] = None,
+        min_similarity: float = 0.0,
+        allowed=None
+    ) -> list[RankedCandidate]:
+        """
+        Liefert die k plausibelsten Distraktoren fuer eine Antwort.
+
+        Args:
+            answer: Die korrekte Antwort
+            k: Anzahl Kandidaten
+            exclude: Begriffe, die nicht zurueckgegeben werden sollen
+            min_similarity: Mindest-Aehnlichkeit (Kosinus)
+            allowed: Optionale Zeilen-Maske aus mask() - nur diese Begriffe
+                kommen als Kandidaten in Frage
+
+        Returns:
+            Liste von RankedCandidate, absteigend nach Score
+        """
+        if not self.terms or k <= 0:
+            return []
+
+        blocked = {answer.strip().lower()}
+        blocked.update(e.strip().lower() for e in (exclude or []))
+        blocked_rows = [self._index[b] for b in blocked if b in self._index]
+
+        answer_len = max(len(answer.strip()), 1)
+        answer_register = self._register(answer.strip())
+
+        if np is not None:
+            sims = self._np_similarities(self._query_vector(answer))
+            lengths = self._np_lengths
+            length_factor = np.sqrt(np.minimum(lengths, answer_len) / np.maximum(lengths, answer_len))
+            register_factor = np.where(self._np_registers == answer_register, 1.0, 0.85)
+            scores = sims * length_factor * register_factor
+            scores[sims < min_similarity] = -1.0
+            if allowed is not None:
+                scores[~allowed] = -1.0
+            if blocked_rows:
+                scores[blocked_rows] = -1.0
+
+            top = min(k, len(scores))
+            threshold = -np.partition(-scores, top - 1)[top - 1]
+            # Alle Kandidaten ab dem k-ten Score (inkl. Gleichstand), dann wie
+            # der Python-Pfad nach Score und bei Gleichstand nach Zeile ordnen
+            candidates = np.flatnonzero((scores >= threshold) & (scores > 0))
+            order = candidates[np.lexsort((candidates, -scores[candidates]))][:top]
+            return [
+                RankedCandidate(self.terms[i], float(scores[i]), float(sims[i]))
+                for i in order
+            ]
+
+        sims = self.similarities(answer)
+        blocked_set = set(blocked_rows)
+        ranked = []
+        for row, sim in enumerate(sims):
+            if row in blocked_set or sim < min_similarity:
+                continue
+            if allowed is not None and not allowed[row]:
+                continue
+            length = self._lengths[row]
+            length_factor = math.sqrt(min(length, answer_len) / max(length, answer_len))
+            register_factor = 1.0 if self._registers[row] == answer_register else 0.85
+            score = sim * length_factor * register_factor
+            if score > 0:
+                ranked.append(RankedCandidate(self.terms[row], score, sim))
+        ranked.sort(key=lambda c: -c.score)
+        return ranked[:k]
@@ -10,7 +10,7 @@ Zentrale Steuerung des Multi-Agent H5P Workflows:
 
 import re
 import asyncio
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Any
 from pathlib import Path
 from enum import Enum
@@ -22,6 +22,8 @@ from sub_agents import (
     ScenarioAgent, MediaAgent
 )
 from brand_config import BrandConfig, get_brand_preset
+from h5p_generator import THEMES, H5PStyle
+from style_overlay import StyleOverlay
 
 
 class ContentStructure(Enum):
@@ -82,6 +84,7 @@ class OrchestratorResult:
     element_results: list[AgentResult]
     combined_result: Any = None  # H5PResult für Container
     design_results: list[DesignResult] = field(default_factory=list)  # NEU: Design-Ergebnisse
+    branded_elements: int = 0    # Beim Bauen per StyleOverlay gebrandete Elemente
     errors: list[str] = field(default_factory=list)
 
 
@@ -149,24 +152,34 @@ class H5POrchestrator:
         'interactive_video': 'media',
     }
 
-    def __init__(self, output_dir: Path | str = None, brand_config: BrandConfig = None):
+    def __init__(self, output_dir: Path | str = None, brand_config: BrandConfig = None,
+                 seed: int | str | None = None, style: H5PStyle = None):
         self.output_dir = Path(output_dir) if output_dir else Path("../test-output")
         self.brand_config = brand_config
+        # Gleicher Seed -> identische Pakete; jedes Element leitet daraus
+        # einen eigenen Seed ab (unabhaengig von paralleler Ausfuehrung)
+        self.seed = seed
+        # Basis-Style der Agents und Rueckfall fuer das Branding-Overlay
+        self.style = style or THEMES['education']
 
         # Sub-Agents initialisieren
         self.agents = {
-            'quiz': QuizAgent(self.output_dir),
-            'card': CardAgent(self.output_dir),
-            'drag': DragAgent(self.output_dir),
-            'scenario': ScenarioAgent(self.output_dir),
-            'media': MediaAgent(self.output_dir),
+            'quiz': QuizAgent(self.output_dir, style=self.style, seed=seed),
+            'card': CardAgent(self.output_dir, style=self.style, seed=seed),
+            'drag': DragAgent(self.output_dir, style=self.style, seed=seed),
+            'scenario': ScenarioAgent(self.output_dir, style=self.style, seed=seed),
+            'media': MediaAgent(self.output_dir, style=self.style, seed=seed),
         }
 
-        # Design Agent initialisieren (falls brand_config vorhanden)
+        # Design Agent initialisieren (falls brand_config vorhanden) - nur noch
+        # fuer bestehende Dateien; neue Elemente werden beim Bauen gebrandet
         self._design_agent = DesignAgent(brand_config) if brand_config else None
+        self.style_overlay = (
+            StyleOverlay.from_brand(brand_config, self.style) if brand_config else None
+        )
 
         # Combiner Agent initialisieren
-        self._combiner_agent = CombinerAgent(self.output_dir)
+        self._combiner_agent = CombinerAgent(self.output_dir, seed=seed)
 
     def analyze(self, content: str | dict) -> ContentAnalysis:
         """
@@ -473,6 +486,21 @@ class H5POrchestrator:
 
         return results
 
+    def _use_style_overlay(self, enabled: bool) -> bool:
+        """
+        Setzt das Branding-Overlay auf allen Agents (oder entfernt es).
+        Die Generatoren branden dann direkt beim Schreiben von content.json.
+
+        Returns:
+            True, wenn gebrandet gebaut wird
+        """
+        overlay = self.style_overlay if enabled else None
+        for agent in self.agents.values():
+            style = getattr(agent, 'style', None)
+            if style is not None and style.overlay is not overlay:
+                agent.style = replace(style, overlay=overlay)
+        return overlay is not None
+
     def run(
         self,
         content: str | dict,
@@ -495,7 +523,6 @@ class H5POrchestrator:
             OrchestratorResult mit allen Ergebnissen
         """
         errors = []
-        design_results = []
         combined_result = None
 
         # 1. Analyse
@@ -522,7 +549,8 @@ class H5POrchestrator:
                 errors=[f"Planung fehlgeschlagen: {str(e)}"]
             )
 
-        # 3. Ausführung
+        # 3. Ausführung (mit Branding, falls Design-Phase aktiv)
+        branded = self._use_style_overlay(apply_design)
         try:
             results = self.execute(plan)
         except Exception as e:
@@ -534,15 +562,8 @@ class H5POrchestrator:
                 errors=[f"Ausführung fehlgeschlagen: {str(e)}"]
             )
 
-        # 4. Design-Phase
-        if apply_design and self._design_agent:
-            try:
-                design_results = self._design_agent.process_batch(results)
-                for dr in design_results:
-                    if not dr.success and dr.error:
-                        errors.append(f"Design {dr.content_type}: {dr.error}")
-            except Exception as e:
-                errors.append(f"Design-Phase fehlgeschlagen: {str(e)}")
+        # 4. Design-Phase: bereits beim Bauen erledigt (StyleOverlay)
+        branded_elements = sum(1 for r in results if r.success) if branded else 0
 
         # 5. Kombinations-Phase (NEU)
         successful_results = [r for r in results if r.success]
@@ -587,28 +608,21 @@ class H5POrchestrator:
             plan=plan,
             element_results=results,
             combined_result=combined_result,
-            design_results=design_results,
+            branded_elements=branded_elements,
             errors=errors
         )
 
     async def run_async(self, content: str | dict, content_items: list[dict] = None, apply_design: bool = True) -> OrchestratorResult:
         """Asynchrone Version von run()"""
         errors = []
-        design_results = []
 
         analysis = self.analyze(content)
         plan = self.plan(analysis, content_items)
+        branded = self._use_style_overlay(apply_design)
         results = await self.execute_async(plan)
 
-        # Design-Phase (synchron, da I/O-bound)
-        if apply_design and self._design_agent:
-            try:
-                design_results = self._design_agent.process_batch(results)
-                for dr in design_results:
-                    if not dr.success and dr.error:
-                        errors.append(f"Design {dr.content_type}: {dr.error}")
-            except Exception as e:
-                errors.append(f"Design-Phase fehlgeschlagen: {str(e)}")
+        # Design-Phase: bereits beim Bauen erledigt (StyleOverlay)
+        branded_elements = sum(1 for r in results if r.success) if branded else 0
 
         success = all(r.success for r in results)
         for r in results:
@@ -620,7 +634,7 @@ class H5POrchestrator:
             analysis=analysis,
             plan=plan,
             element_results=results,
-            design_results=design_results,
+            branded_elements=branded_elements,
             errors=errors
         )
 
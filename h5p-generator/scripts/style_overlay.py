@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Style Overlay - Branding beim Bauen statt nachtraeglich
+
+Ein H5PStyle (oder eine BrandConfig) wird einmal in ein StyleOverlay
+kompiliert: fertiger <style>-Block, Farb-Overrides, Feedback-Texte und
+Bestehensgrenze. Die Generatoren wenden es auf das Content-Dict an, bevor
+content.json geschrieben wird - Branding kostet so keinen zusaetzlichen
+Lese-/Schreibvorgang pro Element.
+
+apply_to_package() ist der nachtraegliche Weg fuer bereits erzeugte
+Dateien und liefert dasselbe Ergebnis (test_style_overlay.py prueft das).
+
+Verwendung:
+    overlay = StyleOverlay.compile(THEMES['education'], name='education')
+    style = dataclasses.replace(THEMES['education'], overlay=overlay)
+    create_multi_choice(title, questions, style=style)   # gebrandet gebaut
+"""
+
+import copy
+import json
+import re
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from json_backend import dumps as dumps_json
+
+
+# HTML-Feld pro Bibliothek, dem der <style>-Block vorangestellt wird
+STYLE_HOSTS: Dict[str, Tuple[str, ...]] = {
+    'H5P.QuestionSet': ('introPage', 'introduction'),
+    'H5P.Blanks': ('questions',),
+    'H5P.Dialogcards': ('description',),
+    'H5P.MarkTheWords': ('taskDescription',),
+    'H5P.DragText': ('taskDescription',),
+    'H5P.Essay': ('taskDescription',),
+    'H5P.SortParagraphs': ('taskDescription',),
+    'H5P.Summary': ('intro',),
+    'H5P.InteractiveBook': ('bookCover', 'coverDescription'),
+}
+
+# Farbfelder pro Bibliothek (werden nur ueberschrieben, wenn vorhanden)
+COLOR_FIELDS: Dict[str, Tuple[Tuple[str, ...], ...]] = {
+    'H5P.InteractiveBook': (('behaviour', 'baseColor'),),
+    'H5P.MemoryGame': (('lookNFeel', 'themeColor'),),
+}
+
+# overallFeedback-Bereiche der Generatoren: 0-50, 51-80, 81-100
+_FEEDBACK_RANGES = ('feedback_wrong', 'feedback_partial', 'feedback_correct')
+
+_STYLE_BLOCK = re.compile(r'<style data-h5p-style="[^"]*">.*?</style>', re.DOTALL)
+
+
+def _lookup(content: Dict, path: Tuple[str, ...]) -> Tuple[Optional[Dict], Optional[str]]:
+    """Eltern-Dict und Schluessel eines Pfads (None, None wenn nicht vorhanden)"""
+    node = content
+    for key in path[:-1]:
+        node = node.get(key) if isinstance(node, dict) else None
+        if node is None:
+            return None, None
+    if isinstance(node, dict) and path[-1] in node:
+        return node, path[-1]
+    return None, None
+
+
+def _assign(parent: Dict, key: str, value: Any):
+    """Schreibt nur bei Aenderung - bereits gebrandete Teile (z.B. geteilte
+    Skeleton-Teile, siehe content_skeleton.py) bleiben unberuehrt"""
+    if parent.get(key) != value:
+        parent[key] = value
+
+
+def build_css(style) -> str:
+    """CSS fuer einen H5PStyle (Buttons, Feedback-Farben, Schrift)"""
+    return (
+        f".h5p-content{{font-family:{style.font_family};font-size:{style.font_size};"
+        f"color:{style.text_color};background:{style.background_color}}}"
+        f".h5p-joubelui-button,.h5p-question-buttons button{{background:{style.primary_color};"
+        f"border-radius:{style.border_radius}}}"
+        f".h5p-correct,.h5p-question-feedback.h5p-correct{{color:{style.success_color}}}"
+        f".h5p-wrong,.h5p-question-feedback.h5p-wrong{{color:{style.error_color}}}"
+    )
+
+
+@dataclass(frozen=True)
+class StyleOverlay:
+    """Einmal kompiliertes Branding, anwendbar auf Content-Dicts"""
+    name: str
+    style_block: str                         # fertiger <style>-Block
+    primary_color: str
+    feedback: Tuple[str, str, str]           # wrong, partial, correct
+    pass_percentage: int
+    extra_css: str = field(default='', repr=False)
+
+    @classmethod
+    def compile(cls, style, name: str = 'custom', css: str = None) -> 'StyleOverlay':
+        """
+        Kompiliert einen H5PStyle.
+
+        Args:
+            style: H5PStyle (oder Objekt mit denselben Attributen)
+            name: Name fuer den <style>-Block (data-h5p-style)
+            css: Zusaetzliches CSS (z.B. aus einer BrandConfig)
+        """
+        full_css = build_css(style) + (css or '')
+        return cls(
+            name=name,
+            style_block=f'<style data-h5p-style="{name}">{full_css}</style>',
+            primary_color=style.primary_color,
+            feedback=tuple(getattr(style, attr) for attr in _FEEDBACK_RANGES),
+            pass_percentage=style.pass_percentage,
+            extra_css=css or ''
+        )
+
+    @classmethod
+    def from_brand(cls, brand, base_style) -> 'StyleOverlay':
+        """
+        Kompiliert eine BrandConfig: Farben/Feedback-Texte der Marke
+        ueberschreiben base_style, CSS der Marke wird angehaengt.
+        """
+        if hasattr(brand, 'to_h5p_style'):
+            style = brand.to_h5p_style()
+        else:
+            colors = getattr(brand, 'colors', None)
+            feedback = getattr(brand, 'feedback', None)
+            style = copy.copy(base_style)
+            for attr, source, key in (
+                ('primary_color', colors, 'primary'),
+                ('success_color', colors, 'success'),
+                ('error_color', colors, 'error'),
+                ('background_color', colors, 'background'),
+                ('text_color', colors, 'text'),
+                ('feedback_correct', feedback, 'correct'),
+                ('feedback_wrong', feedback, 'wrong'),
+                ('feedback_partial', feedback, 'partial'),
+            ):
+                value = getattr(source, key, None)
+                if value:
+                    setattr(style, attr, value)
+            style.font_family = getattr(brand, 'font_family', None) or style.font_family
+
+        get_css = getattr(brand, 'get_css', None)
+        css = get_css() if callable(get_css) else getattr(brand, 'css', None)
+        return cls.compile(style, name=getattr(brand, 'name', 'brand'), css=css)
+
+    # =========================================================================
+    # Anwenden
+    # =========================================================================
+
+    def apply(self, content: Dict, library: str) -> Dict:
+        """
+        Wendet das Overlay auf ein Content-Dict an (in place, idempotent;
+        geschrieben wird nur, was sich aendert).
+
+        Args:
+            content: content.json als Dict
+            library: Machine Name ('H5P.QuestionSet', ggf. mit Version)
+        """
+        machine_name = library.split(' ')[0]
+
+        host = STYLE_HOSTS.get(machine_name)
+        if host:
+            parent, key = _lookup(content, host)
+            if parent is not None and isinstance(parent[key], str):
+                _assign(parent, key, self.style_block + _STYLE_BLOCK.sub('', parent[key]))
+
+        for path in COLOR_FIELDS.get(machine_name, ()):
+            parent, key = _lookup(content, path)
+            if parent is not None:
+                _assign(parent, key, self.primary_color)
+
+        feedback = content.get('overallFeedback')
+        if isinstance(feedback, list) and len(feedback) == len(self.feedback):
+            for entry, text in zip(feedback, self.feedback):
+                if isinstance(entry, dict):
+                    _assign(entry, 'feedback', text)
+
+        if isinstance(content.get('passPercentage'), int):
+            _assign(content, 'passPercentage', self.pass_percentage)
+
+        return content
+
+    def apply_to_package(self, h5p_path, output_path=None) -> Path:
+        """
+        Nachtraegliches Branding einer fertigen .h5p-Datei (liest und schreibt
+        das Paket neu). Fuer neue Inhalte stattdessen das Overlay beim Bauen
+        nutzen (H5PStyle.overlay).
+        """
+        h5p_path = Path(h5p_path)
+        output_path = Path(output_path) if output_path else h5p_path
+
+        with zipfile.ZipFile(h5p_path, 'r') as src:
+            members = [(info, src.read(info.filename)) for info in src.infolist()]
+
+        meta = json.loads(next(data for info, data in members if info.filename == 'h5p.json'))
+        replaced = []
+        for info, data in members:
+            if info.filename == 'content/content.json':
+                content = self.apply(json.loads(data), meta.get('mainLibrary', ''))
+                data = dumps_json(content).encode('utf-8')
+            replaced.append((info, data))
+
+        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as dst:
+            for info, data in replaced:
+                dst.writestr(info, data)
+        return output_path
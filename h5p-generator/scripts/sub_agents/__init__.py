@@ -19,6 +19,8 @@ from .text_parser_agent import (
     InputFormat
 )
 from .distractor_generator import DistractorGenerator, DistractorResult
+from ngram_ranker import NgramRanker, RankedCandidate
+from .question_dedup import QuestionDeduplicator, DedupResult, DuplicateGroup
 
 __all__ = [
     'BaseH5PAgent',
@@ -41,4 +43,9 @@ __all__ = [
     'InputFormat',
     'DistractorGenerator',
     'DistractorResult',
+    'NgramRanker',
+    'RankedCandidate',
+    'QuestionDeduplicator',
+    'DedupResult',
+    'DuplicateGroup',
 ]
@@ -7,13 +7,14 @@ from dataclasses import dataclass, field
 from typing import Any, Callable
 from pathlib import Path
 from enum import Enum
+import random
 import sys
 import os
 
 # Parent-Verzeichnis zum Path hinzufügen für h5p_generator Import
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from h5p_generator import H5PResult
+from h5p_generator import H5PResult, derive_seed
 
 
 class AgentStatus(Enum):
@@ -76,12 +77,24 @@ class BaseH5PAgent:
     FALLBACK_MAP: dict[str, str] = {}  # type -> fallback_type
     MAX_RETRIES: int = 3
 
-    def __init__(self, output_dir: Path | str = None):
+    def __init__(self, output_dir: Path | str = None, seed: int | str | None = None):
         self.output_dir = Path(output_dir) if output_dir else Path("../test-output")
+        self.seed = seed
         self._generators: dict[str, Callable] = {}
         self._validators: dict[str, Callable] = {}
         self._fixers: dict[str, Callable] = {}
 
+    def _element_rng(self, *keys) -> random.Random | None:
+        """
+        Eigener Zufallsgenerator pro Element, abgeleitet aus self.seed.
+
+        Ohne Seed None (nicht-deterministisch). Mit Seed haengt das Ergebnis
+        nur von (Seed, Agent, keys) ab - auch bei paralleler Ausfuehrung.
+        """
+        if self.seed is None:
+            return None
+        return random.Random(derive_seed(self.seed, type(self).__name__, *keys))
+
     def register_generator(self, content_type: str, generator: Callable):
         """Registriert eine Generator-Funktion für einen Typ"""
         self._generators[content_type] = generator
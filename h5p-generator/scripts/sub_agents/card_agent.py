@@ -41,8 +41,8 @@ class CardAgent(BaseH5PAgent):
         'memory_game': 'flashcards',  # Memory → Flashcards ohne Bilder
     }
 
-    def __init__(self, output_dir: Path | str = None, style=None):
-        super().__init__(output_dir)
+    def __init__(self, output_dir: Path | str = None, style=None, seed=None):
+        super().__init__(output_dir, seed=seed)
         self.style = style or THEMES.get('education')
         self._register_generators()
         self._register_validators()
@@ -53,19 +53,20 @@ class CardAgent(BaseH5PAgent):
 
         def gen_flashcards(title, cards, filename=None, **kwargs):
             fname = filename or self._make_filename(title, 'flash')
-            return create_flashcards(title, cards, fname, style=self.style)
+            return create_flashcards(title, cards, fname, style=self.style, rng=self._element_rng(fname))
 
         def gen_accordion(title, panels, filename=None, **kwargs):
             fname = filename or self._make_filename(title, 'acc')
-            return create_accordion(title, panels, fname, style=self.style)
+            return create_accordion(title, panels, fname, style=self.style, rng=self._element_rng(fname))
 
         def gen_timeline(title, events, filename=None, description=None, **kwargs):
             fname = filename or self._make_filename(title, 'timeline')
-            return create_timeline(title, events, fname, description=description)
+            return create_timeline(title, events, fname, description=description, style=self.style,
+                                   rng=self._element_rng(fname))
 
         def gen_memory_game(title, cards, filename=None, **kwargs):
             fname = filename or self._make_filename(title, 'memory')
-            return create_memory_game(title, cards, fname)
+            return create_memory_game(title, cards, fname, style=self.style, rng=self._element_rng(fname))
 
         self.register_generator('flashcards', gen_flashcards)
         self.register_generator('accordion', gen_accordion)
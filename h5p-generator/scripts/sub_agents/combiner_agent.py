@@ -22,6 +22,7 @@ LEARNING (2025-01-25): Interactive Book Kompatibilitaet in Lumi
 """
 
 import json
+import random
 import zipfile
 import tempfile
 from dataclasses import dataclass, field
@@ -37,7 +38,7 @@ from h5p_containers import (
     create_column, create_question_set, create_course_presentation, create_interactive_book,
     ColumnGenerator, QuestionSetGenerator, CoursePresentationGenerator, InteractiveBookGenerator
 )
-from h5p_generator import H5PResult
+from h5p_generator import H5PResult, derive_seed
 from .base_agent import AgentResult, AgentStatus
 
 
@@ -137,8 +138,15 @@ class CombinerAgent:
         'Timeline': 'H5P.Timeline 1.1',
     }
 
-    def __init__(self, output_dir: Path = None):
+    def __init__(self, output_dir: Path = None, seed: int | str | None = None):
         self.output_dir = Path(output_dir) if output_dir else Path("../test-output")
+        self.seed = seed
+
+    def _container_rng(self, title: str) -> Optional[random.Random]:
+        """Zufallsgenerator pro Container, abgeleitet aus self.seed (None ohne Seed)"""
+        if self.seed is None:
+            return None
+        return random.Random(derive_seed(self.seed, type(self).__name__, title))
 
     def combine(
         self,
@@ -312,7 +320,7 @@ class CombinerAgent:
                 }
             })
 
-        return create_column(title, elements)
+        return create_column(title, elements, rng=self._container_rng(title))
 
     def _create_question_set(self, title: str, extracted: List[Dict], **kwargs) -> H5PResult:
         """Erstellt QuestionSet aus extrahierten Quiz-Elementen"""
@@ -338,7 +346,8 @@ class CombinerAgent:
             })
 
         pass_percentage = kwargs.get('pass_percentage', 60)
-        return create_question_set(title, questions, pass_percentage=pass_percentage)
+        return create_question_set(title, questions, pass_percentage=pass_percentage,
+                                   rng=self._container_rng(title))
 
     def _create_course_presentation(self, title: str, extracted: List[Dict], **kwargs) -> H5PResult:
         """
@@ -397,7 +406,7 @@ class CombinerAgent:
             'title': 'Zusammenfassung',
         })
 
-        return create_course_presentation(title, slides)
+        return create_course_presentation(title, slides, rng=self._container_rng(title))
 
     def _create_interactive_book(self, title: str, extracted: List[Dict], **kwargs) -> H5PResult:
         """
@@ -480,7 +489,8 @@ class CombinerAgent:
         chapters.append(summary_chapter)
 
         cover_description = kwargs.get('cover_description', f'Ein interaktives Lernbuch mit {len(extracted)} Elementen')
-        return create_interactive_book(title, chapters, cover_description=cover_description)
+        return create_interactive_book(title, chapters, cover_description=cover_description,
+                                       rng=self._container_rng(title))
 
     def _extract_summary_for_slide(self, element_type: str, content: dict) -> str:
         """Extrahiert eine lesbare Zusammenfassung aus einem H5P-Element"""
@@ -5,13 +5,20 @@ Strategien:
 1. Rule-based: Negation, Variation, Antonym
 2. Domain-based: Vordefinierte Konzepte fuer Fachbereiche
 3. Pattern-based: Aehnlich klingende Begriffe
+4. Similarity-based: Trigramm-TF-IDF Ranking ueber ein Fach-Vokabular
+5. Near-Miss: Edit-Distanz-Nachbarn und Tippfehler-Varianten (Rechtschreibung)
 """
 
 import re
 import random
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Optional
 
+# Index-Module liegen neben h5p_generator (scripts/), das sie ebenfalls nutzt
+from lexicon_index import BKTree
+from ngram_ranker import NgramRanker
+
 
 @dataclass
 class DistractorResult:
@@ -22,6 +29,39 @@ class DistractorResult:
     warnings: list[str] = field(default_factory=list)
 
 
+def _domain_matcher(indicators: dict[str, dict[str, float]]):
+    """
+    Kompiliert die Domain-Indikatoren zu einem einzigen Regex.
+
+    Jeder Indikator wird eine benannte Gruppe; die Alternation ist nach
+    Laenge sortiert, damit "ip-adresse" vor "ip" greift. Ein Bindestrich
+    trennt Woerter, damit Komposita wie "Sprint-Backlog" beide Teile zaehlen.
+
+    Returns:
+        (pattern, lookup) - lookup(match) liefert [(domain, weight), ...]
+    """
+    weights: dict[str, list[tuple[str, float]]] = {}
+    for domain, terms in indicators.items():
+        for term, weight in terms.items():
+            weights.setdefault(term, []).append((domain, weight))
+
+    groups = []
+    group_weights = {}
+    for i, term in enumerate(sorted(weights, key=len, reverse=True)):
+        stem = term.rstrip('*')
+        suffix = r'\w*' if term.endswith('*') else ''
+        name = f"t{i}"
+        groups.append(f"(?P<{name}>{re.escape(stem)}{suffix})")
+        group_weights[name] = weights[term]
+
+    pattern = re.compile(r'(?<!\w)(?:' + '|'.join(groups) + r')(?!\w)')
+
+    def lookup(match: re.Match) -> list[tuple[str, float]]:
+        return group_weights[match.lastgroup]
+
+    return pattern, lookup
+
+
 class DistractorGenerator:
     """
     Generiert plausible falsche Antworten (Distraktoren) fuer Quiz-Fragen.
@@ -30,6 +70,8 @@ class DistractorGenerator:
     - Rule-based: Negation, Zahlen-Variation, Antonym
     - Domain-based: Fachbereichsspezifische Konzepte
     - Pattern-based: Syntaktische Variationen
+    - Similarity-based: Aehnlichste Begriffe aus dem Domain-Vokabular
+    - Near-Miss: Begriffe mit kleiner Edit-Distanz (Fachbegriffe, Vokabeln)
 
     Beispiel:
         generator = DistractorGenerator()
@@ -40,6 +82,10 @@ class DistractorGenerator:
             count=3
         )
         # -> ["Kreditor", "Lieferant", "Glaeubiger"]
+
+        # Mit eigenem Fach-Vokabular (z.B. 100k Begriffe)
+        generator = DistractorGenerator(vocabulary=begriffe)
+        generator.rank_candidates("Umsatzsteuer", count=3)
     """
 
     # Domain-Templates fuer BS:WI-relevante Bereiche
@@ -123,9 +169,68 @@ class DistractorGenerator:
         '100': ['50', '150', '200'],
     }
 
-    def __init__(self):
-        """Initialisiert den Generator"""
-        pass
+    # Domain-Indikatoren mit Gewicht. Treffer zaehlen nur als ganzes Wort
+    # (Bindestriche trennen: "Sprint-Backlog" zaehlt "sprint" und "backlog");
+    # ein "*" am Ende erlaubt Endungen und Komposita ("buchung*" -> "Buchungssatz",
+    # "konto*" -> "Kontos"). Kurze, mehrdeutige Woerter ("soll", "ip", "daily")
+    # wiegen weniger und bleiben ohne "*".
+    DOMAIN_INDICATORS = {
+        'accounting': {
+            'debitor*': 3.0, 'kreditor*': 3.0, 'bilanz*': 3.0, 'buchung*': 2.5,
+            'buchfuehrung*': 3.0, 'buchführung*': 3.0, 'rechnungswesen*': 3.0,
+            'konto*': 2.0, 'konten*': 2.0, 'gegenkont*': 2.5, 'aktiva': 2.0, 'passiva': 2.0,
+            'soll': 0.5, 'haben': 0.5, 'aktiv': 0.5, 'passiv': 0.5,
+        },
+        'scrum': {
+            'scrum*': 3.0, 'sprint*': 3.0, 'backlog*': 3.0, 'product owner*': 3.0,
+            'scrum master*': 3.0, 'retrospektive*': 3.0, 'kanban*': 2.5,
+            'agil*': 2.0, 'daily': 1.0, 'increment*': 1.5, 'inkrement*': 1.5,
+        },
+        'it': {
+            'server*': 2.5, 'client*': 2.5, 'netzwerk*': 2.5, 'datenbank*': 3.0,
+            'protokoll*': 1.5, 'http*': 2.5, 'tcp': 2.5, 'ip': 1.0, 'ip-adresse*': 3.0,
+            'software*': 2.0, 'hardware*': 2.0, 'programmier*': 3.0, 'betriebssystem*': 3.0,
+        },
+        'business': {
+            'angebot*': 2.0, 'nachfrage*': 2.5, 'markt*': 2.0, 'preis*': 1.5,
+            'kosten*': 1.5, 'gewinn*': 2.0, 'verlust*': 1.5, 'wirtschaft*': 2.0,
+            'umsatz*': 2.0,
+        },
+    }
+
+    # Kompilierte DOMAIN_INDICATORS, pro Klasse einmal (siehe _indicator_matcher)
+    _indicator_pattern: Optional[tuple] = None
+
+    # Mindest-Score, ab dem eine Domain als erkannt gilt
+    DOMAIN_MIN_SCORE = 1.5
+
+    # Anzahl gecachter Texte fuer die Domain-Erkennung
+    DOMAIN_CACHE_SIZE = 1024
+
+    # Typische Rechtschreib-Verwechslungen (Deutsch)
+    TYPO_SUBSTITUTIONS = [
+        ('ie', 'ei'), ('ei', 'ie'), ('ss', 's'), ('tt', 't'), ('ll', 'l'),
+        ('mm', 'm'), ('nn', 'n'), ('ck', 'k'), ('tz', 'z'), ('dt', 't'),
+        ('ae', 'e'), ('ue', 'u'), ('oe', 'o'), ('ph', 'f'), ('th', 't'),
+        ('v', 'w'), ('k', 'ck'),
+    ]
+
+    def __init__(self, vocabulary: list[str] = None, rng: random.Random = None):
+        """
+        Initialisiert den Generator.
+
+        Args:
+            vocabulary: Optionales Fach-Vokabular fuer das Aehnlichkeits-Ranking
+            rng: Optionale random.Random Instanz (z.B. random.Random(42)) fuer
+                reproduzierbare Antwort-Reihenfolgen
+        """
+        self.vocabulary = list(vocabulary or [])
+        self.rng = rng or random.Random()
+        self._ranker: Optional[NgramRanker] = None
+        self._ranker_masks: dict[Optional[str], object] = {}
+        self._bk_tree: Optional[BKTree] = None
+        self._active_keys: dict[Optional[str], frozenset[str]] = {}
+        self._domain_cache: OrderedDict[str, list[tuple[str, float]]] = OrderedDict()
 
     def generate(
         self,
@@ -167,12 +272,17 @@ class DistractorGenerator:
                 distractors.extend(domain_results)
                 strategy = f"auto_domain:{detected_domain}"
 
-        # 3. Rule-based Fallback
+        # 3. Aehnlichkeits-Ranking ueber eigenes Vokabular
+        if len(distractors) < count and self.vocabulary:
+            ranked = self.rank_candidates(correct_answer, count=count - len(distractors), exclude=exclude + distractors)
+            distractors.extend(ranked)
+
+        # 4. Rule-based Fallback
         if len(distractors) < count:
             rule_results = self._generate_rule_based(correct_answer, question, exclude + distractors)
             distractors.extend(rule_results)
 
-        # 4. Generic Fallback
+        # 5. Generic Fallback
         if len(distractors) < count:
             generic_results = self._generate_generic(correct_answer, question, count - len(distractors), exclude + distractors)
             distractors.extend(generic_results)
@@ -201,23 +311,64 @@ class DistractorGenerator:
         )
 
     def _detect_domain(self, text: str) -> Optional[str]:
-        """Erkennt Domain aus Text"""
-        text_lower = text.lower()
-
-        # Domain-Indikatoren
-        domain_indicators = {
-            'accounting': ['debitor', 'kreditor', 'bilanz', 'buchung', 'konto', 'soll', 'haben', 'aktiv', 'passiv', 'buchfuehrung', 'rechnungswesen'],
-            'scrum': ['scrum', 'sprint', 'backlog', 'product owner', 'agile', 'kanban', 'retrospektive', 'daily'],
-            'it': ['server', 'client', 'netzwerk', 'datenbank', 'protokoll', 'ip', 'http', 'software', 'hardware', 'programmierung'],
-            'business': ['angebot', 'nachfrage', 'markt', 'preis', 'kosten', 'gewinn', 'verlust', 'wirtschaft']
-        }
+        """Erkennt Domain aus Text (Domain mit der hoechsten Konfidenz)"""
+        ranked = self.detect_domains(text)
+        return ranked[0][0] if ranked else None
+
+    def detect_domains(self, text: str) -> list[tuple[str, float]]:
+        """
+        Bewertet alle Domains fuer einen Text.
+
+        Zaehlt gewichtete Ganzwort-Treffer der DOMAIN_INDICATORS in einem
+        einzigen Durchlauf ueber eine kompilierte Alternation. Ergebnisse
+        werden pro normalisiertem Text gecacht.
+
+        Args:
+            text: Frage (ggf. mit Antwort)
+
+        Returns:
+            Liste von (domain, confidence), absteigend sortiert. Domains unter
+            DOMAIN_MIN_SCORE werden nicht zurueckgegeben. Die Konfidenz ist
+            der Anteil der Domain am Gesamt-Score aller Domains.
+        """
+        key = " ".join(text.lower().split())
+        cached = self._domain_cache.get(key)
+        if cached is not None:
+            self._domain_cache.move_to_end(key)
+            return list(cached)
+
+        pattern, lookup = self._indicator_matcher()
+        scores: dict[str, float] = {}
+        for match in pattern.finditer(key):
+            for domain, weight in lookup(match):
+                scores[domain] = scores.get(domain, 0.0) + weight
+
+        total = sum(scores.values())
+        ranked = sorted(
+            ((domain, round(score / total, 3)) for domain, score in scores.items()
+             if score >= self.DOMAIN_MIN_SCORE),
+            key=lambda item: -item[1]
+        )
 
-        for domain, indicators in domain_indicators.items():
-            matches = sum(1 for ind in indicators if ind in text_lower)
-            if matches >= 1:
-                return domain
+        self._domain_cache[key] = ranked
+        if len(self._domain_cache) > self.DOMAIN_CACHE_SIZE:
+            self._domain_cache.popitem(last=False)
+        return list(ranked)
 
-        return None
+    @classmethod
+    def _indicator_matcher(cls):
+        """
+        Regex der DOMAIN_INDICATORS, einmal pro Klasse kompiliert.
+
+        Unterklassen mit eigenen Indikatoren bekommen einen eigenen Eintrag;
+        die Tabelle selbst wird mitgespeichert, damit eine ersetzte Tabelle
+        neu kompiliert wird.
+        """
+        compiled = cls.__dict__.get('_indicator_pattern')
+        if compiled is None or compiled[0] is not cls.DOMAIN_INDICATORS:
+            compiled = (cls.DOMAIN_INDICATORS, *_domain_matcher(cls.DOMAIN_INDICATORS))
+            cls._indicator_pattern = compiled
+        return compiled[1], compiled[2]
 
     def _generate_from_domain(self, answer: str, domain: str, exclude: list[str]) -> list[str]:
         """Generiert Distraktoren aus Domain-Wissen"""
@@ -232,7 +383,12 @@ class DistractorGenerator:
                 if c.lower() not in [e.lower() for e in exclude]:
                     distractors.append(c)
 
-        # Generische Domain-Begriffe als Fallback
+        # Aehnlichste Domain-Begriffe als Fallback (statt fester Reihenfolge)
+        if len(distractors) < 3:
+            ranked = self.rank_candidates(answer, domain=domain, count=4, exclude=exclude + distractors)
+            distractors.extend(ranked)
+
+        # Generische Domain-Begriffe als letzter Fallback
         if len(distractors) < 3 and '_generic' in concepts:
             for c in concepts['_generic']:
                 if c.lower() not in [e.lower() for e in exclude] and c.lower() not in [d.lower() for d in distractors]:
@@ -240,6 +396,139 @@ class DistractorGenerator:
 
         return distractors[:4]  # Max 4 zurueckgeben
 
+    def rank_candidates(
+        self,
+        answer: str,
+        domain: Optional[str] = None,
+        count: int = 3,
+        exclude: list[str] = None
+    ) -> list[str]:
+        """
+        Rankt Vokabular-Begriffe nach Trigramm-Aehnlichkeit zur Antwort.
+
+        Args:
+            answer: Die korrekte Antwort
+            domain: Fachbereich, dessen Konzepte zum Vokabular gehoeren
+            count: Anzahl Kandidaten
+            exclude: Begriffe, die nicht verwendet werden sollen
+
+        Returns:
+            Liste der plausibelsten Distraktoren
+        """
+        ranker = self._get_ranker()
+        if domain not in self._ranker_masks:
+            self._ranker_masks[domain] = ranker.mask(self._active_lexicon(domain))
+        ranked = ranker.rank(answer, k=count, exclude=exclude, allowed=self._ranker_masks[domain])
+        return [c.term for c in ranked]
+
+    def _get_ranker(self) -> NgramRanker:
+        """
+        Baut den Ranker einmal ueber das gesamte Lexikon auf. Die Domain
+        filtert erst beim Ranking (Zeilen-Maske), damit ein grosses Vokabular
+        nicht pro Domain neu indexiert wird.
+        """
+        if self._ranker is None:
+            self._ranker = NgramRanker(self._full_lexicon())
+        return self._ranker
+
+    def _full_lexicon(self) -> list[str]:
+        """Konzepte aller Domains plus eigenes Vokabular"""
+        concepts = set()
+        for domain in self.DOMAIN_CONCEPTS:
+            concepts.update(self.get_domain_concepts(domain))
+        return sorted(concepts) + self.vocabulary
+
+    def _active_lexicon(self, domain: Optional[str]) -> list[str]:
+        """Domain-Konzepte plus eigenes Vokabular"""
+        terms = self.get_domain_concepts(domain) if domain else []
+        return sorted(terms) + self.vocabulary
+
+    def generate_near_misses(
+        self,
+        correct_answer: str,
+        domain: Optional[str] = None,
+        count: int = 3,
+        max_distance: int = 2,
+        exclude: list[str] = None
+    ) -> DistractorResult:
+        """
+        Generiert Near-Miss-Distraktoren fuer Rechtschreib-Aufgaben.
+
+        Zuerst werden Begriffe aus dem aktiven Lexikon (Domain-Konzepte und
+        Vokabular) mit kleiner Edit-Distanz gesucht, z.B. "Inventur" ->
+        "Inventar". Reicht das nicht, werden Tippfehler-Varianten erzeugt.
+
+        Args:
+            correct_answer: Der korrekt geschriebene Begriff
+            domain: Fachbereich fuer das Lexikon
+            count: Anzahl Distraktoren
+            max_distance: Maximale Levenshtein-Distanz
+            exclude: Begriffe, die nicht verwendet werden sollen
+
+        Returns:
+            DistractorResult mit strategy_used "near_miss"
+        """
+        blocked = {e.lower() for e in (exclude or [])}
+        blocked.add(correct_answer.lower())
+        distractors = []
+        warnings = []
+
+        tree = self._get_bk_tree()
+        if domain not in self._active_keys:
+            self._active_keys[domain] = frozenset(t.strip().lower() for t in self._active_lexicon(domain))
+        active = self._active_keys[domain]
+        for match in tree.search(correct_answer, max_distance=max_distance):
+            key = match.term.lower()
+            if match.distance > 0 and key in active and key not in blocked:
+                distractors.append(match.term)
+                blocked.add(key)
+            if len(distractors) >= count:
+                break
+
+        if len(distractors) < count:
+            typos = [t for t in self.typo_variants(correct_answer) if t.lower() not in blocked]
+            distractors.extend(typos[:count - len(distractors)])
+            if typos:
+                warnings.append("Einige Distraktoren sind Tippfehler-Varianten")
+
+        return DistractorResult(
+            distractors=distractors,
+            strategy_used="near_miss",
+            confidence=0.9 if not warnings else 0.7,
+            warnings=warnings
+        )
+
+    def _get_bk_tree(self) -> BKTree:
+        """Baut den BK-Tree einmal ueber das gesamte Lexikon auf (Domain filtert die Treffer)"""
+        if self._bk_tree is None:
+            self._bk_tree = BKTree(self._full_lexicon())
+        return self._bk_tree
+
+    def typo_variants(self, term: str) -> list[str]:
+        """
+        Erzeugt plausible Falschschreibungen eines Begriffs.
+
+        Reihenfolge: typische Verwechslungen, dann vertauschte Nachbarbuchstaben.
+        """
+        variants = []
+        seen = {term.lower()}
+
+        def add(candidate: str):
+            if candidate.lower() not in seen:
+                seen.add(candidate.lower())
+                variants.append(candidate)
+
+        for wrong, replacement in self.TYPO_SUBSTITUTIONS:
+            idx = term.lower().find(wrong)
+            if idx > 0:
+                add(term[:idx] + replacement + term[idx + len(wrong):])
+
+        for i in range(1, len(term) - 2):
+            if term[i] != term[i + 1] and term[i].isalpha() and term[i + 1].isalpha():
+                add(term[:i] + term[i + 1] + term[i] + term[i + 2:])
+
+        return variants
+
     def _generate_rule_based(self, answer: str, question: str, exclude: list[str]) -> list[str]:
         """Generiert Distraktoren mit Regeln"""
         distractors = []
@@ -306,6 +595,24 @@ class DistractorGenerator:
 
         return distractors
 
+    def build_answers(self, correct_answer: str, distractors: list[str], shuffle: bool = True) -> list[dict]:
+        """
+        Baut die Antwortliste fuer eine MC-Frage.
+
+        Args:
+            correct_answer: Die korrekte Antwort
+            distractors: Falsche Antworten
+            shuffle: Reihenfolge mit self.rng mischen (reproduzierbar bei gleichem Seed)
+
+        Returns:
+            Liste von {"text": ..., "correct": bool}
+        """
+        answers = [{"text": correct_answer, "correct": True}]
+        answers.extend({"text": d, "correct": False} for d in distractors)
+        if shuffle:
+            self.rng.shuffle(answers)
+        return answers
+
     def generate_true_false_variants(
         self,
         statement: str,
@@ -379,7 +686,7 @@ class DistractorGenerator:
             if key != '_generic':
                 concepts.append(key)
                 concepts.extend(values)
-        return list(set(concepts))
+        return list(dict.fromkeys(concepts))
 
 
 # =============================================================================
@@ -441,9 +748,26 @@ if __name__ == "__main__":
         marker = "[WAHR]" if v["correct"] else "[FALSCH]"
         print(f"  {marker} {v['text']}")
 
-    # Test 5: Zahlen-Variation
+    # Test 5: Aehnlichkeits-Ranking
+    print("\n" + "-" * 40)
+    print("Test 5: Similarity Ranking (Trigramm TF-IDF)")
+    ranked = DistractorGenerator(vocabulary=[
+        'Umsatzsteuer', 'Vorsteuer', 'Gewerbesteuer', 'Einkommensteuer',
+        'Umsatzerloese', 'Steuerberater', 'Abschreibung', 'Rueckstellung'
+    ]).rank_candidates("Umsatzsteuer", count=3)
+    print(f"Korrekte Antwort: Umsatzsteuer")
+    print(f"Distraktoren: {ranked}")
+
+    # Test 6: Near-Miss (Rechtschreibung)
+    print("\n" + "-" * 40)
+    print("Test 6: Near-Miss Distraktoren")
+    result = generator.generate_near_misses("Inventur", domain="accounting", count=3)
+    print(f"Korrekte Antwort: Inventur")
+    print(f"Distraktoren: {result.distractors}")
+
+    # Test 7: Zahlen-Variation
     print("\n" + "-" * 40)
-    print("Test 5: Zahlen-Variation")
+    print("Test 7: Zahlen-Variation")
     result = generator.generate(
         correct_answer="3 Scrum-Rollen",
         question="Wie viele Rollen gibt es in Scrum?",
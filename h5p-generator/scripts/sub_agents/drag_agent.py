@@ -38,8 +38,8 @@ class DragAgent(BaseH5PAgent):
         'drag_text': 'mark_words',  # Drag Text → Mark Words bei Problemen
     }
 
-    def __init__(self, output_dir: Path | str = None, style=None):
-        super().__init__(output_dir)
+    def __init__(self, output_dir: Path | str = None, style=None, seed=None):
+        super().__init__(output_dir, seed=seed)
         self.style = style or THEMES.get('education')
         self._register_generators()
         self._register_validators()
@@ -50,15 +50,15 @@ class DragAgent(BaseH5PAgent):
 
         def gen_drag_drop(title, task_description, dropzones, draggables, filename=None, **kwargs):
             fname = filename or self._make_filename(title, 'dragdrop')
-            return create_drag_drop(title, task_description, dropzones, draggables, fname, style=self.style)
+            return create_drag_drop(title, task_description, dropzones, draggables, fname, style=self.style, rng=self._element_rng(fname))
 
         def gen_drag_text(title, text, filename=None, task=None, **kwargs):
             fname = filename or self._make_filename(title, 'dragtext')
-            return create_drag_text(title, text, fname, task=task, style=self.style)
+            return create_drag_text(title, text, fname, task=task, style=self.style, rng=self._element_rng(fname))
 
         def gen_mark_words(title, text, filename=None, task=None, **kwargs):
             fname = filename or self._make_filename(title, 'mark')
-            return create_mark_words(title, text, fname, task=task, style=self.style)
+            return create_mark_words(title, text, fname, task=task, style=self.style, rng=self._element_rng(fname))
 
         self.register_generator('drag_drop', gen_drag_drop)
         self.register_generator('drag_text', gen_drag_text)
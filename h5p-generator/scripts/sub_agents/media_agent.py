@@ -28,8 +28,8 @@ class MediaAgent(BaseH5PAgent):
 
     FALLBACK_MAP = {}  # Kein Fallback
 
-    def __init__(self, output_dir: Path | str = None, style=None):
-        super().__init__(output_dir)
+    def __init__(self, output_dir: Path | str = None, style=None, seed=None):
+        super().__init__(output_dir, seed=seed)
         self.style = style or THEMES.get('education')
         self._register_generators()
         self._register_validators()
@@ -39,7 +39,7 @@ class MediaAgent(BaseH5PAgent):
 
         def gen_interactive_video(title, video_url, interactions=None, filename=None, **kwargs):
             fname = filename or self._make_filename(title, 'ivideo')
-            return create_interactive_video(title, video_url, interactions, fname, style=self.style, **kwargs)
+            return create_interactive_video(title, video_url, interactions, fname, style=self.style, rng=self._element_rng(fname), **kwargs)
 
         self.register_generator('interactive_video', gen_interactive_video)
 
@@ -0,0 +1,333 @@
+"""
+Question Dedup - Erkennt nahezu identische Fragen in Fragen-Pools
+
+Verfahren (annaehernd linear in der Anzahl Fragen):
+1. Normalisierung: Kleinschreibung, Umlaute, Satzzeichen, Leerraum
+2. Zeichen-Shingles (5-Gramme) pro Frage
+3. MinHash-Signatur (128 Permutationen) pro Frage
+4. Locality-Sensitive Hashing: Signatur in Baender teilen, gleiche
+   Baender landen im selben Bucket
+5. Nur Kandidaten aus gemeinsamen Buckets werden per Jaccard verifiziert
+
+Statt n^2/2 Paarvergleichen werden nur die Kandidaten-Paare geprueft.
+
+Standalone:
+    python question_dedup.py fragen.txt --threshold 0.8
+    python question_dedup.py fragen.txt --remove --output bereinigt.txt
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from .text_parser_agent import ParsedQuestion, TextParserAgent
+except ImportError:
+    from text_parser_agent import ParsedQuestion, TextParserAgent
+
+
+# Mersenne-Primzahl fuer die universellen Hash-Funktionen (a*x + b) mod p
+_MERSENNE_PRIME = (1 << 61) - 1
+_MASK_32 = (1 << 32) - 1
+_MASK_64 = (1 << 64) - 1
+
+
+@dataclass
+class DuplicateGroup:
+    """Eine Gruppe nahezu identischer Fragen"""
+    representative: int                     # Index der behaltenen Frage
+    duplicates: list[int]                   # Indizes der Duplikate
+    similarity: float                       # Minimale Jaccard-Aehnlichkeit zum Repraesentanten
+    texts: list[str] = field(default_factory=list)
+
+
+@dataclass
+class DedupResult:
+    """Ergebnis der Duplikat-Erkennung"""
+    unique: list[ParsedQuestion]
+    groups: list[DuplicateGroup]
+    candidates_checked: int = 0
+
+    @property
+    def removed_count(self) -> int:
+        return sum(len(g.duplicates) for g in self.groups)
+
+
+class QuestionDeduplicator:
+    """
+    Findet Near-Duplicates in Fragen-Pools per MinHash/LSH.
+
+    Beispiel:
+        dedup = QuestionDeduplicator(threshold=0.8)
+        result = dedup.deduplicate(parse_result.questions)
+        print(f"{result.removed_count} Duplikate entfernt")
+    """
+
+    UMLAUTS = {'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss'}
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        shingle_size: int = 5,
+        include_answers: bool = False,
+        seed: int = 1,
+        false_negative_rate: float = 0.02
+    ):
+        """
+        Args:
+            threshold: Jaccard-Schwelle, ab der zwei Fragen als Duplikat gelten
+            num_perm: Anzahl MinHash-Permutationen (Signatur-Laenge)
+            shingle_size: Laenge der Zeichen-Shingles
+            include_answers: Antwortoptionen in den Vergleich einbeziehen
+            seed: Seed fuer die Hash-Permutationen (stabile Signaturen)
+            false_negative_rate: Hoechstens so viele Paare genau an der Schwelle
+                werden nicht Kandidat (darueber entsprechend weniger)
+        """
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold muss in (0, 1] liegen")
+        if not 0.0 < false_negative_rate < 1.0:
+            raise ValueError("false_negative_rate muss in (0, 1) liegen")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.include_answers = include_answers
+        self.bands, self.rows = self._optimal_bands(threshold, num_perm, false_negative_rate)
+
+        rng = random.Random(seed)
+        self._a = [rng.randrange(1, _MERSENNE_PRIME) & _MASK_32 | 1 for _ in range(num_perm)]
+        self._b = [rng.randrange(0, _MERSENNE_PRIME) & _MASK_32 for _ in range(num_perm)]
+        if np is not None:
+            self._np_a = np.asarray(self._a, dtype=np.uint64)
+            self._np_b = np.asarray(self._b, dtype=np.uint64)
+
+    @staticmethod
+    def _optimal_bands(threshold: float, num_perm: int,
+                       false_negative_rate: float) -> tuple[int, int]:
+        """
+        Waehlt Baender b und Zeilen r (b * r <= num_perm): moeglichst viele
+        Zeilen (wenige Fehl-Kandidaten), solange ein Paar genau an der
+        Schwelle hoechstens mit false_negative_rate verpasst wird, also
+        (1 - t^r)^b <= false_negative_rate. Der Wendepunkt (1/b)^(1/r) der
+        S-Kurve liegt damit deutlich unter der Schwelle - Kandidaten werden
+        ohnehin exakt per Jaccard verifiziert, zu viele kosten nur Zeit.
+        """
+        for rows in range(num_perm, 0, -1):
+            bands = num_perm // rows
+            if (1.0 - threshold ** rows) ** bands <= false_negative_rate:
+                return bands, rows
+        return num_perm, 1
+
+    # =========================================================================
+    # Normalisierung & Signaturen
+    # =========================================================================
+
+    def normalize(self, text: str) -> str:
+        """Normalisiert Fragetext fuer den Vergleich"""
+        text = text.lower()
+        for umlaut, replacement in self.UMLAUTS.items():
+            text = text.replace(umlaut, replacement)
+        text = re.sub(r'[^\w\s]', ' ', text)
+        return ' '.join(text.split())
+
+    def question_text(self, question: Union[ParsedQuestion, str]) -> str:
+        """Vergleichstext einer Frage (optional mit Antworten)"""
+        if isinstance(question, str):
+            return question
+        text = question.question_text
+        if self.include_answers and question.answers:
+            text += ' ' + ' '.join(sorted(a.get('text', '') for a in question.answers))
+        return text
+
+    def shingles(self, text: str) -> set[int]:
+        """32-Bit Hashes der Zeichen-Shingles eines normalisierten Textes"""
+        normalized = self.normalize(text)
+        k = self.shingle_size
+        if len(normalized) <= k:
+            grams = {normalized} if normalized else set()
+        else:
+            grams = {normalized[i:i + k] for i in range(len(normalized) - k + 1)}
+        return {
+            int.from_bytes(hashlib.blake2b(g.encode('utf-8'), digest_size=4).digest(), 'little')
+            for g in grams
+        }
+
+    def signature(self, shingles: set[int]) -> tuple[int, ...]:
+        """MinHash-Signatur: pro Permutation das Minimum ueber alle Shingles"""
+        if not shingles:
+            return (_MASK_32,) * self.num_perm
+
+        if np is not None:
+            values = np.fromiter(shingles, dtype=np.uint64, count=len(shingles))
+            # uint64-Ueberlauf ist gewollt (entspricht & _MASK_64 im Fallback)
+            hashed = (np.outer(values, self._np_a) + self._np_b) % np.uint64(_MERSENNE_PRIME)
+            return tuple(int(v) for v in (hashed & np.uint64(_MASK_32)).min(axis=0))
+
+        return tuple(
+            min((((a * x + b) & _MASK_64) % _MERSENNE_PRIME) & _MASK_32 for x in shingles)
+            for a, b in zip(self._a, self._b)
+        )
+
+    @staticmethod
+    def jaccard(a: set, b: set) -> float:
+        """Exakte Jaccard-Aehnlichkeit zweier Shingle-Mengen"""
+        if not a and not b:
+            return 1.0
+        return len(a & b) / len(a | b)
+
+    # =========================================================================
+    # Duplikat-Erkennung
+    # =========================================================================
+
+    def find_duplicates(self, questions: list[Union[ParsedQuestion, str]]) -> tuple[list[DuplicateGroup], int]:
+        """
+        Findet Gruppen nahezu identischer Fragen.
+
+        Jede Frage einer Gruppe erreicht die Schwelle gegenueber dem
+        Repraesentanten selbst - Aehnlichkeit wird nicht transitiv ueber
+        Zwischenglieder weitergereicht (A~B, B~C ergibt nicht A~C).
+        Identische Shingle-Mengen werden vorab zusammengefasst und nur
+        einmal in die LSH-Buckets eingetragen.
+
+        Returns:
+            (Gruppen, Anzahl verifizierter Kandidaten-Paare). Repraesentant
+            einer Gruppe ist jeweils die zuerst vorkommende Frage.
+        """
+        texts = [self.question_text(q) for q in questions]
+        shingle_sets = [self.shingles(t) for t in texts]
+
+        # Exakte Duplikate (gleiche Shingles) -> erste Frage ist der Leader
+        copies: dict[int, list[int]] = {}
+        leader_of: dict[frozenset, int] = {}
+        for idx, shingles in enumerate(shingle_sets):
+            leader = leader_of.setdefault(frozenset(shingles), idx)
+            if leader != idx:
+                copies.setdefault(leader, []).append(idx)
+        leaders = sorted(leader_of.values())
+
+        # LSH-Buckets: (Band, Band-Werte) -> Leader-Indizes
+        buckets: dict[tuple, list[int]] = {}
+        band_keys: dict[int, list[tuple]] = {}
+        for idx in leaders:
+            sig = self.signature(shingle_sets[idx])
+            keys = [(band, sig[band * self.rows:(band + 1) * self.rows]) for band in range(self.bands)]
+            band_keys[idx] = keys
+            for key in keys:
+                buckets.setdefault(key, []).append(idx)
+
+        # Greedy in Eingabe-Reihenfolge: eine noch freie Frage wird
+        # Repraesentant, Kandidaten ab der Schwelle werden ihre Duplikate
+        assigned: dict[int, tuple[int, float]] = {}
+        checked = 0
+        for rep in leaders:
+            if rep in assigned:
+                continue
+            candidates = {j for key in band_keys[rep] for j in buckets[key] if j > rep and j not in assigned}
+            for j in sorted(candidates):
+                checked += 1
+                similarity = self.jaccard(shingle_sets[rep], shingle_sets[j])
+                if similarity >= self.threshold:
+                    assigned[j] = (rep, similarity)
+
+        members_by_rep: dict[int, list[tuple[int, float]]] = {}
+        for leader in leaders:
+            rep, similarity = assigned.get(leader, (leader, 1.0))
+            members = members_by_rep.setdefault(rep, [])
+            if leader != rep:
+                members.append((leader, similarity))
+            members.extend((copy, similarity) for copy in copies.get(leader, []))
+
+        groups = []
+        for rep, members in sorted(members_by_rep.items()):
+            if not members:
+                continue
+            members.sort()
+            groups.append(DuplicateGroup(
+                representative=rep,
+                duplicates=[m for m, _ in members],
+                similarity=round(min(sim for _, sim in members), 3),
+                texts=[texts[rep]] + [texts[m] for m, _ in members]
+            ))
+
+        return groups, checked
+
+    def deduplicate(self, questions: list[ParsedQuestion]) -> DedupResult:
+        """Entfernt Near-Duplicates, behaelt jeweils die erste Frage"""
+        groups, checked = self.find_duplicates(questions)
+        removed = {d for g in groups for d in g.duplicates}
+        return DedupResult(
+            unique=[q for i, q in enumerate(questions) if i not in removed],
+            groups=groups,
+            candidates_checked=checked
+        )
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Question Dedup - Findet nahezu identische Fragen (MinHash/LSH)'
+    )
+    parser.add_argument('input', help='Textdatei mit Fragen (TextParserAgent-Formate)')
+    parser.add_argument('--threshold', type=float, default=0.8, help='Jaccard-Schwelle (default: 0.8)')
+    parser.add_argument('--include-answers', action='store_true', help='Antwortoptionen mitvergleichen')
+    parser.add_argument('--remove', action='store_true', help='Duplikate entfernen und bereinigte Fragen ausgeben')
+    parser.add_argument('--output', help='Zieldatei fuer --remove (default: stdout)')
+    parser.add_argument('--json', action='store_true', help='Bericht als JSON ausgeben')
+
+    args = parser.parse_args()
+
+    input_path = Path(args.input)
+    if not input_path.exists():
+        print(f"FEHLER: {input_path} existiert nicht.", file=sys.stderr)
+        sys.exit(1)
+
+    parse_result = TextParserAgent().parse(input_path.read_text(encoding='utf-8'))
+    if not parse_result.success:
+        print(f"FEHLER: {'; '.join(parse_result.errors)}", file=sys.stderr)
+        sys.exit(1)
+
+    dedup = QuestionDeduplicator(threshold=args.threshold, include_answers=args.include_answers)
+    result = dedup.deduplicate(parse_result.questions)
+
+    if args.remove:
+        cleaned = "\n\n".join(q.raw_input or q.question_text for q in result.unique) + "\n"
+        if args.output:
+            Path(args.output).write_text(cleaned, encoding='utf-8')
+        else:
+            print(cleaned, end='')
+
+    report_stream = sys.stderr if args.remove and not args.output else sys.stdout
+    if args.json:
+        print(json.dumps({
+            'questions': len(parse_result.questions),
+            'unique': len(result.unique),
+            'removed': result.removed_count,
+            'candidates_checked': result.candidates_checked,
+            'groups': [g.__dict__ for g in result.groups]
+        }, ensure_ascii=False, indent=2), file=report_stream)
+    else:
+        print(f"{len(parse_result.questions)} Fragen, {len(result.groups)} Duplikat-Gruppen, "
+              f"{result.removed_count} Duplikate", file=report_stream)
+        for group in result.groups:
+            print(f"\n  [{group.similarity:.2f}] {group.texts[0]}", file=report_stream)
+            for text in group.texts[1:]:
+                print(f"         ~ {text}", file=report_stream)
+
+
+if __name__ == "__main__":
+    main()
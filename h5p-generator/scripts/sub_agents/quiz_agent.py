@@ -48,8 +48,8 @@ class QuizAgent(BaseH5PAgent):
         'essay': 'fill_blanks',           # Essay → Blanks bei Problemen
     }
 
-    def __init__(self, output_dir: Path | str = None, style=None):
-        super().__init__(output_dir)
+    def __init__(self, output_dir: Path | str = None, style=None, seed=None):
+        super().__init__(output_dir, seed=seed)
         self.style = style or THEMES.get('education')
         self._register_generators()
         self._register_validators()
@@ -59,31 +59,31 @@ class QuizAgent(BaseH5PAgent):
 
         def gen_true_false(title, questions, filename=None, **kwargs):
             fname = filename or self._make_filename(title, 'tf')
-            return create_true_false(title, questions, fname, style=self.style)
+            return create_true_false(title, questions, fname, style=self.style, rng=self._element_rng(fname))
 
         def gen_multi_choice(title, questions, filename=None, **kwargs):
             fname = filename or self._make_filename(title, 'mc')
-            return create_multi_choice(title, questions, fname, style=self.style)
+            return create_multi_choice(title, questions, fname, style=self.style, rng=self._element_rng(fname))
 
         def gen_single_choice(title, questions, filename=None, **kwargs):
             fname = filename or self._make_filename(title, 'sc')
-            return create_single_choice(title, questions, fname, style=self.style)
+            return create_single_choice(title, questions, fname, style=self.style, rng=self._element_rng(fname))
 
         def gen_summary(title, items, filename=None, **kwargs):
             fname = filename or self._make_filename(title, 'sum')
-            return create_summary(title, items, fname, style=self.style)
+            return create_summary(title, items, fname, style=self.style, rng=self._element_rng(fname))
 
         def gen_fill_blanks(title, text, filename=None, **kwargs):
             fname = filename or self._make_filename(title, 'blanks')
-            return create_fill_blanks(title, text, fname, style=self.style)
+            return create_fill_blanks(title, text, fname, style=self.style, rng=self._element_rng(fname))
 
         def gen_essay(title, task_description, keywords, filename=None, **kwargs):
             fname = filename or self._make_filename(title, 'essay')
-            return create_essay(title, task_description, keywords, fname, style=self.style, **kwargs)
+            return create_essay(title, task_description, keywords, fname, style=self.style, rng=self._element_rng(fname), **kwargs)
 
         def gen_sort_paragraphs(title, paragraphs, filename=None, **kwargs):
             fname = filename or self._make_filename(title, 'sort')
-            return create_sort_paragraphs(title, paragraphs, fname, style=self.style, **kwargs)
+            return create_sort_paragraphs(title, paragraphs, fname, style=self.style, rng=self._element_rng(fname), **kwargs)
 
         self.register_generator('true_false', gen_true_false)
         self.register_generator('multi_choice', gen_multi_choice)
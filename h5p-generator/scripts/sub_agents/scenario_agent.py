@@ -29,8 +29,8 @@ class ScenarioAgent(BaseH5PAgent):
 
     FALLBACK_MAP = {}  # Kein Fallback für Szenarien
 
-    def __init__(self, output_dir: Path | str = None, style=None):
-        super().__init__(output_dir)
+    def __init__(self, output_dir: Path | str = None, style=None, seed=None):
+        super().__init__(output_dir, seed=seed)
         self.style = style or THEMES.get('education')
         self._register_generators()
         self._register_validators()
@@ -40,7 +40,7 @@ class ScenarioAgent(BaseH5PAgent):
 
         def gen_branching_scenario(title, nodes, filename=None, **kwargs):
             fname = filename or self._make_filename(title, 'branch')
-            return create_branching_scenario(title, nodes, fname, style=self.style, **kwargs)
+            return create_branching_scenario(title, nodes, fname, style=self.style, rng=self._element_rng(fname), **kwargs)
 
         self.register_generator('branching_scenario', gen_branching_scenario)
 
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Test: Skeleton-Cache (content_skeleton)
+
+Testet ob:
+1. Geteilte Skeleton-Teile eingefroren sind: Schreiben wirft TypeError,
+   Kopien (dict/list, copy, deepcopy) sind normale, veraenderbare Objekte
+2. Der Cache ein Skeleton pro (Typ, Style) wiederverwendet und ein Paket
+   den Cache nicht veraendert
+3. Jeder batch_create-Typ mit und ohne Cache dasselbe content.json liefert -
+   auch mit Overlay, Umlaut-Wiederherstellung und eingerueckter Ausgabe
+4. Die Umlaut-Wiederherstellung eingefrorene Teile unveraendert uebernimmt
+"""
+
+import sys
+import copy
+import zipfile
+from dataclasses import replace
+from pathlib import Path
+
+# Pfade einrichten
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+
+from content_skeleton import SKELETONS, FrozenDict, FrozenList, Members, compile_skeleton
+from h5p_generator import THEMES, TrueFalseGenerator, batch_create
+from style_overlay import StyleOverlay
+from umlaut_restorer import UmlautRestorer
+
+SEED = 39
+
+ELEMENTS = [
+    {'type': 'true_false', 'title': 'TF', 'questions': [{'text': 'Der PO prueft.', 'correct': True}]},
+    {'type': 'multi_choice', 'title': 'MC', 'questions': [{'question': 'Wie lange?', 'answers': [
+        {'text': '4 Wochen', 'correct': True}, {'text': '3 Monate', 'correct': False}]}]},
+    {'type': 'fill_blanks', 'title': 'FB', 'text': 'Der *Product Owner* prueft.'},
+    {'type': 'single_choice', 'title': 'SC', 'questions': [{'question': 'Wer?', 'answers': ['PO', 'SM']}]},
+    {'type': 'flashcards', 'title': 'FC', 'cards': [{'front': 'PO', 'back': 'Product Owner'}]},
+    {'type': 'mark_words', 'title': 'MW', 'text': 'Der *PO* prueft.'},
+    {'type': 'summary', 'title': 'SU', 'items': [{'statements': ['Richtig', 'Falsch']}]},
+    {'type': 'accordion', 'title': 'AC', 'panels': [{'title': 'A', 'content': 'Groesse'}]},
+    {'type': 'drag_text', 'title': 'DT', 'text': 'Der *PO* prueft.'},
+    {'type': 'timeline', 'title': 'TL', 'events': [{'start_date': '2020', 'headline': 'X', 'text': 'Y'}]},
+    {'type': 'memory_game', 'title': 'MG', 'cards': [{'description': 'A'}, {'description': 'B'}]},
+    {'type': 'sort_paragraphs', 'title': 'SP', 'paragraphs': ['Eins', 'Zwei']},
+    {'type': 'drag_drop', 'title': 'DD', 'task': 'Ordne zu', 'dropzones': ['A', 'B'],
+     'draggables': [{'text': 'x', 'dropzone': 0}]},
+    {'type': 'essay', 'title': 'ES', 'task_description': 'Beschreibe.', 'keywords': [{'keyword': 'Scrum'}]},
+]
+
+failures = []
+
+
+def check(label: str, ok: bool):
+    print(f"  [{'OK' if ok else 'FEHLER'}] {label}")
+    if not ok:
+        failures.append(label)
+
+
+def raises_type_error(action) -> bool:
+    try:
+        action()
+    except TypeError:
+        return True
+    return False
+
+
+def build(build_style, cached: bool) -> dict:
+    """content.json (Bytes) nach Typ, mit oder ohne Skeleton-Cache"""
+    SKELETONS.clear()
+    SKELETONS.enabled = cached
+    packages = {}
+    try:
+        for element, result in zip(ELEMENTS, batch_create(ELEMENTS, style=build_style, seed=SEED)):
+            if not result.success:
+                failures.append(f"{element['type']}: {result.error}")
+                continue
+            with zipfile.ZipFile(result.path, 'r') as zf:
+                packages[element['type']] = zf.read('content/content.json')
+            Path(result.path).unlink()
+    finally:
+        SKELETONS.enabled = True
+    return packages
+
+
+print("=" * 60)
+print("Test: Skeleton-Cache (content_skeleton)")
+print("=" * 60)
+
+print("\n1. Eingefrorene Teile:")
+skeleton = compile_skeleton({
+    'tail': Members({'behaviour': {'enableRetry': True}, 'overallFeedback': [{'from': 0, 'to': 100}]}),
+    'l10n': {'trueText': 'Wahr'},
+})
+tail, l10n = skeleton.members('tail'), skeleton['l10n']
+check("Teile sind FrozenDict/FrozenList (auch verschachtelt)",
+      isinstance(tail, FrozenDict) and isinstance(l10n, FrozenDict)
+      and isinstance(tail['behaviour'], FrozenDict) and isinstance(tail['overallFeedback'], FrozenList)
+      and isinstance(tail['overallFeedback'][0], FrozenDict))
+check("dict: Zuweisen, Loeschen, update, setdefault, pop werfen TypeError", all(raises_type_error(action) for action in (
+    lambda: l10n.__setitem__('trueText', 'X'), lambda: l10n.__delitem__('trueText'),
+    lambda: l10n.update(a=1), lambda: l10n.setdefault('a', 1), lambda: l10n.pop('trueText'),
+    lambda: l10n.clear(), lambda: tail['behaviour'].__ior__({'a': 1}))))
+entries = tail['overallFeedback']
+check("list: Zuweisen, append, extend, sort, += werfen TypeError", all(raises_type_error(action) for action in (
+    lambda: entries.__setitem__(0, {}), lambda: entries.append({}), lambda: entries.extend([{}]),
+    lambda: entries.sort(), lambda: entries.__iadd__([{}]), lambda: entries[0].__setitem__('to', 50))))
+check("Inhalt unveraendert", l10n == {'trueText': 'Wahr'} and tail['overallFeedback'] == [{'from': 0, 'to': 100}])
+mutable = dict(l10n)
+mutable['trueText'] = 'Richtig'
+check("dict(...) ist eine veraenderbare Kopie", l10n['trueText'] == 'Wahr' and type(mutable) is dict)
+deep = copy.deepcopy(tail)
+deep['overallFeedback'][0]['to'] = 50
+check("deepcopy liefert normale dict/list",
+      type(deep) is dict and type(deep['overallFeedback']) is list
+      and type(deep['overallFeedback'][0]) is dict and tail['overallFeedback'][0]['to'] == 100)
+check("copy liefert normales dict", type(copy.copy(l10n)) is dict)
+
+print("\n2. Wiederverwendung:")
+SKELETONS.clear()
+generator = TrueFalseGenerator(style=THEMES['education'])
+first = generator._skeleton("H5P.QuestionSet")
+second = TrueFalseGenerator(style=THEMES['education'])._skeleton("H5P.QuestionSet")
+check(f"ein Skeleton pro (Typ, Style) ({SKELETONS.misses} Miss, {SKELETONS.hits} Hit)",
+      first is second and (SKELETONS.misses, SKELETONS.hits) == (1, 1))
+other = TrueFalseGenerator(style=replace(THEMES['education'], pass_percentage=80))._skeleton("H5P.QuestionSet")
+check("anderer Style -> eigenes Skeleton", other is not first and len(SKELETONS) == 2)
+snapshot = copy.deepcopy(first.parts)
+result = generator.create('Quiz', [{'text': 'Aussage', 'correct': True}])
+if result.success:
+    Path(result.path).unlink()
+check("create() laesst den Cache unveraendert", result.success and first.parts == snapshot)
+
+print("\n3. Mit und ohne Cache gleich (alle Typen):")
+brand = replace(THEMES['education'], primary_color='#8a1538', pass_percentage=70)
+overlay = StyleOverlay.compile(brand, name='test-brand')
+variants = {
+    'Standard': THEMES['education'],
+    'Overlay': replace(THEMES['education'], overlay=overlay),
+    'Umlaute + Overlay + eingerueckt': replace(THEMES['education'], overlay=overlay,
+                                               restore_umlauts=True, pretty_json=True),
+}
+for label, variant in variants.items():
+    cached, uncached = build(variant, cached=True), build(variant, cached=False)
+    differing = sorted(t for t in uncached if cached.get(t) != uncached[t])
+    check(f"{label}: {len(cached)} Typen identisch{f' (abweichend: {differing})' if differing else ''}",
+          len(cached) == len(ELEMENTS) and not differing)
+umlauts = build(variants['Umlaute + Overlay + eingerueckt'], cached=True)
+check("Umlaute im Inhalt wiederhergestellt", 'prüft' in umlauts['fill_blanks'].decode('utf-8'))
+
+print("\n4. Umlaut-Wiederherstellung ueberspringt eingefrorene Teile:")
+restorer = UmlautRestorer.default()
+frozen = FrozenDict({'text': 'prueft'})
+tree = restorer.restore_tree({'part': frozen, 'own': ['prueft']}, keep=(FrozenDict, FrozenList))
+check("eingefrorener Teil unveraendert uebernommen", tree['part'] is frozen)
+check("uebriger Inhalt wiederhergestellt", tree['own'] == ['prüft'])
+check("ohne keep wie bisher", restorer.restore_tree({'part': frozen})['part'] == {'text': 'prüft'})
+
+print("\n" + "=" * 60)
+if failures:
+    print("Test fehlgeschlagen:")
+    for failure in failures:
+        print(f"  - {failure}")
+    sys.exit(1)
+print("Test abgeschlossen!")
+print("=" * 60)
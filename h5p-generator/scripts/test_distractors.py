@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Test: Distraktor-Generator (Ranking, Near-Miss, Domain-Erkennung)
+
+Testet ob:
+1. Das Trigramm-Ranking mit und ohne NumPy dieselben Ergebnisse liefert
+2. Die Domain-Filterung auf dem gemeinsamen Index nur Domain-Konzepte
+   und eigenes Vokabular liefert
+3. Near-Miss-Distraktoren erst Lexikon-Nachbarn, dann Tippfehler liefern
+4. Lueckentexte nahe Schreibweisen als Alternativen uebernehmen
+5. Die Domain-Erkennung Komposita mit Bindestrich und Flexionsformen erkennt
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Pfade einrichten (sub_agents direkt, das Paket importiert optionale Agenten)
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+sys.path.insert(0, str(script_dir / 'sub_agents'))
+
+import ngram_ranker
+from distractor_generator import DistractorGenerator
+from h5p_generator import FillInBlanksGenerator
+from ngram_ranker import NgramRanker
+
+failures = []
+
+
+def check(label: str, ok: bool):
+    print(f"  [{'OK' if ok else 'FEHLER'}] {label}")
+    if not ok:
+        failures.append(label)
+
+
+VOCABULARY = [
+    'Umsatzsteuer', 'Vorsteuer', 'Gewerbesteuer', 'Einkommensteuer', 'Umsatzerloese',
+    'Steuerberater', 'Abschreibung', 'Rueckstellung', 'Kreditor', 'Debitor', 'Inventar',
+    'Inventur', 'Bilanz', 'Bilanzsumme', 'Product Owner', 'Sprint Review', 'server',
+]
+QUERIES = ['Umsatzsteuer', 'Debitor', 'Bilanz', 'Scrum Master', 'Server', 'xyz']
+
+print("=" * 60)
+print("Test: Distraktor-Generator")
+print("=" * 60)
+
+print("\n1. NumPy und reine Python-Akkumulation:")
+if ngram_ranker.np is None:
+    print("  NumPy nicht installiert - Vergleich uebersprungen")
+else:
+    vectorized = NgramRanker(VOCABULARY)
+    numpy_module, ngram_ranker.np = ngram_ranker.np, None
+    try:
+        plain = NgramRanker(VOCABULARY)
+        plain_results = {q: plain.rank(q, k=5, exclude=['Vorsteuer']) for q in QUERIES}
+        plain_masked = plain.rank('Umsatzsteuer', k=5, allowed=plain.mask(VOCABULARY[:6]))
+    finally:
+        ngram_ranker.np = numpy_module
+    for query in QUERIES:
+        a = vectorized.rank(query, k=5, exclude=['Vorsteuer'])
+        b = plain_results[query]
+        check(f"{query}: gleiche Reihenfolge und Scores",
+              [c.term for c in a] == [c.term for c in b]
+              and all(abs(x.score - y.score) < 1e-9 for x, y in zip(a, b)))
+    masked = vectorized.rank('Umsatzsteuer', k=5, allowed=vectorized.mask(VOCABULARY[:6]))
+    check("Maske: gleiche Kandidaten", [c.term for c in masked] == [c.term for c in plain_masked])
+
+print("\n2. Domain-Filter auf einem gemeinsamen Index:")
+generator = DistractorGenerator(vocabulary=VOCABULARY)
+allowed = {t.lower() for t in generator.get_domain_concepts('scrum') + VOCABULARY}
+ranked = generator.rank_candidates('Scrum Master', domain='scrum', count=8)
+check(f"nur Scrum-Konzepte und Vokabular ({ranked[:3]}...)",
+      ranked and all(term.lower() in allowed for term in ranked))
+check("keine Accounting-Konzepte ohne Domain",
+      all(term in VOCABULARY for term in generator.rank_candidates('Aktiva', count=5)))
+check("ohne Vokabular und Domain keine Kandidaten",
+      DistractorGenerator().rank_candidates('Debitor', count=3) == [])
+check("Index einmal fuer alle Domains",
+      generator._get_ranker() is generator._get_ranker() and len(generator._ranker_masks) == 2)
+
+large = DistractorGenerator(vocabulary=[f"Fachbegriff{i:05d}" for i in range(20000)])
+started = time.perf_counter()
+for domain in ('accounting', 'scrum', 'it', 'business'):
+    large.rank_candidates('Fachbegriff00042', domain=domain, count=3)
+elapsed = time.perf_counter() - started
+indexed = len(large._get_ranker())
+check(f"4 Domains mit 20k Vokabular: {elapsed:.2f}s, ein Index ({indexed} Begriffe)",
+      len(large._ranker_masks) == 4)
+
+print("\n3. Near-Miss und Tippfehler:")
+generator = DistractorGenerator()
+result = generator.generate_near_misses("Inventur", domain="accounting", count=3)
+check(f"Inventur: {result.distractors}", result.distractors == ['Inventar', 'Inwentur', 'Ivnentur'])
+check("Strategie near_miss mit Tippfehler-Warnung",
+      result.strategy_used == "near_miss" and result.warnings and result.confidence == 0.7)
+result = generator.generate_near_misses("Debitor", domain="accounting", count=1)
+check(f"nur Lexikon-Treffer: {result.distractors}",
+      result.distractors == ['Debit'] and not result.warnings and result.confidence == 0.9)
+result = generator.generate_near_misses("Kreditor", domain="it", count=2)
+check(f"Lexikon anderer Domains bleibt aussen vor: {result.distractors}",
+      result.distractors == ['Kerditor', 'Krdeitor'])
+result = generator.generate_near_misses("Inventur", domain="accounting", count=3, exclude=['inventar'])
+check("exclude gilt fuer Lexikon und Tippfehler",
+      result.distractors == ['Inwentur', 'Ivnentur', 'Inevntur'])
+check("Tippfehler: Verwechslungen vor Buchstabendrehern",
+      generator.typo_variants("Kasse") == ['Kase', 'Ksase'])
+check("Tippfehler: nie der Begriff selbst, keine Duplikate",
+      all(len(set(v.lower() for v in generator.typo_variants(t))) == len(generator.typo_variants(t))
+          and t.lower() not in {v.lower() for v in generator.typo_variants(t)}
+          for t in ('Bilanz', 'Sprint', 'Rechnung', 'Aa')))
+vocab = DistractorGenerator(vocabulary=['Inventarliste', 'Inventuren'])
+check("eigenes Vokabular ohne Domain",
+      vocab.generate_near_misses("Inventur", count=1).distractors == ['Inventuren'])
+
+print("\n4. Alternative Schreibweisen im Lueckentext:")
+blanks = FillInBlanksGenerator.__new__(FillInBlanksGenerator)
+text = 'Sende eine *E-Mail* an die *Kasse:Tipp*.'
+lexicon = ['Email', 'E-Mail', 'Kassa', 'Klasse']
+check("Vorschlaege pro Luecke",
+      blanks.suggest_alternative_spellings(text, lexicon)
+      == {'E-Mail': ['Email'], 'Kasse': ['Kassa', 'Klasse']})
+check("Luecken erweitert, Tipp bleibt erhalten",
+      blanks.add_alternative_spellings(text, lexicon) == 'Sende eine *E-Mail/Email* an die *Kasse/Kassa/Klasse:Tipp*.')
+check("ohne Treffer unveraendert", blanks.add_alternative_spellings(text, ['Bilanz']) == text)
+
+print("\n5. Domain-Erkennung:")
+DETECTION = {
+    "Was ist ein Sprint-Backlog?": 'scrum',
+    "Wer leitet das Scrum-Team?": 'scrum',
+    "Wie funktioniert ein Client-Server-Modell?": 'it',
+    "Welche Kontos werden bebucht?": 'accounting',
+    "Was ist ein Gegenkonto?": 'accounting',
+    "Wie lautet die IP-Adresse des Servers?": 'it',
+    "Was machen Product Owners?": 'scrum',
+    "Wer soll das haben?": None,           # nur schwache Indikatoren
+    "Was kostet ein Koch?": None,          # "kosten*" nicht in "kostet"
+    "Wie heisst das Skript?": None,        # "ip" nicht innerhalb eines Wortes
+}
+generator = DistractorGenerator()
+for text, expected in DETECTION.items():
+    ranked = generator.detect_domains(text)
+    detected = ranked[0][0] if ranked else None
+    check(f"{text} -> {detected}", detected == expected)
+check("Ergebnis gecacht", generator.detect_domains("Was ist ein  SPRINT-Backlog?") == [('scrum', 1.0)]
+      and len(generator._domain_cache) == len(DETECTION))
+
+
+class CustomGenerator(DistractorGenerator):
+    DOMAIN_INDICATORS = {'lager': {'lager*': 3.0}}
+
+
+check("Unterklasse mit eigenen Indikatoren",
+      CustomGenerator().detect_domains("Wie gross ist das Lager?") == [('lager', 1.0)]
+      and generator.detect_domains("Wie gross ist das Lager?") == [])
+check("Regex einmal pro Klasse kompiliert",
+      DistractorGenerator._indicator_matcher()[0] is DistractorGenerator()._indicator_matcher()[0])
+
+print("\n" + "=" * 60)
+if failures:
+    print("Test fehlgeschlagen:")
+    for failure in failures:
+        print(f"  - {failure}")
+    sys.exit(1)
+print("Test abgeschlossen!")
+print("=" * 60)
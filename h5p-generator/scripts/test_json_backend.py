@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Test: JSON-Backend (kompakte und eingerueckte Ausgabe)
+
+Testet ob:
+1. dumps() kompakt ohne Leerraum und eingerueckt mit 2 Leerzeichen schreibt,
+   beides mit denselben Daten und ohne \\u-Escapes fuer Umlaute
+2. Alle installierten Backends byte-identisch zu stdlib kodieren und
+   set_backend() unbekannte Backends mit ValueError ablehnt
+3. Generator-Pakete standardmaessig kompakte content.json/h5p.json enthalten,
+   mit pretty_json=True eingerueckte - mit gleichem Inhalt
+4. Die kompakte content.json kleiner ist als die eingerueckte
+"""
+
+import json
+import random
+import sys
+import tempfile
+import zipfile
+from dataclasses import replace
+from pathlib import Path
+
+# Pfade einrichten
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+
+from json_backend import BACKENDS, PRETTY_INDENT, available_backends, dumps, get_backend, set_backend
+from h5p_generator import (THEMES, AccordionGenerator, DragDropGenerator, MultiChoiceGenerator,
+                           TrueFalseGenerator)
+
+failures = []
+
+
+def check(label: str, ok: bool):
+    print(f"  [{'OK' if ok else 'FEHLER'}] {label}")
+    if not ok:
+        failures.append(label)
+
+
+SAMPLE = {
+    'text': "Prüfung der Rückstellungen <b>&amp;</b> Größe",
+    'zahlen': [1, 2.5, -3, 10 ** 12],
+    'leer': {}, 'liste': [], 'wahr': True, 'nichts': None,
+    'verschachtelt': {'a': [{'b': 'c'}, [1, [2, {}]]]},
+}
+
+GENERATORS = {
+    'TrueFalse': (TrueFalseGenerator, ("Wahr oder falsch", [{'text': "Der PO prüft.", 'correct': True}])),
+    'MultiChoice': (MultiChoiceGenerator, ("Quiz", [{'question': "Wer prüft?", 'answers': [
+        {'text': "PO", 'correct': True}, {'text': "SM"}, {'text': "Team"}]}])),
+    'DragQuestion': (DragDropGenerator, ("Bilanz", "Ordne zu", ["Aktiva", "Passiva"], [
+        {'text': "Kasse", 'dropzone': 0}, {'text': "Rückstellungen", 'dropzone': 1}])),
+    'Accordion': (AccordionGenerator, ("Größen", [{'title': "Übersicht", 'content': "<p>Text</p>"}])),
+}
+
+
+def package(directory: Path, cls, args, style) -> dict:
+    """content.json und h5p.json eines Pakets als Text"""
+    name = f"{cls.__name__}-{'pretty' if style.pretty_json else 'kompakt'}"
+    result = cls(output_dir=str(directory), style=style, rng=random.Random(40)).create(*args, output_name=name)
+    with zipfile.ZipFile(result.path) as zf:
+        return {member: zf.read(member).decode('utf-8') for member in ('content/content.json', 'h5p.json')}
+
+
+print("=" * 60)
+print(f"Test: JSON-Backend (aktiv: {get_backend().name}, installiert: {available_backends()})")
+print("=" * 60)
+
+print("\n1. Kompakt und eingerueckt:")
+compact, pretty = dumps(SAMPLE), dumps(SAMPLE, pretty=True)
+check("kompakt: eine Zeile, Trennzeichen ',' und ':'",
+      '\n' not in compact and ', ' not in compact and '": ' not in compact
+      and compact == json.dumps(SAMPLE, ensure_ascii=False, separators=(',', ':')))
+check("eingerueckt: 2 Leerzeichen, ': '",
+      pretty == json.dumps(SAMPLE, ensure_ascii=False, indent=PRETTY_INDENT))
+check("gleiche Daten", json.loads(compact) == json.loads(pretty) == SAMPLE)
+check("Umlaute nicht escaped", "Prüfung" in compact and "\\u00fc" not in compact + pretty)
+
+print("\n2. Backends:")
+reference = BACKENDS['stdlib']()
+for name in available_backends():
+    backend = BACKENDS[name]()
+    check(f"{name}: kompakt und eingerueckt identisch zu stdlib",
+          backend.dumps(SAMPLE) == reference.dumps(SAMPLE)
+          and backend.dumps(SAMPLE, PRETTY_INDENT) == reference.dumps(SAMPLE, PRETTY_INDENT))
+if 'orjson' not in BACKENDS:
+    print("  [UEBERSPRUNGEN] orjson nicht installiert")
+active = get_backend()
+try:
+    set_backend('gibtsnicht')
+    check("unbekanntes Backend -> ValueError", False)
+except ValueError:
+    check("unbekanntes Backend -> ValueError", True)
+check("aktives Backend bleibt nach Fehler erhalten", get_backend() is active)
+set_backend('stdlib')
+check("set_backend('stdlib')", get_backend().name == 'stdlib')
+set_backend(active.name)
+
+print("\n3. Generator-Pakete:")
+default_style = THEMES['education']
+pretty_style = replace(default_style, pretty_json=True)
+sizes = {}
+with tempfile.TemporaryDirectory() as tmp:
+    for label, (cls, args) in GENERATORS.items():
+        compact_files = package(Path(tmp), cls, args, default_style)
+        pretty_files = package(Path(tmp), cls, args, pretty_style)
+        compact_ok = all('\n' not in text and text == dumps(json.loads(text))
+                         for text in compact_files.values())
+        pretty_ok = all(text == dumps(json.loads(text), pretty=True) and '\n  "' in text
+                        for text in pretty_files.values())
+        same = all(json.loads(compact_files[m]) == json.loads(pretty_files[m]) for m in compact_files)
+        check(f"{label}: kompakt={compact_ok}, eingerueckt={pretty_ok}, gleicher Inhalt={same}",
+              compact_ok and pretty_ok and same)
+        sizes[label] = (len(compact_files['content/content.json'].encode('utf-8')),
+                        len(pretty_files['content/content.json'].encode('utf-8')))
+
+print("\n4. Groesse content.json:")
+for label, (small, large) in sizes.items():
+    check(f"{label}: {small} statt {large} Bytes ({100 - small * 100 // large}% kleiner)", small < large)
+
+print("\n" + "=" * 60)
+if failures:
+    print("Test fehlgeschlagen:")
+    for failure in failures:
+        print(f"  - {failure}")
+    sys.exit(1)
+print("Test abgeschlossen!")
+print("=" * 60)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Test: Near-Duplicate-Erkennung (MinHash/LSH)
+
+Testet ob:
+1. Die Schwelle greift (Paar knapp darueber gruppiert, knapp darunter nicht)
+2. Gruppen nicht transitiv wachsen (A~B, B~C, aber A!~C -> C bleibt)
+3. Jedes Duplikat die Schwelle gegenueber seinem Repraesentanten erreicht
+4. Exakte Duplikate ohne Paarvergleiche zusammengefasst werden
+5. Paare knapp ueber der Schwelle zuverlaessig Kandidaten werden (Recall
+   auf eingepflanzten Paaren mit Jaccard 0.77-0.86)
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Pfade einrichten (sub_agents direkt, das Paket importiert optionale Agenten)
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir / 'sub_agents'))
+
+from question_dedup import QuestionDeduplicator
+
+failures = []
+
+
+def check(label: str, ok: bool):
+    print(f"  [{'OK' if ok else 'FEHLER'}] {label}")
+    if not ok:
+        failures.append(label)
+
+
+A = "Welche Aufgaben hat der Scrum Master im Team"
+B = "Welche Aufgaben hat der Scrum Master im Sprint Review"
+C = "Welche Pflichten hat der Scrum Master im Sprint Review"
+
+def planted_pairs(checker, count, low, high, seed):
+    """Paare (Frage, Variante, exakte Jaccard) mit Aehnlichkeit in [low, high]"""
+    rng = random.Random(seed)
+    syllables = ['ka', 'lo', 'mi', 'ter', 'bu', 'sen', 'ra', 'vo', 'dis', 'pel', 'gu', 'nor']
+
+    def word():
+        return ''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4)))
+
+    pairs = []
+    while len(pairs) < count:
+        words = [word() for _ in range(14)]
+        variant = list(words)
+        while True:
+            # Woerter tauschen, bis die Aehnlichkeit im Zielbereich liegt
+            variant[rng.randrange(len(variant))] = word()
+            text, changed = ' '.join(words), ' '.join(variant)
+            similarity = checker.jaccard(checker.shingles(text), checker.shingles(changed))
+            if similarity < low:
+                break
+            if similarity <= high:
+                pairs.append((text, changed, similarity))
+                break
+    return pairs
+
+
+print("=" * 60)
+print("Test: Question Dedup (MinHash/LSH)")
+print("=" * 60)
+
+dedup = QuestionDeduplicator(threshold=0.6)
+ab, bc, ac = (dedup.jaccard(dedup.shingles(x), dedup.shingles(y)) for x, y in ((A, B), (B, C), (A, C)))
+print(f"\n  Jaccard: A-B {ab:.2f}, B-C {bc:.2f}, A-C {ac:.2f}")
+
+print("\n1. Schwelle:")
+groups, _ = QuestionDeduplicator(threshold=0.65).find_duplicates([A, B])
+check("A-B ueber der Schwelle -> Gruppe", [(g.representative, g.duplicates) for g in groups] == [(0, [1])])
+groups, _ = QuestionDeduplicator(threshold=0.7).find_duplicates([A, B])
+check("A-B unter der Schwelle -> keine Gruppe", groups == [])
+for invalid in (0.0, 1.5):
+    try:
+        QuestionDeduplicator(threshold=invalid)
+        check(f"threshold {invalid} abgelehnt", False)
+    except ValueError:
+        check(f"threshold {invalid} abgelehnt", True)
+
+print("\n2. Keine transitive Verkettung:")
+groups, _ = dedup.find_duplicates([A, B, C])
+check(f"A und B gruppiert, C eigenstaendig ({[g.duplicates for g in groups]})",
+      [(g.representative, g.duplicates) for g in groups] == [(0, [1])])
+result = dedup.deduplicate([A, B, C])
+check("C bleibt erhalten", result.unique == [A, C] and result.removed_count == 1)
+
+print("\n3. Gruppen gegen die Schwelle:")
+rng = random.Random(30)
+stems = ["Was ist ein Debitor in der Buchfuehrung", "Wer priorisiert das Product Backlog im Team",
+         "Welche Aufgaben hat der Scrum Master", "Wie wird eine Bilanz gegliedert"]
+pool = [f"{rng.choice(stems)} {rng.choice(['?', ' genau?', ' eigentlich?', ' heute?'])} {rng.randint(0, 40)}"
+        for _ in range(200)]
+for threshold in (0.6, 0.8, 0.9):
+    checker = QuestionDeduplicator(threshold=threshold)
+    groups, checked = checker.find_duplicates(pool)
+    sets = [checker.shingles(q) for q in pool]
+    worst = min((checker.jaccard(sets[g.representative], sets[d]) for g in groups for d in g.duplicates),
+                default=1.0)
+    check(f"threshold {threshold}: {len(groups)} Gruppen, min. Aehnlichkeit {worst:.2f}, "
+          f"{checked} Paare geprueft", worst >= threshold and checked < len(pool) * (len(pool) - 1) // 2)
+    members = [m for g in groups for m in [g.representative] + g.duplicates]
+    check(f"threshold {threshold}: jede Frage hoechstens in einer Gruppe", len(members) == len(set(members)))
+
+print("\n4. Exakte Duplikate:")
+copies = ["Was ist ein Sprint?"] * 150 + ["Was ist ein  SPRINT!"] * 50 + ["Wer ist der Product Owner?"]
+groups, checked = QuestionDeduplicator(threshold=0.8).find_duplicates(copies)
+check("eine Gruppe mit 199 Duplikaten, Aehnlichkeit 1.0",
+      len(groups) == 1 and len(groups[0].duplicates) == 199 and groups[0].similarity == 1.0)
+check(f"keine Paarvergleiche innerhalb identischer Fragen ({checked} geprueft)", checked <= 1)
+
+print("\n5. Recall knapp ueber der Schwelle:")
+checker = QuestionDeduplicator(threshold=0.8)
+pairs = planted_pairs(checker, 300, 0.77, 0.86, seed=30)
+pool = [text for pair in pairs for text in pair[:2]]
+groups, checked = checker.find_duplicates(pool)
+found = {(g.representative, d) for g in groups for d in g.duplicates}
+above = [i for i, (_, _, similarity) in enumerate(pairs) if similarity >= 0.8]
+hits = sum((2 * i, 2 * i + 1) in found for i in above)
+print(f"  Baender {checker.bands} x Zeilen {checker.rows}, "
+      f"Wendepunkt {(1 / checker.bands) ** (1 / checker.rows):.2f}")
+check(f"{hits} von {len(above)} Paaren ab 0.8 gefunden", hits >= 0.97 * len(above))
+check("keine Paare unter der Schwelle gruppiert",
+      found <= {(2 * i, 2 * i + 1) for i in above})
+check(f"{checked} von {len(pool) * (len(pool) - 1) // 2} Paaren geprueft",
+      checked < 2 * len(pool))
+try:
+    QuestionDeduplicator(false_negative_rate=0.0)
+    check("false_negative_rate 0 abgelehnt", False)
+except ValueError:
+    check("false_negative_rate 0 abgelehnt", True)
+
+print("\n" + "=" * 60)
+if failures:
+    print("Test fehlgeschlagen:")
+    for failure in failures:
+        print(f"  - {failure}")
+    sys.exit(1)
+print("Test abgeschlossen!")
+print("=" * 60)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Test: Reproduzierbare Pakete (Seed)
+
+Testet ob:
+1. Gleicher Seed byte-identische .h5p Dateien liefert (alle batch_create-Typen)
+2. Ein anderer Seed andere UUIDs liefert, ohne Seed zufaellig bleibt
+3. Ein einzelner Generator mit make_rng(seed) reproduzierbar ist
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Pfade einrichten
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+
+from h5p_generator import THEMES, AccordionGenerator, batch_create, make_rng
+
+ELEMENTS = [
+    {'type': 'true_false', 'title': 'TF', 'questions': [{'text': 'Der PO priorisiert.', 'correct': True}]},
+    {'type': 'multi_choice', 'title': 'MC', 'questions': [{'question': 'Wie lange?', 'answers': [
+        {'text': '4 Wochen', 'correct': True}, {'text': '3 Monate', 'correct': False},
+        {'text': '1 Jahr', 'correct': False}]}]},
+    {'type': 'fill_blanks', 'title': 'FB', 'text': 'Der *Product Owner* priorisiert.'},
+    {'type': 'single_choice', 'title': 'SC', 'questions': [{'question': 'Wer?', 'answers': ['PO', 'SM', 'Dev']}]},
+    {'type': 'flashcards', 'title': 'FC', 'cards': [{'front': 'PO', 'back': 'Product Owner'}]},
+    {'type': 'mark_words', 'title': 'MW', 'text': 'Der *PO* priorisiert.'},
+    {'type': 'summary', 'title': 'SU', 'items': [{'statements': ['Richtig', 'Falsch', 'Auch falsch']}]},
+    {'type': 'accordion', 'title': 'AC', 'panels': [{'title': 'A', 'content': 'B'}]},
+    {'type': 'drag_text', 'title': 'DT', 'text': 'Der *PO* priorisiert.'},
+    {'type': 'timeline', 'title': 'TL', 'events': [{'start_date': '2020', 'headline': 'X', 'text': 'Y'}]},
+    {'type': 'memory_game', 'title': 'MG', 'cards': [{'description': 'A'}, {'description': 'B'}]},
+    {'type': 'sort_paragraphs', 'title': 'SP', 'paragraphs': ['Eins', 'Zwei', 'Drei']},
+    {'type': 'drag_drop', 'title': 'DD', 'task': 'Ordne zu', 'dropzones': ['A', 'B'],
+     'draggables': [{'text': 'x', 'dropzone': 0}, {'text': 'y', 'dropzone': 1}]},
+    {'type': 'essay', 'title': 'ES', 'task_description': 'Beschreibe.', 'keywords': [{'keyword': 'Scrum'}]},
+]
+
+failures = []
+
+
+def check(label: str, ok: bool):
+    print(f"  [{'OK' if ok else 'FEHLER'}] {label}")
+    if not ok:
+        failures.append(label)
+
+
+def build(seed):
+    """Pakete als Bytes, nach Typ"""
+    packages = {}
+    for element, result in zip(ELEMENTS, batch_create(ELEMENTS, style=THEMES['education'], seed=seed)):
+        if not result.success:
+            failures.append(f"{element['type']}: {result.error}")
+            continue
+        packages[element['type']] = Path(result.path).read_bytes()
+        Path(result.path).unlink()
+    return packages
+
+
+print("=" * 60)
+print("Test: Reproduzierbare Pakete (Seed)")
+print("=" * 60)
+
+print("\n1. Gleicher Seed:")
+first, second = build(29), build(29)
+for content_type in first:
+    check(f"{content_type}: byte-identisch", first[content_type] == second.get(content_type))
+check("alle Typen gebaut", len(first) == len(ELEMENTS))
+
+print("\n2. Anderer Seed:")
+other = build(30)
+# Nur Typen mit erzeugten UUIDs haengen vom Seed ab, die uebrigen nutzen
+# feste IDs ("tf-0", "mc-0") und sind ohnehin deterministisch
+changed = sorted(t for t in first if first[t] != other.get(t))
+check(f"Pakete mit UUIDs unterscheiden sich ({', '.join(changed)})", 'accordion' in changed)
+check("seed=None bleibt zufaellig", build(None)['accordion'] != build(None)['accordion'])
+
+print("\n3. Einzelner Generator:")
+with tempfile.TemporaryDirectory() as tmp:
+    panels = [{'title': f"Panel {i}", 'content': f"Text {i}"} for i in range(5)]
+    runs = []
+    for name in ('a', 'b'):
+        generator = AccordionGenerator(output_dir=tmp, rng=make_rng('quiz-7'))
+        result = generator.create("Akkordeon", panels, output_name=name)
+        runs.append(Path(result.path).read_bytes())
+    check("make_rng('quiz-7') zweimal: byte-identisch", runs[0] == runs[1])
+
+print("\n" + "=" * 60)
+if failures:
+    print("Test fehlgeschlagen:")
+    for failure in failures:
+        print(f"  - {failure}")
+    sys.exit(1)
+print("Test abgeschlossen!")
+print("=" * 60)
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Test: Branding beim Bauen (StyleOverlay)
+
+Testet ob:
+1. Jeder batch_create-Typ beim Bauen genau die erwarteten Felder brandet
+   (<style>-Block, Farbe, Feedback-Texte, Bestehensgrenze) und sonst nichts
+   veraendert - erwartet wird aus dem ungebrandeten Paket abgeleitet
+2. Das nachtraegliche Branding (apply_to_package) dasselbe Ergebnis liefert
+3. Das Overlay idempotent ist (zweimal anwenden = einmal anwenden)
+4. Der CardAgent sein Style (mit Overlay) an Timeline und Memory weitergibt
+5. Der Orchestrator das Overlay aus seinem Style kompiliert (wie H5PSystem)
+   und dieses Style an die Agents weitergibt
+"""
+
+import sys
+import copy
+import json
+import zipfile
+from dataclasses import replace
+from pathlib import Path
+
+# Pfade einrichten
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+
+from h5p_generator import THEMES, batch_create
+from style_overlay import StyleOverlay
+
+SEED = 38
+
+ELEMENTS = [
+    {'type': 'true_false', 'title': 'TF', 'questions': [{'text': 'Der PO priorisiert.', 'correct': True}]},
+    {'type': 'multi_choice', 'title': 'MC', 'questions': [{'question': 'Wie lange?', 'answers': [
+        {'text': '4 Wochen', 'correct': True}, {'text': '3 Monate', 'correct': False}]}]},
+    {'type': 'fill_blanks', 'title': 'FB', 'text': 'Der *Product Owner* priorisiert.'},
+    {'type': 'single_choice', 'title': 'SC', 'questions': [{'question': 'Wer?', 'answers': ['PO', 'SM']}]},
+    {'type': 'flashcards', 'title': 'FC', 'cards': [{'front': 'PO', 'back': 'Product Owner'}]},
+    {'type': 'mark_words', 'title': 'MW', 'text': 'Der *PO* priorisiert.'},
+    {'type': 'summary', 'title': 'SU', 'items': [{'statements': ['Richtig', 'Falsch']}]},
+    {'type': 'accordion', 'title': 'AC', 'panels': [{'title': 'A', 'content': 'B'}]},
+    {'type': 'drag_text', 'title': 'DT', 'text': 'Der *PO* priorisiert.'},
+    {'type': 'timeline', 'title': 'TL', 'events': [{'start_date': '2020', 'headline': 'X', 'text': 'Y'}]},
+    {'type': 'memory_game', 'title': 'MG', 'cards': [{'description': 'A'}, {'description': 'B'}]},
+    {'type': 'sort_paragraphs', 'title': 'SP', 'paragraphs': ['Eins', 'Zwei']},
+    {'type': 'drag_drop', 'title': 'DD', 'task': 'Ordne zu', 'dropzones': ['A', 'B'],
+     'draggables': [{'text': 'x', 'dropzone': 0}]},
+    {'type': 'essay', 'title': 'ES', 'task_description': 'Beschreibe.', 'keywords': [{'keyword': 'Scrum'}]},
+]
+
+# Erwartetes Branding pro Typ: (Bibliothek, HTML-Feld fuer den <style>-Block,
+# Farbfeld, overallFeedback, passPercentage) - unabhaengig von StyleOverlay notiert
+EXPECTED = {
+    'true_false': ('H5P.QuestionSet', ('introPage', 'introduction'), None, False, True),
+    'multi_choice': ('H5P.QuestionSet', ('introPage', 'introduction'), None, False, True),
+    'fill_blanks': ('H5P.Blanks', ('questions',), None, True, False),
+    'single_choice': ('H5P.SingleChoiceSet', None, None, True, False),
+    'flashcards': ('H5P.Dialogcards', ('description',), None, False, False),
+    'mark_words': ('H5P.MarkTheWords', ('taskDescription',), None, True, False),
+    'summary': ('H5P.Summary', ('intro',), None, True, False),
+    'accordion': ('H5P.Accordion', None, None, False, False),
+    'drag_text': ('H5P.DragText', ('taskDescription',), None, True, False),
+    'timeline': ('H5P.Timeline', None, None, False, False),
+    'memory_game': ('H5P.MemoryGame', None, ('lookNFeel', 'themeColor'), False, False),
+    'sort_paragraphs': ('H5P.SortParagraphs', ('taskDescription',), None, False, False),
+    'drag_drop': ('H5P.DragQuestion', None, None, True, False),
+    'essay': ('H5P.Essay', ('taskDescription',), None, True, False),
+}
+
+failures = []
+
+
+def check(label: str, ok: bool):
+    print(f"  [{'OK' if ok else 'FEHLER'}] {label}")
+    if not ok:
+        failures.append(label)
+
+
+def get(content, path):
+    for key in path:
+        content = content[key]
+    return content
+
+
+def put(content, path, value):
+    get(content, path[:-1])[path[-1]] = value
+
+
+def expected_branding(plain, content_type, brand, style_block):
+    """Ungebrandeter Inhalt plus genau die erwarteten Aenderungen"""
+    library, host, color, feedback, pass_percentage = EXPECTED[content_type]
+    expected = copy.deepcopy(plain)
+    if host:
+        put(expected, host, style_block + get(plain, host))
+    if color:
+        put(expected, color, brand.primary_color)
+    if feedback:
+        texts = (brand.feedback_wrong, brand.feedback_partial, brand.feedback_correct)
+        for entry, text in zip(expected['overallFeedback'], texts):
+            entry['feedback'] = text
+    if pass_percentage:
+        expected['passPercentage'] = brand.pass_percentage
+    return library, expected
+
+
+def read_package(path):
+    """content.json und h5p.json eines Pakets"""
+    with zipfile.ZipFile(path, 'r') as zf:
+        return json.loads(zf.read('content/content.json')), json.loads(zf.read('h5p.json'))
+
+
+print("=" * 60)
+print("Test: StyleOverlay (Branding beim Bauen)")
+print("=" * 60)
+
+# Marke weicht in jedem gebrandeten Feld bewusst vom Basis-Style ab
+style = THEMES['education']
+brand = replace(style, primary_color='#8a1538', feedback_wrong='Nochmal!', feedback_partial='Fast!',
+                feedback_correct='Ausgezeichnet!', pass_percentage=70)
+overlay = StyleOverlay.compile(brand, name='test-brand', css='.h5p-content{letter-spacing:0}')
+check("Marke unterscheidet sich vom Basis-Style",
+      all(getattr(brand, a) != getattr(style, a) for a in
+          ('primary_color', 'feedback_wrong', 'feedback_partial', 'feedback_correct', 'pass_percentage')))
+
+
+def build(build_style, post_hoc=None):
+    """Pakete nach Typ als (content, h5p.json); optional nachtraeglich gebrandet"""
+    packages = {}
+    for element, result in zip(ELEMENTS, batch_create(ELEMENTS, style=build_style, seed=SEED)):
+        if not result.success:
+            failures.append(f"{element['type']}: {result.error}")
+            continue
+        if post_hoc:
+            post_hoc.apply_to_package(result.path)
+        packages[element['type']] = read_package(result.path)
+        Path(result.path).unlink()
+    return packages
+
+
+plain = build(style)
+built = build(replace(style, overlay=overlay))
+post_hoc = build(style, post_hoc=overlay)
+
+print("\n1. Beim Bauen gebrandet (alle Typen):")
+check("alle Typen erwartet", set(built) == set(EXPECTED))
+for content_type, (content, meta) in built.items():
+    library, expected = expected_branding(plain[content_type][0], content_type, brand, overlay.style_block)
+    check(f"{content_type} ({library})", meta['mainLibrary'] == library and content == expected)
+
+print("\n2. Nachtraeglich gebrandet (apply_to_package):")
+different = [t for t in built if post_hoc.get(t) != built[t]]
+check(f"gleiches Ergebnis fuer {len(built)} Typen ({', '.join(different) or 'keine Abweichung'})",
+      not different)
+
+print("\n3. Idempotenz:")
+repeated = [t for t, (content, meta) in built.items()
+            if overlay.apply(copy.deepcopy(content), meta['mainLibrary']) != content]
+check(f"zweimal anwenden = einmal anwenden ({', '.join(repeated) or 'alle Typen'})", not repeated)
+rebranded = overlay.apply(copy.deepcopy(built['fill_blanks'][0]), 'H5P.Blanks')
+check("genau ein <style>-Block", rebranded['questions'].count('<style data-h5p-style=') == 1)
+
+print("\n4. CardAgent gibt sein Style weiter:")
+try:
+    from sub_agents.card_agent import CardAgent
+except ImportError as e:
+    # sub_agents/__init__.py importiert den optionalen DesignAgent
+    print(f"  [UEBERSPRUNGEN] sub_agents nicht importierbar ({e})")
+else:
+    import tempfile
+    # pretty_json macht das Style auch ohne Branding-Felder sichtbar (Timeline)
+    agent_style = replace(style, overlay=overlay, pretty_json=True)
+    cards = [{'description': f'Karte {i}'} for i in range(4)]
+    events = [{'start_date': str(year), 'headline': f'Ereignis {year}', 'text': 'Y'} for year in (2019, 2020)]
+    with tempfile.TemporaryDirectory() as tmp:
+        agent = CardAgent(tmp, style=agent_style, seed=SEED)
+        for content_type, params in (('memory_game', {'cards': cards}), ('timeline', {'events': events})):
+            result = agent.generate(content_type, title='Karten', **params)
+            if result.final_type != content_type or result.h5p_result is None:
+                check(f"{content_type}: gebaut ({result.error})", False)
+                continue
+            with zipfile.ZipFile(result.h5p_result.path) as zf:
+                raw = zf.read('content/content.json').decode('utf-8')
+            check(f"{content_type}: mit dem Style des Agents gebaut", raw.startswith('{\n'))
+            if content_type == 'memory_game':
+                check("memory_game: Markenfarbe", json.loads(raw)['lookNFeel']['themeColor'] == brand.primary_color)
+
+print("\n5. Orchestrator nutzt sein Style als Basis:")
+try:
+    from orchestrator import H5POrchestrator
+except ImportError as e:
+    print(f"  [UEBERSPRUNGEN] orchestrator nicht importierbar ({e})")
+else:
+    import tempfile
+    from types import SimpleNamespace
+    # Marke nur mit Primaerfarbe: alle anderen Werte kommen aus dem Basis-Style
+    partial_brand = SimpleNamespace(name='teilmarke', colors=SimpleNamespace(primary='#8a1538'))
+    base = THEMES['professional']
+    with tempfile.TemporaryDirectory() as tmp:
+        orchestrator = H5POrchestrator(tmp, brand_config=partial_brand, style=base)
+    check("Overlay aus dem uebergebenen Style",
+          orchestrator.style_overlay == StyleOverlay.from_brand(partial_brand, base))
+    check("Rueckfall-Feedback aus dem Style (nicht education)",
+          orchestrator.style_overlay.feedback[2] == base.feedback_correct != style.feedback_correct)
+    check("Agents mit dem uebergebenen Style",
+          all(agent.style is base for agent in orchestrator.agents.values()))
+
+print("\n" + "=" * 60)
+if failures:
+    print("Test fehlgeschlagen:")
+    for failure in failures:
+        print(f"  - {failure}")
+    sys.exit(1)
+print("Test abgeschlossen!")
+print("=" * 60)
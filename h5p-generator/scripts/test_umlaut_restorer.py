@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test: Umlaut-Wiederherstellung (Lexikon + Trie)
+
+Testet ob:
+1. Woerter mit "ue"/"ae"/"oe"/"ss" ohne Umlaut unveraendert bleiben
+   (Steuer, neue, Quelle - auch flektiert, als Kompositum, in Grossbuchstaben)
+2. Alle geschuetzten Lexikon-Eintraege ('!wort') unveraendert bleiben
+3. Echte Ersatzschreibweisen weiterhin wiederhergestellt werden, auch neben
+   Steuer/neue/Quelle im selben Kompositum
+4. HTML-Tags, Entities und SKIP_KEYS nicht angefasst werden
+"""
+
+import sys
+from pathlib import Path
+
+# Pfade einrichten
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+
+from umlaut_restorer import DEFAULT_LEXICON, UmlautRestorer
+
+failures = []
+
+
+def check(label: str, ok: bool):
+    print(f"  [{'OK' if ok else 'FEHLER'}] {label}")
+    if not ok:
+        failures.append(label)
+
+
+restorer = UmlautRestorer.default()
+
+print("=" * 60)
+print(f"Test: Umlaut Restorer ({len(restorer)} Woerter)")
+print("=" * 60)
+
+print("\n1. Keine Falsch-Positiven:")
+unchanged = {
+    'Steuer': "Steuer Steuern Steuerung Steuerberater Lohnsteuer Umsatzsteuer Vorsteuer STEUER",
+    'neue': "neue neuen neuer neues erneuern Neuerung Neuerungen erneut NEUE",
+    'Quelle': "Quelle Quellen Quellcode Quelltext Quellensteuer Stromquelle QUELLE",
+    'ue/ae/oe': "Abenteuer teuer Feuer Feuerwehr Bauer dauern Bedauern Mauer Treue Reue Aue "
+                "Sauerstoff Ungeheuer Museum Aquarium Israel Poesie Aerosol",
+    'ss': "Kasse muss Masse Prozess Interesse",
+}
+for label, text in unchanged.items():
+    found = restorer.find(text)
+    check(f"{label}: {found or 'keine Aenderung'}", found == [] and restorer.restore(text) == text)
+sentence = "Die neue Quelle zur Steuer ist aktuell und eventuell teuer."
+check("Satz unveraendert", restorer.restore(sentence) == sentence)
+
+print("\n2. Geschuetzte Lexikon-Eintraege:")
+protected = [line.strip()[1:] for line in DEFAULT_LEXICON.read_text(encoding='utf-8').splitlines()
+             if line.startswith('!')]
+changed = [word for word in protected
+           for variant in (word, word.capitalize(), word.upper())
+           if restorer.restore_word(variant) is not None]
+check(f"{len(protected)} Eintraege, veraendert: {changed or 'keine'}", bool(protected) and not changed)
+
+print("\n3. Echte Ersatzschreibweisen:")
+expected = {
+    "Der Product Owner prueft die Kundenwuensche.": "Der Product Owner prüft die Kundenwünsche.",
+    "Steuerpruefung und Steueraenderung": "Steuerprüfung und Steueränderung",
+    "Neuerungen fuer die Quellenpruefung": "Neuerungen für die Quellenprüfung",
+    "GROESSE, Strasse, Uebersicht": "GRÖSSE, Straße, Übersicht",
+}
+for text, result in expected.items():
+    check(f"{text} -> {restorer.restore(text)}", restorer.restore(text) == result)
+
+print("\n4. Markup und SKIP_KEYS:")
+html = "<p class='ueberschrift' title='neue Quelle'>Pruefung &uuml; Steuer</p>"
+check(f"{restorer.restore(html)}",
+      restorer.restore(html) == "<p class='ueberschrift' title='neue Quelle'>Prüfung &uuml; Steuer</p>")
+tree = restorer.restore_tree({'library': 'H5P.Pruefung 1.0', 'text': ['Pruefung', {'path': 'groesse.png'}]})
+check("library/path bleiben, Texte werden ersetzt",
+      tree == {'library': 'H5P.Pruefung 1.0', 'text': ['Prüfung', {'path': 'groesse.png'}]})
+
+print("\n" + "=" * 60)
+if failures:
+    print("Test fehlgeschlagen:")
+    for failure in failures:
+        print(f"  - {failure}")
+    sys.exit(1)
+print("Test abgeschlossen!")
+print("=" * 60)
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Umlaut Restorer - Stellt Umlaute aus Ersatzschreibweisen wieder her
+
+"Schaetzt" -> "Schätzt", "Kundenwuensche" -> "Kundenwünsche",
+"Strasse" -> "Straße" - aber nur, wenn das Ergebnis ein bekanntes Wort ist.
+"Steuer", "neue" oder "aktuell" bleiben unveraendert.
+
+Verfahren:
+1. Lexikon (umlaut_lexicon.txt + optionale Wortlisten) wird in zwei Tries
+   geladen, Schluessel ist die Ersatzschreibweise ("pruefung" -> "prüfung"):
+   vorwaerts fuer Praefixe, rueckwaerts fuer Suffixe (Komposita)
+2. Ein kompilierter Regex findet in einem Durchlauf nur Kandidaten-Woerter
+   (mit ae/oe/ue/ss) und ueberspringt HTML-Tags und Entities
+3. Ergebnisse pro Wort werden gecacht - ganze Buecher bleiben schnell
+
+Verwendet von:
+- H5PDesigner: Encoding-Check und Auto-Fix
+- H5PGenerator: Vorverarbeitung der Texte (H5PStyle.restore_umlauts)
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+DEFAULT_LEXICON = Path(__file__).parent / "umlaut_lexicon.txt"
+
+_TRANSLITERATION = str.maketrans({'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss'})
+
+# Blatt-Markierung im Trie
+_END = ''
+
+# Mindestlaengen fuer Komposita-Treffer
+MIN_KEY_LENGTH = 4       # kuerzere Lexikon-Woerter nur als ganzes Wort
+MIN_REST_LENGTH = 4      # Rest eines Kompositums hinter einem Praefix-Treffer
+MIN_HEAD_LENGTH = 3      # Kopf eines Kompositums vor einem Suffix-Treffer
+
+# Keys, deren Werte keine Fliesstexte sind (IDs, Bibliotheken, Pfade)
+SKIP_KEYS = frozenset({
+    'library', 'subContentId', 'machineName', 'path', 'mime', 'contentType',
+    'license', 'id', 'uuid', 'mainLibrary', 'embedTypes', 'language'
+})
+
+
+def transliterate(word: str) -> str:
+    """Ersatzschreibweise eines Wortes (Kleinbuchstaben): 'Größe' -> 'groesse'"""
+    return word.lower().translate(_TRANSLITERATION)
+
+
+class _Trie:
+    """Zeichen-Trie mit Longest-Match-Suche"""
+
+    def __init__(self):
+        self.root: Dict[str, Any] = {}
+
+    def insert(self, key: str, value: Optional[str]):
+        node = self.root
+        for char in key:
+            node = node.setdefault(char, {})
+        node[_END] = value
+
+    def longest_prefix(self, text: str) -> Tuple[int, Optional[str], bool]:
+        """
+        Laengster Schluessel, der ein Praefix von text ist.
+
+        Returns:
+            (Laenge, Wert, gefunden) - Wert None = geschuetztes Wort
+        """
+        node = self.root
+        best = (0, None, False)
+        for i, char in enumerate(text):
+            node = node.get(char)
+            if node is None:
+                break
+            if _END in node:
+                best = (i + 1, node[_END], True)
+        return best
+
+
+class UmlautRestorer:
+    """
+    Lexikon-basierte Umlaut-Wiederherstellung.
+
+    Beispiel:
+        restorer = UmlautRestorer.default()
+        restorer.restore("Der Kunde prueft die Kundenwuensche.")
+        # -> "Der Kunde prüft die Kundenwünsche."
+        restorer.restore("Die Steuer ist neue")   # unveraendert
+    """
+
+    _default: Optional['UmlautRestorer'] = None
+
+    # Kandidaten: Woerter mit Ersatzschreibweise; Tags und Entities werden
+    # mitgematcht, damit sie unveraendert bleiben
+    _PATTERN = re.compile(r'<[^>]*>|&#?\w+;|[^\W\d_]*(?:ae|oe|ue|ss)[^\W\d_]*', re.IGNORECASE)
+
+    def __init__(self, words: Iterable[str] = (), protected: Iterable[str] = ()):
+        """
+        Args:
+            words: Woerter in korrekter Schreibweise (mit ä/ö/ü/ß)
+            protected: Woerter in Ersatzschreibweise, die nie veraendert werden
+        """
+        self._exact: Dict[str, Optional[str]] = {}
+        self._prefixes = _Trie()
+        self._suffixes = _Trie()
+        self._cache: Dict[str, Optional[str]] = {}
+
+        for word in words:
+            self.add_word(word)
+        for word in protected:
+            self.add_protected(word)
+
+    @classmethod
+    def from_wordlist(cls, *paths: Path) -> 'UmlautRestorer':
+        """
+        Laedt Wortlisten (ein Wort pro Zeile, '#' Kommentar, '!wort' geschuetzt).
+
+        Hunspell-.dic-Dateien funktionieren ebenfalls (Affix-Flags hinter '/'
+        werden ignoriert, die erste Zeile mit der Wortanzahl wird uebersprungen).
+        """
+        restorer = cls()
+        for path in paths:
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    entry = line.split('/', 1)[0].strip()
+                    if not entry or entry.startswith('#') or entry.isdigit():
+                        continue
+                    if entry.startswith('!'):
+                        restorer.add_protected(entry[1:])
+                    else:
+                        restorer.add_word(entry)
+        return restorer
+
+    @classmethod
+    def default(cls) -> 'UmlautRestorer':
+        """Gemeinsame Instanz mit dem mitgelieferten Lexikon (einmal geladen)"""
+        if cls._default is None:
+            cls._default = cls.from_wordlist(DEFAULT_LEXICON)
+        return cls._default
+
+    def add_word(self, word: str):
+        """Fuegt ein Wort in korrekter Schreibweise hinzu"""
+        word = word.strip()
+        key = transliterate(word)
+        if key == word.lower():
+            # Kein Umlaut: bekanntes Wort, das unveraendert bleiben soll
+            self.add_protected(word)
+            return
+        if self._exact.get(key, '') is None:
+            return  # geschuetzt
+        self._exact[key] = word.lower()
+        if len(key) >= MIN_KEY_LENGTH:
+            self._prefixes.insert(key, word.lower())
+            self._suffixes.insert(key[::-1], word.lower())
+        self._cache.clear()
+
+    def add_protected(self, word: str):
+        """Markiert ein Wort in Ersatzschreibweise als unveraenderlich"""
+        key = word.strip().lower()
+        if not key:
+            return
+        self._exact[key] = None
+        if len(key) >= MIN_KEY_LENGTH:
+            self._prefixes.insert(key, None)
+            self._suffixes.insert(key[::-1], None)
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return sum(1 for v in self._exact.values() if v is not None)
+
+    # =========================================================================
+    # Wort-Ebene
+    # =========================================================================
+
+    def _restore_lower(self, word: str, allow_prefix: bool = True) -> Optional[str]:
+        """Wiederherstellung eines kleingeschriebenen Wortes (None = unveraendert)"""
+        if word in self._exact:
+            return self._exact[word]
+
+        # Kompositum mit bekanntem Wort am Ende: "kunden" + "wuensche"
+        length, value, found = self._suffixes.longest_prefix(word[::-1])
+        if found and len(word) - length >= MIN_HEAD_LENGTH:
+            if value is None:
+                return None
+            head = word[:-length]
+            return self._restore_head(head) + value
+
+        # Kompositum mit bekanntem Wort am Anfang: "pruefungs" + "ordnung"
+        if allow_prefix:
+            length, value, found = self._prefixes.longest_prefix(word)
+            if found and len(word) - length >= MIN_REST_LENGTH:
+                if value is None:
+                    return None
+                rest = word[length:]
+                return value + (self._restore_lower(rest, allow_prefix=False) or rest)
+
+        return None
+
+    def _restore_head(self, head: str) -> str:
+        """Kopf eines Kompositums, auch mit Fugen-s ("qualitaets" -> "qualitäts")"""
+        restored = self._restore_lower(head)
+        if restored is None and head.endswith('s') and len(head) > MIN_KEY_LENGTH:
+            stem = self._restore_lower(head[:-1])
+            restored = stem + 's' if stem else None
+        return restored or head
+
+    def restore_word(self, word: str) -> Optional[str]:
+        """
+        Stellt ein einzelnes Wort wieder her.
+
+        Returns:
+            Wort mit Umlauten (Gross-/Kleinschreibung wie im Original)
+            oder None, wenn es kein bekanntes Wort ergibt
+        """
+        if word in self._cache:
+            return self._cache[word]
+
+        restored = self._restore_lower(word.lower())
+        if restored is not None and restored != word.lower():
+            if word.isupper() and len(word) > 1:
+                restored = restored.upper()
+            elif word[0].isupper():
+                restored = restored[0].upper() + restored[1:]
+        else:
+            restored = None
+
+        self._cache[word] = restored
+        return restored
+
+    # =========================================================================
+    # Text-Ebene
+    # =========================================================================
+
+    def _replace(self, match: re.Match) -> str:
+        token = match.group(0)
+        if token[0] in '<&':
+            return token
+        return self.restore_word(token) or token
+
+    def restore(self, text: str) -> str:
+        """Stellt alle bekannten Woerter in einem Text wieder her (ein Durchlauf)"""
+        if not text:
+            return text
+        return self._PATTERN.sub(self._replace, text)
+
+    def find(self, text: str) -> List[Tuple[str, str]]:
+        """Alle wiederherstellbaren Woerter als (Original, Korrektur), ohne Duplikate"""
+        found = {}
+        for match in self._PATTERN.finditer(text or ''):
+            token = match.group(0)
+            if token[0] in '<&' or token in found:
+                continue
+            restored = self.restore_word(token)
+            if restored:
+                found[token] = restored
+        return list(found.items())
+
+    def restore_tree(self, data: Any, skip_keys: frozenset = SKIP_KEYS, keep: tuple = ()) -> Any:
+        """
+        Wendet restore() auf alle Strings einer JSON-Struktur an (neue Struktur).
+
+        Knoten vom Typ keep gelten als bereits wiederhergestellt und werden
+        unveraendert uebernommen (z.B. die Skeleton-Teile des Generators).
+        """
+        if keep and isinstance(data, keep):
+            return data
+        if isinstance(data, str):
+            return self.restore(data)
+        if isinstance(data, list):
+            return [self.restore_tree(item, skip_keys, keep) for item in data]
+        if isinstance(data, dict):
+            return {
+                key: value if key in skip_keys else self.restore_tree(value, skip_keys, keep)
+                for key, value in data.items()
+            }
+        return data
+
+
+def restore_umlauts(text: str) -> str:
+    """Kurzform: Umlaute mit dem Standard-Lexikon wiederherstellen"""
+    return UmlautRestorer.default().restore(text)
+
+
+# =============================================================================
+# Test
+# =============================================================================
+
+if __name__ == "__main__":
+    restorer = UmlautRestorer.default()
+    print(f"Umlaut Restorer - {len(restorer)} Woerter")
+    print("=" * 50)
+    samples = [
+        "Der Product Owner prueft die Kundenwuensche und schaetzt die Aufwaende.",
+        "Die Steuer ist neue, aktuell und die Masse ist gross.",
+        "<p class='ueberschrift'>Pruefungsordnung fuer die Abschlusspruefung</p>",
+        "STRASSE, Groesse, Qualitaetspruefung, Rueckstellungen",
+    ]
+    for sample in samples:
+        print(f"  {sample}\n  -> {restorer.restore(sample)}\n")
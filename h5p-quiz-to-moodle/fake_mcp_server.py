@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Fake MCP Server - Lokaler Stand-in fuer den Moodle-MCP-Endpunkt
+
+Spricht JSON-RPC ueber HTTP und antwortet wie der echte Server als SSE
+(event: message / data: {...}) mit Content ID und Embed URL. Fuer Tests
+von quiz_to_moodle ohne Moodle:
+
+    with FakeMCPServer(fail_plan={'quiz-a.h5p': 2}) as server:
+        results = bulk_upload(items, mcp_url=server.url, api_key=server.api_key)
+        server.uploads        # angenommene Uploads (create / update)
+        server.connections    # Anzahl TCP-Verbindungen (Connection-Pool)
+        server.requests       # Content-Length / chunked pro Request
+
+tools/list liefert die angebotenen Tools (tools=..., z.B. ohne
+moodle_update_h5p fuer einen Server, der nicht ersetzen kann); Aufrufe
+anderer Tools beantwortet er mit einem JSON-RPC-Fehler.
+
+Mit progress_events/linger antwortet er wie ein Streamable-HTTP-Server:
+chunked SSE mit Fortschritts-Notifications vor dem Ergebnis und einem
+Stream, der danach noch linger Sekunden offen bleibt.
+
+Standalone (z.B. fuer manuelle Versuche mit der CLI):
+    python fake_mcp_server.py --port 8765
+"""
+
+import argparse
+import base64
+import binascii
+import hashlib
+import io
+import json
+import threading
+import time
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List
+
+# Tools des echten Servers: neues Paket anlegen / vorhandenen Inhalt ersetzen
+TOOLS = ('moodle_upload_h5p', 'moodle_update_h5p')
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'       # Keep-Alive, damit Pooling sichtbar wird
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.fake._connection_opened()
+
+    def _reply(self, status: int, body: bytes = b'', content_type: str = 'text/plain', headers: Dict = None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True        # Client hat aufgegeben (Timeout)
+
+    def _read_chunked(self) -> bytes:
+        """Body mit Transfer-Encoding: chunked"""
+        parts = []
+        while True:
+            size = int(self.rfile.readline().split(b';', 1)[0].strip(), 16)
+            if size == 0:
+                while self.rfile.readline() not in (b'\r\n', b'\n', b''):
+                    pass        # Trailer
+                return b''.join(parts)
+            parts.append(self.rfile.read(size))
+            self.rfile.readline()
+
+    def do_POST(self):
+        fake = self.server.fake
+        if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+            body = self._read_chunked()
+        else:
+            body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        fake._request_received(self.headers, len(body))
+
+        if self.headers.get('x-api-key') != fake.api_key:
+            self._reply(401, b'Unauthorized')
+            return
+
+        try:
+            request = json.loads(body)
+            if request.get('method') == 'tools/list':
+                self._reply(200, fake._list_tools(request), 'text/event-stream')
+                return
+            arguments = request['params']['arguments']
+        except (ValueError, KeyError, TypeError, AttributeError):
+            self._reply(400, b'Bad Request')
+            return
+
+        if request['params'].get('name') not in fake.tools:
+            self._reply(200, _event(request, error={
+                'code': -32602, 'message': f"Unbekanntes Tool: {request['params'].get('name')}"}),
+                'text/event-stream')
+            return
+
+        status = fake._planned_failure(arguments.get('filename', ''))
+        if status:
+            self._reply(status, b'Service Unavailable', headers={'Retry-After': '0'} if status == 429 else None)
+            return
+
+        if fake.progress_events or fake.linger:
+            self._stream(fake, request, arguments)
+            return
+        if fake.delay:
+            time.sleep(fake.delay)
+        self._reply(200, fake._handle_upload(request, arguments), 'text/event-stream')
+
+    def _stream(self, fake: 'FakeMCPServer', request: Dict, arguments: Dict):
+        """Chunked SSE: Kommentar, Fortschritt, Ergebnis, dann offen bleiben"""
+        def send(data: bytes):
+            self.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b"\r\n")
+            self.wfile.flush()
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        try:
+            send(b": verarbeite Upload\n\n")
+            for step in range(fake.progress_events):
+                notification = {'jsonrpc': '2.0', 'method': 'notifications/progress',
+                                'params': {'progress': step + 1, 'total': fake.progress_events}}
+                # Mehrzeiliges data-Feld wie bei eingerueckt serialisiertem JSON
+                lines = json.dumps(notification, indent=1).split('\n')
+                send(''.join(f"data: {line}\n" for line in lines).encode('utf-8') + b"\n")
+                time.sleep(fake.delay / max(1, fake.progress_events))
+            send(fake._handle_upload(request, arguments))
+            time.sleep(fake.linger)
+            self.wfile.write(b"0\r\n\r\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass        # Client hat nach dem Ergebnis getrennt
+        self.close_connection = True
+
+
+def _event(request: Dict, **fields) -> bytes:
+    """JSON-RPC-Antwort (result=... oder error=...) als SSE-Event"""
+    event = {'jsonrpc': '2.0', 'id': request.get('id'), **fields}
+    return f"event: message\ndata: {json.dumps(event, ensure_ascii=False)}\n\n".encode('utf-8')
+
+
+class FakeMCPServer:
+    """
+    Moodle-MCP-Stand-in in einem Hintergrund-Thread.
+
+    Args:
+        api_key: Erwarteter x-api-key (sonst HTTP 401)
+        fail_plan: Dateiname -> Anzahl Fehlversuche vor dem Erfolg
+        fail_status: HTTP-Status der geplanten Fehlversuche
+        delay: Bearbeitungszeit pro Upload in Sekunden
+        progress_events: Fortschritts-Events vor dem Ergebnis (Streaming)
+        linger: Sekunden, die der Stream nach dem Ergebnis offen bleibt
+        tools: Angebotene Tools (tools/list); andere Aufrufe -> JSON-RPC-Fehler
+        page_size: Tools pro tools/list-Seite (0 = alle auf einer Seite)
+        port: 0 = freier Port
+    """
+
+    def __init__(self, api_key: str = 'test-key', fail_plan: Dict[str, int] = None,
+                 fail_status: int = 503, delay: float = 0.0, progress_events: int = 0,
+                 linger: float = 0.0, tools: Iterable[str] = TOOLS, page_size: int = 0,
+                 port: int = 0):
+        self.api_key = api_key
+        self.fail_plan = dict(fail_plan or {})
+        self.fail_status = fail_status
+        self.delay = delay
+        self.progress_events = progress_events
+        self.linger = linger
+        self.tools = tuple(tools)
+        self.page_size = page_size
+        self.tool_lists = 0                 # Anzahl tools/list-Anfragen
+        self.uploads: List[Dict] = []
+        self.contents: Dict[int, str] = {}      # Content ID -> SHA-256 des aktuellen Pakets
+        self.requests: List[Dict] = []      # Header-Infos pro Request
+        self.attempts: Dict[str, int] = {}
+        self.connections = 0
+        self._next_content_id = 100
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), _Handler)
+        self._server.daemon_threads = True
+        self._server.fake = self
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/mcp"
+
+    def start(self) -> 'FakeMCPServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'FakeMCPServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # =========================================================================
+    # Verhalten
+    # =========================================================================
+
+    def _connection_opened(self):
+        with self._lock:
+            self.connections += 1
+
+    def _request_received(self, headers, body_size: int):
+        with self._lock:
+            self.requests.append({
+                'content_length': headers.get('Content-Length'),
+                'chunked': headers.get('Transfer-Encoding', '').lower() == 'chunked',
+                'body_size': body_size,
+            })
+
+    def _planned_failure(self, filename: str) -> int:
+        """HTTP-Status fuer einen geplanten Fehlversuch (0 = annehmen)"""
+        with self._lock:
+            self.attempts[filename] = self.attempts.get(filename, 0) + 1
+            if self.fail_plan.get(filename, 0) > 0:
+                self.fail_plan[filename] -= 1
+                return self.fail_status
+        return 0
+
+    def _list_tools(self, request: Dict) -> bytes:
+        """Eine Seite von tools/list (Cursor = Index des ersten Tools)"""
+        with self._lock:
+            self.tool_lists += 1
+        start = int((request.get('params') or {}).get('cursor') or 0)
+        end = start + self.page_size if self.page_size else len(self.tools)
+        result = {'tools': [{'name': name, 'inputSchema': {'type': 'object'}} for name in self.tools[start:end]]}
+        if end < len(self.tools):
+            result['nextCursor'] = str(end)
+        return _event(request, result=result)
+
+    def _handle_upload(self, request: Dict, arguments: Dict) -> bytes:
+        """Prueft das Paket und erzeugt die SSE-Antwort"""
+        try:
+            package = base64.b64decode(arguments.get('base64data', ''), validate=True)
+            with zipfile.ZipFile(io.BytesIO(package)) as zf:
+                zf.getinfo('h5p.json')
+        except (binascii.Error, zipfile.BadZipFile, KeyError) as e:
+            return _event(request, error={'code': -32602, 'message': f'Ungueltiges H5P-Paket: {e}'})
+
+        update = request.get('params', {}).get('name') == 'moodle_update_h5p'
+        with self._lock:
+            if update:
+                content_id = arguments.get('contentid')
+                if content_id not in self.contents:
+                    return _event(request, error={'code': -32602, 'message': f'Inhalt {content_id} nicht gefunden'})
+            else:
+                content_id = self._next_content_id
+                self._next_content_id += 1
+            self.contents[content_id] = hashlib.sha256(package).hexdigest()
+            self.uploads.append({
+                'action': 'update' if update else 'create',
+                'content_id': content_id,
+                'filename': arguments.get('filename'),
+                'title': arguments.get('title'),
+                'courseid': arguments.get('courseid'),
+                'size': len(package),
+                'sha256': hashlib.sha256(package).hexdigest(),
+            })
+
+        text = (
+            f"H5P-Inhalt hochgeladen\n\n| Eigenschaft | Wert |\n|---|---|\n"
+            f"| **Content ID** | {content_id} |\n| **Titel** | {arguments.get('title')} |\n\n"
+            f"**Embed URL:** https://moodle.test/h5p/embed.php?id={content_id}\n"
+        )
+        return _event(request, result={'content': [{'type': 'text', 'text': text}]})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Lokaler Stand-in fuer den Moodle-MCP-Server')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--api-key', default='test-key')
+    parser.add_argument('--delay', type=float, default=0.0, help='Bearbeitungszeit pro Upload (s)')
+    args = parser.parse_args()
+
+    server = FakeMCPServer(api_key=args.api_key, delay=args.delay, port=args.port)
+    print(f"Fake MCP Server: {server.url} (x-api-key: {server.api_key})")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
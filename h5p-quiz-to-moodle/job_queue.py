@@ -0,0 +1,540 @@
+#!/usr/bin/env python3
+"""
+Job Queue - Dauerhafte Warteschlange fuer Moodle-Uploads
+
+SQLite-Tabelle mit einem Job pro Quiz: Zustand, Versuche, Ergebnis.
+Bricht ein Rollout ab (Timeout, Absturz, Strg+C), setzt der naechste
+Worker-Lauf bei den offenen Jobs fort - fertige werden nicht erneut
+hochgeladen.
+
+Zustaende:
+    offen    -> wartet (ggf. bis not_before, nach einem Fehlversuch)
+    laeuft   -> von einem Worker reserviert (Lease, verlaengert sich,
+                solange der Worker den Job bearbeitet)
+    fertig   -> hochgeladen, Content ID gespeichert
+    fehler   -> max_attempts erreicht
+    unklar   -> Abbruch nach dem Senden (Timeout, Verbindungsabbruch,
+                Absturz): der Inhalt kann
+                in Moodle angelegt sein. Wird NICHT automatisch wiederholt -
+                in Moodle pruefen, dann `requeue` (mit --content-id, falls
+                der Inhalt existiert: er wird dann ersetzt statt dupliziert)
+
+Idempotenz: Jeder Job hat einen eindeutigen Schluessel (default: Kurs +
+Moodle-Dateiname). Erneutes Einreihen desselben Quiz legt keinen zweiten
+Job an; ist die Content ID bekannt, ersetzt jeder weitere Upload diesen
+Inhalt (UPDATE_TOOL) statt eine neue Aktivitaet anzulegen.
+
+Verwendung:
+    python job_queue.py add kurs/*.txt --course 2          # einreihen
+    python job_queue.py work --workers 4                   # abarbeiten / fortsetzen
+    python job_queue.py status
+    python job_queue.py requeue 7 --content-id 123         # unklaren Job freigeben
+
+    with JobQueue('jobs.sqlite') as jobs, MoodleUploader() as uploader:
+        jobs.enqueue(UploadItem(title='Bilanz', course_id=2, questions_text=text))
+        work(jobs, uploader)
+"""
+
+import argparse
+import json
+import os
+import socket
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from quiz_to_moodle import OUTPUT_DIR, MoodleUploader, QuizResult, UploadItem, items_from_files
+from sync_manifest import package_hash
+
+QUEUED = 'offen'
+RUNNING = 'laeuft'
+DONE = 'fertig'
+FAILED = 'fehler'
+UNCERTAIN = 'unklar'
+STATES = (QUEUED, RUNNING, DONE, FAILED, UNCERTAIN)
+
+# Phasen eines laufenden Jobs - entscheidet nach einem Absturz, ob neu
+# versucht werden darf (generieren) oder der Upload unklar ist (senden)
+PHASE_GENERATE = 'generieren'
+PHASE_SEND = 'senden'
+
+DEFAULT_PATH = OUTPUT_DIR / 'jobs.sqlite'
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_LEASE = 600.0           # Sekunden, nach denen ein Job als verwaist gilt
+DEFAULT_RETRY_DELAY = 30.0      # Wartezeit nach dem ersten Fehlversuch (verdoppelt sich)
+
+
+def default_key(item: UploadItem) -> str:
+    """Idempotenz-Schluessel: ein Quiz pro Kurs und Moodle-Dateiname"""
+    return f"{item.course_id}:{item.key}"
+
+
+def worker_id() -> str:
+    """Kennung des aktuellen Prozesses (Host:PID)"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _worker_dead(worker: Optional[str]) -> bool:
+    """True, wenn der Worker auf diesem Host lief und nicht mehr existiert"""
+    host, _, pid = (worker or '').rpartition(':')
+    if host != socket.gethostname() or not pid.isdigit():
+        return False        # fremder Host: nur die Lease zaehlt
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        pass
+    return False
+
+
+@dataclass
+class Job:
+    """Ein Upload-Auftrag"""
+    id: int
+    key: str
+    item: UploadItem
+    state: str
+    phase: Optional[str]
+    attempts: int
+    max_attempts: int
+    worker: Optional[str]
+    lease_until: Optional[float]
+    not_before: float
+    content_id: Optional[int]
+    embed_url: Optional[str]
+    questions_count: int
+    error: Optional[str]
+    created_at: float
+    updated_at: float
+
+
+class JobQueue:
+    """
+    SQLite-Job-Queue (thread- und prozesssicher).
+
+    Jobs werden mit BEGIN IMMEDIATE reserviert - mehrere Worker-Threads
+    oder -Prozesse auf derselben Datei bekommen nie denselben Job.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id              INTEGER PRIMARY KEY AUTOINCREMENT,
+            key             TEXT NOT NULL UNIQUE,
+            item            TEXT NOT NULL,
+            content_hash    TEXT,
+            state           TEXT NOT NULL,
+            phase           TEXT,
+            attempts        INTEGER NOT NULL DEFAULT 0,
+            max_attempts    INTEGER NOT NULL,
+            worker          TEXT,
+            lease_until     REAL,
+            not_before      REAL NOT NULL DEFAULT 0,
+            content_id      INTEGER,
+            embed_url       TEXT,
+            questions_count INTEGER NOT NULL DEFAULT 0,
+            error           TEXT,
+            created_at      REAL NOT NULL,
+            updated_at      REAL NOT NULL
+        )
+    """
+    _COLUMNS = ("id, key, item, state, phase, attempts, max_attempts, worker, lease_until, "
+                "not_before, content_id, embed_url, questions_count, error, created_at, updated_at")
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False,
+                                     isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(self._SCHEMA)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state, not_before)")
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'JobQueue':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Schreibtransaktion (sperrt die Datei auch gegen andere Prozesse)"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _job(self, row) -> Job:
+        values = list(row)
+        values[2] = UploadItem(**json.loads(values[2]))
+        return Job(*values)
+
+    def _update(self, conn: sqlite3.Connection, job_id: int, **fields):
+        fields['updated_at'] = time.time()
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        conn.execute(f"UPDATE jobs SET {assignments} WHERE id = ?", (*fields.values(), job_id))
+
+    # =========================================================================
+    # Einreihen und Abfragen
+    # =========================================================================
+
+    def enqueue(self, item: UploadItem, key: str = None,
+                max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> Job:
+        """
+        Reiht ein Quiz ein (idempotent ueber key, default: default_key).
+
+        - neuer Schluessel: Job 'offen'
+        - fertiger Job mit geaendertem Inhalt (Fragen-Text bzw. Paket-Hash
+          bei .h5p-Dateien): wieder 'offen', die bekannte
+          Content ID bleibt - der naechste Upload ersetzt den Inhalt
+        - Job 'fehler': wieder 'offen' mit neuen Versuchen
+        - sonst (unveraendert, laeuft, unklar): bestehender Job
+        """
+        key = key or default_key(item)
+        payload = json.dumps(asdict(item), sort_keys=True, ensure_ascii=False)
+        content_hash = package_hash(item.h5p_path) if item.h5p_path else None
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute("SELECT id, item, content_hash, state FROM jobs WHERE key = ?",
+                               (key,)).fetchone()
+            if row is None:
+                conn.execute(
+                    "INSERT INTO jobs (key, item, content_hash, state, max_attempts, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, payload, content_hash, QUEUED, max_attempts, now, now))
+            else:
+                job_id, old_payload, old_hash, state = row
+                changed = (old_payload, old_hash) != (payload, content_hash)
+                if state == FAILED or (state == DONE and changed):
+                    self._update(conn, job_id, item=payload, content_hash=content_hash, state=QUEUED,
+                                 phase=None, attempts=0, max_attempts=max_attempts, not_before=0,
+                                 error=None)
+                elif state == QUEUED and changed:
+                    self._update(conn, job_id, item=payload, content_hash=content_hash)
+        return self.get(key)
+
+    def get(self, key_or_id) -> Optional[Job]:
+        """Job per Schluessel oder ID"""
+        column = 'id' if isinstance(key_or_id, int) else 'key'
+        with self._lock:
+            row = self._conn.execute(f"SELECT {self._COLUMNS} FROM jobs WHERE {column} = ?",
+                                     (key_or_id,)).fetchone()
+        return self._job(row) if row else None
+
+    def jobs(self, state: str = None) -> List[Job]:
+        """Alle Jobs (optional nur in einem Zustand), nach ID"""
+        query = f"SELECT {self._COLUMNS} FROM jobs"
+        params = ()
+        if state is not None:
+            query += " WHERE state = ?"
+            params = (state,)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY id", params).fetchall()
+        return [self._job(row) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        """Anzahl Jobs pro Zustand"""
+        with self._lock:
+            rows = self._conn.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall()
+        counts = dict.fromkeys(STATES, 0)
+        counts.update(rows)
+        return counts
+
+    def next_retry(self) -> Optional[float]:
+        """Fruehester Zeitpunkt, zu dem ein offener Job wieder dran ist"""
+        with self._lock:
+            row = self._conn.execute("SELECT MIN(not_before) FROM jobs WHERE state = ?",
+                                     (QUEUED,)).fetchone()
+        return row[0]
+
+    # =========================================================================
+    # Worker-Protokoll
+    # =========================================================================
+
+    def recover(self, now: float = None) -> Dict[str, int]:
+        """
+        Gibt Jobs abgestuerzter Worker frei (Lease abgelaufen oder Prozess
+        auf diesem Host beendet): beim Generieren -> 'offen', beim Senden
+        -> 'unklar'. Wird von claim() automatisch aufgerufen.
+        """
+        now = now or time.time()
+        recovered = {QUEUED: 0, UNCERTAIN: 0}
+        with self._transaction() as conn:
+            rows = conn.execute("SELECT id, phase, worker, lease_until FROM jobs WHERE state = ?",
+                                (RUNNING,)).fetchall()
+            for job_id, phase, worker, lease_until in rows:
+                if (lease_until or 0) >= now and not _worker_dead(worker):
+                    continue
+                if phase == PHASE_SEND:
+                    self._update(conn, job_id, state=UNCERTAIN, worker=None, lease_until=None,
+                                 error=f"Worker {worker} waehrend des Uploads abgebrochen - "
+                                       f"in Moodle pruefen")
+                    recovered[UNCERTAIN] += 1
+                else:
+                    self._update(conn, job_id, state=QUEUED, phase=None, worker=None, lease_until=None)
+                    recovered[QUEUED] += 1
+        return recovered
+
+    def claim(self, worker: str = None, lease: float = DEFAULT_LEASE) -> Optional[Job]:
+        """Reserviert den naechsten faelligen Job (None = keiner faellig)"""
+        now = time.time()
+        self.recover(now)
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE state = ? AND not_before <= ? ORDER BY id LIMIT 1",
+                (QUEUED, now)).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE jobs SET state = ?, phase = ?, attempts = attempts + 1, worker = ?, "
+                "lease_until = ?, updated_at = ? WHERE id = ?",
+                (RUNNING, PHASE_GENERATE, worker or worker_id(), now + lease, now, row[0]))
+        return self.get(row[0])
+
+    def _set_owned(self, job_id: int, worker: str, **fields) -> bool:
+        """Aendert einen laufenden Job nur, wenn worker ihn (noch) reserviert hat"""
+        fields['updated_at'] = time.time()
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._transaction() as conn:
+            cursor = conn.execute(f"UPDATE jobs SET {assignments} WHERE id = ? AND state = ? AND worker = ?",
+                                  (*fields.values(), job_id, RUNNING, worker))
+        return cursor.rowcount == 1
+
+    def renew(self, job_id: int, worker: str, lease: float = DEFAULT_LEASE) -> bool:
+        """Verlaengert die Lease (False: Job gehoert worker nicht mehr)"""
+        return self._set_owned(job_id, worker, lease_until=time.time() + lease)
+
+    @contextmanager
+    def keep_alive(self, job_id: int, worker: str, lease: float = DEFAULT_LEASE):
+        """
+        Verlaengert die Lease alle lease/3 Sekunden, solange der Block laeuft -
+        lange Uploads und Wiederholungen mit Backoff gelten nicht als verwaist.
+        """
+        stop = threading.Event()
+
+        def heartbeat():
+            while not stop.wait(lease / 3):
+                if not self.renew(job_id, worker, lease):
+                    return
+
+        thread = threading.Thread(target=heartbeat, daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def mark_sending(self, job_id: int, worker: str, lease: float = DEFAULT_LEASE) -> bool:
+        """
+        Ab hier kann der Inhalt in Moodle entstehen (Absturz -> 'unklar').
+        Verlaengert die Lease.
+
+        Returns:
+            False, wenn worker den Job nicht mehr reserviert hat (z.B. nach
+            abgelaufener Lease freigegeben) - dann nicht hochladen
+        """
+        return self._set_owned(job_id, worker, phase=PHASE_SEND, lease_until=time.time() + lease)
+
+    def finish(self, job_id: int, worker: str, result: QuizResult,
+               retry_delay: float = DEFAULT_RETRY_DELAY) -> Job:
+        """
+        Speichert das Ergebnis eines Versuchs.
+
+        Erfolg -> 'fertig'; Fehler nach dem Senden (result.uncertain) ->
+        'unklar'; sonst 'offen' mit Backoff bzw. 'fehler' nach max_attempts.
+
+        Ohne Wirkung, wenn worker den Job nicht mehr reserviert hat - ein
+        Worker mit abgelaufener Lease ueberschreibt nicht den Stand eines
+        anderen.
+        """
+        with self._transaction() as conn:
+            row = conn.execute("SELECT state, worker, attempts, max_attempts FROM jobs WHERE id = ?",
+                               (job_id,)).fetchone()
+            if row is not None and (row[0], row[1]) == (RUNNING, worker):
+                attempts, max_attempts = row[2:]
+                done = dict(phase=None, worker=None, lease_until=None)
+                if result.success:
+                    self._update(conn, job_id, state=DONE, content_id=result.content_id,
+                                 embed_url=result.embed_url, questions_count=result.questions_count,
+                                 error=None, **done)
+                elif result.uncertain:
+                    self._update(conn, job_id, state=UNCERTAIN, error=result.error, **done)
+                elif attempts >= max_attempts:
+                    self._update(conn, job_id, state=FAILED, error=result.error, **done)
+                else:
+                    self._update(conn, job_id, state=QUEUED, error=result.error,
+                                 not_before=time.time() + retry_delay * 2 ** (attempts - 1), **done)
+        return self.get(job_id)
+
+    def requeue(self, job_id: int, content_id: int = None) -> Job:
+        """
+        Gibt einen Job ('fehler' oder 'unklar') wieder frei.
+
+        Args:
+            content_id: Inhalt, den der abgebrochene Upload in Moodle angelegt
+                hat - der naechste Versuch ersetzt ihn statt neu anzulegen
+        """
+        fields = dict(state=QUEUED, phase=None, attempts=0, not_before=0, worker=None, lease_until=None)
+        if content_id is not None:
+            fields['content_id'] = content_id
+        with self._transaction() as conn:
+            row = conn.execute("SELECT state FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None or row[0] not in (FAILED, UNCERTAIN, QUEUED):
+                raise ValueError(f"Job {job_id} kann nicht erneut eingereiht werden "
+                                 f"({row[0] if row else 'unbekannt'})")
+            self._update(conn, job_id, **fields)
+        return self.get(job_id)
+
+
+# =============================================================================
+# Worker
+# =============================================================================
+
+def process(queue: JobQueue, uploader: MoodleUploader, job: Job,
+            retry_delay: float = DEFAULT_RETRY_DELAY, lease: float = DEFAULT_LEASE) -> Job:
+    """
+    Ein reservierter Job: generieren, hochladen, Ergebnis speichern.
+
+    Die Lease wird waehrenddessen verlaengert. Hat der Worker den Job vor
+    dem Senden verloren (Lease abgelaufen, freigegeben), wird nicht
+    hochgeladen.
+    """
+    item = job.item
+    with queue.keep_alive(job.id, job.worker, lease):
+        try:
+            h5p_path, questions_count = item.resolve()
+        except ImportError as e:
+            result = QuizResult(success=False, title=item.title, course_id=item.course_id,
+                                error=f"h5p-generator nicht gefunden: {e}")
+        except Exception as e:
+            result = QuizResult(success=False, title=item.title, course_id=item.course_id, error=str(e))
+        else:
+            if not queue.mark_sending(job.id, job.worker, lease):
+                return queue.get(job.id)
+            result = uploader.upload(h5p_path, item.title, item.course_id, item.filename,
+                                     questions_count, content_id=job.content_id)
+    return queue.finish(job.id, job.worker, result, retry_delay)
+
+
+def work(queue: JobQueue, uploader: MoodleUploader, workers: int = None, wait: bool = True,
+         lease: float = DEFAULT_LEASE, retry_delay: float = DEFAULT_RETRY_DELAY) -> List[Job]:
+    """
+    Arbeitet die Queue ab (auch nach einem Abbruch: setzt bei den offenen
+    Jobs fort, verwaiste werden per recover() freigegeben).
+
+    Args:
+        workers: Threads (default: uploader.max_workers)
+        wait: Auf Jobs im Backoff warten statt zurueckzukehren
+
+    Returns:
+        Die in diesem Lauf bearbeiteten Jobs (Endstand je Versuch)
+    """
+    processed: List[Job] = []
+    owner = worker_id()
+
+    def loop():
+        while True:
+            job = queue.claim(owner, lease)
+            if job is not None:
+                processed.append(process(queue, uploader, job, retry_delay, lease))
+                continue
+            next_retry = queue.next_retry()
+            if not wait or next_retry is None:
+                return
+            time.sleep(min(max(0.0, next_retry - time.time()), 1.0) + 0.01)
+
+    threads = [threading.Thread(target=loop) for _ in range(workers or uploader.max_workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return processed
+
+
+def _print_jobs(jobs: List[Job]):
+    print("| Job | Status | Titel | Kurs | Versuche | Content ID | Fehler |")
+    print("|-----|--------|-------|------|----------|------------|--------|")
+    for job in jobs:
+        print(f"| {job.id} | {job.state} | {job.item.title} | {job.item.course_id} | "
+              f"{job.attempts}/{job.max_attempts} | {job.content_id or '-'} | {job.error or ''} |")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Dauerhafte Job-Queue fuer Moodle-Uploads')
+    parser.add_argument('--queue', default=str(DEFAULT_PATH),
+                        help='Pfad zur Queue-Datei (default: output/jobs.sqlite)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    add = commands.add_parser('add', help='.h5p- und Fragen-Dateien einreihen')
+    add.add_argument('files', nargs='+', metavar='DATEI')
+    add.add_argument('--course', '-c', type=int, default=2, help='Moodle Kurs-ID (default: 2)')
+    add.add_argument('--domain', '-d', choices=['accounting', 'scrum', 'it', 'business'])
+    add.add_argument('--max-attempts', type=int, default=DEFAULT_MAX_ATTEMPTS)
+
+    run = commands.add_parser('work', help='Offene Jobs abarbeiten (setzt nach Abbruch fort)')
+    run.add_argument('--workers', '-w', type=int, default=4, help='Gleichzeitige Uploads (default: 4)')
+    run.add_argument('--retries', type=int, default=3,
+                     help='Wiederholungen pro Versuch bei voruebergehenden Fehlern (default: 3)')
+    run.add_argument('--retry-delay', type=float, default=DEFAULT_RETRY_DELAY,
+                     help='Wartezeit vor dem naechsten Versuch eines Jobs in s (verdoppelt sich)')
+    run.add_argument('--no-wait', action='store_true', help='Nicht auf Jobs im Backoff warten')
+
+    status = commands.add_parser('status', help='Jobs anzeigen')
+    status.add_argument('--state', choices=STATES)
+
+    requeue = commands.add_parser('requeue', help="Jobs ('fehler'/'unklar') wieder freigeben")
+    requeue.add_argument('jobs', nargs='*', type=int, metavar='JOB')
+    requeue.add_argument('--state', choices=[FAILED, UNCERTAIN], help='Alle Jobs in diesem Zustand')
+    requeue.add_argument('--content-id', type=int,
+                         help='Bereits in Moodle angelegter Inhalt (wird ersetzt statt dupliziert)')
+
+    args = parser.parse_args()
+
+    with JobQueue(args.queue) as queue:
+        if args.command == 'add':
+            for item in items_from_files(args.files, args.course, args.domain):
+                job = queue.enqueue(item, max_attempts=args.max_attempts)
+                print(f"Job {job.id}: {job.item.title} ({job.state})")
+
+        elif args.command == 'work':
+            with MoodleUploader(max_workers=args.workers, retries=args.retries) as uploader:
+                processed = work(queue, uploader, wait=not args.no_wait, retry_delay=args.retry_delay)
+            _print_jobs(processed)
+            counts = queue.counts()
+            print("\n" + ", ".join(f"{n} {state}" for state, n in counts.items() if n))
+            sys.exit(0 if not counts[FAILED] and not counts[UNCERTAIN] else 1)
+
+        elif args.command == 'status':
+            _print_jobs(queue.jobs(args.state))
+
+        elif args.command == 'requeue':
+            ids = list(args.jobs)
+            if args.state:
+                ids += [job.id for job in queue.jobs(args.state)]
+            if args.content_id is not None and len(ids) != 1:
+                parser.error('--content-id gilt fuer genau einen Job')
+            for job_id in ids:
+                try:
+                    job = queue.requeue(job_id, args.content_id)
+                except ValueError as e:
+                    print(f"Fehler: {e}")
+                    continue
+                print(f"Job {job.id}: {job.item.title} ({job.state})")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,24 +5,66 @@ H5P Quiz to Moodle - Generiert Quiz und laedt zu Moodle hoch
 Usage:
     python quiz_to_moodle.py --questions "Q1\\nQ2\\n..." --title "Quiz" --course 2
 
+Bulk (viele Fragen-Sets oder fertige .h5p-Dateien; Generierung und Upload
+laufen als Pipeline gleichzeitig):
+    python quiz_to_moodle.py --bulk quiz1.txt quiz2.txt paket.h5p --course 2 --workers 4 -g 2
+
+Sync (unveraenderte Pakete ueberspringen, geaenderte ersetzen):
+    python quiz_to_moodle.py --bulk kurs/*.txt --course 2 --manifest sync_manifest.sqlite
+
 Oder als Modul:
     from quiz_to_moodle import create_and_upload_quiz
     result = create_and_upload_quiz(questions_text, title, course_id)
+
+    from quiz_to_moodle import UploadItem, bulk_upload
+    results = bulk_upload([UploadItem(h5p_path='a.h5p', title='A', course_id=2), ...])
 """
 
 import argparse
 import base64
 import json
 import os
+import queue
+import random
+import re
 import sys
+import threading
+import time
+import zipfile
 import requests
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+
+from sync_manifest import SyncManifest, package_hash
 
 # H5P Generator importieren
 sys.path.insert(0, str(Path(__file__).parent.parent / "h5p-generator" / "scripts"))
 
+DEFAULT_MCP_URL = "https://mcp-moodle.dirk-schulenburg.net/mcp"
+DEFAULT_API_KEY = "ae9ee37c6c6fb8e22e49a15c12bc819b8cd9e338ec27af4a5414affd5b1e7d61"
+
+# Voruebergehende Fehler, nach denen ein Upload wiederholt wird. Read-Timeouts,
+# Abbrueche nach dem Senden und HTTP 500 nicht: der Server hat den Upload
+# evtl. schon angelegt. Verbindungsfehler nur, wenn nichts gesendet wurde.
+RETRY_STATUS = frozenset({429, 502, 503, 504})
+
+OUTPUT_DIR = Path(__file__).parent / "output"
+
+# Rohdaten pro Base64-Block (Vielfaches von 3, damit die Bloecke ohne
+# Padding aneinanderpassen): 192 KiB -> 256 KiB Base64
+CHUNK_SIZE = 3 * 64 * 1024
+
+# MCP-Tools: neues Paket anlegen / vorhandenen Inhalt (contentid) ersetzen
+UPLOAD_TOOL = 'moodle_upload_h5p'
+UPDATE_TOOL = 'moodle_update_h5p'
+
+# Platzhalter fuer die Base64-Daten im JSON-RPC-Payload
+_DATA_MARKER = '\x00base64data\x00'
+
 
 @dataclass
 class QuizResult:
@@ -36,6 +78,10 @@ class QuizResult:
     h5p_path: Optional[str] = None
     error: Optional[str] = None
     questions_count: int = 0
+    attempts: int = 0
+    first_event_s: Optional[float] = None    # Sekunden vom Absenden bis zum ersten SSE-Event
+    action: Optional[str] = None             # Sync: 'neu', 'aktualisiert', 'unveraendert'
+    uncertain: bool = False                  # Fehler nach dem Senden: Inhalt evtl. angelegt
 
     def __str__(self):
         if self.success:
@@ -55,158 +101,732 @@ Embed URL: {self.embed_url}
             return f"Fehler: {self.error}"
 
 
-def create_and_upload_quiz(
-    questions_text: str,
-    title: str = "Quiz",
-    course_id: int = 2,
-    domain: str = None,
-    mcp_url: str = None,
-    api_key: str = None
-) -> QuizResult:
+class UploadError(Exception):
+    """
+    Upload fehlgeschlagen (retryable: erneuter Versuch sinnvoll,
+    uncertain: Anfrage war beim Server - Inhalt evtl. trotzdem angelegt)
     """
-    Erstellt H5P Quiz und laedt es zu Moodle hoch.
+
+    def __init__(self, message: str, retryable: bool = False, retry_after: float = None,
+                 uncertain: bool = False):
+        super().__init__(message)
+        self.retryable = retryable
+        self.retry_after = retry_after
+        self.uncertain = uncertain
+
+
+def _not_sent(error: requests.ConnectionError) -> bool:
+    """
+    True, wenn die Anfrage den Server sicher nicht erreicht hat: Connect-Timeout,
+    Verbindung abgelehnt, Name nicht aufloesbar. Alles andere (z.B. Abbruch
+    nach dem Senden des Bodys) kann einen Upload angelegt haben.
+    """
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+
+
+def _safe_filename(title: str) -> str:
+    """Dateiname fuer Moodle aus dem Titel"""
+    safe_title = "".join(c if c.isalnum() or c in '-_ ' else '-' for c in title)
+    return f"{safe_title.lower().replace(' ', '-')}.h5p"
+
+
+# Ergebnis-Text des moodle_upload_h5p-Tools
+_CONTENT_ID = re.compile(r'\*\*Content ID\*\*\s*\|\s*(\d+)')
+_EMBED_URL = re.compile(r'\*\*Embed URL:\*\*\s*(https?://[^\s]+)')
+
+
+def iter_sse_events(lines: Iterable[bytes]) -> Iterator[Tuple[str, str]]:
+    """
+    Server-Sent Events aus einer Folge von Zeilen (ohne Zeilenende).
+
+    Mehrzeilige data-Felder werden mit '\\n' verbunden, Kommentare (':')
+    ignoriert; ein Event endet mit einer Leerzeile oder dem Stream-Ende.
+
+    Yields:
+        (Event-Typ, Daten) - Typ 'message', wenn nicht angegeben
+    """
+    event, data = 'message', []
+    for line in lines:
+        if not line:
+            if data:
+                yield event, '\n'.join(data)
+            event, data = 'message', []
+            continue
+        line = line.decode('utf-8') if isinstance(line, bytes) else line
+        name, _, value = line.partition(':')
+        if value.startswith(' '):
+            value = value[1:]
+        if name == 'data':
+            data.append(value)
+        elif name == 'event':
+            event = value or 'message'
+    if data:
+        yield event, '\n'.join(data)
+
+
+def parse_upload_text(text: str) -> Tuple[Optional[int], Optional[str]]:
+    """Content ID und Embed URL aus dem Ergebnis-Text des Upload-Tools"""
+    id_match = _CONTENT_ID.search(text)
+    url_match = _EMBED_URL.search(text)
+    return (int(id_match.group(1)) if id_match else None,
+            url_match.group(1) if url_match else None)
+
+
+def read_rpc_result(lines: Iterable[bytes], started: float = None) -> Tuple[dict, Optional[float]]:
+    """
+    Liest die SSE-Antwort inkrementell bis zum result-Event - der Rest des
+    Streams wird nicht mehr abgewartet.
 
     Args:
-        questions_text: Fragen im h5p-generator Format
-        title: Quiz-Titel
-        course_id: Moodle Kurs-ID
-        domain: Fachbereich fuer Distraktoren
-        mcp_url: Moodle MCP URL (default: aus env)
-        api_key: MCP API Key (default: aus env)
+        lines: Zeilen der Antwort (response.iter_lines())
+        started: time.perf_counter() beim Absenden (fuer die Latenz)
 
     Returns:
-        QuizResult
+        (JSON-RPC result, Sekunden bis zum ersten Event)
+
+    Raises:
+        UploadError: JSON-RPC-Fehler oder Stream ohne result-Event
     """
-    # Defaults aus Umgebung
-    mcp_url = mcp_url or os.environ.get(
-        "MOODLE_MCP_URL",
-        "https://mcp-moodle.dirk-schulenburg.net/mcp"
-    )
-    api_key = api_key or os.environ.get(
-        "MOODLE_MCP_API_KEY",
-        "ae9ee37c6c6fb8e22e49a15c12bc819b8cd9e338ec27af4a5414affd5b1e7d61"
-    )
+    started = time.perf_counter() if started is None else started
+    first_event = None
+    for _, data in iter_sse_events(lines):
+        if first_event is None:
+            first_event = time.perf_counter() - started
+        try:
+            message = json.loads(data)
+        except ValueError:
+            continue
+        if not isinstance(message, dict):
+            continue
+        if 'error' in message:
+            error = message['error']
+            raise UploadError(f"MCP-Fehler: {error.get('message', error) if isinstance(error, dict) else error}")
+        if 'result' in message:
+            return message['result'], first_event
+        # Sonst: Fortschritts-/Log-Notification - weiterlesen
+    raise UploadError("Antwort ohne result-Event")
+
+
+def read_upload_result(lines: Iterable[bytes], started: float = None) -> Tuple[Optional[int], Optional[str], Optional[float]]:
+    """
+    Wie read_rpc_result, fuer die Antwort des Upload-Tools.
 
-    try:
-        # 1. H5P erstellen
-        from h5p_system import H5PSystem
+    Returns:
+        (Content ID, Embed URL, Sekunden bis zum ersten Event)
+    """
+    result, first_event = read_rpc_result(lines, started)
+    content = result.get('content') or [{}]
+    content_id, embed_url = parse_upload_text(content[0].get('text', ''))
+    return content_id, embed_url, first_event
 
-        # Output-Verzeichnis
-        output_dir = Path(__file__).parent / "output"
-        output_dir.mkdir(exist_ok=True)
 
-        system = H5PSystem(output_dir=str(output_dir))
-        result = system.generate_from_questions(
-            questions_text,
-            title=title,
-            domain=domain
-        )
+def encoded_length(size: int) -> int:
+    """Laenge der Base64-Kodierung von size Bytes"""
+    return 4 * ((size + 2) // 3)
 
-        if not result.success or not result.h5p_files:
-            return QuizResult(
-                success=False,
-                error=f"H5P-Generierung fehlgeschlagen: {'; '.join(result.errors)}"
-            )
-
-        h5p_path = result.h5p_files[0]
-        questions_count = result.statistics.get('questions_parsed', 0)
-
-        # 2. H5P Datei als Base64 lesen
-        with open(h5p_path, 'rb') as f:
-            h5p_base64 = base64.b64encode(f.read()).decode('utf-8')
-
-        # 3. Zu Moodle hochladen
-        safe_title = "".join(c if c.isalnum() or c in '-_ ' else '-' for c in title)
-        filename = f"{safe_title.lower().replace(' ', '-')}.h5p"
-
-        payload = {
-            'jsonrpc': '2.0',
-            'id': 1,
-            'method': 'tools/call',
-            'params': {
-                'name': 'moodle_upload_h5p',
-                'arguments': {
-                    'base64data': h5p_base64,
-                    'filename': filename,
-                    'title': title,
-                    'courseid': course_id
-                }
-            }
-        }
 
-        headers = {
-            'Content-Type': 'application/json',
-            'Accept': 'application/json, text/event-stream',
-            'x-api-key': api_key
+def iter_base64(path, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Base64 einer Datei in Bloecken - nie mehr als chunk_size Bytes im Speicher"""
+    chunk_size -= chunk_size % 3
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield base64.b64encode(chunk)
+
+
+def upload_payload_parts(request_id: int, filename: str, title: str, course_id: int,
+                         content_id: int = None) -> Tuple[bytes, bytes]:
+    """
+    JSON-RPC-Payload vor und nach dem base64data-Wert.
+
+    Base64 enthaelt keine JSON-Sonderzeichen - die kodierten Bloecke koennen
+    unveraendert zwischen die beiden Teile gestreamt werden.
+
+    Mit content_id wird der vorhandene Inhalt ersetzt (UPDATE_TOOL).
+    """
+    arguments = {
+        'base64data': _DATA_MARKER,
+        'filename': filename,
+        'title': title,
+        'courseid': course_id
+    }
+    if content_id is not None:
+        arguments['contentid'] = content_id
+    payload = {
+        'jsonrpc': '2.0',
+        'id': request_id,
+        'method': 'tools/call',
+        'params': {
+            'name': UPDATE_TOOL if content_id is not None else UPLOAD_TOOL,
+            'arguments': arguments
         }
+    }
+    head, tail = json.dumps(payload).split(json.dumps(_DATA_MARKER)[1:-1])
+    return head.encode('utf-8'), tail.encode('utf-8')
 
-        response = requests.post(mcp_url, json=payload, headers=headers, timeout=60, stream=True)
 
-        if response.status_code != 200:
-            return QuizResult(
-                success=False,
-                error=f"Moodle Upload fehlgeschlagen: HTTP {response.status_code}",
-                h5p_path=str(h5p_path),
-                questions_count=questions_count
-            )
+def iter_upload_body(h5p_path, request_id: int, filename: str, title: str, course_id: int,
+                     chunk_size: int = CHUNK_SIZE, content_id: int = None) -> Iterator[bytes]:
+    """JSON-RPC-Body eines Uploads als Folge von Bloecken (Datei wird gestreamt)"""
+    head, tail = upload_payload_parts(request_id, filename, title, course_id, content_id)
+    yield head
+    yield from iter_base64(h5p_path, chunk_size)
+    yield tail
 
-        # SSE Response parsen
-        raw = response.content.decode('utf-8')
-        content_id = None
-        embed_url = None
 
-        for line in raw.split('\n'):
-            if line.startswith('data:'):
-                try:
-                    event_data = json.loads(line[5:].strip())
-                    if 'result' in event_data:
-                        text = event_data['result'].get('content', [{}])[0].get('text', '')
-
-                        # Content ID extrahieren
-                        import re
-                        id_match = re.search(r'\*\*Content ID\*\*\s*\|\s*(\d+)', text)
-                        if id_match:
-                            content_id = int(id_match.group(1))
-
-                        # Embed URL extrahieren
-                        url_match = re.search(r'\*\*Embed URL:\*\*\s*(https?://[^\s]+)', text)
-                        if url_match:
-                            embed_url = url_match.group(1)
-                except:
-                    pass
+class UploadBody:
+    """
+    Datei-aehnlicher Request-Body ueber iter_upload_body mit bekannter Laenge.
 
-        return QuizResult(
-            success=True,
-            content_id=content_id,
+    requests sendet ihn mit Content-Length und liest ihn blockweise - anders
+    als ein Generator-Body, der als Transfer-Encoding: chunked rausgeht.
+    """
+
+    def __init__(self, h5p_path, request_id: int, filename: str, title: str, course_id: int,
+                 chunk_size: int = CHUNK_SIZE, content_id: int = None):
+        head, tail = upload_payload_parts(request_id, filename, title, course_id, content_id)
+        self.length = len(head) + encoded_length(os.path.getsize(h5p_path)) + len(tail)
+        self._chunks = iter_upload_body(h5p_path, request_id, filename, title, course_id,
+                                        chunk_size, content_id)
+        self._chunk = b''
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return self.length
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self.length
+        parts = []
+        while size > 0:
+            if self._pos >= len(self._chunk):
+                self._chunk, self._pos = next(self._chunks, b''), 0
+                if not self._chunk:
+                    break
+            part = self._chunk[self._pos:self._pos + size]
+            self._pos += len(part)
+            size -= len(part)
+            parts.append(part)
+        return b''.join(parts)
+
+
+def generate_quiz(questions_text: str, title: str = "Quiz", domain: str = None,
+                  output_dir: Path = None, seed: Union[int, str] = None) -> Tuple[Path, int]:
+    """
+    Erstellt das H5P Quiz (ohne Upload).
+
+    Mit seed ist das Paket reproduzierbar (gleiche Fragen = gleicher Inhalt).
+
+    Returns:
+        (Pfad der .h5p-Datei, Anzahl erkannter Fragen)
+
+    Raises:
+        ImportError: h5p-generator nicht gefunden
+        RuntimeError: Generierung fehlgeschlagen
+    """
+    from h5p_system import H5PSystem
+
+    output_dir = Path(output_dir or OUTPUT_DIR)
+    output_dir.mkdir(exist_ok=True)
+
+    system = H5PSystem(output_dir=str(output_dir), seed=seed)
+    result = system.generate_from_questions(
+        questions_text,
+        title=title,
+        domain=domain
+    )
+
+    if not result.success or not result.h5p_files:
+        raise RuntimeError(f"H5P-Generierung fehlgeschlagen: {'; '.join(result.errors)}")
+
+    return result.h5p_files[0], result.statistics.get('questions_parsed', 0)
+
+
+@dataclass
+class PipelineStats:
+    """Kennzahlen eines upload_many-Laufs (Zeiten in Sekunden, summiert ueber Worker)"""
+    items: int = 0
+    generate_s: float = 0.0
+    upload_s: float = 0.0
+    wall_s: float = 0.0
+    queue_high_water: int = 0
+
+    def __str__(self):
+        return (f"Pipeline: {self.items} Elemente, Generierung {self.generate_s:.1f}s, "
+                f"Upload {self.upload_s:.1f}s, Gesamt {self.wall_s:.1f}s "
+                f"(Queue max. {self.queue_high_water})")
+
+
+class MoodleUploader:
+    """
+    Laedt .h5p-Dateien ueber den Moodle-MCP-Server hoch.
+
+    Alle Uploads teilen eine requests.Session mit Connection-Pool - TCP- und
+    TLS-Verbindungen werden wiederverwendet statt pro Quiz neu aufgebaut.
+    Voruebergehende Fehler (Verbindung nicht aufgebaut, HTTP 429/502/503/504)
+    werden mit exponentiellem Backoff wiederholt. Bricht die Verbindung ab,
+    nachdem der Body gesendet wurde, gibt es keine Wiederholung - das
+    Ergebnis ist unklar (uncertain), der Inhalt evtl. schon angelegt.
+
+    Die Datei wird blockweise Base64-kodiert und direkt in den Request-Body
+    gestreamt - der Speicherbedarf haengt nicht von der Paketgroesse ab.
+
+    Mit einem SyncManifest laedt upload_many nur geaenderte Pakete hoch:
+    unveraenderte werden uebersprungen, geaenderte ersetzen den vorhandenen
+    Inhalt (UPDATE_TOOL mit der bekannten Content ID). Ob der Server
+    UPDATE_TOOL anbietet, wird vor dem ersten Ersetzen per tools/list
+    geprueft; fehlt es, schlaegt das Ersetzen mit einer klaren Meldung fehl,
+    statt einen zweiten Inhalt anzulegen.
+
+    upload_many generiert und laedt gleichzeitig: Generierungs-Worker
+    fuellen eine begrenzte Queue, die Upload-Worker leeren sie.
+
+    Beispiel:
+        with MoodleUploader(max_workers=4) as uploader:
+            results = uploader.upload_many(items)
+    """
+
+    def __init__(self, mcp_url: str = None, api_key: str = None, max_workers: int = 4,
+                 retries: int = 3, backoff: float = 1.0, timeout: float = 60,
+                 chunked: bool = False, chunk_size: int = CHUNK_SIZE,
+                 manifest: SyncManifest = None, force: bool = False):
+        """
+        Args:
+            mcp_url: Moodle MCP URL (default: aus env)
+            api_key: MCP API Key (default: aus env)
+            max_workers: Gleichzeitige Uploads (= Groesse des Connection-Pools)
+            retries: Wiederholungen nach voruebergehenden Fehlern
+            backoff: Wartezeit vor der ersten Wiederholung in Sekunden,
+                verdoppelt sich pro Versuch (plus Zufallsanteil)
+            timeout: Timeout pro Request in Sekunden
+            chunked: Body als Transfer-Encoding: chunked senden (ohne
+                Content-Length), sonst mit vorab berechneter Laenge
+            chunk_size: Rohdaten pro Base64-Block
+            manifest: Sync-Manifest fuer upload_many (None = alles hochladen)
+            force: Mit Manifest auch unveraenderte Pakete erneut hochladen
+        """
+        self.mcp_url = mcp_url or os.environ.get("MOODLE_MCP_URL", DEFAULT_MCP_URL)
+        self.max_workers = max(1, max_workers)
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.chunked = chunked
+        self.chunk_size = chunk_size
+        self.manifest = manifest
+        self.force = force
+        self.stats = PipelineStats()
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'Accept': 'application/json, text/event-stream',
+            'x-api-key': api_key or os.environ.get("MOODLE_MCP_API_KEY", DEFAULT_API_KEY)
+        })
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers, pool_block=True)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._request_id = 0
+        self._lock = threading.Lock()
+        self._tools: Optional[frozenset] = None
+        self._tools_lock = threading.Lock()
+
+    def __enter__(self) -> 'MoodleUploader':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    def _next_id(self) -> int:
+        with self._lock:
+            self._request_id += 1
+            return self._request_id
+
+    def _raise_for_status(self, response: requests.Response):
+        """UploadError fuer HTTP-Status != 200"""
+        if response.status_code == 200:
+            return
+        response.content    # Body lesen, damit die Verbindung in den Pool zurueckgeht
+        retry_after = response.headers.get('Retry-After', '')
+        raise UploadError(
+            f"Moodle Upload fehlgeschlagen: HTTP {response.status_code}",
+            retryable=response.status_code in RETRY_STATUS,
+            retry_after=float(retry_after) if retry_after.isdigit() else None,
+            uncertain=response.status_code == 500
+        )
+
+    def tools(self) -> frozenset:
+        """
+        Namen der Tools, die der MCP-Server anbietet (tools/list, alle Seiten).
+
+        Wird einmal pro Uploader abgefragt. Die Abfrage legt nichts an -
+        jeder Fehler ist wiederholbar.
+
+        Raises:
+            UploadError: Server nicht erreichbar oder Fehlerantwort
+        """
+        with self._tools_lock:
+            if self._tools is not None:
+                return self._tools
+            names, cursor = set(), None
+            while True:
+                payload = {'jsonrpc': '2.0', 'id': self._next_id(), 'method': 'tools/list',
+                           'params': {'cursor': cursor} if cursor else {}}
+                try:
+                    with self.session.post(self.mcp_url, data=json.dumps(payload),
+                                           timeout=self.timeout, stream=True) as response:
+                        self._raise_for_status(response)
+                        result, _ = read_rpc_result(response.iter_lines())
+                except requests.RequestException as e:
+                    raise UploadError(f"Tool-Liste nicht abrufbar: {e}", retryable=True)
+                names.update(tool.get('name') for tool in result.get('tools', []))
+                cursor = result.get('nextCursor')
+                if not cursor:
+                    break
+            self._tools = frozenset(names)
+            return self._tools
+
+    def _post(self, h5p_path, filename: str, title: str, course_id: int,
+              content_id: int = None) -> Tuple[Optional[int], Optional[str], Optional[float]]:
+        """Ein Upload-Versuch (Body wird pro Versuch neu aus der Datei gestreamt)"""
+        body_args = (h5p_path, self._next_id(), filename, title, course_id, self.chunk_size, content_id)
+        body = iter_upload_body(*body_args) if self.chunked else UploadBody(*body_args)
+
+        started = time.perf_counter()
+        try:
+            response = self.session.post(self.mcp_url, data=body, timeout=self.timeout, stream=True)
+        except requests.ConnectionError as e:
+            if _not_sent(e):
+                raise UploadError(f"Verbindungsfehler: {e}", retryable=True)
+            raise UploadError(f"Verbindung abgebrochen: {e}", uncertain=True)
+        except requests.Timeout as e:
+            raise UploadError(f"Timeout: {e}", uncertain=True)
+
+        with response:
+            self._raise_for_status(response)
+            try:
+                reply = read_upload_result(response.iter_lines(), started)
+            except requests.RequestException as e:
+                # Abbruch waehrend der Antwort: Upload evtl. schon angelegt
+                raise UploadError(f"Antwort abgebrochen: {e}", uncertain=True)
+            if getattr(response.raw, 'length_remaining', None) == 0:
+                # Antwort komplett gelesen - Verbindung zurueck in den Pool.
+                # Offene Streams schliesst response.close() sofort.
+                response.raw.drain_conn()
+            return reply
+
+    def upload(self, h5p_path, title: str = "Quiz", course_id: int = 2, filename: str = None,
+               questions_count: int = 0, content_id: int = None) -> QuizResult:
+        """
+        Laedt eine .h5p-Datei hoch (mit Wiederholungen).
+
+        Args:
+            content_id: Vorhandenen Moodle-Inhalt ersetzen statt neu anlegen
+                (nur wenn der Server UPDATE_TOOL anbietet, sonst Fehler)
+
+        Returns:
+            QuizResult (success=False statt Exception, attempts = Versuche)
+        """
+        filename = filename or _safe_filename(title)
+        result = QuizResult(
+            success=False,
             title=title,
             filename=filename,
             course_id=course_id,
-            embed_url=embed_url,
             h5p_path=str(h5p_path),
             questions_count=questions_count
         )
 
+        if not os.access(h5p_path, os.R_OK) or not os.path.isfile(h5p_path):
+            result.error = f"Datei nicht lesbar: {h5p_path}"
+            return result
+
+        for attempt in range(self.retries + 1):
+            result.attempts = attempt + 1
+            try:
+                if content_id is not None and UPDATE_TOOL not in self.tools():
+                    raise UploadError(
+                        f"Ersetzen nicht unterstuetzt: Server bietet {UPDATE_TOOL} nicht an "
+                        f"(Inhalt {content_id} unveraendert)")
+                result.content_id, result.embed_url, result.first_event_s = self._post(
+                    h5p_path, filename, title, course_id, content_id)
+                if content_id is not None and result.content_id is None:
+                    result.content_id = content_id
+                result.success = True
+                result.error = None
+                result.uncertain = False
+                return result
+            except UploadError as e:
+                result.error = str(e)
+                result.uncertain = e.uncertain
+                if not e.retryable or attempt == self.retries:
+                    return result
+                delay = e.retry_after if e.retry_after is not None else self.backoff * 2 ** attempt
+                time.sleep(delay + random.uniform(0, self.backoff))
+            except Exception as e:
+                result.error = f"Unerwarteter Fehler: {type(e).__name__}: {e}"
+                return result
+        return result
+
+    def upload_many(self, items: Iterable['UploadItem'], generate_workers: int = 1,
+                    queue_size: int = None) -> List[QuizResult]:
+        """
+        Generiert und laedt viele Elemente als Pipeline hoch.
+
+        Generierungs-Worker (CPU) fuellen eine begrenzte Queue, aus der
+        max_workers Upload-Worker (Netzwerk) lesen - beides laeuft
+        gleichzeitig, die Gesamtzeit naehert sich max(Generierung, Upload)
+        statt der Summe. Ist Moodle langsam, blockiert die volle Queue die
+        Generierung (Backpressure), statt Pakete auf Vorrat zu bauen.
+
+        Args:
+            items: UploadItems (fertige .h5p-Dateien oder Fragen-Sets)
+            generate_workers: Parallele Generierungen; > 1 nutzt Prozesse
+            queue_size: Fertige Pakete, die auf den Upload warten duerfen
+                (default: 2 * max_workers)
+
+        Returns:
+            Ein QuizResult pro Element, in der Reihenfolge der Eingabe
+            (Kennzahlen des Laufs in self.stats). Mit Manifest: siehe sync().
+        """
+        items = list(items)
+        results: List[Optional[QuizResult]] = [None] * len(items)
+        jobs = queue.Queue(maxsize=queue_size or 2 * self.max_workers)
+        pending = iter(enumerate(items))
+        pending_lock = threading.Lock()
+        stats = PipelineStats(items=len(items))
+        stats_lock = threading.Lock()
+        pool = ProcessPoolExecutor(max_workers=generate_workers) if generate_workers > 1 else None
+
+        def generate():
+            while True:
+                with pending_lock:
+                    index, item = next(pending, (None, None))
+                if item is None:
+                    return
+                started = time.perf_counter()
+                try:
+                    if pool is not None and not item.h5p_path:
+                        h5p_path, questions_count = pool.submit(_resolve_item, item).result()
+                    else:
+                        h5p_path, questions_count = item.resolve()
+                except ImportError as e:
+                    results[index] = QuizResult(success=False, title=item.title, course_id=item.course_id,
+                                                error=f"h5p-generator nicht gefunden: {e}")
+                    continue
+                except Exception as e:
+                    results[index] = QuizResult(success=False, title=item.title, course_id=item.course_id,
+                                                error=str(e))
+                    continue
+                finally:
+                    with stats_lock:
+                        stats.generate_s += time.perf_counter() - started
+                jobs.put((index, item, h5p_path, questions_count))    # blockiert bei voller Queue
+                with stats_lock:
+                    stats.queue_high_water = max(stats.queue_high_water, jobs.qsize())
+
+        def upload():
+            while True:
+                job = jobs.get()
+                if job is None:
+                    return
+                index, item, h5p_path, questions_count = job
+                started = time.perf_counter()
+                if self.manifest is not None:
+                    results[index] = self.sync(h5p_path, item, questions_count)
+                else:
+                    results[index] = self.upload(h5p_path, item.title, item.course_id,
+                                                 item.filename, questions_count)
+                with stats_lock:
+                    stats.upload_s += time.perf_counter() - started
+
+        started = time.perf_counter()
+        producers = [threading.Thread(target=generate) for _ in range(max(1, generate_workers))]
+        consumers = [threading.Thread(target=upload) for _ in range(self.max_workers)]
+        try:
+            for thread in producers + consumers:
+                thread.start()
+            for thread in producers:
+                thread.join()
+        finally:
+            for _ in consumers:
+                jobs.put(None)
+            for thread in consumers:
+                thread.join()
+            if pool is not None:
+                pool.shutdown()
+        stats.wall_s = time.perf_counter() - started
+        self.stats = stats
+        return results
+
+    def sync(self, h5p_path, item: 'UploadItem', questions_count: int = 0) -> QuizResult:
+        """
+        Abgleich eines Pakets mit dem Manifest.
+
+        - Hash unveraendert: kein Upload (action 'unveraendert')
+        - Hash geaendert: vorhandenen Inhalt ersetzen ('aktualisiert')
+        - nicht im Manifest: neu hochladen ('neu')
+        """
+        try:
+            content_hash = package_hash(h5p_path)
+        except (OSError, zipfile.BadZipFile) as e:
+            return QuizResult(success=False, title=item.title, course_id=item.course_id,
+                              h5p_path=str(h5p_path), error=f"Paket nicht lesbar: {e}")
+
+        entry = self.manifest.lookup(item.course_id, item.key)
+        if entry is not None and entry.content_hash == content_hash and not self.force:
+            return QuizResult(success=True, content_id=entry.content_id, title=item.title,
+                              filename=item.key, course_id=item.course_id, embed_url=entry.embed_url,
+                              h5p_path=str(h5p_path), questions_count=questions_count,
+                              action='unveraendert')
+
+        existing_id = entry.content_id if entry is not None else None
+        result = self.upload(h5p_path, item.title, item.course_id, item.key,
+                             questions_count, content_id=existing_id)
+        if result.success:
+            result.action = 'aktualisiert' if existing_id is not None else 'neu'
+            self.manifest.record(item.course_id, item.key, content_hash, result.content_id,
+                                 item.title, result.embed_url)
+        return result
+
+
+@dataclass
+class UploadItem:
+    """Ein Element fuer bulk_upload: fertige .h5p-Datei oder Fragen-Text"""
+    title: str = "Quiz"
+    course_id: int = 2
+    h5p_path: Optional[str] = None
+    questions_text: Optional[str] = None
+    domain: Optional[str] = None
+    filename: Optional[str] = None
+    seed: Optional[Union[int, str]] = None
+
+    @property
+    def key(self) -> str:
+        """Moodle-Dateiname - identifiziert das Quiz im Kurs (Sync-Manifest)"""
+        return self.filename or _safe_filename(self.title)
+
+    def resolve(self) -> Tuple[Path, int]:
+        """
+        Pfad der .h5p-Datei (Fragen-Sets werden dafuer generiert).
+
+        Generierung mit festem Seed (default: Kurs + Dateiname) - unveraenderte
+        Fragen ergeben dasselbe Paket und werden beim Sync uebersprungen.
+        """
+        if self.h5p_path:
+            return Path(self.h5p_path), 0
+        if self.questions_text:
+            seed = self.seed if self.seed is not None else f"{self.course_id}:{self.key}"
+            return generate_quiz(self.questions_text, self.title, self.domain, seed=seed)
+        raise ValueError("UploadItem braucht h5p_path oder questions_text")
+
+
+def items_from_files(paths: Iterable[str], course_id: int = 2, domain: str = None) -> List[UploadItem]:
+    """UploadItems aus .h5p-Dateien und Fragen-Dateien (Titel = Dateiname)"""
+    items = []
+    for filepath in paths:
+        path = Path(filepath)
+        title = path.stem.replace('_', ' ').replace('-', ' ')
+        if path.suffix.lower() == '.h5p':
+            items.append(UploadItem(title=title, course_id=course_id, h5p_path=str(path)))
+        else:
+            items.append(UploadItem(title=title, course_id=course_id, domain=domain,
+                                    questions_text=path.read_text(encoding='utf-8')))
+    return items
+
+
+def _resolve_item(item: 'UploadItem') -> Tuple[Path, int]:
+    """UploadItem.resolve fuer ProcessPoolExecutor (picklebar)"""
+    return item.resolve()
+
+
+def bulk_upload(items: Iterable[UploadItem], mcp_url: str = None, api_key: str = None,
+                max_workers: int = 4, retries: int = 3, backoff: float = 1.0,
+                manifest: SyncManifest = None, force: bool = False,
+                generate_workers: int = 1, queue_size: int = None) -> List[QuizResult]:
+    """
+    Generiert und laedt viele Quizze ueber eine gemeinsame Session hoch
+    (Pipeline, siehe MoodleUploader.upload_many).
+
+    Args:
+        max_workers: Gleichzeitige Uploads
+        generate_workers: Parallele Generierungen (> 1 in Prozessen)
+        queue_size: Fertige Pakete, die auf den Upload warten duerfen
+        manifest: Sync-Manifest - unveraenderte Pakete werden uebersprungen,
+            geaenderte ersetzen den vorhandenen Inhalt
+        force: Mit Manifest auch unveraenderte Pakete erneut hochladen
+
+    Returns:
+        Ein QuizResult pro Element, in der Reihenfolge der Eingabe
+    """
+    with MoodleUploader(mcp_url, api_key, max_workers=max_workers, retries=retries,
+                        backoff=backoff, manifest=manifest, force=force) as uploader:
+        return uploader.upload_many(items, generate_workers, queue_size)
+
+
+def create_and_upload_quiz(
+    questions_text: str,
+    title: str = "Quiz",
+    course_id: int = 2,
+    domain: str = None,
+    mcp_url: str = None,
+    api_key: str = None
+) -> QuizResult:
+    """
+    Erstellt H5P Quiz und laedt es zu Moodle hoch.
+
+    Args:
+        questions_text: Fragen im h5p-generator Format
+        title: Quiz-Titel
+        course_id: Moodle Kurs-ID
+        domain: Fachbereich fuer Distraktoren
+        mcp_url: Moodle MCP URL (default: aus env)
+        api_key: MCP API Key (default: aus env)
+
+    Returns:
+        QuizResult
+    """
+    try:
+        h5p_path, questions_count = generate_quiz(questions_text, title, domain)
     except ImportError as e:
         return QuizResult(
             success=False,
             error=f"h5p-generator nicht gefunden: {e}"
         )
+    except RuntimeError as e:
+        return QuizResult(success=False, error=str(e))
     except Exception as e:
         return QuizResult(
             success=False,
             error=f"Unerwarteter Fehler: {type(e).__name__}: {e}"
         )
 
+    with MoodleUploader(mcp_url, api_key, max_workers=1) as uploader:
+        return uploader.upload(h5p_path, title, course_id, questions_count=questions_count)
+
 
 def main():
     parser = argparse.ArgumentParser(
         description='Erstellt H5P Quiz und laedt zu Moodle hoch'
     )
-    parser.add_argument(
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
         '--questions', '-q',
-        required=True,
         help='Fragen im h5p-generator Format (oder @datei.txt)'
     )
+    source.add_argument(
+        '--bulk', '-b',
+        nargs='+',
+        metavar='DATEI',
+        help='Bulk-Upload: .h5p-Dateien und/oder Fragen-Dateien (.txt, Titel = Dateiname)'
+    )
     parser.add_argument(
         '--title', '-t',
         default='Quiz',
@@ -223,9 +843,68 @@ def main():
         choices=['accounting', 'scrum', 'it', 'business'],
         help='Fachbereich fuer Distraktoren'
     )
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=4,
+        help='Bulk: gleichzeitige Uploads (default: 4)'
+    )
+    parser.add_argument(
+        '--generate-workers', '-g',
+        type=int,
+        default=1,
+        help='Bulk: parallele Generierungen, > 1 in eigenen Prozessen (default: 1)'
+    )
+    parser.add_argument(
+        '--queue-size',
+        type=int,
+        help='Bulk: fertige Pakete, die auf den Upload warten duerfen (default: 2 x --workers)'
+    )
+    parser.add_argument(
+        '--retries',
+        type=int,
+        default=3,
+        help='Wiederholungen bei voruebergehenden Fehlern (default: 3)'
+    )
+    parser.add_argument(
+        '--manifest', '-m',
+        nargs='?',
+        const=str(OUTPUT_DIR / 'sync_manifest.sqlite'),
+        help='Bulk: Sync-Manifest - unveraenderte Pakete ueberspringen, geaenderte ersetzen '
+             '(default-Pfad: output/sync_manifest.sqlite)'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Mit --manifest auch unveraenderte Pakete erneut hochladen'
+    )
 
     args = parser.parse_args()
 
+    if args.bulk:
+        items = items_from_files(args.bulk, args.course, args.domain)
+        manifest = SyncManifest(args.manifest) if args.manifest else None
+        try:
+            with MoodleUploader(max_workers=args.workers, retries=args.retries,
+                                manifest=manifest, force=args.force) as uploader:
+                results = uploader.upload_many(items, args.generate_workers, args.queue_size)
+        finally:
+            if manifest is not None:
+                manifest.close()
+        print("| Status | Titel | Content ID | Versuche | Erstes Event | Fehler |")
+        print("|--------|-------|------------|----------|--------------|--------|")
+        for result in results:
+            status = (result.action or 'OK') if result.success else 'FEHLER'
+            first_event = f"{result.first_event_s:.2f}s" if result.first_event_s is not None else '-'
+            print(f"| {status} | {result.title} | "
+                  f"{result.content_id or '-'} | {result.attempts} | {first_event} | {result.error or ''} |")
+        failed = sum(1 for r in results if not r.success)
+        skipped = sum(1 for r in results if r.action == 'unveraendert')
+        print(f"\n{len(results) - failed - skipped}/{len(results)} hochgeladen"
+              + (f", {skipped} unveraendert" if skipped else ""))
+        print(uploader.stats)
+        sys.exit(0 if not failed else 1)
+
     # Fragen aus Datei oder direkt
     if args.questions.startswith('@'):
         filepath = args.questions[1:]
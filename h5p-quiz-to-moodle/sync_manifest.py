@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Sync Manifest - Merkt sich, welche Pakete schon in Moodle liegen
+
+SQLite-Tabelle (Kurs-ID, Schluessel) -> Inhalts-Hash + Moodle Content ID.
+Beim erneuten Sync wird ein Paket mit unveraendertem Hash uebersprungen,
+ein geaendertes ersetzt den vorhandenen Inhalt (gleiche Content ID) statt
+eine neue Aktivitaet anzulegen.
+
+Der Hash laeuft ueber den Paketinhalt, nicht ueber die ZIP-Datei:
+Zeitstempel, Kompression und JSON-Formatierung aendern ihn nicht.
+
+Verwendung:
+    with SyncManifest('sync_manifest.sqlite') as manifest:
+        results = bulk_upload(items, manifest=manifest)
+
+    python sync_manifest.py sync_manifest.sqlite [--course 2]    # Inhalt anzeigen
+"""
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+# Lesegroesse fuer Medien im Paket
+_BLOCK_SIZE = 1024 * 1024
+
+
+def package_hash(path) -> str:
+    """
+    SHA-256 ueber den Inhalt einer .h5p-Datei.
+
+    Dateien werden nach Namen sortiert gehasht, JSON-Dateien in kanonischer
+    Form (sortierte Keys, kompakt) - gleiche Inhalte ergeben denselben Hash,
+    egal wie das ZIP geschrieben wurde.
+    """
+    digest = hashlib.sha256()
+    with zipfile.ZipFile(path, 'r') as zf:
+        for info in sorted(zf.infolist(), key=lambda i: i.filename):
+            if info.is_dir():
+                continue
+            digest.update(info.filename.encode('utf-8') + b'\0')
+            if info.filename.endswith('.json'):
+                data = zf.read(info)
+                try:
+                    data = json.dumps(json.loads(data), sort_keys=True, ensure_ascii=False,
+                                      separators=(',', ':')).encode('utf-8')
+                except ValueError:
+                    pass
+                digest.update(len(data).to_bytes(8, 'big') + data)
+            else:
+                digest.update(info.file_size.to_bytes(8, 'big'))
+                with zf.open(info) as member:
+                    for block in iter(lambda: member.read(_BLOCK_SIZE), b''):
+                        digest.update(block)
+    return digest.hexdigest()
+
+
+@dataclass
+class ManifestEntry:
+    """Ein synchronisiertes Paket"""
+    course_id: int
+    key: str
+    content_hash: str
+    content_id: Optional[int]
+    title: str = ""
+    embed_url: Optional[str] = None
+    updated_at: float = 0.0
+
+
+class SyncManifest:
+    """
+    SQLite-Manifest der hochgeladenen Pakete (thread-sicher).
+
+    Schluessel ist der Moodle-Dateiname des Quiz (aus dem Titel) - derselbe
+    Titel im selben Kurs gilt als dasselbe Quiz.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS packages (
+            course_id    INTEGER NOT NULL,
+            key          TEXT NOT NULL,
+            content_hash TEXT NOT NULL,
+            content_id   INTEGER,
+            title        TEXT,
+            embed_url    TEXT,
+            updated_at   REAL NOT NULL,
+            PRIMARY KEY (course_id, key)
+        )
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(self._SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'SyncManifest':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._conn.close()
+
+    def lookup(self, course_id: int, key: str) -> Optional[ManifestEntry]:
+        """Eintrag fuer ein Quiz (None = noch nie hochgeladen)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT course_id, key, content_hash, content_id, title, embed_url, updated_at "
+                "FROM packages WHERE course_id = ? AND key = ?", (course_id, key)
+            ).fetchone()
+        return ManifestEntry(*row) if row else None
+
+    def record(self, course_id: int, key: str, content_hash: str, content_id: Optional[int],
+               title: str = "", embed_url: str = None):
+        """Speichert einen erfolgreichen Upload (ersetzt den alten Eintrag)"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO packages "
+                "(course_id, key, content_hash, content_id, title, embed_url, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (course_id, key, content_hash, content_id, title, embed_url, time.time())
+            )
+            self._conn.commit()
+
+    def forget(self, course_id: int, key: str):
+        """Entfernt einen Eintrag (naechster Sync laedt neu hoch)"""
+        with self._lock:
+            self._conn.execute("DELETE FROM packages WHERE course_id = ? AND key = ?", (course_id, key))
+            self._conn.commit()
+
+    def entries(self, course_id: int = None) -> List[ManifestEntry]:
+        """Alle Eintraege (optional nur eines Kurses)"""
+        query = ("SELECT course_id, key, content_hash, content_id, title, embed_url, updated_at "
+                 "FROM packages")
+        params = ()
+        if course_id is not None:
+            query += " WHERE course_id = ?"
+            params = (course_id,)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY course_id, key", params).fetchall()
+        return [ManifestEntry(*row) for row in rows]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Sync Manifest anzeigen')
+    parser.add_argument('manifest', help='Pfad zur Manifest-Datei')
+    parser.add_argument('--course', '-c', type=int, help='Nur dieser Kurs')
+    args = parser.parse_args()
+
+    with SyncManifest(args.manifest) as manifest:
+        print("| Kurs | Datei | Content ID | Hash | Stand |")
+        print("|------|-------|------------|------|-------|")
+        for entry in manifest.entries(args.course):
+            stamp = time.strftime('%Y-%m-%d %H:%M', time.localtime(entry.updated_at))
+            print(f"| {entry.course_id} | {entry.key} | {entry.content_id} | "
+                  f"{entry.content_hash[:12]} | {stamp} |")
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test: Bulk-Upload gegen den lokalen Fake-MCP-Server
+
+Testet ob:
+1. Viele Pakete parallel hochgeladen werden (eine Session, Pool <= workers)
+2. Voruebergehende Fehler (503) mit Backoff wiederholt werden
+3. Ergebnisse pro Element in Eingabe-Reihenfolge zurueckkommen
+4. Dauerhafte Fehler (401, fehlende Datei, Server weg) nicht blockieren
+5. Ein Verbindungsabbruch nach dem Senden nicht wiederholt, sondern als
+   unklar gemeldet wird (Upload evtl. angelegt)
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Pfade einrichten
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+sys.path.insert(0, str(script_dir.parent / "h5p-generator" / "scripts"))
+
+from fake_mcp_server import FakeMCPServer
+from quiz_to_moodle import UploadItem, bulk_upload, _safe_filename
+from testkit import (HangupServer, build_items, bulk_upload_to, check, finish, free_port, header,
+                     statements, uploader_for)
+
+WORKERS = 4
+
+header("Bulk-Upload")
+
+with tempfile.TemporaryDirectory() as tmp:
+    items = build_items(tmp, statements(10))
+    for i, item in enumerate(items):
+        item.course_id = 2 + i % 2
+    flaky = {_safe_filename('Quiz 3'): 2, _safe_filename('Quiz 7'): 1}
+
+    # 1-3. Parallel, mit Wiederholungen
+    print("\n1. 10 Pakete, 2 davon mit voruebergehenden Fehlern:")
+    with FakeMCPServer(fail_plan=flaky) as server:
+        results = bulk_upload_to(server, items, max_workers=WORKERS, retries=3)
+        content_ids = [r.content_id for r in results]
+        check("alle hochgeladen", all(r.success for r in results))
+        check("Reihenfolge wie Eingabe", [r.title for r in results] == [i.title for i in items])
+        check("Content IDs eindeutig", len(set(content_ids)) == len(items) and None not in content_ids)
+        check("Embed URL geparst", all(r.embed_url and str(r.content_id) in r.embed_url for r in results))
+        check("Kurs-IDs durchgereicht",
+              sorted(u['courseid'] for u in server.uploads) == sorted(i.course_id for i in items))
+        check("Wiederholungen (3 + 2 Versuche)", (results[3].attempts, results[7].attempts) == (3, 2))
+        check("keine doppelten Uploads", len(server.uploads) == len(items))
+        check(f"Connection-Pool ({server.connections} Verbindungen <= {WORKERS})",
+              server.connections <= WORKERS)
+
+    # 4. Dauerhafte Fehler
+    print("\n2. Dauerhafte Fehler:")
+    with FakeMCPServer() as server:
+        results = bulk_upload_to(server, items[:2], api_key='falsch', retries=3)
+        check("HTTP 401 ohne Wiederholung", all(not r.success and r.attempts == 1 and '401' in r.error
+                                                 for r in results))
+
+        mixed = [items[0], UploadItem(title='Fehlt', h5p_path=str(Path(tmp) / 'fehlt.h5p')), items[1]]
+        results = bulk_upload_to(server, mixed)
+        check("fehlende Datei blockiert andere nicht",
+              [r.success for r in results] == [True, False, True])
+
+    with FakeMCPServer(fail_plan={_safe_filename('Quiz 0'): 10}) as server:
+        results = bulk_upload_to(server, items[:1], retries=2)
+        check("Wiederholungen begrenzt (retries=2 -> 3 Versuche)",
+              not results[0].success and results[0].attempts == 3 and '503' in results[0].error)
+
+    results = bulk_upload(items[:1], mcp_url=f"http://127.0.0.1:{free_port()}/mcp", api_key='x',
+                          retries=1, backoff=0.01)
+    check("Server nicht erreichbar -> Verbindungsfehler nach Wiederholung",
+          not results[0].success and results[0].attempts == 2 and 'Verbindungsfehler' in results[0].error)
+    check("Server nicht erreichbar -> nicht unklar (nichts gesendet)", not results[0].uncertain)
+
+    print("\n3. Verbindungsabbruch nach dem Senden:")
+    for chunked in (False, True):
+        mode = 'chunked' if chunked else 'Content-Length'
+        with HangupServer() as server, uploader_for(server, retries=3, chunked=chunked) as uploader:
+            result = uploader.upload(items[0].h5p_path, title=items[0].title)
+            check(f"{mode}: ein Versuch, keine Wiederholung ({result.attempts} Versuch(e), "
+                  f"{server.requests} Request(s) empfangen)",
+                  result.attempts == 1 and server.requests == 1)
+            check(f"{mode}: unklar statt Fehler ({result.error})",
+                  not result.success and result.uncertain and 'abgebrochen' in result.error)
+
+finish()
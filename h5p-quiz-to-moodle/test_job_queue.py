@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Test: Dauerhafte Job-Queue (fortsetzbare Uploads)
+
+Testet ob:
+1. Einreihen idempotent ist (gleicher Schluessel -> ein Job)
+2. Ein Worker alle Jobs abarbeitet und ein zweiter Lauf nichts hochlaedt
+3. Jobs eines abgestuerzten Workers fortgesetzt bzw. als 'unklar' markiert werden
+4. Ein Timeout nach dem Senden keinen doppelten Inhalt erzeugt
+5. Voruebergehende Fehler mit Backoff wiederholt werden, bis max_attempts
+6. Ein Verbindungsabbruch nach dem Senden den Job 'unklar' macht (ein Request)
+7. Die Lease waehrend langer Uploads verlaengert wird und nur der reservierende
+   Worker einen Job abschliessen oder senden darf
+"""
+
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Pfade einrichten
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+sys.path.insert(0, str(script_dir.parent / "h5p-generator" / "scripts"))
+
+from fake_mcp_server import FakeMCPServer
+from job_queue import DONE, FAILED, QUEUED, RUNNING, UNCERTAIN, JobQueue, work
+from quiz_to_moodle import QuizResult
+from testkit import HangupServer, build_items, check, finish, header, statements, uploader_for
+
+
+def start_worker():
+    """Stand-in-Prozess, der als Worker Jobs reserviert und dann abstuerzt"""
+    process = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])
+    return process, f"{socket.gethostname()}:{process.pid}"
+
+
+header("Job-Queue")
+
+with tempfile.TemporaryDirectory() as tmp:
+    items = build_items(tmp, statements(4))
+
+    with FakeMCPServer() as server, JobQueue(Path(tmp) / 'jobs.sqlite') as queue:
+        print("\n1. Einreihen:")
+        first = [queue.enqueue(item) for item in items]
+        again = [queue.enqueue(item) for item in items]
+        check("4 Jobs, erneutes Einreihen ohne Duplikate",
+              len(queue.jobs()) == 4 and [j.id for j in first] == [j.id for j in again])
+        check("alle offen", queue.counts()[QUEUED] == 4)
+
+        print("\n2. Worker:")
+        with uploader_for(server) as uploader:
+            processed = work(queue, uploader, workers=2)
+            check("alle fertig", len(processed) == 4 and queue.counts()[DONE] == 4)
+            content_ids = {job.key: job.content_id for job in queue.jobs()}
+            check("Content IDs gespeichert", sorted(content_ids.values()) == [100, 101, 102, 103])
+            for item in items:
+                queue.enqueue(item)
+            check("zweiter Lauf: nichts zu tun", work(queue, uploader) == [] and len(server.uploads) == 4)
+
+            print("\n3. Absturz eines Workers:")
+            changed = build_items(tmp, statements(2, prefix="Neu"))
+            for item in changed:
+                queue.enqueue(item)
+            process, worker = start_worker()
+            generating = queue.claim(worker)
+            sending = queue.claim(worker)
+            queue.mark_sending(sending.id, worker)
+            process.kill()
+            process.wait()
+            processed = work(queue, uploader)
+            check("beim Generieren abgestuerzt -> fortgesetzt",
+                  queue.get(generating.id).state == DONE and len(processed) == 1)
+            check("beim Senden abgestuerzt -> unklar, kein Upload",
+                  queue.get(sending.id).state == UNCERTAIN and len(server.uploads) == 5)
+            check("geaendertes Quiz ersetzt den vorhandenen Inhalt",
+                  (server.uploads[4]['action'], server.uploads[4]['content_id'])
+                  == ('update', content_ids[generating.key]))
+            queue.requeue(sending.id)
+            work(queue, uploader)
+            check("nach requeue: Update mit bekannter Content ID",
+                  server.uploads[-1]['action'] == 'update' and len(server.contents) == 4)
+            try:
+                queue.requeue(sending.id)
+                check("fertiger Job nicht erneut einreihbar", False)
+            except ValueError:
+                check("fertiger Job nicht erneut einreihbar", True)
+
+    print("\n4. Timeout nach dem Senden:")
+    with FakeMCPServer(delay=0.6) as server, JobQueue(Path(tmp) / 'timeout.sqlite') as queue:
+        job = queue.enqueue(items[0])
+        with uploader_for(server, timeout=0.2) as uploader:
+            work(queue, uploader)
+            time.sleep(0.6)         # Server legt den Inhalt trotzdem an
+            check("Job unklar statt wiederholt", queue.get(job.id).state == UNCERTAIN)
+            check("ein Inhalt angelegt", len(server.contents) == 1)
+            created = server.uploads[0]['content_id']
+            queue.requeue(job.id, content_id=created)
+            server.delay = 0.0
+            work(queue, uploader)
+        check("nach requeue mit Content ID: ersetzt, kein Duplikat",
+              queue.get(job.id).state == DONE and len(server.contents) == 1
+              and [u['action'] for u in server.uploads] == ['create', 'update'])
+
+    print("\n5. Voruebergehende Fehler:")
+    plan = {'quiz-0.h5p': 3, 'quiz-1.h5p': 100}
+    with FakeMCPServer(fail_plan=plan) as server, JobQueue(Path(tmp) / 'retry.sqlite') as queue:
+        ok = queue.enqueue(items[0])
+        broken = queue.enqueue(items[1], max_attempts=2)
+        with uploader_for(server, retries=1) as uploader:
+            work(queue, uploader, workers=1, retry_delay=0.05)
+        ok, broken = queue.get(ok.id), queue.get(broken.id)
+        check(f"nach Backoff hochgeladen (Versuche: {ok.attempts})", ok.state == DONE and ok.attempts == 2)
+        check("nach max_attempts 'fehler'", broken.state == FAILED and 'HTTP 503' in broken.error)
+        check("erneut einreihen setzt Versuche zurueck",
+              queue.enqueue(items[1]).state == QUEUED and queue.get(broken.id).attempts == 0)
+
+    print("\n6. Verbindungsabbruch nach dem Senden:")
+    with HangupServer() as server, JobQueue(Path(tmp) / 'hangup.sqlite') as queue:
+        job = queue.enqueue(items[0])
+        with uploader_for(server, retries=3) as uploader:
+            work(queue, uploader)
+        job = queue.get(job.id)
+        check(f"Job unklar nach einem Request ({server.requests})",
+              job.state == UNCERTAIN and job.attempts == 1 and server.requests == 1)
+
+    print("\n7. Lease und Besitz:")
+    with JobQueue(Path(tmp) / 'lease.sqlite') as queue:
+        job = queue.enqueue(items[0])
+        queue.claim('host-a:1', lease=0.05)
+        success = QuizResult(success=True, content_id=555, title=job.item.title)
+        check("fremder Worker: finish ohne Wirkung",
+              queue.finish(job.id, 'host-b:2', success).state == RUNNING)
+        check("fremder Worker: mark_sending abgelehnt", not queue.mark_sending(job.id, 'host-b:2'))
+        check("mark_sending verlaengert die Lease",
+              queue.mark_sending(job.id, 'host-a:1', lease=60) and queue.get(job.id).lease_until > time.time() + 50)
+        time.sleep(0.1)
+        check("nicht verwaist trotz kurzer Claim-Lease", queue.recover()[UNCERTAIN] == 0)
+
+        queue.renew(job.id, 'host-a:1', lease=0.05)
+        time.sleep(0.1)
+        check("abgelaufene Lease beim Senden -> unklar", queue.recover()[UNCERTAIN] == 1)
+        queue.requeue(job.id)
+        taken = queue.claim('host-b:2')
+        check("alter Worker ueberschreibt den neuen nicht",
+              queue.finish(job.id, 'host-a:1', success).state == RUNNING
+              and queue.get(job.id).worker == 'host-b:2' and queue.get(job.id).content_id is None)
+        check("alter Worker sendet nicht mehr", not queue.mark_sending(job.id, 'host-a:1'))
+        check("neuer Worker schliesst ab", queue.finish(job.id, 'host-b:2', success).state == DONE)
+
+    with FakeMCPServer(delay=1.0) as server, JobQueue(Path(tmp) / 'heartbeat.sqlite') as queue:
+        job = queue.enqueue(items[0])
+        with uploader_for(server) as uploader:
+            worker = threading.Thread(target=work, args=(queue, uploader), kwargs={'lease': 0.3})
+            worker.start()
+            time.sleep(0.7)         # Upload laeuft noch, Lease laengst 2x verlaengert
+            recovered = queue.recover()
+            worker.join()
+        check(f"Upload laenger als die Lease: nicht verwaist ({recovered})",
+              recovered == {QUEUED: 0, UNCERTAIN: 0})
+        check("fertig, ein Upload", queue.get(job.id).state == DONE and len(server.uploads) == 1)
+
+finish()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test: Pipeline aus Generierung und Upload (begrenzte Queue)
+
+Testet ob:
+1. Generierung und Upload ueberlappen (Gesamtzeit ~ max statt Summe)
+2. Ein langsamer Server die Generierung bremst (Backpressure)
+3. Generierungsfehler das Ergebnis des Elements sind, nicht des Laufs
+4. Generierung in Prozessen (generate_workers > 1) dieselben Ergebnisse liefert
+"""
+
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+# Pfade einrichten
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+sys.path.insert(0, str(script_dir.parent / "h5p-generator" / "scripts"))
+
+from h5p_generator import TrueFalseGenerator, make_rng
+from fake_mcp_server import FakeMCPServer
+from quiz_to_moodle import UploadItem
+from testkit import check, finish, header, uploader_for
+
+
+@dataclass
+class SlowItem(UploadItem):
+    """Stand-in fuer die Generierung: echtes Paket plus feste Rechenzeit"""
+    output_dir: str = ""
+    cost: float = 0.0
+
+    def resolve(self):
+        if self.questions_text == 'kaputt':
+            raise ValueError("Fragen nicht lesbar")
+        started = time.perf_counter()
+        generator = TrueFalseGenerator(output_dir=self.output_dir, rng=make_rng(self.title))
+        result = generator.create(self.title, [{'text': self.questions_text, 'correct': True}])
+        time.sleep(max(0.0, self.cost - (time.perf_counter() - started)))
+        return result.path, 1
+
+
+def items(tmp: str, count: int, cost: float):
+    return [SlowItem(title=f"Quiz {i}", questions_text=f"Aussage {i}", output_dir=tmp, cost=cost)
+            for i in range(count)]
+
+
+header("Pipeline Generierung -> Upload")
+
+with tempfile.TemporaryDirectory() as tmp:
+    print("\n1. Ueberlappung (12 x 0.1s Generierung, 12 x 0.1s Upload):")
+    with FakeMCPServer(delay=0.1) as server:
+        with uploader_for(server, max_workers=1) as uploader:
+            results = uploader.upload_many(items(tmp, 12, 0.1))
+            stats = uploader.stats
+    print(f"  {stats}")
+    check("alle hochgeladen", all(r.success for r in results) and len(server.uploads) == 12)
+    check("Reihenfolge der Eingabe", [r.title for r in results] == [f"Quiz {i}" for i in range(12)])
+    check(f"Gesamtzeit {stats.wall_s:.2f}s < 75% der Summe ({stats.generate_s + stats.upload_s:.2f}s)",
+          stats.wall_s < 0.75 * (stats.generate_s + stats.upload_s))
+
+    print("\n2. Backpressure (langsamer Server, queue_size=2):")
+    generated = []
+
+    @dataclass
+    class TracedItem(SlowItem):
+        def resolve(self):
+            path = super().resolve()
+            generated.append(time.perf_counter())
+            return path
+
+    traced = [TracedItem(title=f"Quiz {i}", questions_text=f"Aussage {i}", output_dir=tmp)
+              for i in range(10)]
+    with FakeMCPServer(delay=0.2) as server:
+        with uploader_for(server, max_workers=2) as uploader:
+            started = time.perf_counter()
+            results = uploader.upload_many(traced, queue_size=2)
+            stats = uploader.stats
+    check("alle hochgeladen", all(r.success for r in results))
+    check(f"Queue nie ueber 2 (max. {stats.queue_high_water})", stats.queue_high_water <= 2)
+    # Ohne Backpressure waeren alle 10 Pakete nach wenigen ms fertig
+    check(f"Generierung wartet auf Uploads (letztes Paket nach {generated[-1] - started:.2f}s)",
+          generated[-1] - started >= 0.4)
+
+    print("\n3. Fehler bei der Generierung:")
+    mixed = items(tmp, 3, 0.0)
+    mixed[1].questions_text = 'kaputt'
+    with FakeMCPServer() as server:
+        with uploader_for(server) as uploader:
+            results = uploader.upload_many(mixed)
+    check("Fehler am Element", not results[1].success and 'nicht lesbar' in results[1].error)
+    check("uebrige hochgeladen", results[0].success and results[2].success and len(server.uploads) == 2)
+
+    print("\n4. Generierung in Prozessen:")
+    with FakeMCPServer() as server:
+        with uploader_for(server) as uploader:
+            results = uploader.upload_many(items(tmp, 6, 0.0), generate_workers=2)
+    check("alle hochgeladen", all(r.success for r in results) and len(server.uploads) == 6)
+    check("Dateinamen je Quiz", sorted(u['filename'] for u in server.uploads)
+          == sorted(r.title.lower().replace(' ', '-') + '.h5p' for r in results))
+
+finish()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test: Inkrementelles SSE-Parsing der Upload-Antwort
+
+Testet ob:
+1. iter_sse_events mehrzeilige data-Felder, Kommentare und Event-Typen versteht
+2. read_upload_result beim result-Event aufhoert und Fehler-Events meldet
+3. Gegen einen Streaming-Server nicht auf das Stream-Ende gewartet wird
+4. Die Zeit bis zum ersten Event gemessen wird
+"""
+
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Pfade einrichten
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+sys.path.insert(0, str(script_dir.parent / "h5p-generator" / "scripts"))
+
+from h5p_generator import TrueFalseGenerator
+from fake_mcp_server import FakeMCPServer
+from quiz_to_moodle import UploadError, iter_sse_events, read_upload_result
+from testkit import check, finish, header, uploader_for
+
+
+def result_event(content_id: int) -> bytes:
+    text = f"| **Content ID** | {content_id} |\n**Embed URL:** https://moodle.test/h5p/embed.php?id={content_id}"
+    return b"data: " + json.dumps({'jsonrpc': '2.0', 'id': 1, 'result': {
+        'content': [{'type': 'text', 'text': text}]}}).encode('utf-8')
+
+
+header("SSE-Parsing")
+
+print("\n1. iter_sse_events:")
+lines = [b": kommentar", b"event: progress", b"data: {\"a\":", b"data: 1}", b"",
+         b"", "data: Prüfung".encode('utf-8'), b"", b"data:ohne-leerzeichen"]
+events = list(iter_sse_events(lines))
+check("Events erkannt", events == [('progress', '{"a":\n1}'), ('message', 'Prüfung'),
+                                   ('message', 'ohne-leerzeichen')])
+
+print("\n2. read_upload_result:")
+consumed = []
+
+
+def stream():
+    for line in [b"data: {\"jsonrpc\":\"2.0\",\"method\":\"notifications/progress\"}", b"",
+                 result_event(42), b"", b"data: danach", b""]:
+        consumed.append(line)
+        yield line
+
+
+content_id, embed_url, first_event = read_upload_result(stream())
+check("Content ID / Embed URL", (content_id, embed_url) == (42, 'https://moodle.test/h5p/embed.php?id=42'))
+check("stoppt nach result-Event", b"data: danach" not in consumed)
+check("Zeit bis erstes Event gemessen", first_event is not None and first_event >= 0)
+
+for label, lines in {
+    'Fehler-Event': [b'data: {"jsonrpc":"2.0","id":1,"error":{"code":-32000,"message":"Kurs nicht gefunden"}}', b""],
+    'Stream ohne result': [b": nur kommentar", b""],
+}.items():
+    try:
+        read_upload_result(iter(lines))
+        check(f"{label} -> UploadError", False)
+    except UploadError as e:
+        check(f"{label} -> UploadError ({e})", True)
+
+print("\n3. Streaming-Server (3 Fortschritts-Events, 0.3s, danach 3s offen):")
+with tempfile.TemporaryDirectory() as tmp:
+    package = TrueFalseGenerator(output_dir=tmp).create("SSE", [{'text': 'a', 'correct': True}]).path
+    with FakeMCPServer(progress_events=3, delay=0.3, linger=3.0) as server:
+        with uploader_for(server) as uploader:
+            start = time.perf_counter()
+            result = uploader.upload(package, title='Prüfung SSE', course_id=2)
+            elapsed = time.perf_counter() - start
+    check("hochgeladen", result.success and result.content_id == 100)
+    check(f"wartet nicht auf Stream-Ende ({elapsed:.2f}s < 1.5s)", elapsed < 1.5)
+    check(f"erstes Event vor dem Ergebnis ({result.first_event_s:.3f}s < 0.2s)",
+          result.first_event_s is not None and result.first_event_s < 0.2)
+
+finish()
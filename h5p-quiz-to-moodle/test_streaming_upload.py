@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test: Gestreamter Upload (Base64 in Bloecken, Request-Body als Stream)
+
+Testet ob:
+1. Der gestreamte Body byte-identisch zum bisherigen JSON-Payload ist
+2. UploadBody die exakte Laenge meldet und beliebig blockweise lesbar ist
+3. Der Speicherbedarf nicht mit der Paketgroesse waechst
+4. Grosse Pakete mit Content-Length und mit chunked unveraendert ankommen
+"""
+
+import base64
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+import zipfile
+from pathlib import Path
+
+# Pfade einrichten
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+
+from fake_mcp_server import FakeMCPServer
+from quiz_to_moodle import UploadBody, iter_upload_body
+from testkit import check, finish, header, uploader_for
+
+
+def make_package(path: Path, media_bytes: int) -> Path:
+    """H5P-Paket mit unkomprimierbarem 'Video' der gewuenschten Groesse"""
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_STORED) as zf:
+        zf.writestr('h5p.json', json.dumps({'title': 'Video', 'mainLibrary': 'H5P.InteractiveVideo'}))
+        zf.writestr('content/content.json', '{}')
+        zf.writestr('content/videos/lecture.mp4', os.urandom(media_bytes))
+    return path
+
+
+def old_payload(path: Path, request_id: int, filename: str, title: str, course_id: int) -> bytes:
+    """Bisheriger Weg: ganze Datei lesen, kodieren, in ein Dict packen, serialisieren"""
+    with open(path, 'rb') as f:
+        h5p_base64 = base64.b64encode(f.read()).decode('utf-8')
+    payload = {
+        'jsonrpc': '2.0', 'id': request_id, 'method': 'tools/call',
+        'params': {'name': 'moodle_upload_h5p', 'arguments': {
+            'base64data': h5p_base64, 'filename': filename, 'title': title, 'courseid': course_id}}
+    }
+    return json.dumps(payload).encode('utf-8')
+
+
+header("Gestreamter Upload")
+
+with tempfile.TemporaryDirectory() as tmp:
+    small = make_package(Path(tmp) / 'klein.h5p', 100_001)      # nicht durch 3 teilbar
+    args = (7, 'prüfung.h5p', 'Prüfung "Bilanz"', 3)
+
+    print("\n1. Body identisch zum bisherigen Payload:")
+    streamed = b''.join(iter_upload_body(small, *args, chunk_size=3 * 1024))
+    check("byte-identisch", streamed == old_payload(small, *args))
+
+    print("\n2. UploadBody:")
+    body = UploadBody(small, *args, chunk_size=3 * 1024)
+    pieces = []
+    for size in (1, 7, 8192, 5000, 16384):
+        pieces.append(body.read(size))
+    pieces.append(body.read())
+    check("Laenge exakt", len(body) == len(streamed))
+    check("blockweise gelesen = Ganzes", b''.join(pieces) == streamed)
+    check("danach leer", body.read(100) == b'')
+
+    print("\n3. Speicherbedarf (24 MB Paket):")
+    large = make_package(Path(tmp) / 'gross.h5p', 24 * 1024 * 1024)
+    size = large.stat().st_size
+
+    tracemalloc.start()
+    body = UploadBody(large, *args)
+    while body.read(16384):
+        pass
+    streamed_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    old_payload(large, *args)
+    old_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(f"  bisher: {old_peak / size:.1f}x Paketgroesse, gestreamt: {streamed_peak / 1024:.0f} KiB")
+    check("gestreamt < 2 MB Spitze", streamed_peak < 2 * 1024 * 1024)
+    check("bisher >= 3 Kopien", old_peak >= 3 * size)
+
+    print("\n4. Upload gegen Fake-Server (8 MB Paket):")
+    video = make_package(Path(tmp) / 'video.h5p', 8 * 1024 * 1024)
+    digest = hashlib.sha256(video.read_bytes()).hexdigest()
+    with FakeMCPServer() as server:
+        for chunked in (False, True):
+            with uploader_for(server, chunked=chunked) as uploader:
+                result = uploader.upload(video, title='Video', course_id=2)
+            mode = 'chunked' if chunked else 'Content-Length'
+            check(f"{mode}: hochgeladen", result.success and result.content_id is not None)
+            check(f"{mode}: Paket unveraendert", server.uploads[-1]['sha256'] == digest)
+        check("Header: Content-Length bzw. chunked",
+              [(r['content_length'] is not None, r['chunked']) for r in server.requests]
+              == [(True, False), (False, True)])
+        check("Content-Length = Body", int(server.requests[0]['content_length']) == server.requests[0]['body_size'])
+
+finish()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Test: Sync-Manifest (unveraenderte Pakete ueberspringen)
+
+Testet ob:
+1. Der Paket-Hash unabhaengig von ZIP-Kompression und JSON-Formatierung ist
+2. Der erste Sync alles neu anlegt, der zweite nichts hochlaedt
+3. Ein geaendertes Paket den vorhandenen Inhalt ersetzt (gleiche Content ID)
+4. force alles erneut hochlaedt und fehlende Inhalte als Fehler gemeldet werden
+5. Ersetzen nur versucht wird, wenn der Server moodle_update_h5p anbietet
+   (tools/list, einmal pro Lauf, auch ueber mehrere Seiten)
+"""
+
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+# Pfade einrichten
+script_dir = Path(__file__).parent
+sys.path.insert(0, str(script_dir))
+sys.path.insert(0, str(script_dir.parent / "h5p-generator" / "scripts"))
+
+from h5p_generator import H5PStyle
+from fake_mcp_server import FakeMCPServer
+from sync_manifest import SyncManifest, package_hash
+from testkit import build_items, bulk_upload_to, check, finish, header, statements
+
+
+def sync(server, manifest, items, force=False):
+    return bulk_upload_to(server, items, manifest=manifest, force=force)
+
+
+header("Sync-Manifest")
+
+questions = statements(5)
+
+with tempfile.TemporaryDirectory() as tmp:
+    print("\n1. Paket-Hash:")
+    items = build_items(tmp, questions)
+    digest = package_hash(items[0].h5p_path)
+    repacked = Path(tmp) / 'repacked.h5p'
+    with zipfile.ZipFile(items[0].h5p_path) as src, zipfile.ZipFile(repacked, 'w', zipfile.ZIP_STORED) as dst:
+        for info in reversed(src.infolist()):
+            dst.writestr(info.filename, src.read(info))
+    check("gleich bei anderer Kompression/Reihenfolge", package_hash(repacked) == digest)
+    pretty = build_items(tmp, questions, style=H5PStyle(pretty_json=True))
+    check("gleich bei eingeruecktem JSON", package_hash(pretty[0].h5p_path) == digest)
+    check("anders bei anderem Inhalt", package_hash(items[1].h5p_path) != digest)
+
+    with FakeMCPServer() as server, SyncManifest(Path(tmp) / 'manifest.sqlite') as manifest:
+        print("\n2. Erster und zweiter Sync:")
+        first = sync(server, manifest, items)
+        check("erster Sync: alles neu", [r.action for r in first] == ['neu'] * 5)
+        check("Manifest gefuellt", len(manifest.entries(2)) == 5)
+
+        second = sync(server, manifest, build_items(tmp, questions, style=H5PStyle(pretty_json=True)))
+        check("zweiter Sync: alles unveraendert", [r.action for r in second] == ['unveraendert'] * 5)
+        check("kein weiterer Upload", len(server.uploads) == 5)
+        check("Content IDs aus dem Manifest", [r.content_id for r in second] == [r.content_id for r in first])
+
+        print("\n3. Ein Paket geaendert:")
+        changed = build_items(tmp, questions[:3] + ["Geaenderte Aussage"] + questions[4:])
+        third = sync(server, manifest, changed)
+        check("nur Quiz 3 aktualisiert",
+              [r.action for r in third] == ['unveraendert'] * 3 + ['aktualisiert', 'unveraendert'])
+        check("ein Update-Request mit derselben Content ID",
+              [(u['action'], u['content_id']) for u in server.uploads[5:]] == [('update', first[3].content_id)])
+        check("Server hat das neue Paket",
+              server.contents[first[3].content_id] == server.uploads[-1]['sha256'])
+        check("Manifest aktualisiert",
+              manifest.lookup(2, 'quiz-3.h5p').content_hash == package_hash(changed[3].h5p_path))
+
+        print("\n4. force und geloeschte Inhalte:")
+        forced = sync(server, manifest, changed, force=True)
+        check("force: alles aktualisiert", [r.action for r in forced] == ['aktualisiert'] * 5)
+        check("force: keine neuen Content IDs", len(server.contents) == 5)
+
+        del server.contents[first[0].content_id]
+        changed[0] = build_items(tmp, ["Neu in Quiz 0"])[0]
+        missing = sync(server, manifest, changed[:1])
+        check("geloeschter Inhalt -> Fehler", not missing[0].success and 'nicht gefunden' in missing[0].error)
+        manifest.forget(2, 'quiz-0.h5p')
+        again = sync(server, manifest, changed[:1])
+        check("nach forget: neu angelegt", again[0].action == 'neu' and again[0].content_id not in
+              [r.content_id for r in first])
+
+    print("\n5. Server ohne moodle_update_h5p:")
+    # Eigene Verzeichnisse - build_items ueberschreibt quiz-<i>.h5p
+    (Path(tmp) / 'alt').mkdir()
+    (Path(tmp) / 'neu').mkdir()
+    items = build_items(Path(tmp) / 'alt', questions)
+    changed = build_items(Path(tmp) / 'neu', ["Anders 0", "Anders 1"] + questions[2:])
+    with FakeMCPServer(tools=['moodle_upload_h5p']) as server, \
+            SyncManifest(Path(tmp) / 'ohne-update.sqlite') as manifest:
+        first = sync(server, manifest, items)
+        check("Neuanlage ohne tools/list", all(r.success for r in first) and server.tool_lists == 0)
+        results = sync(server, manifest, changed)
+        check(f"Ersetzen abgelehnt ({results[0].error})",
+              [r.success for r in results] == [False, False, True, True, True]
+              and all('nicht unterstuetzt' in r.error and not r.uncertain for r in results[:2]))
+        check(f"kein zweiter Inhalt, kein Update-Aufruf ({len(server.requests)} Requests: 5 Uploads + tools/list)",
+              len(server.contents) == 5 and len(server.requests) == 6)
+        check("Tools einmal pro Lauf abgefragt", server.tool_lists == 1)
+        check("Manifest behaelt den alten Stand",
+              manifest.lookup(2, 'quiz-0.h5p').content_hash == package_hash(items[0].h5p_path))
+
+    with FakeMCPServer(page_size=1) as server, SyncManifest(Path(tmp) / 'seiten.sqlite') as manifest:
+        sync(server, manifest, items[:1])
+        results = sync(server, manifest, changed[:1])
+        check("tools/list ueber 2 Seiten: Update gefunden",
+              results[0].action == 'aktualisiert' and server.tool_lists == 2)
+
+finish()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Testkit - Gemeinsame Bausteine der test_*.py Skripte
+
+Ergebnis-Ausgabe ([OK]/[FEHLER] plus Zusammenfassung), Testpakete,
+Uploader gegen den Fake-MCP-Server und ein Server, der nach dem Empfang
+ohne Antwort auflegt (HangupServer):
+
+    from testkit import build_items, check, finish, header, statements, uploader_for
+
+    header("Bulk-Upload")
+    items = build_items(tmp, statements(4))
+    with FakeMCPServer() as server, uploader_for(server) as uploader:
+        check("hochgeladen", uploader.upload(items[0].h5p_path).success)
+    finish()
+"""
+
+import socket
+import sys
+import threading
+from pathlib import Path
+from typing import Iterable, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "h5p-generator" / "scripts"))
+
+from h5p_generator import H5PStyle, TrueFalseGenerator, make_rng
+from quiz_to_moodle import MoodleUploader, UploadItem, bulk_upload
+
+# Wartezeit zwischen Wiederholungen in Tests (statt Sekunden)
+TEST_BACKOFF = 0.01
+
+failures: List[str] = []
+
+
+def check(label: str, ok: bool):
+    print(f"  [{'OK' if ok else 'FEHLER'}] {label}")
+    if not ok:
+        failures.append(label)
+
+
+def header(title: str):
+    print("=" * 60)
+    print(f"Test: {title} (quiz_to_moodle)")
+    print("=" * 60)
+
+
+def finish():
+    """Zusammenfassung; Exit-Code 1 bei Fehlern"""
+    print("\n" + "=" * 60)
+    if failures:
+        print("Test fehlgeschlagen:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("Test abgeschlossen!")
+    print("=" * 60)
+
+
+# =============================================================================
+# Testpakete und Uploader
+# =============================================================================
+
+def statements(count: int, prefix: str = "Aussage") -> List[str]:
+    return [f"{prefix} {i}" for i in range(count)]
+
+
+def build_items(directory, texts: Iterable[str], style: H5PStyle = None,
+                course_id: int = 2) -> List[UploadItem]:
+    """Ein TrueFalse-Paket "Quiz <i>" pro Aussage, reproduzierbar (Seed pro Quiz)"""
+    items = []
+    for i, text in enumerate(texts):
+        generator = TrueFalseGenerator(output_dir=str(directory), style=style, rng=make_rng(i))
+        result = generator.create(f"Quiz {i}", [{'text': text, 'correct': True}])
+        items.append(UploadItem(title=f"Quiz {i}", course_id=course_id, h5p_path=str(result.path)))
+    return items
+
+
+def uploader_for(server, **kwargs) -> MoodleUploader:
+    """MoodleUploader fuer den Fake-Server (kurzer Backoff)"""
+    kwargs.setdefault('backoff', TEST_BACKOFF)
+    return MoodleUploader(server.url, server.api_key, **kwargs)
+
+
+def bulk_upload_to(server, items, **kwargs):
+    """bulk_upload gegen den Fake-Server (kurzer Backoff)"""
+    kwargs.setdefault('backoff', TEST_BACKOFF)
+    kwargs.setdefault('api_key', server.api_key)
+    return bulk_upload(items, mcp_url=server.url, **kwargs)
+
+
+def free_port() -> int:
+    """Port, auf dem niemand lauscht (Verbindung wird abgelehnt)"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class HangupServer:
+    """
+    Liest jeden Request vollstaendig und schliesst die Verbindung ohne Antwort -
+    ein Server, der nach dem Empfang abstuerzt. Der Upload ist dann evtl.
+    angelegt; der Client darf ihn nicht wiederholen.
+    """
+
+    api_key = 'test-key'
+
+    def __init__(self):
+        self.requests = 0       # vollstaendig empfangene Requests
+        self._sock = socket.socket()
+        self._sock.bind(('127.0.0.1', 0))
+        self._sock.listen()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._sock.getsockname()
+        return f"http://{host}:{port}/mcp"
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return
+            with conn:
+                if self._read_request(conn):
+                    self.requests += 1
+
+    @staticmethod
+    def _read_request(conn) -> bool:
+        """Header und Body (Content-Length oder chunked) lesen; False bei vorzeitigem Ende"""
+        data = b''
+
+        def receive() -> bool:
+            nonlocal data
+            chunk = conn.recv(65536)
+            data += chunk
+            return bool(chunk)
+
+        while b'\r\n\r\n' not in data:
+            if not receive():
+                return False
+        head = data.split(b'\r\n\r\n', 1)[0].lower()
+        if b'transfer-encoding: chunked' in head:
+            while not data.endswith(b'\r\n0\r\n\r\n'):
+                if not receive():
+                    return False
+            return True
+        length = next((int(line.split(b':', 1)[1]) for line in head.split(b'\r\n')
+                       if line.startswith(b'content-length:')), 0)
+        while len(data) - len(head) - 4 < length:
+            if not receive():
+                return False
+        return True
+
+    def __enter__(self) -> 'HangupServer':
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._sock.close()